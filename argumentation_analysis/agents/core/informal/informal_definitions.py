@@ -33,7 +33,7 @@ import requests
 import semantic_kernel as sk
 from semantic_kernel.functions import kernel_function
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from semantic_kernel.functions.kernel_function import KernelFunction
 from semantic_kernel.functions.kernel_function_metadata import KernelFunctionMetadata
 from semantic_kernel.functions.kernel_parameter_metadata import KernelParameterMetadata
@@ -57,6 +57,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger("InformalDefinitions")
 
+from .taxonomy_index import TaxonomyIndex
+
 # Import des prompts
 from .prompts import prompt_identify_args_v8, prompt_analyze_fallacies_v1, prompt_justify_fallacy_attribution_v1 # Nettoyage des imports dupliqués
 
@@ -82,6 +84,7 @@ class InformalAnalysisPlugin:
         DATA_DIR (Path): Chemin vers le répertoire de données local.
         FALLACY_CSV_LOCAL_PATH (Path): Chemin local attendu pour le fichier CSV de la taxonomie.
         _taxonomy_df_cache (Optional[pd.DataFrame]): Cache pour le DataFrame de la taxonomie.
+        _taxonomy_index_cache (Optional[TaxonomyIndex]): Index de la taxonomie utilisé par les fonctions natives.
     """
     
     def __init__(self, taxonomy_file_path: Optional[str] = None):
@@ -111,6 +114,9 @@ class InformalAnalysisPlugin:
             
         # Cache pour le DataFrame de taxonomie
         self._taxonomy_df_cache = None
+        # Index de la taxonomie (construit une fois) et DataFrame dont il est issu
+        self._taxonomy_index_cache = None
+        self._taxonomy_index_source = None
     
     def _internal_load_and_prepare_dataframe(self) -> pd.DataFrame:
         """
@@ -216,17 +222,52 @@ class InformalAnalysisPlugin:
             self._taxonomy_df_cache = self._internal_load_and_prepare_dataframe()
         return self._taxonomy_df_cache.copy() # Retourner une copie pour éviter les modifications accidentelles du cache
     
-    def _internal_explore_hierarchy(self, current_pk: int, df: pd.DataFrame, max_children: int = 15) -> Dict[str, Any]:
+    def _get_taxonomy_index(self) -> Optional[TaxonomyIndex]:
+        """
+        Récupère l'index de la taxonomie des sophismes, construit une seule fois.
+
+        L'index est construit à partir du DataFrame de `_get_taxonomy_dataframe` au
+        premier appel, puis réutilisé tant que le DataFrame en cache ne change pas.
+
+        :return: L'index de la taxonomie, ou None si la taxonomie n'est pas disponible.
+        :rtype: Optional[TaxonomyIndex]
+        """
+        if self._taxonomy_index_cache is not None and self._taxonomy_df_cache is not None \
+                and self._taxonomy_index_source is self._taxonomy_df_cache:
+            return self._taxonomy_index_cache
+        df = self._get_taxonomy_dataframe()
+        if df is None:
+            return None
+        self._taxonomy_index_cache = TaxonomyIndex.from_dataframe(df)
+        self._taxonomy_index_source = self._taxonomy_df_cache
+        return self._taxonomy_index_cache
+
+    @staticmethod
+    def _as_taxonomy_index(taxonomy: Union[TaxonomyIndex, pd.DataFrame, None]) -> Optional[TaxonomyIndex]:
+        """
+        Retourne l'index d'une taxonomie fournie comme index ou comme DataFrame.
+
+        :param taxonomy: L'index de la taxonomie, son DataFrame, ou None.
+        :type taxonomy: Union[TaxonomyIndex, pd.DataFrame, None]
+        :return: L'index (construit à la volée pour un DataFrame), ou None.
+        :rtype: Optional[TaxonomyIndex]
+        """
+        if taxonomy is None or isinstance(taxonomy, TaxonomyIndex):
+            return taxonomy
+        return TaxonomyIndex.from_dataframe(taxonomy)
+
+    def _internal_explore_hierarchy(self, current_pk: int, df: Union[TaxonomyIndex, pd.DataFrame], max_children: int = 15) -> Dict[str, Any]:
         """
         Explore la hiérarchie des sophismes à partir d'un nœud parent donné (par sa PK).
 
         Construit un dictionnaire représentant le nœud courant et ses enfants directs,
-        en se basant sur les colonnes 'FK_Parent', 'parent_pk', ou 'path' du DataFrame.
+        en se basant sur les colonnes 'FK_Parent', 'parent_pk', ou 'path' de la taxonomie
+        (voir `TaxonomyIndex.children_of`).
 
         :param current_pk: La clé primaire (PK) du nœud parent à partir duquel explorer.
         :type current_pk: int
-        :param df: Le DataFrame pandas de la taxonomie des sophismes.
-        :type df: pd.DataFrame
+        :param df: L'index de la taxonomie des sophismes (ou son DataFrame pandas).
+        :type df: Union[TaxonomyIndex, pd.DataFrame]
         :param max_children: Le nombre maximum d'enfants directs à retourner.
         :type max_children: int
         :return: Un dictionnaire contenant les informations du nœud courant (`current_node`),
@@ -239,172 +280,98 @@ class InformalAnalysisPlugin:
             "error": None
         }
         
-        if df is None:
+        index = self._as_taxonomy_index(df)
+        if index is None:
             result["error"] = "Taxonomie sophismes non disponible."
             return result
         
-        # Convertir les colonnes numériques
-        if 'depth' in df.columns:
-            df['depth'] = pd.to_numeric(df['depth'], errors='coerce')
-        
         # Trouver le nœud courant
-        current_node_df = df.loc[[current_pk]] if current_pk in df.index else pd.DataFrame()
-        if len(current_node_df) == 0:
+        current_row = index.get(current_pk)
+        if current_row is None:
             result["error"] = f"PK {current_pk} non trouvée dans la taxonomie."
             return result
         
-        # Extraire les informations du nœud courant
-        current_row = current_node_df.iloc[0]
-        # Utiliser une valeur par défaut pour path si elle n'existe pas
-        current_path = current_row.get('path', '') # .get est disponible sur les Series pandas
-        
+        current_depth = index.depth_of(current_pk)
         result["current_node"] = {
-            "pk": int(current_row.name), # PK est l'index
-            "path": current_path,
-            "depth": int(current_row['depth']) if pd.notna(current_row.get('depth')) else 0,
+            "pk": int(current_pk),
+            "path": current_row.get('path', ''),
+            "depth": int(current_depth) if current_depth is not None else 0,
             "Name": current_row.get('Name', ''), # Utiliser la colonne 'Name' du CSV
             "nom_vulgarise": current_row.get('nom_vulgarisé', ''), # nom_vulgarisé (peut être redondant ou un alias)
             "famille": current_row.get('Famille', ''),             # Famille
             "description_courte": current_row.get('text_fr', '')   # text_fr comme description courte
         }
         
-        # Trouver les enfants
-        children_df = pd.DataFrame() # Initialiser à un DataFrame vide
-        if 'FK_Parent' in df.columns:
-            # Si FK_Parent existe, l'utiliser pour trouver les enfants
-            children_df = df[df['FK_Parent'] == current_pk]
-        elif 'parent_pk' in df.columns:
-            # Si parent_pk existe, l'utiliser pour trouver les enfants
-            children_df = df[df['parent_pk'] == current_pk]
-        elif 'path' in df.columns and current_path:
-            # Si path existe, l'utiliser pour trouver les enfants
-            # S'assurer que current_path se termine par un point pour éviter les correspondances partielles incorrectes
-            # Exemple: si current_path est "1", on ne veut pas matcher "10.x"
-            # On cherche les enfants directs, donc le path de l'enfant doit être current_path + ".quelquechose"
-            # et ne pas contenir d'autres points après "quelquechose".
-            # Exemple: si current_path = "1", on cherche "1.X" mais pas "1.X.Y"
-            # Si current_path = "1.2", on cherche "1.2.X" mais pas "1.2.X.Y"
-            
-            # Construire le préfixe attendu pour les enfants directs
-            child_path_prefix = str(current_path) + "."
-            
-            # Filtrer les enfants qui commencent par ce préfixe
-            potential_children = df[df['path'].astype(str).str.startswith(child_path_prefix, na=False)]
-            
-            # Filtrer pour ne garder que les enfants directs (pas les petits-enfants, etc.)
-            # Un enfant direct aura un path qui, une fois le préfixe retiré, ne contient plus de "."
-            children_df = potential_children[~potential_children['path'].astype(str).str.slice(start=len(child_path_prefix)).str.contains('.', na=False, regex=False)]
-
-        elif 'depth' in df.columns and pd.notna(current_row.get('depth')):
-             # Si depth existe et que le nœud courant a une profondeur,
-             # les enfants directs auront une profondeur de current_depth + 1
-             # et leur path commencera par le path du parent.
-            current_depth = int(current_row['depth'])
-            # S'assurer que current_path est une chaîne pour la comparaison str.startswith
-            current_path_str = str(current_path) if pd.notna(current_path) else ""
-
-            # Filtrer par profondeur et par le début du path
-            # (pour éviter de prendre des nœuds d'une autre branche ayant la même profondeur)
-            children_df = df[
-                (df['depth'] == current_depth + 1) &
-                (df['path'].astype(str).str.startswith(current_path_str + ('.' if current_path_str else ''), na=False))
-            ]
-        
-        children_count = len(children_df)
+        # Trouver les enfants (liste d'adjacence précalculée)
+        children_pks = index.children_of(current_pk)
+        children_count = len(children_pks)
         
-        if children_count > 0:
-            # Limiter le nombre d'enfants si nécessaire
-            if max_children > 0 and children_count > max_children:
-                children_df = children_df.head(max_children)
-                result["children_truncated"] = True
-                result["total_children"] = children_count
-            
-            # Extraire les informations des enfants
-            for _, child_row in children_df.iterrows():
-                # Vérifier si l'enfant a lui-même des enfants
-                # (simplifié, une vérification plus robuste serait nécessaire pour une UI complexe)
-                # Pour cette fonction, on peut se baser sur la présence d'enfants dans le dataframe
-                # en utilisant une logique similaire à celle ci-dessus.
-                # Pour l'instant, on met False, car le but est de lister les enfants directs.
-                child_info = {
-                    "pk": int(child_row.name), # .name est l'index (PK)
-                    "nom_vulgarise": child_row.get('nom_vulgarisé', ''), # nom_vulgarisé
-                    "description_courte": child_row.get('text_fr', ''),   # text_fr
-                    "famille": child_row.get('Famille', ''),             # Famille
-                    "has_children": False # Simplifié. Pourrait être calculé si besoin.
-                }
-                result["children"].append(child_info)
+        # Limiter le nombre d'enfants si nécessaire
+        if max_children > 0 and children_count > max_children:
+            children_pks = children_pks[:max_children]
+            result["children_truncated"] = True
+            result["total_children"] = children_count
+        
+        for child_pk in children_pks:
+            child_row = index.get(child_pk)
+            result["children"].append({
+                "pk": int(child_pk),
+                "nom_vulgarise": child_row.get('nom_vulgarisé', ''), # nom_vulgarisé
+                "description_courte": child_row.get('text_fr', ''),   # text_fr
+                "famille": child_row.get('Famille', ''),             # Famille
+                "has_children": bool(index.children_of(child_pk))
+            })
         
         return result
     
-    # La méthode _internal_get_children_details n'est plus explicitement appelée,
-    # sa logique est intégrée dans _internal_get_node_details et _internal_explore_hierarchy.
-    # Si elle devait être réactivée, elle nécessiterait une mise à jour similaire des noms de colonnes.
-    # Pour l'instant, nous la laissons telle quelle ou la commentons si elle n'est plus du tout utilisée.
-    # Par souci de propreté, si elle n'est pas utilisée, il vaut mieux la supprimer ou la commenter clairement.
-    # Pour cette passe, je vais la laisser mais noter qu'elle n'est pas au centre des modifications actuelles.
-    def _internal_get_children_details(self, pk: int, df: pd.DataFrame, max_children: int = 10) -> List[Dict[str, Any]]:
+    def _internal_get_children_details(self, pk: int, df: Union[TaxonomyIndex, pd.DataFrame], max_children: int = 10) -> List[Dict[str, Any]]:
         """
         Obtient les détails (PK, nom, description, exemple) des enfants directs d'un nœud spécifique.
 
         :param pk: La clé primaire (PK) du nœud parent.
         :type pk: int
-        :param df: Le DataFrame pandas de la taxonomie des sophismes.
-        :type df: pd.DataFrame
+        :param df: L'index de la taxonomie des sophismes (ou son DataFrame pandas).
+        :type df: Union[TaxonomyIndex, pd.DataFrame]
         :param max_children: Le nombre maximum d'enfants à retourner.
         :type max_children: int
         :return: Une liste de dictionnaires, chaque dictionnaire représentant un enfant
-                 avec ses détails. Retourne une liste vide si le DataFrame est None
+                 avec ses détails. Retourne une liste vide si la taxonomie est None
                  ou si aucun enfant n'est trouvé.
         :rtype: List[Dict[str, Any]]
         """
         children_details_list = [] # Renommé pour éviter conflit avec variable 'children'
         
-        if df is None:
+        index = self._as_taxonomy_index(df)
+        if index is None:
             return children_details_list
         
-        # Convertir les colonnes numériques si elles existent et ne sont pas déjà numériques
-        if 'PK' in df.columns and not pd.api.types.is_numeric_dtype(df['PK']):
-            df['PK'] = pd.to_numeric(df['PK'], errors='coerce')
-        if 'FK_Parent' in df.columns and not pd.api.types.is_numeric_dtype(df['FK_Parent']):
-            df['FK_Parent'] = pd.to_numeric(df['FK_Parent'], errors='coerce')
-        
-        # Trouver les enfants (nœuds dont le parent est le nœud courant)
-        child_nodes_df = pd.DataFrame() # Initialiser
-        if 'FK_Parent' in df.columns:
-            child_nodes_df = df[df['FK_Parent'] == pk]
-        elif 'parent_pk' in df.columns: # Fallback si FK_Parent n'existe pas
-            child_nodes_df = df[df['parent_pk'] == pk]
-        # Ajouter une logique basée sur 'path' et 'depth' si nécessaire, comme dans _internal_explore_hierarchy
-        
-        # Limiter le nombre d'enfants si nécessaire
-        if max_children > 0 and len(child_nodes_df) > max_children:
-            child_nodes_df = child_nodes_df.head(max_children)
+        children_pks = index.children_of(pk)
+        if max_children > 0:
+            children_pks = children_pks[:max_children]
         
-        # Extraire les informations des enfants
-        for _, child_row in child_nodes_df.iterrows():
-            child_info = {
-                "pk": int(child_row.name), # .name est l'index (PK)
+        for child_pk in children_pks:
+            child_row = index.get(child_pk)
+            children_details_list.append({
+                "pk": int(child_pk),
                 "nom_vulgarise": child_row.get('nom_vulgarisé', ''), # nom_vulgarisé
                 "description_courte": child_row.get('text_fr', ''),   # text_fr
                 "description_longue": child_row.get('desc_fr', ''), # desc_fr
                 "exemple": child_row.get('example_fr', ''), # example_fr
                 "famille": child_row.get('Famille', ''),         # Famille
                 "error": None
-            }
-            children_details_list.append(child_info)
+            })
         
         return children_details_list
     
-    def _internal_get_node_details(self, pk: int, df: pd.DataFrame) -> Dict[str, Any]:
+    def _internal_get_node_details(self, pk: int, df: Union[TaxonomyIndex, pd.DataFrame]) -> Dict[str, Any]:
         """
         Obtient les détails complets d'un nœud spécifique de la taxonomie,
         y compris les informations sur son parent et ses enfants directs.
 
         :param pk: La clé primaire (PK) du nœud dont les détails sont demandés.
         :type pk: int
-        :param df: Le DataFrame pandas de la taxonomie des sophismes.
-        :type df: pd.DataFrame
+        :param df: L'index de la taxonomie des sophismes (ou son DataFrame pandas).
+        :type df: Union[TaxonomyIndex, pd.DataFrame]
         :return: Un dictionnaire contenant tous les attributs du nœud, ainsi que
                  des informations sur son parent et ses enfants. Contient un champ `error`
                  si le nœud n'est pas trouvé ou si la taxonomie n'est pas disponible.
@@ -415,96 +382,44 @@ class InformalAnalysisPlugin:
             "error": None
         }
         
-        if df is None:
+        index = self._as_taxonomy_index(df)
+        if index is None:
             result["error"] = "Taxonomie sophismes non disponible."
             return result
         
-        # Convertir les colonnes numériques si elles existent et ne sont pas déjà numériques
-        if 'PK' in df.columns and not pd.api.types.is_numeric_dtype(df['PK']):
-            df['PK'] = pd.to_numeric(df['PK'], errors='coerce')
-        if 'depth' in df.columns and not pd.api.types.is_numeric_dtype(df['depth']):
-            df['depth'] = pd.to_numeric(df['depth'], errors='coerce')
-        
         # Trouver le nœud
-        node_df = df.loc[[pk]] if pk in df.index else pd.DataFrame()
-        if len(node_df) == 0:
+        row = index.get(pk)
+        if row is None:
             result["error"] = f"PK {pk} non trouvée dans la taxonomie."
             return result
-        # Extraire les informations du nœud
-        row = node_df.iloc[0]
-        # Suppression des logs de débogage
-        for col in row.index: # Utiliser row.index qui contient les noms des colonnes
-            if pd.notna(row[col]):
+        for col, value in row.items():
+            if pd.notna(value):
                 # Gérer la conversion pour numpy types si nécessaire pour la sérialisation JSON
-                if hasattr(row[col], 'item'): # Typique pour les types numpy (int64, float64, etc.)
-                    result[col] = row[col].item()
-                else:
-                    result[col] = row[col]
+                result[col] = value.item() if hasattr(value, 'item') else value
         
         # Trouver le parent
-        parent_df = pd.DataFrame() # Initialiser
-        parent_pk_val = None
-        if 'FK_Parent' in df.columns and pd.notna(row.get('FK_Parent')):
-            parent_pk_val = row.get('FK_Parent')
-        elif 'parent_pk' in df.columns and pd.notna(row.get('parent_pk')): # Fallback
-            parent_pk_val = row.get('parent_pk')
-        
-        if parent_pk_val is not None:
-            try:
-                parent_pk_int = int(parent_pk_val)
-                parent_df = df.loc[[parent_pk_int]] if parent_pk_int in df.index else pd.DataFrame()
-            except ValueError:
-                self._logger.warning(f"Valeur FK_Parent/parent_pk non entière pour le nœud {pk}: {parent_pk_val}")
-
-        elif 'path' in df.columns:
-            # Sinon, essayer d'utiliser path
-            path_val = row.get('path', '')
-            if path_val and '.' in str(path_val): # S'assurer que path_val est une chaîne
-                parent_path = str(path_val).rsplit('.', 1)[0]
-                parent_df = df[df['path'] == parent_path]
-        
-        if len(parent_df) > 0:
-            parent_row = parent_df.iloc[0]
+        parent_pk = index.parent_of(pk)
+        if parent_pk is not None:
+            parent_row = index.get(parent_pk)
             result["parent"] = {
-                "pk": int(parent_row.name), # .name est l'index (PK)
+                "pk": int(parent_pk),
                 "nom_vulgarise": parent_row.get('nom_vulgarisé', ''), # nom_vulgarisé
                 "description_courte": parent_row.get('text_fr', ''),   # text_fr
                 "famille": parent_row.get('Famille', '')              # Famille
             }
         
-        # Trouver les enfants (logique similaire à _internal_explore_hierarchy)
-        # children_list = [] # Renommé pour éviter conflit
-        # Pour être plus précis, on reprend la logique de _internal_explore_hierarchy pour les enfants directs
-        
-        child_nodes_for_details = pd.DataFrame()
-        current_path_for_children = row.get('path', '')
-        current_depth_for_children = row.get('depth', None)
-        
-        if 'FK_Parent' in df.columns:
-            child_nodes_for_details = df[df['FK_Parent'] == pk]
-        elif 'parent_pk' in df.columns:
-            child_nodes_for_details = df[df['parent_pk'] == pk]
-        elif 'path' in df.columns and current_path_for_children:
-            child_path_prefix = str(current_path_for_children) + "."
-            potential_children = df[df['path'].astype(str).str.startswith(child_path_prefix, na=False)]
-            child_nodes_for_details = potential_children[~potential_children['path'].astype(str).str.slice(start=len(child_path_prefix)).str.contains('.', na=False, regex=False)]
-        elif 'depth' in df.columns and pd.notna(current_depth_for_children):
-            current_path_str_for_children = str(current_path_for_children) if pd.notna(current_path_for_children) else ""
-            child_nodes_for_details = df[
-                (df['depth'] == int(current_depth_for_children) + 1) &
-                (df['path'].astype(str).str.startswith(current_path_str_for_children + ('.' if current_path_str_for_children else ''), na=False))
-            ]
-
-        if len(child_nodes_for_details) > 0:
+        # Trouver les enfants directs
+        children_pks = index.children_of(pk)
+        if children_pks:
             result["children"] = []
-            for _, child_row_detail in child_nodes_for_details.iterrows():
-                child_info_detail = {
-                    "pk": int(child_row_detail.name),
-                    "nom_vulgarise": child_row_detail.get('nom_vulgarisé', ''), # nom_vulgarisé
-                    "description_courte": child_row_detail.get('text_fr', ''),   # text_fr
-                    "famille": child_row_detail.get('Famille', '')              # Famille
-                }
-                result["children"].append(child_info_detail)
+            for child_pk in children_pks:
+                child_row = index.get(child_pk)
+                result["children"].append({
+                    "pk": int(child_pk),
+                    "nom_vulgarise": child_row.get('nom_vulgarisé', ''), # nom_vulgarisé
+                    "description_courte": child_row.get('text_fr', ''),   # text_fr
+                    "famille": child_row.get('Famille', '')              # Famille
+                })
         
         return result
     
@@ -535,12 +450,12 @@ class InformalAnalysisPlugin:
             self._logger.error(f"PK invalide: {current_pk_str}")
             return json.dumps({"error": f"PK invalide: {current_pk_str}"})
         
-        df = self._get_taxonomy_dataframe()
-        if df is None: # Vérifier si df est None après l'appel
+        index = self._get_taxonomy_index()
+        if index is None:
             self._logger.error("Taxonomie sophismes non disponible (DataFrame est None).")
             return json.dumps({"error": "Taxonomie sophismes non disponible."})
         
-        result = self._internal_explore_hierarchy(current_pk, df, max_children)
+        result = self._internal_explore_hierarchy(current_pk, index, max_children)
         if result.get("error"):
             self._logger.warning(f" -> Erreur exploration PK {current_pk}: {result['error']}")
         else:
@@ -581,12 +496,12 @@ class InformalAnalysisPlugin:
             result_error["error"] = f"PK invalide: {fallacy_pk_str}"
             return json.dumps(result_error)
         
-        df = self._get_taxonomy_dataframe()
-        if df is None: # Vérifier si df est None
+        index = self._get_taxonomy_index()
+        if index is None:
             self._logger.error("Taxonomie sophismes non disponible (DataFrame est None).")
             return json.dumps({"pk_requested": fallacy_pk, "error": "Taxonomie sophismes non disponible."})
         
-        details = self._internal_get_node_details(fallacy_pk, df)
+        details = self._internal_get_node_details(fallacy_pk, index)
         if details.get("error"):
              self._logger.warning(f" -> Erreur récupération détails PK {fallacy_pk}: {details['error']}")
         else:
@@ -615,37 +530,19 @@ class InformalAnalysisPlugin:
         :rtype: str
         """
         self._logger.info(f"Recherche de la définition pour le sophisme: '{fallacy_name}'")
-        df = self._get_taxonomy_dataframe()
-        if df is None:
+        index = self._get_taxonomy_index()
+        if index is None:
             return json.dumps({"error": "Taxonomie non disponible."})
 
-        # Recherche cas insensible dans 'nom_vulgarisé' et 'text_fr' (pour la taxonomie réelle)
-        # 'fallacy_type' n'est pas une colonne standard de la taxonomie réelle pour le nom principal.
-        
-        condition_nom_vulgarise = pd.Series(False, index=df.index)
-        if 'nom_vulgarisé' in df.columns:
-            condition_nom_vulgarise = df['nom_vulgarisé'].fillna('').astype(str).str.contains(fallacy_name, case=False, na=False)
-        
-        condition_text_fr = pd.Series(False, index=df.index)
-        if 'text_fr' in df.columns: # text_fr peut aussi contenir des noms/labels
-            condition_text_fr = df['text_fr'].fillna('').astype(str).str.contains(fallacy_name, case=False, na=False)
-            
-        # On peut aussi chercher dans 'Latin' si pertinent
-        condition_latin = pd.Series(False, index=df.index)
-        if 'Latin' in df.columns:
-            condition_latin = df['Latin'].fillna('').astype(str).str.contains(fallacy_name, case=False, na=False)
-
-        found_fallacy = df[condition_nom_vulgarise | condition_text_fr | condition_latin]
+        # Recherche cas insensible dans 'nom_vulgarisé', 'text_fr' et 'Latin' (nom exact, sinon sous-chaîne)
+        pk_found = index.find_by_name(fallacy_name)
 
-        if not found_fallacy.empty:
-            # Prendre la première occurrence si plusieurs
+        if pk_found is not None:
+            found_fallacy = index.get(pk_found)
             # Utiliser 'desc_fr' pour la définition
-            definition = found_fallacy.iloc[0].get('desc_fr', "Définition non disponible.")
-            
-            # Gérer l'absence de 'PK' comme index
-            pk_found = found_fallacy.iloc[0].name if df.index.name == 'PK' else found_fallacy.index[0]
+            definition = found_fallacy.get('desc_fr', "Définition non disponible.")
             # Le nom trouvé est prioritairement 'nom_vulgarisé', sinon 'text_fr', sinon le nom cherché
-            name_found = found_fallacy.iloc[0].get('nom_vulgarisé', found_fallacy.iloc[0].get('text_fr', fallacy_name))
+            name_found = found_fallacy.get('nom_vulgarisé', found_fallacy.get('text_fr', fallacy_name))
 
             self._logger.info(f"Définition trouvée pour '{name_found}' (PK: {pk_found}).")
             return json.dumps({"fallacy_name": name_found, "pk": int(pk_found), "definition": definition}, default=str)
@@ -665,12 +562,12 @@ class InformalAnalysisPlugin:
         :rtype: str
         """
         self._logger.info("Listage des catégories de sophismes...")
-        df = self._get_taxonomy_dataframe()
-        if df is None:
+        index = self._get_taxonomy_index()
+        if index is None:
             return json.dumps({"error": "Taxonomie non disponible."})
 
-        if 'Famille' in df.columns:
-            categories = df['Famille'].dropna().unique().tolist()
+        if 'Famille' in index.columns:
+            categories = index.categories()
             if categories:
                 self._logger.info(f"{len(categories)} catégories trouvées.")
                 return json.dumps({"categories": categories}, default=str)
@@ -698,21 +595,21 @@ class InformalAnalysisPlugin:
         :rtype: str
         """
         self._logger.info(f"Listage des sophismes dans la catégorie: '{category_name}'")
-        df = self._get_taxonomy_dataframe()
-        if df is None:
+        index = self._get_taxonomy_index()
+        if index is None:
             return json.dumps({"error": "Taxonomie non disponible."})
 
-        if 'Famille' not in df.columns:
+        if 'Famille' not in index.columns:
             self._logger.warning("Colonne 'Famille' non trouvée pour lister les sophismes par catégorie.")
             return json.dumps({"category": category_name, "fallacies": [], "error": "Colonne 'Famille' pour les catégories non trouvée."})
 
         # Filtrer par catégorie (cas sensible pour correspondre aux valeurs exactes de 'Famille')
-        fallacies_in_cat_df = df[df['Famille'] == category_name]
+        fallacies_in_cat = index.in_category(category_name)
 
-        if not fallacies_in_cat_df.empty:
+        if fallacies_in_cat:
             result_list = []
-            for index, row in fallacies_in_cat_df.iterrows():
-                pk_val = index # PK est l'index
+            for pk_val in fallacies_in_cat:
+                row = index.get(pk_val)
                 # Utiliser nom_vulgarisé, sinon text_fr
                 name_val = row.get('nom_vulgarisé', row.get('text_fr', 'Nom non disponible'))
                 result_list.append({
@@ -739,30 +636,18 @@ class InformalAnalysisPlugin:
         :rtype: str
         """
         self._logger.info(f"Recherche d'un exemple pour le sophisme: '{fallacy_name}'")
-        df = self._get_taxonomy_dataframe()
-        if df is None:
+        index = self._get_taxonomy_index()
+        if index is None:
             return json.dumps({"error": "Taxonomie non disponible."})
 
-        # Recherche cas insensible dans 'nom_vulgarisé' et 'text_fr' (pour la taxonomie réelle)
-        condition_nom_vulgarise = pd.Series(False, index=df.index)
-        if 'nom_vulgarisé' in df.columns:
-            condition_nom_vulgarise = df['nom_vulgarisé'].fillna('').astype(str).str.contains(fallacy_name, case=False, na=False)
-        
-        condition_text_fr = pd.Series(False, index=df.index)
-        if 'text_fr' in df.columns:
-            condition_text_fr = df['text_fr'].fillna('').astype(str).str.contains(fallacy_name, case=False, na=False)
-
-        condition_latin = pd.Series(False, index=df.index)
-        if 'Latin' in df.columns:
-            condition_latin = df['Latin'].fillna('').astype(str).str.contains(fallacy_name, case=False, na=False)
-
-        found_fallacy = df[condition_nom_vulgarise | condition_text_fr | condition_latin]
+        # Même recherche que find_fallacy_definition
+        pk_found = index.find_by_name(fallacy_name)
 
-        if not found_fallacy.empty:
+        if pk_found is not None:
+            found_fallacy = index.get(pk_found)
             # Utiliser 'example_fr' pour l'exemple
-            example = found_fallacy.iloc[0].get('example_fr', "Exemple non disponible.")
-            pk_found = found_fallacy.iloc[0].name if df.index.name == 'PK' else found_fallacy.index[0]
-            name_found = found_fallacy.iloc[0].get('nom_vulgarisé', found_fallacy.iloc[0].get('text_fr', fallacy_name))
+            example = found_fallacy.get('example_fr', "Exemple non disponible.")
+            name_found = found_fallacy.get('nom_vulgarisé', found_fallacy.get('text_fr', fallacy_name))
 
             self._logger.info(f"Exemple trouvé pour '{name_found}' (PK: {pk_found}).")
             return json.dumps({"fallacy_name": name_found, "pk": int(pk_found), "example": example}, default=str)
@@ -0,0 +1,300 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Index en mémoire de la taxonomie des sophismes.
+
+Les fonctions natives de `InformalAnalysisPlugin` parcouraient le DataFrame de
+la taxonomie (environ 1 400 lignes) à chaque appel : filtres sur les colonnes
+de parenté ou sur `path`, trois recherches `str.contains` pour retrouver un
+sophisme par son nom, puis `iterrows()` pour construire les résultats.
+`TaxonomyIndex` est construit une seule fois à partir du DataFrame et répond à
+ces requêtes par des accès à des dictionnaires :
+
+- PK → ligne (dictionnaire colonne → valeur, valeurs brutes du DataFrame) ;
+- parent → enfants directs, selon la colonne de parenté (`FK_Parent` ou
+  `parent_pk`), à défaut selon `path` ("1.2" est le parent de "1.2.3"), ou
+  par profondeur pour les nœuds sans chemin ;
+- nom normalisé (`nom_vulgarisé`, `text_fr`) et nom latin (`Latin`) → PK ;
+- trigrammes des noms → lignes, pour la recherche par sous-chaîne ;
+- catégorie (`Famille`) → PKs.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger("TaxonomyIndex")
+
+PARENT_COLUMNS = ("FK_Parent", "parent_pk")
+NAME_COLUMNS = ("nom_vulgarisé", "text_fr")
+LATIN_COLUMN = "Latin"
+CATEGORY_COLUMN = "Famille"
+NGRAM_SIZE = 3
+
+
+def _is_missing(value: Any) -> bool:
+    """Équivalent de `pd.isna` pour une valeur scalaire (None, NaN, NaT, pd.NA)."""
+    if value is None:
+        return True
+    try:
+        return bool(value != value)
+    except TypeError:
+        # pd.NA != pd.NA est lui-même pd.NA, dont la valeur de vérité est indéfinie
+        return True
+
+
+def _to_number(value: Any) -> Optional[float]:
+    """Convertit une valeur en nombre comme `pd.to_numeric(errors='coerce')` (None si impossible)."""
+    if _is_missing(value) or isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if number != number else number
+
+
+def normalize_name(value: Any) -> str:
+    """
+    Normalise un nom de sophisme pour la recherche : casse et espaces ignorés.
+
+    :param value: Le nom (toute valeur est convertie en chaîne).
+    :type value: Any
+    :return: Le nom normalisé.
+    :rtype: str
+    """
+    return " ".join(str(value).casefold().split())
+
+
+def _ngrams(text: str) -> Set[str]:
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class TaxonomyIndex:
+    """
+    Index de la taxonomie des sophismes, construit une fois au chargement.
+
+    Les lignes sont conservées telles quelles ; les listes (enfants, catégories)
+    respectent l'ordre des lignes du DataFrame.
+
+    Attributes:
+        columns (List[str]): Les colonnes de la taxonomie (hors index PK).
+    """
+
+    def __init__(self, rows: Iterable[Tuple[Any, Dict[str, Any]]], columns: Iterable[str]):
+        """
+        Construit l'index.
+
+        :param rows: Les lignes de la taxonomie, dans l'ordre : couples (PK, {colonne: valeur}).
+        :type rows: Iterable[Tuple[Any, Dict[str, Any]]]
+        :param columns: Les colonnes de la taxonomie.
+        :type columns: Iterable[str]
+        """
+        self.columns = list(columns)
+        self._parent_column = next((column for column in PARENT_COLUMNS if column in self.columns), None)
+        search_columns = [column for column in NAME_COLUMNS + (LATIN_COLUMN,) if column in self.columns]
+
+        self._nodes: Dict[Any, Dict[str, Any]] = {}
+        self._row_pks: List[Any] = []
+        self._search_texts: List[Tuple[str, ...]] = []
+        self._pk_by_name: Dict[str, Any] = {}
+        self._pk_by_latin: Dict[str, Any] = {}
+        self._ngram_rows: Dict[str, Set[int]] = defaultdict(set)
+        self._children_by_parent: Dict[Any, List[Any]] = defaultdict(list)
+        self._children_by_path: Dict[str, List[Any]] = defaultdict(list)
+        self._pk_by_path: Dict[Any, Any] = {}
+        self._depths: Dict[Any, Optional[float]] = {}
+        self._pks_by_depth: Dict[float, List[Any]] = defaultdict(list)
+        self._pks_by_category: Dict[Any, List[Any]] = {}
+
+        for position, (pk, row) in enumerate(rows):
+            # En cas de PK dupliquée, la première ligne fait foi (comme df.loc[[pk]].iloc[0])
+            self._nodes.setdefault(pk, row)
+            self._row_pks.append(pk)
+
+            texts = tuple(
+                "" if _is_missing(row.get(column)) else normalize_name(row.get(column))
+                for column in search_columns
+            )
+            self._search_texts.append(texts)
+            for column, text in zip(search_columns, texts):
+                if text:
+                    table = self._pk_by_latin if column == LATIN_COLUMN else self._pk_by_name
+                    table.setdefault(text, pk)
+            for text in set(texts):
+                for gram in _ngrams(text):
+                    self._ngram_rows[gram].add(position)
+
+            if self._parent_column is not None:
+                parent = row.get(self._parent_column)
+                if not _is_missing(parent):
+                    number = _to_number(parent)
+                    self._children_by_parent[parent if number is None else number].append(pk)
+            path = row.get("path")
+            if not _is_missing(path):
+                self._pk_by_path.setdefault(path, pk)
+                if "." in str(path):
+                    self._children_by_path[str(path).rsplit(".", 1)[0]].append(pk)
+            depth = _to_number(row.get("depth"))
+            self._depths.setdefault(pk, depth)
+            if depth is not None:
+                self._pks_by_depth[depth].append(pk)
+
+            category = row.get(CATEGORY_COLUMN)
+            if not _is_missing(category):
+                self._pks_by_category.setdefault(category, []).append(pk)
+
+        logger.info(f"Index de taxonomie construit: {len(self._nodes)} nœuds, {len(self._ngram_rows)} trigrammes.")
+
+    @classmethod
+    def from_dataframe(cls, df: Any) -> "TaxonomyIndex":
+        """
+        Construit l'index à partir du DataFrame de la taxonomie (indexé par PK).
+
+        :param df: Le DataFrame pandas de la taxonomie.
+        :type df: pd.DataFrame
+        :return: L'index.
+        :rtype: TaxonomyIndex
+        """
+        return cls(zip(df.index, df.to_dict("records")), df.columns)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, pk: Any) -> bool:
+        return pk in self._nodes
+
+    def get(self, pk: Any) -> Optional[Dict[str, Any]]:
+        """
+        Récupère la ligne d'un nœud.
+
+        :param pk: La PK du nœud.
+        :type pk: Any
+        :return: La ligne (à ne pas modifier), ou None si la PK est inconnue.
+        :rtype: Optional[Dict[str, Any]]
+        """
+        return self._nodes.get(pk)
+
+    def depth_of(self, pk: Any) -> Optional[float]:
+        """
+        Récupère la profondeur numérique d'un nœud.
+
+        :param pk: La PK du nœud.
+        :type pk: Any
+        :return: La profondeur, ou None si elle est absente ou non numérique.
+        :rtype: Optional[float]
+        """
+        return self._depths.get(pk)
+
+    def children_of(self, pk: Any) -> List[Any]:
+        """
+        Récupère les PKs des enfants directs d'un nœud.
+
+        La colonne de parenté (`FK_Parent`, sinon `parent_pk`) est prioritaire ;
+        à défaut, un enfant direct a pour chemin celui du nœud suivi d'un segment ;
+        pour un nœud sans chemin, les enfants sont les nœuds de profondeur
+        immédiatement supérieure.
+
+        :param pk: La PK du nœud.
+        :type pk: Any
+        :return: Les PKs des enfants, dans l'ordre des lignes (liste vide si la PK est inconnue).
+        :rtype: List[Any]
+        """
+        node = self._nodes.get(pk)
+        if node is None:
+            return []
+        if self._parent_column is not None:
+            return list(self._children_by_parent.get(pk, ()))
+
+        path = node.get("path", "")
+        if "path" in self.columns and path:
+            return list(self._children_by_path.get(str(path), ()))
+
+        depth = self._depths.get(pk)
+        if "depth" not in self.columns or depth is None:
+            return []
+        path_str = "" if _is_missing(path) else str(path)
+        prefix = path_str + ("." if path_str else "")
+        return [
+            child for child in self._pks_by_depth.get(float(int(depth) + 1), ())
+            if str(self._nodes[child].get("path", "")).startswith(prefix)
+        ]
+
+    def parent_of(self, pk: Any) -> Optional[Any]:
+        """
+        Récupère la PK du parent d'un nœud.
+
+        :param pk: La PK du nœud.
+        :type pk: Any
+        :return: La PK du parent, ou None (racine, parent inconnu ou PK inconnue).
+        :rtype: Optional[Any]
+        """
+        node = self._nodes.get(pk)
+        if node is None:
+            return None
+        if self._parent_column is not None:
+            parent = node.get(self._parent_column)
+            if not _is_missing(parent):
+                number = _to_number(parent)
+                if number is None:
+                    logger.warning(f"Valeur {self._parent_column} non entière pour le nœud {pk}: {parent}")
+                    return None
+                return int(number) if int(number) in self._nodes else None
+        if "path" in self.columns:
+            path = node.get("path", "")
+            if path and "." in str(path):
+                return self._pk_by_path.get(str(path).rsplit(".", 1)[0])
+        return None
+
+    def find_by_name(self, name: str) -> Optional[Any]:
+        """
+        Recherche un sophisme par son nom, sans tenir compte de la casse ni des espaces.
+
+        Un nom identique (`nom_vulgarisé` ou `text_fr`, puis `Latin`) est
+        prioritaire ; sinon, la première ligne dont un de ces noms contient
+        `name` est retenue. Les candidats de la recherche par sous-chaîne sont
+        les lignes qui contiennent tous les trigrammes de `name`.
+
+        :param name: Le nom recherché (ou une partie du nom).
+        :type name: str
+        :return: La PK du sophisme trouvé, ou None.
+        :rtype: Optional[Any]
+        """
+        query = normalize_name(name)
+        for table in (self._pk_by_name, self._pk_by_latin):
+            if query in table:
+                return table[query]
+
+        if len(query) >= NGRAM_SIZE:
+            postings = [self._ngram_rows.get(gram) for gram in _ngrams(query)]
+            if not all(postings):
+                return None
+            postings.sort(key=len)
+            candidates: Iterable[int] = sorted(set.intersection(*postings))
+        else:
+            candidates = range(len(self._row_pks))
+        for position in candidates:
+            if any(query in text for text in self._search_texts[position]):
+                return self._row_pks[position]
+        return None
+
+    def categories(self) -> List[Any]:
+        """
+        Liste les catégories (`Famille`) dans l'ordre de leur première apparition.
+
+        :return: Les catégories.
+        :rtype: List[Any]
+        """
+        return list(self._pks_by_category)
+
+    def in_category(self, category: Any) -> List[Any]:
+        """
+        Liste les PKs des sophismes d'une catégorie (valeur exacte de `Famille`).
+
+        :param category: La catégorie.
+        :type category: Any
+        :return: Les PKs, dans l'ordre des lignes.
+        :rtype: List[Any]
+        """
+        return list(self._pks_by_category.get(category, ()))
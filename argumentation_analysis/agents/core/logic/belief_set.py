@@ -1,10 +1,54 @@
 # argumentation_analysis/agents/core/logic/belief_set.py
 """
 Classes pour représenter les ensembles de croyances.
+
+Un ensemble de croyances conserve son texte source, mais aussi la liste de
+ses formules (découpée une seule fois, à la première utilisation), un
+condensat stable de son contenu, sa signature éventuelle et l'objet Java
+construit par le dernier handler qui l'a parsé. Les handlers acceptent ces
+objets à la place des chaînes et n'ont alors plus à découper, nettoyer ni
+re-parser le texte.
 """
 
+import re
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, Hashable, List, Optional, Tuple, Union
+
+from .parse_cache import ParseCache
+
+_FORMULA_SEPARATORS = re.compile(r"[;\n]")
+
+
+def strip_comment(formula_str: str) -> str:
+    """
+    Retire d'une formule (ou d'une ligne) le commentaire Tweety : ce qui suit un '%'.
+
+    Args:
+        formula_str: La formule
+
+    Returns:
+        La formule sans commentaire ni espaces de bord
+    """
+    return formula_str.split('%')[0].strip()
+
+
+def split_formulas(knowledge_base_str: str) -> List[str]:
+    """
+    Découpe un ensemble de croyances en formules.
+
+    Les formules sont séparées par des points-virgules ou des retours à la
+    ligne ; ce qui suit un '%' (commentaire Tweety) est ignoré.
+
+    Args:
+        knowledge_base_str: Le texte de l'ensemble de croyances
+
+    Returns:
+        Les formules, dans l'ordre, sans doublons
+    """
+    lines = (strip_comment(line) for line in knowledge_base_str.replace("\\n", "\n").splitlines())
+    formulas = (formula.strip() for line in lines for formula in _FORMULA_SEPARATORS.split(line))
+    return list(OrderedDict.fromkeys(formula for formula in formulas if formula))
 
 
 class BeliefSet(ABC):
@@ -12,15 +56,38 @@ class BeliefSet(ABC):
     Classe abstraite de base pour représenter un ensemble de croyances.
     """
     
-    def __init__(self, content: str):
+    def __init__(self, content: str, signature: Optional[str] = None):
         """
         Initialise un ensemble de croyances.
 
         :param content: Le contenu textuel représentant l'ensemble de croyances
                         dans la logique spécifique.
         :type content: str
+        :param signature: Déclarations de signature (FOL ou modal), optionnelles.
+        :type signature: Optional[str]
         """
         self._content = content
+        self._signature = signature
+        self._formulas: Optional[Tuple[str, ...]] = None
+        self._content_hash: Optional[str] = None
+        self._java_object: Optional[Tuple[Hashable, Any]] = None
+
+    @classmethod
+    def from_formulas(cls, formulas: List[str], signature: Optional[str] = None) -> 'BeliefSet':
+        """
+        Crée un ensemble de croyances à partir de formules déjà découpées.
+
+        :param formulas: Les formules, sans séparateur ni commentaire.
+        :type formulas: List[str]
+        :param signature: Déclarations de signature, optionnelles.
+        :type signature: Optional[str]
+        :return: L'ensemble de croyances, dont le contenu est la liste des formules jointes par "; ".
+        :rtype: BeliefSet
+        """
+        formulas = tuple(OrderedDict.fromkeys(formula.strip() for formula in formulas if formula.strip()))
+        belief_set = cls("; ".join(formulas), signature)
+        belief_set._formulas = formulas
+        return belief_set
     
     @property
     def content(self) -> str:
@@ -31,6 +98,88 @@ class BeliefSet(ABC):
         :rtype: str
         """
         return self._content
+
+    @property
+    def formulas(self) -> Tuple[str, ...]:
+        """
+        Retourne les formules de l'ensemble, découpées une seule fois (voir `split_formulas`).
+
+        :return: Les formules, dans l'ordre, sans doublons ni commentaires.
+        :rtype: Tuple[str, ...]
+        """
+        if self._formulas is None:
+            self._formulas = tuple(split_formulas(self._content))
+        return self._formulas
+
+    @property
+    def canonical_content(self) -> str:
+        """
+        Retourne le contenu normalisé : les formules jointes par "; ".
+
+        :return: Le contenu normalisé.
+        :rtype: str
+        """
+        return "; ".join(self.formulas)
+
+    @property
+    def content_hash(self) -> str:
+        """
+        Retourne le condensat du contenu normalisé.
+
+        Deux ensembles ne différant que par la mise en forme (espaces, retours
+        à la ligne, commentaires) ont le même condensat. Il est identique à
+        `ParseCache.content_hash(canonical_content)` : les caches de parsing
+        peuvent l'utiliser directement comme clé.
+
+        :return: Le condensat hexadécimal.
+        :rtype: str
+        """
+        if self._content_hash is None:
+            self._content_hash = ParseCache.content_hash(self.canonical_content)
+        return self._content_hash
+
+    @property
+    def signature(self) -> Optional[str]:
+        """
+        Retourne les déclarations de signature de l'ensemble.
+
+        :return: Les déclarations, ou None.
+        :rtype: Optional[str]
+        """
+        return self._signature
+
+    def get_java_object(self, context: Hashable = None) -> Any:
+        """
+        Retourne l'objet Java construit pour cet ensemble dans un contexte de parsing donné.
+
+        :param context: Le contexte de parsing (logique, logique modale, signature...).
+        :type context: Hashable
+        :return: L'objet Java, ou None s'il n'a pas été construit dans ce contexte.
+        """
+        if self._java_object is not None and self._java_object[0] == context:
+            return self._java_object[1]
+        return None
+
+    def set_java_object(self, java_object: Any, context: Hashable = None) -> None:
+        """
+        Associe à l'ensemble l'objet Java construit dans un contexte de parsing.
+
+        L'objet est partagé avec le cache de parsing : il ne doit pas être modifié.
+        Il n'est ni sérialisé ni copié avec l'ensemble.
+
+        :param java_object: L'objet Java (par exemple un PlBeliefSet).
+        :param context: Le contexte de parsing.
+        :type context: Hashable
+        """
+        self._java_object = (context, java_object)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_java_object"] = None
+        return state
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._content!r})"
     
     @property
     @abstractmethod
@@ -49,13 +198,18 @@ class BeliefSet(ABC):
         """
         Convertit l'instance `BeliefSet` en un dictionnaire.
 
-        :return: Un dictionnaire contenant le type de logique et le contenu.
+        :return: Un dictionnaire contenant le type de logique, le contenu, le condensat
+                 du contenu et, si elle est définie, la signature.
         :rtype: Dict[str, Any]
         """
-        return {
+        data = {
             "logic_type": self.logic_type,
-            "content": self.content
+            "content": self.content,
+            "content_hash": self.content_hash
         }
+        if self._signature is not None:
+            data["signature"] = self._signature
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Optional['BeliefSet']:
@@ -64,23 +218,25 @@ class BeliefSet(ABC):
 
         La sous-classe est déterminée par la valeur de la clé "logic_type" dans `data`.
 
-        :param data: Dictionnaire contenant les clés "logic_type" et "content".
+        :param data: Dictionnaire contenant les clés "logic_type" et "content" (ou "formulas"),
+                     et éventuellement "signature". "content_hash" est ignoré et recalculé.
         :type data: Dict[str, Any]
         :return: Une instance de `PropositionalBeliefSet`, `FirstOrderBeliefSet`,
                  ou `ModalBeliefSet`, ou None si `logic_type` n'est pas supporté.
         :rtype: Optional[BeliefSet]
         """
         logic_type = data.get("logic_type", "").lower()
-        content = data.get("content", "")
-        
-        if logic_type == "propositional":
-            return PropositionalBeliefSet(content)
-        elif logic_type == "first_order":
-            return FirstOrderBeliefSet(content)
-        elif logic_type == "modal":
-            return ModalBeliefSet(content)
-        else:
+        belief_set_classes = {
+            "propositional": PropositionalBeliefSet,
+            "first_order": FirstOrderBeliefSet,
+            "modal": ModalBeliefSet
+        }
+        belief_set_class = belief_set_classes.get(logic_type)
+        if belief_set_class is None:
             return None
+        if "formulas" in data and "content" not in data:
+            return belief_set_class.from_formulas(data["formulas"], data.get("signature"))
+        return belief_set_class(data.get("content", ""), data.get("signature"))
 
 
 class PropositionalBeliefSet(BeliefSet):
@@ -128,4 +284,23 @@ class ModalBeliefSet(BeliefSet):
         :return: "modal"
         :rtype: str
         """
-        return "modal"
\ No newline at end of file
+        return "modal"
+
+
+def as_belief_set(knowledge_base: Union[str, BeliefSet], belief_set_class: type,
+                  signature: Optional[str] = None) -> BeliefSet:
+    """
+    Retourne un ensemble de croyances structuré, en créant au besoin un objet à partir d'un texte.
+
+    :param knowledge_base: Un texte (formules séparées par ';') ou un ensemble de croyances.
+    :type knowledge_base: Union[str, BeliefSet]
+    :param belief_set_class: La classe à instancier pour un texte.
+    :type belief_set_class: type
+    :param signature: Déclarations de signature pour un texte.
+    :type signature: Optional[str]
+    :return: L'ensemble de croyances.
+    :rtype: BeliefSet
+    """
+    if isinstance(knowledge_base, BeliefSet):
+        return knowledge_base
+    return belief_set_class(knowledge_base, signature)
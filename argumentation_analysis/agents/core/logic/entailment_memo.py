@@ -0,0 +1,235 @@
+# argumentation_analysis/agents/core/logic/entailment_memo.py
+"""
+Mémoïsation persistante des résultats d'inférence (SQLite).
+
+Les agents logiques posent souvent la même question d'un tour de conversation
+à l'autre. `EntailmentMemo` enregistre dans un fichier SQLite local les
+résultats `(type de logique, condensat de l'ensemble de croyances normalisé,
+opération, requête normalisée) -> booléen`, consultés par `PLHandler` avant
+tout appel au raisonneur SAT.
+
+La normalisation suit la lecture de l'ensemble de croyances par le parseur :
+les formules sont découpées comme pour le parsing (`split_formulas` : ';' et
+retours à la ligne, commentaires '%' ignorés), les espaces autour des
+opérateurs supprimés et les autres réduits à un seul, puis les formules sont
+dédoublonnées et triées, de sorte que deux écritures du même ensemble
+partagent leurs résultats sans que deux ensembles différents se confondent.
+
+La mémoïsation est désactivée par défaut ; elle est activée en passant une
+instance à `TweetyBridge`/`PLHandler`, ou en définissant la variable
+d'environnement `TWEETY_ENTAILMENT_MEMO` (chemin du fichier SQLite).
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .belief_set import BeliefSet, split_formulas, strip_comment
+
+logger = logging.getLogger("Orchestration.EntailmentMemo")
+
+ENTAILMENT_MEMO_ENV_VAR = "TWEETY_ENTAILMENT_MEMO"
+
+OPERATION_QUERY = "query"
+OPERATION_CONSISTENCY = "consistency"
+
+_WHITESPACE = re.compile(r"\s+")
+_OPERATOR_SPACES = re.compile(r"\s*([^\w\s])\s*")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entailments (
+    logic_type TEXT NOT NULL,
+    kb_hash TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    query TEXT NOT NULL,
+    result INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (logic_type, kb_hash, operation, query)
+)
+"""
+
+
+class EntailmentMemo:
+    """
+    Table persistante des résultats d'inférence, partageable entre processus.
+
+    Attributes:
+        path (str): Chemin du fichier SQLite (":memory:" pour une table volatile).
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        """
+        Ouvre (ou crée) la table de mémoïsation.
+
+        Args:
+            path: Chemin du fichier SQLite (":memory:" pour une table volatile)
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        if self.path != ":memory:":
+            # WAL : lectures concurrentes depuis plusieurs processus pendant une écriture
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0}
+
+    @staticmethod
+    def normalize_formula(formula: str) -> str:
+        """
+        Normalise une formule : suppression du commentaire '%', des espaces
+        autour des opérateurs, et réduction des autres espaces à un seul.
+
+        Args:
+            formula: La formule à normaliser
+
+        Returns:
+            La formule normalisée
+        """
+        formula = _WHITESPACE.sub(" ", strip_comment(formula))
+        return _OPERATOR_SPACES.sub(r"\1", formula)
+
+    @classmethod
+    def normalize_belief_set(cls, knowledge_base: Union[str, BeliefSet]) -> str:
+        """
+        Normalise un ensemble de croyances en une liste triée de formules uniques.
+
+        Args:
+            knowledge_base: Les formules (séparées par ';' ou des retours à la ligne) ou un ensemble de croyances
+
+        Returns:
+            Les formules normalisées, triées et jointes par ';'
+        """
+        formulas = knowledge_base.formulas if isinstance(knowledge_base, BeliefSet) else split_formulas(knowledge_base)
+        return ";".join(sorted({cls.normalize_formula(formula) for formula in formulas}))
+
+    @classmethod
+    def belief_set_hash(cls, knowledge_base: Union[str, BeliefSet]) -> str:
+        """
+        Calcule le condensat d'un ensemble de croyances normalisé.
+
+        Args:
+            knowledge_base: Les formules ou un ensemble de croyances
+
+        Returns:
+            Le condensat hexadécimal
+        """
+        return hashlib.sha256(cls.normalize_belief_set(knowledge_base).encode("utf-8")).hexdigest()
+
+    def lookup(self, logic_type: str, knowledge_base: Union[str, BeliefSet], operation: str, query: str = "") -> Optional[bool]:
+        """
+        Recherche un résultat mémorisé.
+
+        Args:
+            logic_type: Type de logique ("pl", ...)
+            knowledge_base: L'ensemble de croyances
+            operation: OPERATION_QUERY ou OPERATION_CONSISTENCY
+            query: La requête (vide pour une vérification de cohérence)
+
+        Returns:
+            Le résultat mémorisé, ou None s'il est absent
+        """
+        key = (logic_type, self.belief_set_hash(knowledge_base), operation, self.normalize_formula(query))
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT result FROM entailments WHERE logic_type = ? AND kb_hash = ? AND operation = ? AND query = ?",
+                key
+            ).fetchone()
+            self._stats["hits" if row is not None else "misses"] += 1
+        return bool(row[0]) if row is not None else None
+
+    def store(self, logic_type: str, knowledge_base: Union[str, BeliefSet], operation: str, query: str, result: bool) -> None:
+        """
+        Mémorise un résultat.
+
+        Args:
+            logic_type: Type de logique ("pl", ...)
+            knowledge_base: L'ensemble de croyances
+            operation: OPERATION_QUERY ou OPERATION_CONSISTENCY
+            query: La requête (vide pour une vérification de cohérence)
+            result: Le résultat du raisonneur
+        """
+        key = (logic_type, self.belief_set_hash(knowledge_base), operation, self.normalize_formula(query))
+        with self._lock:
+            try:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO entailments VALUES (?, ?, ?, ?, ?, ?)",
+                    key + (int(bool(result)), time.time())
+                )
+                self._connection.commit()
+                self._stats["stores"] += 1
+            except sqlite3.Error as e:
+                # La mémoïsation est une optimisation : une base verrouillée ne doit pas faire échouer la requête
+                logger.warning(f"Could not store entailment result in {self.path}: {e}")
+
+    def invalidate(self, knowledge_base: Optional[Union[str, BeliefSet]] = None, logic_type: Optional[str] = None) -> int:
+        """
+        Supprime les résultats d'un ensemble de croyances, d'un type de logique, ou tous.
+
+        Args:
+            knowledge_base: L'ensemble de croyances dont les résultats sont supprimés (optionnel)
+            logic_type: Type de logique dont les résultats sont supprimés (optionnel)
+
+        Returns:
+            Le nombre de résultats supprimés
+        """
+        clauses, parameters = [], []
+        if knowledge_base is not None:
+            clauses.append("kb_hash = ?")
+            parameters.append(self.belief_set_hash(knowledge_base))
+        if logic_type is not None:
+            clauses.append("logic_type = ?")
+            parameters.append(logic_type)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            cursor = self._connection.execute(f"DELETE FROM entailments{where}", parameters)
+            self._connection.commit()
+            return cursor.rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Récupère les compteurs de la table.
+
+        Returns:
+            Un dictionnaire avec les succès, échecs, enregistrements et le nombre de résultats mémorisés
+        """
+        with self._lock:
+            entries = self._connection.execute("SELECT COUNT(*) FROM entailments").fetchone()[0]
+            return {**self._stats, "entries": entries, "path": self.path}
+
+    def close(self) -> None:
+        """Ferme la connexion SQLite."""
+        with self._lock:
+            self._connection.close()
+
+
+_default_memo: Optional[EntailmentMemo] = None
+_default_memo_lock = threading.Lock()
+
+
+def get_default_entailment_memo() -> Optional[EntailmentMemo]:
+    """
+    Retourne la table de mémoïsation configurée par `TWEETY_ENTAILMENT_MEMO`.
+
+    Returns:
+        L'instance partagée du processus, ou None si la variable n'est pas définie
+    """
+    global _default_memo
+    path = os.getenv(ENTAILMENT_MEMO_ENV_VAR)
+    if not path:
+        return None
+    with _default_memo_lock:
+        if _default_memo is None or _default_memo.path != path:
+            _default_memo = EntailmentMemo(path)
+            logger.info(f"Entailment memo enabled at {path}")
+        return _default_memo
@@ -4,6 +4,8 @@ import logging
 # La configuration du logging (appel à setup_logging()) est supposée être faite globalement.
 from argumentation_analysis.utils.core_utils.logging_utils import setup_logging
 from .tweety_initializer import TweetyInitializer # To access FOL parser
+from .parse_cache import ParseCache, get_shared_parse_cache
+from .belief_set import FirstOrderBeliefSet, as_belief_set
 
 setup_logging()
 logger = logging.getLogger(__name__) # Obtient le logger pour ce module
@@ -12,11 +14,16 @@ class FOLHandler:
     """
     Handles First-Order Logic (FOL) operations using TweetyProject.
     Relies on TweetyInitializer for JVM and FOL component setup.
+    Parsed formulas and belief sets are kept in a ParseCache (shared by default),
+    keyed by their signature declarations.
+    By default the handler uses the parser shared through TweetyInitializer;
+    pooled handlers receive their own instance (see TweetyInitializer.create_components).
     """
 
-    def __init__(self, initializer_instance: TweetyInitializer):
+    def __init__(self, initializer_instance: TweetyInitializer, parse_cache: ParseCache = None, fol_parser=None):
         self._initializer_instance = initializer_instance
-        self._fol_parser = self._initializer_instance.get_fol_parser()
+        self._parse_cache = parse_cache if parse_cache is not None else get_shared_parse_cache()
+        self._fol_parser = fol_parser if fol_parser is not None else self._initializer_instance.get_fol_parser()
         # self._fol_reasoner = TweetyInitializer.get_fol_reasoner() # If a general one is set up
 
         if self._fol_parser is None:
@@ -27,6 +34,14 @@ class FOLHandler:
         """Parses an FOL formula string into a TweetyProject FolFormula object."""
         if not isinstance(formula_str, str):
             raise TypeError("Input formula must be a string.")
+        return self._parse_cache.get_or_parse(
+            "fol", "formula", formula_str,
+            lambda text: self._parse_fol_formula(text, signature_declarations_str),
+            signature=signature_declarations_str
+        )
+
+    def _parse_fol_formula(self, formula_str: str, signature_declarations_str: str = None):
+        """Parses an FOL formula through the Java parser, bypassing the cache."""
         logger.debug(f"Attempting to parse FOL formula: {formula_str}")
         try:
             # Revenir à la version simple. La gestion de la signature doit être revue.
@@ -84,6 +99,55 @@ class FOLHandler:
         # logger.info(f"Predicate '{predicate_name}/{arity}' conceptually added.")
         pass # Placeholder
 
+    def parse_fol_belief_set(self, knowledge_base, signature_declarations_str: str = None):
+        """
+        Parses an FOL knowledge base (semicolon-separated formulas, or a BeliefSet) into a FolBeliefSet.
+        Without explicit declarations, the signature of a BeliefSet is used. A BeliefSet provides
+        its already split formulas and content hash, and keeps a handle to the FolBeliefSet.
+        The result is cached per signature and shared: callers must not modify it.
+        """
+        belief_set = as_belief_set(knowledge_base, FirstOrderBeliefSet, signature_declarations_str)
+        if signature_declarations_str is None:
+            signature_declarations_str = belief_set.signature
+        context = ("fol", signature_declarations_str)
+        kb = belief_set.get_java_object(context)
+        if kb is None:
+            kb = self._parse_cache.get_or_parse(
+                "fol", "belief_set", belief_set.canonical_content,
+                lambda text: self._parse_fol_belief_set(belief_set.formulas, signature_declarations_str),
+                signature=signature_declarations_str,
+                text_hash=belief_set.content_hash
+            )
+            belief_set.set_java_object(kb, context)
+        return kb
+
+    def _parse_fol_belief_set(self, formula_strings, signature_declarations_str: str = None):
+        """Builds a new FolBeliefSet from a list of formulas, bypassing the belief set cache."""
+        FolBeliefSet = jpype.JClass("org.tweetyproject.logics.fol.syntax.FolBeliefSet")
+        FolSignature = jpype.JClass("org.tweetyproject.logics.fol.syntax.FolSignature")
+
+        # Create a signature. If declarations are provided, parse them.
+        # This is a complex part: Tweety doesn't have a simple string parser for full signatures.
+        # Declarations often come from a file or are built programmatically.
+        # For now, we'll assume an empty or default signature if not provided,
+        # or a very simplified parsing if signature_declarations_str is used.
+        signature = FolSignature() # Default empty signature
+
+        if signature_declarations_str:
+            logger.warning("Parsing FOL signature declarations from string is complex and not fully implemented here.")
+            # Simplified: one might need a dedicated parser for "sort X;" "predicate P(X,Y);" etc.
+            # For example, one could parse "predicate Friends(person,person);"
+            # and then programmatically add this to the signature.
+            # This is where the `fol_add_sort` and `fol_add_predicate` logic would be invoked.
+            # This is a placeholder for a more robust signature handling mechanism.
+            pass
+
+        kb = FolBeliefSet(signature)
+        for f_str in formula_strings:
+            parsed_formula = self.parse_fol_formula(f_str)
+            kb.add(parsed_formula)
+        return kb
+
     def fol_check_consistency(self, knowledge_base_str: str, signature_declarations_str: str = None) -> bool:
         """
         Checks if an FOL knowledge base is consistent.
@@ -93,36 +157,11 @@ class FOLHandler:
         """
         logger.debug(f"Checking FOL consistency for KB: {knowledge_base_str}")
         try:
-            FolBeliefSet = jpype.JClass("org.tweetyproject.logics.fol.syntax.FolBeliefSet")
-            FolSignature = jpype.JClass("org.tweetyproject.logics.fol.syntax.FolSignature")
-            
-            # Create a signature. If declarations are provided, parse them.
-            # This is a complex part: Tweety doesn't have a simple string parser for full signatures.
-            # Declarations often come from a file or are built programmatically.
-            # For now, we'll assume an empty or default signature if not provided,
-            # or a very simplified parsing if signature_declarations_str is used.
-            signature = FolSignature() # Default empty signature
-
-            if signature_declarations_str:
-                logger.warning("Parsing FOL signature declarations from string is complex and not fully implemented here.")
-                # Simplified: one might need a dedicated parser for "sort X;" "predicate P(X,Y);" etc.
-                # For example, one could parse "predicate Friends(person,person);"
-                # and then programmatically add this to the signature.
-                # This is where the `fol_add_sort` and `fol_add_predicate` logic would be invoked.
-                # This is a placeholder for a more robust signature handling mechanism.
-                pass
-
-
-            kb = FolBeliefSet(signature)
-            formula_strings = [f.strip() for f in knowledge_base_str.split(';') if f.strip()]
-            if not formula_strings:
+            kb = self.parse_fol_belief_set(knowledge_base_str, signature_declarations_str)
+            if kb.size() == 0:
                 logger.info("Empty FOL knowledge base is considered consistent.")
                 return True
 
-            for f_str in formula_strings:
-                parsed_formula = self.parse_fol_formula(f_str)
-                kb.add(parsed_formula)
-            
             # FOL consistency often requires a specific reasoner.
             # DefaultProver = jpype.JClass("org.tweetyproject.logics.fol.reasoner.DefaultProver")
             # reasoner = DefaultProver() # Or another suitable FOL reasoner
@@ -168,21 +207,7 @@ class FOLHandler:
         """
         logger.debug(f"Performing FOL query. KB: '{knowledge_base_str}', Query: '{query_formula_str}'")
         try:
-            FolBeliefSet = jpype.JClass("org.tweetyproject.logics.fol.syntax.FolBeliefSet")
-            FolSignature = jpype.JClass("org.tweetyproject.logics.fol.syntax.FolSignature")
-            signature = FolSignature() # Default empty signature
-
-            if signature_declarations_str:
-                logger.warning("Parsing FOL signature declarations from string is complex and not fully implemented here.")
-                # Add logic to parse declarations and populate signature if developed
-                pass
-
-            kb = FolBeliefSet(signature)
-            kb_formula_strings = [f.strip() for f in knowledge_base_str.split(';') if f.strip()]
-            for f_str in kb_formula_strings:
-                parsed_formula = self.parse_fol_formula(f_str)
-                kb.add(parsed_formula)
-            
+            kb = self.parse_fol_belief_set(knowledge_base_str, signature_declarations_str)
             query_formula = self.parse_fol_formula(query_formula_str)
             
             # FOL querying requires a specific reasoner.
@@ -209,4 +234,27 @@ class FOLHandler:
             logger.error(f"Unexpected error during FOL query: {e}", exc_info=True)
             raise
 
+    def fol_query_batch(self, knowledge_base_str: str, query_formula_strs: list, signature_declarations_str: str = None) -> list:
+        """
+        Checks several query formulas against the same FOL knowledge base, parsed once.
+        Returns one dict per query: {"query", "entailed" (bool or None), "error" (str or None)}.
+        Like fol_query, entailment is a placeholder until a real FOL reasoner is integrated.
+        """
+        logger.debug(f"Performing FOL batch query ({len(query_formula_strs)} queries). KB: '{knowledge_base_str}'")
+        kb = self.parse_fol_belief_set(knowledge_base_str, signature_declarations_str)
+        logger.warning("FOL query in TweetyProject requires specific reasoners and signature setup. This implementation is a placeholder.")
+
+        results = []
+        for query_formula_str in query_formula_strs:
+            try:
+                self.parse_fol_formula(query_formula_str)
+                # Même résultat provisoire que fol_query (voir ses commentaires)
+                results.append({"query": query_formula_str, "entailed": True, "error": None})
+            except ValueError as e:
+                logger.warning(f"Error parsing FOL batch query '{query_formula_str}': {e}")
+                results.append({"query": query_formula_str, "entailed": None, "error": str(e)})
+
+        logger.info(f"FOL batch query on KB of {kb.size()} formulas: {len(results)} queries processed (Placeholder results).")
+        return results
+
     # Add other FOL-specific methods as needed
\ No newline at end of file
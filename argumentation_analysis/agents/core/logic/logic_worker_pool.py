@@ -0,0 +1,350 @@
+# argumentation_analysis/agents/core/logic/logic_worker_pool.py
+"""
+Pool de processus de raisonnement logique, chacun avec sa propre JVM.
+
+JPype n'autorise qu'une JVM par processus, et celle-ci ne peut pas être
+redémarrée : une requête Tweety lente ou bloquée immobilise donc tout le
+processus d'analyse. `LogicWorkerPool` exécute les requêtes PL, FOL et
+modales dans des processus fils (démarrés par « spawn »), qui initialisent
+chacun leur JVM via `initialize_jvm` puis servent les appels à un
+`TweetyBridge` local reçus par un tube `multiprocessing`.
+
+Chaque requête a un délai maximal : à son expiration, le processus est tué
+et sera relancé (nouvelle JVM) à la requête suivante qui l'emprunte.
+Les processus sont empruntés via un `ReasonerPool`, ce qui permet
+d'exécuter en parallèle autant de requêtes que de processus.
+"""
+
+import itertools
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .reasoner_pool import ReasonerPool
+
+logger = logging.getLogger("Orchestration.LogicWorkerPool")
+
+# Méthodes de TweetyBridge pouvant être appelées dans un processus de raisonnement
+WORKER_METHODS = frozenset({
+    "validate_formula", "validate_belief_set", "execute_pl_query",
+    "validate_fol_formula", "validate_fol_belief_set", "execute_fol_query",
+    "validate_modal_formula", "validate_modal_belief_set", "execute_modal_query",
+    "execute_queries_batch",
+})
+
+
+class LogicWorkerError(RuntimeError):
+    """Exception levée lorsqu'un processus de raisonnement échoue ou se termine inopinément."""
+    pass
+
+
+class LogicWorkerTimeout(LogicWorkerError, TimeoutError):
+    """Exception levée lorsqu'une requête dépasse son délai ; le processus concerné a été tué."""
+    pass
+
+
+def create_tweety_bridge(**bridge_kwargs) -> Any:
+    """
+    Fabrique par défaut des processus de raisonnement : démarre la JVM puis crée un TweetyBridge.
+
+    Args:
+        **bridge_kwargs: Arguments transmis à TweetyBridge (par exemple pl_backend)
+
+    Returns:
+        Le TweetyBridge du processus
+    """
+    from argumentation_analysis.core.jvm_setup import initialize_jvm
+    from .tweety_bridge import TweetyBridge
+
+    if not initialize_jvm():
+        raise RuntimeError("JVM initialization failed in logic worker")
+    return TweetyBridge(**bridge_kwargs)
+
+
+def _worker_main(connection, factory: Callable[..., Any], factory_kwargs: Dict[str, Any]) -> None:
+    """
+    Boucle principale d'un processus de raisonnement.
+
+    Le processus crée son service (un TweetyBridge par défaut), le signale par
+    un message "ready", puis exécute chaque requête (identifiant, méthode,
+    arguments) jusqu'à recevoir None ou la fermeture du tube.
+    """
+    try:
+        service = factory(**factory_kwargs)
+    except Exception as e:
+        connection.send(("startup_error", f"{type(e).__name__}: {e}"))
+        return
+    connection.send(("ready", None))
+
+    while True:
+        try:
+            request = connection.recv()
+        except (EOFError, OSError):
+            return
+        if request is None:
+            return
+        request_id, method_name, args, kwargs = request
+        try:
+            result = getattr(service, method_name)(*args, **kwargs)
+            response = (request_id, "ok", result)
+        except Exception as e:
+            response = (request_id, "error", f"{type(e).__name__}: {e}")
+        try:
+            connection.send(response)
+        except Exception as e:
+            # Résultat non sérialisable : l'erreur est renvoyée à la place
+            connection.send((request_id, "error", f"{type(e).__name__}: {e}"))
+
+
+class _LogicWorker:
+    """
+    Un processus de raisonnement et son tube, relancé après une expiration ou un arrêt inattendu.
+
+    Un _LogicWorker n'est utilisé que par un appelant à la fois (emprunt via le pool).
+    """
+
+    def __init__(self, pool: "LogicWorkerPool", index: int):
+        self._pool = pool
+        self.index = index
+        self._process = None
+        self._connection = None
+        self._request_ids = itertools.count()
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        """Démarre le processus et attend qu'il soit prêt."""
+        pool = self._pool
+        parent_connection, child_connection = pool._context.Pipe()
+        process = pool._context.Process(
+            target=_worker_main,
+            args=(child_connection, pool._factory, pool._factory_kwargs),
+            name=f"logic_worker_{self.index}",
+            daemon=True
+        )
+        start_time = time.perf_counter()
+        process.start()
+        child_connection.close()
+        self._process, self._connection = process, parent_connection
+
+        if not parent_connection.poll(pool.startup_timeout):
+            self.kill()
+            raise LogicWorkerError(f"Logic worker #{self.index} not ready after {pool.startup_timeout} s")
+        try:
+            status, detail = parent_connection.recv()
+        except EOFError:
+            self.kill()
+            raise LogicWorkerError(f"Logic worker #{self.index} exited during startup")
+        if status != "ready":
+            self.kill()
+            raise LogicWorkerError(f"Logic worker #{self.index} failed to start: {detail}")
+        pool._record("starts")
+        logger.info(f"Logic worker #{self.index} ready (pid {process.pid}) in {time.perf_counter() - start_time:.2f} s")
+
+    def kill(self) -> None:
+        """Tue le processus (sans attendre la fin de la requête en cours)."""
+        process, connection = self._process, self._connection
+        self._process = self._connection = None
+        if connection is not None:
+            connection.close()
+        if process is not None:
+            process.terminate()
+            process.join(1.0)
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+    def stop(self) -> None:
+        """Demande au processus de s'arrêter, puis le tue s'il ne s'arrête pas."""
+        if self._connection is not None:
+            try:
+                self._connection.send(None)
+                self._process.join(2.0)
+            except (OSError, ValueError):
+                pass
+        self.kill()
+
+    def call(self, method_name: str, args: Tuple, kwargs: Dict[str, Any], timeout: Optional[float]) -> Any:
+        """Exécute une requête dans le processus, en le (re)démarrant au besoin."""
+        if not self.is_alive():
+            if self._process is not None:
+                self._pool._record("crashes")
+                self.kill()
+            self.start()
+
+        request_id = next(self._request_ids)
+        try:
+            self._connection.send((request_id, method_name, args, kwargs))
+            ready = self._connection.poll(timeout)
+            response_id, status, payload = self._connection.recv() if ready else (None, None, None)
+        except (EOFError, OSError) as e:
+            self.kill()
+            self._pool._record("crashes")
+            raise LogicWorkerError(f"Logic worker #{self.index} terminated during {method_name}: {e}") from e
+        if not ready:
+            self.kill()
+            self._pool._record("timeouts")
+            raise LogicWorkerTimeout(f"{method_name} exceeded {timeout} s in logic worker #{self.index}; worker killed")
+
+        if response_id != request_id:
+            # Réponse d'une requête précédente : le tube n'est plus fiable
+            self.kill()
+            raise LogicWorkerError(f"Logic worker #{self.index} returned an out-of-order response")
+        if status == "error":
+            raise LogicWorkerError(payload)
+        return payload
+
+
+class LogicWorkerPool:
+    """
+    Pool de processus de raisonnement isolés, chacun avec sa propre JVM.
+
+    Attributes:
+        size (int): Nombre maximum de processus.
+        query_timeout (Optional[float]): Délai par défaut d'une requête, en secondes.
+        startup_timeout (float): Délai de démarrage d'un processus (JVM comprise), en secondes.
+    """
+
+    def __init__(self, size: int = 2, query_timeout: Optional[float] = 60.0, startup_timeout: float = 120.0,
+                 factory: Callable[..., Any] = create_tweety_bridge, **factory_kwargs):
+        """
+        Crée le pool ; les processus sont démarrés à leur premier emprunt (ou par `start`).
+
+        Args:
+            size: Nombre maximum de processus
+            query_timeout: Délai par défaut d'une requête en secondes (None : sans limite)
+            startup_timeout: Délai de démarrage d'un processus en secondes
+            factory: Fonction de niveau module créant le service d'un processus
+                (par défaut `create_tweety_bridge`)
+            **factory_kwargs: Arguments de la fabrique (par exemple pl_backend="auto")
+        """
+        self.size = size
+        self.query_timeout = query_timeout
+        self.startup_timeout = startup_timeout
+        self._factory = factory
+        self._factory_kwargs = factory_kwargs
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: List[_LogicWorker] = []
+        self._workers_lock = threading.Lock()
+        self._pool = ReasonerPool(self._create_worker, size, name="logic_worker")
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stats = {"requests": 0, "errors": 0, "timeouts": 0, "crashes": 0, "starts": 0}
+        self._closed = False
+
+    def _record(self, counter: str) -> None:
+        with self._workers_lock:
+            self._stats[counter] += 1
+
+    def _create_worker(self, index: int) -> _LogicWorker:
+        worker = _LogicWorker(self, index)
+        worker.start()
+        with self._workers_lock:
+            self._workers.append(worker)
+        return worker
+
+    def start(self) -> "LogicWorkerPool":
+        """
+        Démarre tous les processus à l'avance, en parallèle.
+
+        Raises:
+            LogicWorkerError: Si un processus ne démarre pas
+        """
+        barrier = threading.Barrier(self.size)
+
+        def start_one():
+            # Chaque emprunt reste ouvert jusqu'à ce que tous les processus soient créés
+            try:
+                with self._pool.checkout():
+                    barrier.wait(self.startup_timeout)
+            except threading.BrokenBarrierError:
+                raise
+            except Exception:
+                barrier.abort()
+                raise
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            errors = [future.exception() for future in [executor.submit(start_one) for _ in range(self.size)]]
+        errors = [e for e in errors if e is not None and not isinstance(e, threading.BrokenBarrierError)]
+        if errors:
+            raise errors[0]
+        return self
+
+    def execute(self, method_name: str, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Exécute une méthode de TweetyBridge dans un processus de raisonnement.
+
+        Args:
+            method_name: Nom de la méthode (voir WORKER_METHODS)
+            *args: Arguments de la méthode (sérialisables par pickle)
+            timeout: Délai de la requête en secondes (par défaut query_timeout)
+            **kwargs: Arguments nommés de la méthode
+
+        Returns:
+            Le résultat de la méthode
+
+        Raises:
+            ValueError: Si la méthode n'est pas autorisée
+            LogicWorkerTimeout: Si la requête dépasse son délai (le processus est tué)
+            LogicWorkerError: Si la méthode lève une exception ou si le processus échoue
+        """
+        if method_name not in WORKER_METHODS:
+            raise ValueError(f"Method not available in logic workers: {method_name}")
+        if self._closed:
+            raise LogicWorkerError("Logic worker pool is shut down")
+        timeout = self.query_timeout if timeout is None else timeout
+        self._record("requests")
+        try:
+            with self._pool.checkout() as worker:
+                return worker.call(method_name, args, kwargs, timeout)
+        except LogicWorkerError:
+            self._record("errors")
+            raise
+
+    def submit(self, method_name: str, *args, timeout: Optional[float] = None, **kwargs) -> Future:
+        """
+        Exécute une méthode de TweetyBridge de façon asynchrone (voir `execute`).
+
+        Returns:
+            Le Future du résultat
+        """
+        with self._workers_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="logic_worker_client")
+            executor = self._executor
+        return executor.submit(self.execute, method_name, *args, timeout=timeout, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Récupère les compteurs du pool.
+
+        Returns:
+            Le nombre de requêtes, d'erreurs, d'expirations, d'arrêts inattendus et de
+            démarrages de processus, le nombre de processus vivants, et l'état des emprunts
+        """
+        with self._workers_lock:
+            stats = dict(self._stats)
+            stats["alive"] = sum(1 for worker in self._workers if worker.is_alive())
+        stats["pool"] = self._pool.get_stats()
+        return stats
+
+    def shutdown(self) -> None:
+        """Arrête les processus et l'exécuteur ; le pool ne peut plus être utilisé."""
+        self._closed = True
+        with self._workers_lock:
+            executor, self._executor = self._executor, None
+            workers = list(self._workers)
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for worker in workers:
+            worker.stop()
+        logger.info("Logic worker pool shut down")
+
+    def __enter__(self) -> "LogicWorkerPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
@@ -4,6 +4,8 @@ import logging
 # La configuration du logging (appel à setup_logging()) est supposée être faite globalement.
 from argumentation_analysis.utils.core_utils.logging_utils import setup_logging
 from .tweety_initializer import TweetyInitializer # To access Modal parser
+from .parse_cache import ParseCache, get_shared_parse_cache
+from .belief_set import ModalBeliefSet, as_belief_set
 
 setup_logging()
 logger = logging.getLogger(__name__) # Obtient le logger pour ce module
@@ -12,11 +14,16 @@ class ModalHandler:
     """
     Handles Modal Logic (ML) operations using TweetyProject.
     Relies on TweetyInitializer for JVM and ML component setup.
+    Parsed formulas and belief sets are kept in a ParseCache (shared by default),
+    keyed by modal logic and signature declarations.
+    By default the handler uses the parser shared through TweetyInitializer;
+    pooled handlers receive their own instance (see TweetyInitializer.create_components).
     """
 
-    def __init__(self, initializer_instance: TweetyInitializer):
+    def __init__(self, initializer_instance: TweetyInitializer, parse_cache: ParseCache = None, modal_parser=None):
         self._initializer_instance = initializer_instance
-        self._modal_parser = self._initializer_instance.get_modal_parser()
+        self._parse_cache = parse_cache if parse_cache is not None else get_shared_parse_cache()
+        self._modal_parser = modal_parser if modal_parser is not None else self._initializer_instance.get_modal_parser()
         # self._modal_reasoner = TweetyInitializer.get_modal_reasoner() # If a general one is set up
         # self._modal_logic_instance = TweetyInitializer.get_modal_logic_instance() # e.g., S4
 
@@ -36,6 +43,14 @@ class ModalHandler:
 
         if not isinstance(formula_str, str):
             raise TypeError("Input formula must be a string.")
+        return self._parse_cache.get_or_parse(
+            "modal", "formula", formula_str,
+            lambda text: self._parse_modal_formula(text, modal_logic_str, signature_declarations_str),
+            signature=(modal_logic_str, signature_declarations_str)
+        )
+
+    def _parse_modal_formula(self, formula_str: str, modal_logic_str: str = "S4", signature_declarations_str: str = None):
+        """Parses a Modal Logic formula through the Java parser, bypassing the cache."""
         logger.debug(f"Attempting to parse Modal Logic formula: {formula_str} (Logic: {modal_logic_str}), Signature: {signature_declarations_str}")
         
         try:
@@ -64,6 +79,40 @@ class ModalHandler:
             logger.error(f"Unexpected error parsing Modal Logic formula '{formula_str}' for logic '{modal_logic_str}': {e}", exc_info=True)
             raise
 
+    def parse_modal_belief_set(self, knowledge_base, modal_logic_str: str = "S4", signature_declarations_str: str = None):
+        """
+        Parses a Modal Logic knowledge base (semicolon-separated formulas, or a BeliefSet) into an MlBeliefSet.
+        Without explicit declarations, the signature of a BeliefSet is used. A BeliefSet provides
+        its already split formulas and content hash, and keeps a handle to the MlBeliefSet.
+        The result is cached per modal logic and signature and shared: callers must not modify it.
+        """
+        belief_set = as_belief_set(knowledge_base, ModalBeliefSet, signature_declarations_str)
+        if signature_declarations_str is None:
+            signature_declarations_str = belief_set.signature
+        context = ("modal", modal_logic_str, signature_declarations_str)
+        kb = belief_set.get_java_object(context)
+        if kb is None:
+            kb = self._parse_cache.get_or_parse(
+                "modal", "belief_set", belief_set.canonical_content,
+                lambda text: self._parse_modal_belief_set(belief_set.formulas, modal_logic_str),
+                signature=(modal_logic_str, signature_declarations_str),
+                text_hash=belief_set.content_hash
+            )
+            belief_set.set_java_object(kb, context)
+        return kb
+
+    def _parse_modal_belief_set(self, formula_strings, modal_logic_str: str = "S4"):
+        """Builds a new MlBeliefSet from a list of formulas, bypassing the belief set cache."""
+        MlBeliefSet = jpype.JClass("org.tweetyproject.logics.ml.syntax.MlBeliefSet")
+        # La logique modale est spécifiée lors du parsing des formules individuelles
+        # (voir les commentaires de modal_check_consistency sur le constructeur de MlBeliefSet).
+        kb = MlBeliefSet() # Utiliser le constructeur par défaut
+
+        for f_str in formula_strings:
+            parsed_formula = self.parse_modal_formula(f_str, modal_logic_str)
+            kb.add(parsed_formula)
+        return kb
+
     def modal_check_consistency(self, knowledge_base_str: str, modal_logic_str: str = "S4", signature_declarations_str: str = None) -> bool:
         """
         Checks if a Modal Logic knowledge base is consistent for a given modal logic (e.g., S4).
@@ -76,37 +125,22 @@ class ModalHandler:
 
         logger.debug(f"Checking Modal Logic consistency for KB: '{knowledge_base_str}' (Logic: {modal_logic_str})")
         try:
-            MlBeliefSet = jpype.JClass("org.tweetyproject.logics.ml.syntax.MlBeliefSet")
-            # ModalLogic = jpype.JClass("org.tweetyproject.logics.ml.syntax.ModalLogic") # Incorrect
-            
             # Supposons que MlBeliefSet attend une chaîne pour le type de logique, ou que le parser s'en charge.
             # Le constructeur de MlBeliefSet(ModalLogic) est probablement pour un objet ModalLogic spécifique,
             # pas juste l'enum. Si le parser est responsable de la logique, le KB n'a peut-être pas besoin de la logique au constructeur.
             # Pour l'instant, on va supposer que le constructeur par défaut de MlBeliefSet est suffisant
-            # et que la logique est gérée au niveau du parsing de chaque formule ou par le reasoner.
-            # try:
-            #     java_modal_logic_enum = getattr(ModalLogic, modal_logic_str.upper())
-            # except AttributeError:
-            #     logger.error(f"Unsupported Modal Logic type string: {modal_logic_str}")
-            #     raise ValueError(f"Unsupported Modal Logic type: {modal_logic_str}")
-
-            # kb = MlBeliefSet(java_modal_logic_enum) # Cela échouerait si java_modal_logic_enum n'est pas un objet ModalLogic
-            kb = MlBeliefSet() # Utiliser le constructeur par défaut
-
+            # et que la logique est gérée au niveau du parsing de chaque formule ou par le reasoner
+            # (voir _parse_modal_belief_set).
             if signature_declarations_str:
                 logger.warning("Parsing Modal Logic signature declarations from string is complex and not fully implemented here. This may affect consistency checks.")
                 # This would require parsing sorts, constants, predicates specific to modal contexts if applicable.
                 pass
             
-            formula_strings = [f.strip() for f in knowledge_base_str.split(';') if f.strip()]
-            if not formula_strings:
+            kb = self.parse_modal_belief_set(knowledge_base_str, modal_logic_str, signature_declarations_str)
+            if kb.size() == 0:
                 logger.info("Empty Modal Logic knowledge base is considered consistent.")
                 return True
 
-            for f_str in formula_strings:
-                parsed_formula = self.parse_modal_formula(f_str, modal_logic_str)
-                kb.add(parsed_formula)
-            
             logger.info(f"Modal Logic KB created with {kb.size()} formulas for logic {modal_logic_str}.")
 
             # For actual consistency checking, a reasoner specific to the modal logic is needed.
@@ -141,29 +175,11 @@ class ModalHandler:
 
         logger.debug(f"Performing Modal Logic query. KB: '{knowledge_base_str}', Query: '{query_formula_str}', Logic: {modal_logic_str}")
         try:
-            MlBeliefSet = jpype.JClass("org.tweetyproject.logics.ml.syntax.MlBeliefSet")
-            # ModalLogic = jpype.JClass("org.tweetyproject.logics.ml.syntax.ModalLogic") # Incorrect
-
-            # Comme pour modal_check_consistency, utilisons le constructeur par défaut pour MlBeliefSet.
-            # La logique modale sera spécifiée lors du parsing des formules individuelles.
-            # try:
-            #    java_modal_logic_enum = getattr(ModalLogic, modal_logic_str.upper())
-            # except AttributeError:
-            #    logger.error(f"Unsupported Modal Logic type string: {modal_logic_str}")
-            #    raise ValueError(f"Unsupported Modal Logic type: {modal_logic_str}")
-
-            # kb = MlBeliefSet(java_modal_logic_enum)
-            kb = MlBeliefSet() # Utiliser le constructeur par défaut
-
             if signature_declarations_str:
                 logger.warning("Parsing Modal Logic signature declarations from string is complex and not fully implemented here. This may affect query results.")
                 pass
             
-            formula_strings = [f.strip() for f in knowledge_base_str.split(';') if f.strip()]
-            for f_str in formula_strings:
-                parsed_formula = self.parse_modal_formula(f_str, modal_logic_str)
-                kb.add(parsed_formula)
-
+            kb = self.parse_modal_belief_set(knowledge_base_str, modal_logic_str, signature_declarations_str)
             parsed_query_formula = self.parse_modal_formula(query_formula_str, modal_logic_str)
             
             logger.info(f"Modal Logic KB created with {kb.size()} formulas, query parsed for logic {modal_logic_str}.")
@@ -187,6 +203,39 @@ class ModalHandler:
             logger.error(f"Unexpected error performing Modal Logic query (KB: '{knowledge_base_str}', Query: '{query_formula_str}', Logic: {modal_logic_str}): {e}", exc_info=True)
             raise
 
+    def modal_query_batch(self, knowledge_base_str: str, query_formula_strs: list, modal_logic_str: str = "S4", signature_declarations_str: str = None) -> list:
+        """
+        Checks several Modal Logic query formulas against the same knowledge base, parsed once.
+        Returns one dict per query: {"query", "entailed" (bool or None), "error" (str or None)}.
+        Like modal_query, entailment is a placeholder until a real ML reasoner is integrated.
+        """
+        if not self._initializer_instance.is_jvm_started():
+            logger.error("JVM not started. Cannot perform modal query.")
+            raise RuntimeError("JVM must be started by TweetyInitializer before performing modal queries.")
+
+        logger.debug(f"Performing Modal Logic batch query ({len(query_formula_strs)} queries). KB: '{knowledge_base_str}', Logic: {modal_logic_str}")
+        try:
+            kb = self.parse_modal_belief_set(knowledge_base_str, modal_logic_str, signature_declarations_str)
+        except jpype.JException as e:
+            logger.error(f"JPype JException building Modal Logic KB '{knowledge_base_str}' (Logic: {modal_logic_str}): {e.getMessage()}", exc_info=True)
+            raise ValueError(f"Error performing Modal Logic query: {e.getMessage()}") from e
+        logger.warning(f"Modal Logic query for {modal_logic_str} is a placeholder. "
+                       "Actual query requires a specific TweetyProject reasoner. "
+                       "Currently returning False as a default for this basic check.")
+
+        results = []
+        for query_formula_str in query_formula_strs:
+            try:
+                self.parse_modal_formula(query_formula_str, modal_logic_str)
+                # Même résultat provisoire que modal_query
+                results.append({"query": query_formula_str, "entailed": False, "error": None})
+            except ValueError as e:
+                logger.warning(f"Error parsing Modal Logic batch query '{query_formula_str}': {e}")
+                results.append({"query": query_formula_str, "entailed": None, "error": str(e)})
+
+        logger.info(f"Modal Logic batch query on KB of {kb.size()} formulas: {len(results)} queries processed (Placeholder results).")
+        return results
+
 if __name__ == '__main__':
     # Basic test setup
     from argumentation_analysis.utils.core_utils.logging_utils import setup_logging
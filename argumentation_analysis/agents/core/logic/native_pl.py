@@ -0,0 +1,645 @@
+# argumentation_analysis/agents/core/logic/native_pl.py
+"""
+Raisonneur propositionnel en Python pur, sans JVM.
+
+Les requêtes propositionnelles passent normalement par TweetyProject
+(`PLHandler`), ce qui impose une JVM démarrée (plusieurs secondes) et rend tout
+le chemin logique inutilisable sans JPype. Ce module fournit un moteur
+équivalent, en processus, pour les petits ensembles de croyances :
+
+- un parseur de la syntaxe propositionnelle de Tweety (`!`, `&&`, `||`, `^^`,
+  `=>`, `<=>`, `+` pour le vrai, `-` pour le faux, parenthèses) ;
+- une mise en forme normale conjonctive par la transformation de Tseitin
+  (une variable auxiliaire par sous-formule, taille linéaire) ;
+- un solveur SAT CDCL (littéraux surveillés, apprentissage de clauses au
+  premier point d'implication unique, retour arrière non chronologique,
+  heuristique d'activité des variables et redémarrages de Luby).
+
+`NativePLHandler` expose la même interface que `PLHandler` et peut être
+sélectionné comme backend propositionnel de `TweetyBridge`. Le module
+n'importe pas JPype.
+
+Priorité des opérateurs, du plus lâche au plus fort : `<=>`, `=>` (associatif
+à droite), `||`, `^^`, `&&`, `!`.
+"""
+
+import heapq
+import logging
+import re
+from collections import ChainMap
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .belief_set import PropositionalBeliefSet, as_belief_set
+from .parse_cache import ParseCache, get_shared_parse_cache
+
+logger = logging.getLogger("Orchestration.NativePL")
+
+# Noeuds de l'arbre syntaxique : tuples (opérateur, opérandes...), hashables
+ATOM = "atom"
+NOT = "not"
+AND = "and"
+OR = "or"
+XOR = "xor"
+IMPLIES = "implies"
+IFF = "iff"
+TOP = "top"
+BOTTOM = "bottom"
+
+_TOKEN = re.compile(r"\s*(<=>|=>|\|\||&&|\^\^|!|\(|\)|\+|-|[A-Za-z0-9_]+)")
+
+# Opérateurs binaires, du plus lâche au plus fort
+_BINARY_OPERATORS = (("<=>", IFF), ("=>", IMPLIES), ("||", OR), ("^^", XOR), ("&&", AND))
+
+
+def _tokenize(formula_str: str) -> List[str]:
+    """Découpe une formule en lexèmes."""
+    tokens = []
+    position = 0
+    text = formula_str.rstrip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None:
+            raise ValueError(f"Unexpected character '{text[position:].strip()[0]}' at position {position}")
+        tokens.append(match.group(1))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Parseur à descente récursive d'une formule propositionnelle."""
+
+    def __init__(self, tokens: List[str]):
+        self.tokens = tokens
+        self.position = 0
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise ValueError("Unexpected end of formula")
+        self.position += 1
+        return token
+
+    def parse(self) -> Tuple:
+        formula = self._parse_binary(0)
+        if self._peek() is not None:
+            raise ValueError(f"Unexpected token '{self._peek()}'")
+        return formula
+
+    def _parse_binary(self, level: int) -> Tuple:
+        if level == len(_BINARY_OPERATORS):
+            return self._parse_unary()
+        symbol, operator = _BINARY_OPERATORS[level]
+        operands = [self._parse_binary(level + 1)]
+        while self._peek() == symbol:
+            self.position += 1
+            operands.append(self._parse_binary(level + 1))
+        if len(operands) == 1:
+            return operands[0]
+        if operator in (AND, OR):
+            flattened = []
+            for operand in operands:
+                flattened.extend(operand[1:] if operand[0] == operator else [operand])
+            return (operator,) + tuple(flattened)
+        if operator == IMPLIES:
+            formula = operands[-1]
+            for operand in reversed(operands[:-1]):
+                formula = (IMPLIES, operand, formula)
+            return formula
+        formula = operands[0]
+        for operand in operands[1:]:
+            formula = (operator, formula, operand)
+        return formula
+
+    def _parse_unary(self) -> Tuple:
+        token = self._next()
+        if token == "!":
+            return (NOT, self._parse_unary())
+        if token == "(":
+            formula = self._parse_binary(0)
+            if self._next() != ")":
+                raise ValueError("Missing closing parenthesis")
+            return formula
+        if token == "+":
+            return (TOP,)
+        if token == "-":
+            return (BOTTOM,)
+        if token in ("<=>", "=>", "||", "^^", "&&", ")"):
+            raise ValueError(f"Unexpected token '{token}'")
+        return (ATOM, token)
+
+
+def parse_formula(formula_str: str) -> Tuple:
+    """
+    Parse une formule propositionnelle en syntaxe Tweety.
+
+    Args:
+        formula_str: La formule
+
+    Returns:
+        L'arbre syntaxique de la formule (tuples imbriqués)
+
+    Raises:
+        ValueError: Si la formule est syntaxiquement invalide
+    """
+    try:
+        tokens = _tokenize(formula_str.strip().rstrip('%'))
+        if not tokens:
+            raise ValueError("Empty formula")
+        return _Parser(tokens).parse()
+    except ValueError as e:
+        raise ValueError(f"Error parsing PL formula '{formula_str}': {e}") from e
+
+
+def evaluate(formula: Tuple, assignment: Dict[str, bool]) -> bool:
+    """
+    Évalue une formule dans une interprétation (les atomes absents sont faux).
+
+    Args:
+        formula: L'arbre syntaxique de la formule
+        assignment: La valeur de vérité des atomes
+
+    Returns:
+        La valeur de vérité de la formule
+    """
+    operator = formula[0]
+    if operator == ATOM:
+        return assignment.get(formula[1], False)
+    if operator == NOT:
+        return not evaluate(formula[1], assignment)
+    if operator == AND:
+        return all(evaluate(operand, assignment) for operand in formula[1:])
+    if operator == OR:
+        return any(evaluate(operand, assignment) for operand in formula[1:])
+    if operator == XOR:
+        return evaluate(formula[1], assignment) != evaluate(formula[2], assignment)
+    if operator == IMPLIES:
+        return not evaluate(formula[1], assignment) or evaluate(formula[2], assignment)
+    if operator == IFF:
+        return evaluate(formula[1], assignment) == evaluate(formula[2], assignment)
+    return operator == TOP
+
+
+class TseitinEncoder:
+    """
+    Traduction de formules en clauses par la transformation de Tseitin.
+
+    Les variables sont des entiers strictement positifs, les littéraux des
+    entiers signés. Un encodeur peut être dérivé d'un autre (`extend`) : il
+    partage alors ses variables et ses définitions sans les recopier, ce qui
+    permet d'ajouter la négation d'une requête à un ensemble de croyances
+    compilé une seule fois.
+
+    Attributes:
+        atoms (Dict[str, int]): Variable associée à chaque atome.
+        clauses (List[List[int]]): Clauses produites par cet encodeur (sans celles de l'encodeur parent).
+        num_vars (int): Nombre de variables utilisées.
+    """
+
+    def __init__(self, parent: Optional["TseitinEncoder"] = None):
+        self.atoms = ChainMap({}, parent.atoms) if parent is not None else {}
+        self._definitions = ChainMap({}, parent._definitions) if parent is not None else {}
+        self.num_vars = parent.num_vars if parent is not None else 0
+        self.clauses: List[List[int]] = []
+        self._parent = parent
+
+    def extend(self) -> "TseitinEncoder":
+        """Crée un encodeur dérivé, qui partage les variables de celui-ci."""
+        return TseitinEncoder(self)
+
+    def all_clauses(self) -> List[List[int]]:
+        """Retourne les clauses de cet encodeur et de ses parents."""
+        parent_clauses = self._parent.all_clauses() if self._parent is not None else []
+        return parent_clauses + self.clauses
+
+    def _new_var(self) -> int:
+        self.num_vars += 1
+        return self.num_vars
+
+    def encode(self, formula: Tuple) -> int:
+        """
+        Retourne un littéral équivalent à la formule, en ajoutant ses définitions.
+
+        Args:
+            formula: L'arbre syntaxique de la formule
+
+        Returns:
+            Le littéral représentant la formule
+        """
+        operator = formula[0]
+        if operator == NOT:
+            return -self.encode(formula[1])
+        if operator == BOTTOM:
+            return -self.encode((TOP,))
+        literal = self._definitions.get(formula)
+        if literal is not None:
+            return literal
+
+        if operator == ATOM:
+            literal = self.atoms[formula[1]] = self._new_var()
+        elif operator == TOP:
+            literal = self._new_var()
+            self.clauses.append([literal])
+        else:
+            operands = [self.encode(operand) for operand in formula[1:]]
+            if operator == IMPLIES:
+                operator, operands = OR, [-operands[0], operands[1]]
+            literal = self._new_var()
+            if operator == AND:
+                self.clauses.extend([-literal, operand] for operand in operands)
+                self.clauses.append([literal] + [-operand for operand in operands])
+            elif operator == OR:
+                self.clauses.extend([literal, -operand] for operand in operands)
+                self.clauses.append([-literal] + operands)
+            else:
+                left, right = operands
+                if operator == XOR:
+                    right = -right
+                self.clauses.extend([[-literal, -left, right], [-literal, left, -right],
+                                     [literal, left, right], [literal, -left, -right]])
+        self._definitions[formula] = literal
+        return literal
+
+    def assert_formula(self, formula: Tuple) -> None:
+        """
+        Ajoute des clauses imposant que la formule soit vraie.
+
+        Les conjonctions et disjonctions au sommet de la formule sont traduites
+        directement, sans variable auxiliaire.
+
+        Args:
+            formula: L'arbre syntaxique de la formule
+        """
+        operator = formula[0]
+        if operator == AND:
+            for operand in formula[1:]:
+                self.assert_formula(operand)
+        elif operator == OR:
+            self.clauses.append([self.encode(operand) for operand in formula[1:]])
+        elif operator == IMPLIES:
+            self.clauses.append([-self.encode(formula[1]), self.encode(formula[2])])
+        else:
+            self.clauses.append([self.encode(formula)])
+
+
+def _luby(index: int) -> int:
+    """Terme d'indice `index` (à partir de 0) de la suite de Luby : 1, 1, 2, 1, 1, 2, 4, ..."""
+    size, exponent = 1, 0
+    while size < index + 1:
+        exponent += 1
+        size = 2 * size + 1
+    while size - 1 != index:
+        size = (size - 1) // 2
+        exponent -= 1
+        index %= size
+    return 2 ** exponent
+
+
+class CDCLSolver:
+    """
+    Solveur SAT CDCL sur des clauses en entiers signés.
+
+    Les clauses apprises sont toutes conservées : le solveur vise les
+    petites instances produites par les ensembles de croyances des agents.
+
+    Attributes:
+        num_vars (int): Nombre de variables.
+        stats (Dict[str, int]): Nombre de décisions, propagations et conflits.
+    """
+
+    RESTART_BASE = 100
+    ACTIVITY_DECAY = 0.95
+
+    def __init__(self, num_vars: int, clauses: Iterable[List[int]]):
+        self.num_vars = num_vars
+        self._values = [0] * (num_vars + 1)  # 1 vrai, -1 faux, 0 non affecté
+        self._levels = [0] * (num_vars + 1)
+        self._reasons: List[Optional[int]] = [None] * (num_vars + 1)
+        self._phases = [False] * (num_vars + 1)
+        self._activity = [0.0] * (num_vars + 1)
+        self._activity_increment = 1.0
+        self._heap = [(0.0, var) for var in range(1, num_vars + 1)]
+        self._clauses: List[List[int]] = []
+        self._watches: Dict[int, List[int]] = {}
+        self._trail: List[int] = []
+        self._trail_limits: List[int] = []
+        self._propagation_head = 0
+        self._units: List[int] = []
+        self._unsatisfiable = False
+        self.stats = {"decisions": 0, "propagations": 0, "conflicts": 0}
+
+        for clause in clauses:
+            self._add_clause(clause)
+
+    def _add_clause(self, clause: List[int]) -> None:
+        literals = list(dict.fromkeys(clause))
+        literal_set = set(literals)
+        if any(-literal in literal_set for literal in literals):
+            return  # Tautologie
+        if not literals:
+            self._unsatisfiable = True
+        elif len(literals) == 1:
+            self._units.append(literals[0])
+        else:
+            self._attach(literals)
+
+    def _attach(self, literals: List[int]) -> int:
+        index = len(self._clauses)
+        self._clauses.append(literals)
+        self._watches.setdefault(literals[0], []).append(index)
+        self._watches.setdefault(literals[1], []).append(index)
+        return index
+
+    def _value(self, literal: int) -> int:
+        value = self._values[abs(literal)]
+        return value if literal > 0 else -value
+
+    def _enqueue(self, literal: int, reason: Optional[int]) -> None:
+        var = abs(literal)
+        self._values[var] = 1 if literal > 0 else -1
+        self._levels[var] = len(self._trail_limits)
+        self._reasons[var] = reason
+        self._trail.append(literal)
+
+    def _propagate(self) -> Optional[int]:
+        """Propage les clauses unitaires ; retourne l'indice d'une clause en conflit, le cas échéant."""
+        while self._propagation_head < len(self._trail):
+            false_literal = -self._trail[self._propagation_head]
+            self._propagation_head += 1
+            self.stats["propagations"] += 1
+            watchers = self._watches.get(false_literal, [])
+            kept: List[int] = []
+            conflict = None
+            for position, index in enumerate(watchers):
+                clause = self._clauses[index]
+                if clause[0] == false_literal:
+                    clause[0], clause[1] = clause[1], clause[0]
+                other = clause[0]
+                if self._value(other) == 1:
+                    kept.append(index)
+                    continue
+                for k in range(2, len(clause)):
+                    if self._value(clause[k]) != -1:
+                        clause[1], clause[k] = clause[k], clause[1]
+                        self._watches.setdefault(clause[1], []).append(index)
+                        break
+                else:
+                    kept.append(index)
+                    if self._value(other) == -1:
+                        conflict = index
+                        kept.extend(watchers[position + 1:])
+                        break
+                    self._enqueue(other, index)
+            self._watches[false_literal] = kept
+            if conflict is not None:
+                return conflict
+        return None
+
+    def _bump(self, var: int) -> None:
+        self._activity[var] += self._activity_increment
+        if self._activity[var] > 1e100:
+            self._activity = [activity * 1e-100 for activity in self._activity]
+            self._activity_increment *= 1e-100
+            self._heap = [(-self._activity[v], v) for v in range(1, self.num_vars + 1) if self._values[v] == 0]
+            heapq.heapify(self._heap)
+        elif self._values[var] == 0:
+            heapq.heappush(self._heap, (-self._activity[var], var))
+
+    def _analyze(self, conflict: int) -> Tuple[List[int], int]:
+        """Apprend une clause au premier point d'implication unique ; retourne la clause et le niveau de retour."""
+        level = len(self._trail_limits)
+        learnt = [0]
+        seen = set()
+        pending = 0
+        literal = 0
+        clause = self._clauses[conflict]
+        index = len(self._trail) - 1
+        while True:
+            for other in clause:
+                var = abs(other)
+                if other == literal or var in seen or self._levels[var] == 0:
+                    continue
+                seen.add(var)
+                self._bump(var)
+                if self._levels[var] == level:
+                    pending += 1
+                else:
+                    learnt.append(other)
+            while abs(self._trail[index]) not in seen:
+                index -= 1
+            literal = self._trail[index]
+            index -= 1
+            pending -= 1
+            if pending == 0:
+                break
+            clause = self._clauses[self._reasons[abs(literal)]]
+        learnt[0] = -literal
+
+        if len(learnt) == 1:
+            return learnt, 0
+        deepest = max(range(1, len(learnt)), key=lambda i: self._levels[abs(learnt[i])])
+        learnt[1], learnt[deepest] = learnt[deepest], learnt[1]
+        return learnt, self._levels[abs(learnt[1])]
+
+    def _backtrack(self, level: int) -> None:
+        if len(self._trail_limits) <= level:
+            return
+        limit = self._trail_limits[level]
+        for literal in self._trail[limit:]:
+            var = abs(literal)
+            self._phases[var] = literal > 0
+            self._values[var] = 0
+            self._reasons[var] = None
+            heapq.heappush(self._heap, (-self._activity[var], var))
+        del self._trail[limit:]
+        del self._trail_limits[level:]
+        self._propagation_head = limit
+
+    def _pick_branching_var(self) -> Optional[int]:
+        while self._heap:
+            _, var = heapq.heappop(self._heap)
+            if self._values[var] == 0:
+                return var
+        return None
+
+    def solve(self) -> Optional[Dict[int, bool]]:
+        """
+        Cherche un modèle des clauses.
+
+        Returns:
+            Un modèle (valeur de chaque variable), ou None si les clauses sont insatisfiables
+        """
+        if self._unsatisfiable:
+            return None
+        for literal in self._units:
+            value = self._value(literal)
+            if value == -1:
+                self._unsatisfiable = True
+                return None
+            if value == 0:
+                self._enqueue(literal, None)
+
+        restarts = 0
+        conflicts_before_restart = self.RESTART_BASE * _luby(restarts)
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.stats["conflicts"] += 1
+                if not self._trail_limits:
+                    self._unsatisfiable = True
+                    return None
+                learnt, level = self._analyze(conflict)
+                self._backtrack(level)
+                self._enqueue(learnt[0], self._attach(learnt) if len(learnt) > 1 else None)
+                self._activity_increment /= self.ACTIVITY_DECAY
+                conflicts_before_restart -= 1
+                continue
+
+            if conflicts_before_restart <= 0:
+                restarts += 1
+                conflicts_before_restart = self.RESTART_BASE * _luby(restarts)
+                self._backtrack(0)
+                continue
+
+            var = self._pick_branching_var()
+            if var is None:
+                model = {v: self._values[v] == 1 for v in range(1, self.num_vars + 1)}
+                self._backtrack(0)
+                return model
+            self.stats["decisions"] += 1
+            self._trail_limits.append(len(self._trail))
+            self._enqueue(var if self._phases[var] else -var, None)
+
+
+class CompiledBeliefSet:
+    """
+    Ensemble de croyances propositionnel compilé en clauses.
+
+    Attributes:
+        formulas (List[Tuple]): Les formules parsées.
+        encoder (TseitinEncoder): L'encodeur contenant les clauses de l'ensemble.
+    """
+
+    def __init__(self, formulas: List[Tuple]):
+        self.formulas = formulas
+        self.encoder = TseitinEncoder()
+        for formula in formulas:
+            self.encoder.assert_formula(formula)
+        self._consistent: Optional[bool] = None
+
+    def size(self) -> int:
+        """Retourne le nombre de formules (comme `PlBeliefSet.size()`)."""
+        return len(self.formulas)
+
+    def _solve(self, encoder: TseitinEncoder) -> Optional[Dict[int, bool]]:
+        return CDCLSolver(encoder.num_vars, encoder.all_clauses()).solve()
+
+    def is_consistent(self) -> bool:
+        """Vérifie que l'ensemble a au moins un modèle."""
+        if self._consistent is None:
+            self._consistent = self._solve(self.encoder) is not None
+        return self._consistent
+
+    def get_model(self) -> Optional[Dict[str, bool]]:
+        """
+        Cherche un modèle de l'ensemble.
+
+        Returns:
+            La valeur de vérité de chaque atome, ou None si l'ensemble est incohérent
+        """
+        model = self._solve(self.encoder)
+        if model is None:
+            return None
+        return {atom: model[var] for atom, var in self.encoder.atoms.items()}
+
+    def entails(self, query: Tuple) -> bool:
+        """
+        Vérifie si l'ensemble infère une formule (l'ensemble ∪ {¬requête} est insatisfiable).
+
+        Args:
+            query: L'arbre syntaxique de la requête
+
+        Returns:
+            True si la requête est inférée
+        """
+        if self._consistent is False:
+            return True
+        encoder = self.encoder.extend()
+        encoder.assert_formula((NOT, query))
+        return self._solve(encoder) is None
+
+
+class NativePLHandler:
+    """
+    Handles Propositional Logic (PL) operations in pure Python, without a JVM.
+    Mirrors the PLHandler interface; parsed formulas and compiled belief sets
+    are kept in a ParseCache (shared by default) under the "pl_native" logic type.
+    """
+
+    LOGIC_TYPE = "pl_native"
+
+    def __init__(self, parse_cache: ParseCache = None):
+        self._parse_cache = parse_cache if parse_cache is not None else get_shared_parse_cache()
+
+    def parse_pl_formula(self, formula_str: str) -> Tuple:
+        """Parses a PL formula string into a syntax tree."""
+        if not isinstance(formula_str, str):
+            raise TypeError("Input formula must be a string.")
+        return self._parse_cache.get_or_parse(self.LOGIC_TYPE, "formula", formula_str, parse_formula)
+
+    def parse_pl_belief_set(self, knowledge_base) -> CompiledBeliefSet:
+        """
+        Parses and compiles a PL knowledge base (string of formulas, semicolon-separated, or a BeliefSet).
+        The result is cached by content hash and shared: callers must not modify it.
+        """
+        belief_set = as_belief_set(knowledge_base, PropositionalBeliefSet)
+        return self._parse_cache.get_or_parse(self.LOGIC_TYPE, "belief_set", belief_set.canonical_content,
+                                              lambda text: self._parse_pl_belief_set(belief_set.formulas),
+                                              text_hash=belief_set.content_hash)
+
+    def _parse_pl_belief_set(self, formula_strings) -> CompiledBeliefSet:
+        """Compiles a list of formulas, bypassing the belief set cache."""
+        return CompiledBeliefSet([self.parse_pl_formula(f) for f in formula_strings])
+
+    def pl_check_consistency(self, knowledge_base_str: str, use_memo: bool = True) -> bool:
+        """
+        Checks if a PL knowledge base is consistent.
+        use_memo is accepted for interface compatibility with PLHandler and ignored.
+        """
+        kb = self.parse_pl_belief_set(knowledge_base_str)
+        is_consistent = kb.is_consistent()
+        logger.debug(f"Native PL knowledge base consistency for '{knowledge_base_str}': {is_consistent}")
+        return is_consistent
+
+    def pl_query(self, knowledge_base_str: str, query_formula_str: str, use_memo: bool = True) -> bool:
+        """
+        Checks if a query formula is entailed by a PL knowledge base.
+        use_memo is accepted for interface compatibility with PLHandler and ignored.
+        """
+        kb = self.parse_pl_belief_set(knowledge_base_str)
+        entails = kb.entails(self.parse_pl_formula(query_formula_str.rstrip('%').strip()))
+        logger.debug(f"Native PL Query: KB entails '{query_formula_str}'? {entails}")
+        return entails
+
+    def pl_query_batch(self, knowledge_base_str: str, query_formula_strs: list, use_memo: bool = True) -> list:
+        """
+        Checks several query formulas against the same PL knowledge base, as PLHandler.pl_query_batch.
+        Returns one dict per query: {"query", "entailed" (bool or None), "error" (str or None)};
+        knowledge base parsing errors are raised.
+        """
+        kb = self.parse_pl_belief_set(knowledge_base_str)
+        results = []
+        for query_formula_str in query_formula_strs:
+            try:
+                entails = kb.entails(self.parse_pl_formula(query_formula_str.rstrip('%').strip()))
+                results.append({"query": query_formula_str, "entailed": entails, "error": None})
+            except ValueError as e:
+                logger.warning(f"Error parsing native PL batch query '{query_formula_str}': {e}")
+                results.append({"query": query_formula_str, "entailed": None, "error": str(e)})
+        return results
+
+    def pl_get_model(self, knowledge_base_str: str) -> Optional[Dict[str, Any]]:
+        """Returns a model of a PL knowledge base (truth value of each atom), or None if it is inconsistent."""
+        return self.parse_pl_belief_set(knowledge_base_str).get_model()
@@ -0,0 +1,184 @@
+# argumentation_analysis/agents/core/logic/parse_cache.py
+"""
+Cache LRU des formules et ensembles de croyances parsés par TweetyProject.
+
+Chaque requête des handlers (`PLHandler`, `FOLHandler`, `ModalHandler`)
+reconstruisait l'ensemble de croyances Java en re-parsant toutes ses formules
+via JPype, puis parsait la requête. `ParseCache` conserve les objets Java déjà
+parsés, indexés par un condensat du texte source, afin qu'une série de requêtes
+sur le même ensemble de croyances ne paie le parsing qu'une fois.
+
+Les clés combinent le type de logique, la nature de l'objet ("formula" ou
+"belief_set"), la signature (déclarations FOL, logique modale...) et le
+condensat du texte. Le cache est borné en nombre d'entrées et en octets ; la
+taille des objets Java n'étant pas mesurable depuis Python, la taille du texte
+source sert d'estimation.
+
+Les objets mis en cache sont partagés entre appelants et ne doivent pas être
+modifiés : les handlers construisent un nouvel ensemble de croyances Java s'ils
+doivent y ajouter des formules.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger("Orchestration.ParseCache")
+
+# Surcoût forfaitaire par entrée (clé, objet proxy JPype), en octets
+ENTRY_OVERHEAD = 256
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+
+class ParseCache:
+    """
+    Cache LRU thread-safe d'objets parsés, indexé par condensat de contenu.
+
+    Attributes:
+        max_entries (int): Nombre maximum d'entrées conservées.
+        max_bytes (int): Taille estimée maximale du cache, en octets.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialise un cache vide.
+
+        Args:
+            max_entries: Nombre maximum d'entrées conservées
+            max_bytes: Taille estimée maximale du cache, en octets
+
+        Raises:
+            ValueError: Si une des limites n'est pas strictement positive
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """
+        Calcule le condensat d'un texte source.
+
+        Args:
+            text: Le texte d'une formule ou d'un ensemble de croyances
+
+        Returns:
+            Le condensat hexadécimal du texte encodé en UTF-8
+        """
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get_or_parse(self, logic_type: str, kind: str, text: str, parse: Callable[[str], Any],
+                     signature: Hashable = None, text_hash: Optional[str] = None) -> Any:
+        """
+        Retourne l'objet parsé correspondant à un texte, en le parsant au besoin.
+
+        Le parsing a lieu hors du verrou : deux appels concurrents sur un même
+        texte absent du cache peuvent le parser chacun une fois. Les erreurs de
+        parsing sont propagées et rien n'est mis en cache.
+
+        Args:
+            logic_type: Type de logique ("pl", "fol", "modal")
+            kind: Nature de l'objet ("formula" ou "belief_set")
+            text: Le texte source
+            parse: Fonction de parsing appelée en cas d'absence du cache
+            signature: Contexte de parsing distinguant deux textes identiques (optionnel)
+            text_hash: Condensat du texte déjà calculé (par exemple `BeliefSet.content_hash`),
+                utilisé à la place de `content_hash(text)`
+
+        Returns:
+            L'objet parsé
+        """
+        key = (logic_type, kind, signature, text_hash if text_hash is not None else self.content_hash(text))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[0]
+            self._stats["misses"] += 1
+
+        value = parse(text)
+        size = len(text.encode("utf-8")) + ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            logger.debug(f"Parsed {kind} of {size} bytes exceeds the cache budget, not cached")
+            return value
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats["evictions"] += 1
+        return value
+
+    def invalidate(self, logic_type: Optional[str] = None) -> int:
+        """
+        Supprime les entrées d'un type de logique, ou toutes les entrées.
+
+        Args:
+            logic_type: Type de logique à purger (None pour tout le cache)
+
+        Returns:
+            Le nombre d'entrées supprimées
+        """
+        with self._lock:
+            if logic_type is None:
+                count = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return count
+
+            keys = [key for key in self._entries if key[0] == logic_type]
+            for key in keys:
+                self._bytes -= self._entries.pop(key)[1]
+            return len(keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Récupère les compteurs et l'occupation du cache.
+
+        Returns:
+            Un dictionnaire avec les succès, échecs, évictions, le taux de succès
+            et l'occupation en entrées et en octets
+        """
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes
+            }
+
+
+_shared_cache: Optional[ParseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_parse_cache() -> ParseCache:
+    """
+    Retourne le cache partagé par tous les handlers et instances de TweetyBridge.
+
+    Returns:
+        L'instance de `ParseCache` du processus
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ParseCache()
+        return _shared_cache
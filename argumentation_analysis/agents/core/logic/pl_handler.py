@@ -6,6 +6,10 @@ import logging
 from argumentation_analysis.utils.core_utils.logging_utils import setup_logging
 # Import TweetyInitializer to access its static methods for parser/reasoner
 from .tweety_initializer import TweetyInitializer
+from .parse_cache import ParseCache, get_shared_parse_cache
+from .entailment_memo import EntailmentMemo, OPERATION_CONSISTENCY, OPERATION_QUERY, get_default_entailment_memo
+from .reasoning_session import PLReasoningSession
+from .belief_set import PropositionalBeliefSet, as_belief_set
 
 setup_logging() # Appel de la configuration globale du logging
 logger = logging.getLogger(__name__) # Obtient le logger pour ce module
@@ -14,12 +18,20 @@ class PLHandler:
     """
     Handles Propositional Logic (PL) operations using TweetyProject.
     Relies on TweetyInitializer for JVM and PL component setup.
+    Parsed formulas and belief sets are kept in a ParseCache (shared by default).
+    Reasoner results are looked up in an optional persistent EntailmentMemo
+    (by default the one configured by TWEETY_ENTAILMENT_MEMO, if any).
+    By default the handler uses the parser and reasoner shared through TweetyInitializer;
+    pooled handlers receive their own instances (see TweetyInitializer.create_components).
     """
 
-    def __init__(self, initializer_instance: TweetyInitializer):
+    def __init__(self, initializer_instance: TweetyInitializer, parse_cache: ParseCache = None,
+                 entailment_memo: EntailmentMemo = None, pl_parser=None, pl_reasoner=None):
         self._initializer_instance = initializer_instance
-        self._pl_parser = self._initializer_instance.get_pl_parser()
-        self._pl_reasoner = self._initializer_instance.get_pl_reasoner()
+        self._parse_cache = parse_cache if parse_cache is not None else get_shared_parse_cache()
+        self._entailment_memo = entailment_memo if entailment_memo is not None else get_default_entailment_memo()
+        self._pl_parser = pl_parser if pl_parser is not None else self._initializer_instance.get_pl_parser()
+        self._pl_reasoner = pl_reasoner if pl_reasoner is not None else self._initializer_instance.get_pl_reasoner()
 
         if self._pl_parser is None or self._pl_reasoner is None:
             logger.error("PL components not initialized. Ensure TweetyBridge calls TweetyInitializer first.")
@@ -30,6 +42,10 @@ class PLHandler:
         """Parses a PL formula string into a TweetyProject PlFormula object."""
         if not isinstance(formula_str, str):
             raise TypeError("Input formula must be a string.")
+        return self._parse_cache.get_or_parse("pl", "formula", formula_str, self._parse_pl_formula)
+
+    def _parse_pl_formula(self, formula_str: str):
+        """Parses a PL formula through the Java parser, bypassing the cache."""
         logger.debug(f"Attempting to parse PL formula: {formula_str}")
         try:
             # Tweety's PlParser expects a Java String
@@ -48,39 +64,64 @@ class PLHandler:
             logger.error(f"Unexpected error parsing PL formula '{formula_str}': {e}", exc_info=True)
             raise
 
-    def pl_check_consistency(self, knowledge_base_str: str) -> bool:
+    def parse_pl_belief_set(self, knowledge_base):
+        """
+        Parses a PL knowledge base (string of formulas, semicolon-separated, or a BeliefSet) into a PlBeliefSet.
+        A BeliefSet provides its already split formulas and content hash, and keeps a handle
+        to the PlBeliefSet so that later calls skip the cache lookup.
+        The result is cached and shared: callers must not modify it.
+        """
+        belief_set = as_belief_set(knowledge_base, PropositionalBeliefSet)
+        kb = belief_set.get_java_object("pl")
+        if kb is None:
+            kb = self._parse_cache.get_or_parse(
+                "pl", "belief_set", belief_set.canonical_content,
+                lambda text: self._parse_pl_belief_set(belief_set.formulas),
+                text_hash=belief_set.content_hash
+            )
+            belief_set.set_java_object(kb, "pl")
+        return kb
+
+    def _parse_pl_belief_set(self, formula_strings):
+        """Builds a new PlBeliefSet from a list of formulas, bypassing the belief set cache."""
+        PlBeliefSet = jpype.JClass("org.tweetyproject.logics.pl.syntax.PlBeliefSet")
+        kb = PlBeliefSet()
+        for f_str in formula_strings:
+            kb.add(self.parse_pl_formula(f_str))
+        return kb
+
+    def _memo_lookup(self, use_memo: bool, knowledge_base, operation: str, query_str: str = ""):
+        """Returns the memoized result of an operation, or None if absent or disabled."""
+        if not use_memo or self._entailment_memo is None:
+            return None
+        return self._entailment_memo.lookup("pl", knowledge_base, operation, query_str)
+
+    def _memo_store(self, use_memo: bool, knowledge_base, operation: str, query_str: str, result: bool):
+        """Memoizes the result of an operation if memoization is enabled."""
+        if use_memo and self._entailment_memo is not None:
+            self._entailment_memo.store("pl", knowledge_base, operation, query_str, result)
+
+    def pl_check_consistency(self, knowledge_base_str: str, use_memo: bool = True) -> bool:
         """
         Checks if a PL knowledge base (string of formulas, semicolon-separated) is consistent.
+        With use_memo=False, the entailment memo is neither consulted nor updated.
         """
         logger.debug(f"Checking PL consistency for: {knowledge_base_str}")
         try:
-            # Parse the knowledge base string into a PlBeliefSet
-            # Tweety's PlParser can parse a belief set directly if formulas are separated by ';'
-            # However, it's often safer to parse individual formulas and add them to a knowledge base.
-            # For simplicity here, assuming parseBeliefSet handles it or we adapt.
-            
-            # Let's refine this: parse individual formulas and add to a PlBeliefSet
-            formulas = []
-            # Handle potential empty strings or formulas correctly
-            formula_strings = [f.strip() for f in knowledge_base_str.split(';') if f.strip()]
-            
-            if not formula_strings:
+            memoized = self._memo_lookup(use_memo, knowledge_base_str, OPERATION_CONSISTENCY)
+            if memoized is not None:
+                logger.info(f"PL Knowledge base consistency for '{knowledge_base_str}': {memoized} (memoized)")
+                return memoized
+
+            kb = self.parse_pl_belief_set(knowledge_base_str)
+            if kb.size() == 0:
                 logger.info("Empty knowledge base is considered consistent.")
                 return True
 
-            PlBeliefSet = jpype.JClass("org.tweetyproject.logics.pl.syntax.PlBeliefSet")
-            kb = PlBeliefSet()
-
-            for f_str in formula_strings:
-                # Remove trailing '%' if present, as it was a previous workaround
-                cleaned_f_str = f_str.rstrip('%').strip()
-                if cleaned_f_str:
-                    parsed_formula = self.parse_pl_formula(cleaned_f_str)
-                    kb.add(parsed_formula)
-            
-            is_consistent = self._pl_reasoner.isConsistent(kb)
+            is_consistent = bool(self._pl_reasoner.isConsistent(kb))
+            self._memo_store(use_memo, knowledge_base_str, OPERATION_CONSISTENCY, "", is_consistent)
             logger.info(f"PL Knowledge base consistency for '{knowledge_base_str}': {is_consistent}")
-            return bool(is_consistent)
+            return is_consistent
         except ValueError as e: # Catch parsing errors from parse_pl_formula
             logger.error(f"Error parsing formula in knowledge base for consistency check: {e}", exc_info=True)
             raise
@@ -91,29 +132,27 @@ class PLHandler:
             logger.error(f"Unexpected error during PL consistency check for '{knowledge_base_str}': {e}", exc_info=True)
             raise
 
-    def pl_query(self, knowledge_base_str: str, query_formula_str: str) -> bool:
+    def pl_query(self, knowledge_base_str: str, query_formula_str: str, use_memo: bool = True) -> bool:
         """
         Checks if a query formula is entailed by a PL knowledge base.
         Knowledge base: string of formulas, semicolon-separated.
         Query: single formula string.
+        With use_memo=False, the entailment memo is neither consulted nor updated.
         """
         logger.debug(f"Performing PL query. KB: '{knowledge_base_str}', Query: '{query_formula_str}'")
         try:
-            PlBeliefSet = jpype.JClass("org.tweetyproject.logics.pl.syntax.PlBeliefSet")
-            kb = PlBeliefSet()
-
-            formula_strings = [f.strip() for f in knowledge_base_str.split(';') if f.strip()]
-            for f_str in formula_strings:
-                cleaned_f_str = f_str.rstrip('%').strip()
-                if cleaned_f_str:
-                    parsed_formula = self.parse_pl_formula(cleaned_f_str)
-                    kb.add(parsed_formula)
-            
+            memoized = self._memo_lookup(use_memo, knowledge_base_str, OPERATION_QUERY, query_formula_str)
+            if memoized is not None:
+                logger.info(f"PL Query: KB entails '{query_formula_str}'? {memoized} (memoized)")
+                return memoized
+
+            kb = self.parse_pl_belief_set(knowledge_base_str)
             query_formula = self.parse_pl_formula(query_formula_str.rstrip('%').strip())
             
-            entails = self._pl_reasoner.query(kb, query_formula)
+            entails = bool(self._pl_reasoner.query(kb, query_formula))
+            self._memo_store(use_memo, knowledge_base_str, OPERATION_QUERY, query_formula_str, entails)
             logger.info(f"PL Query: KB entails '{query_formula_str}'? {entails}")
-            return bool(entails)
+            return entails
         except ValueError as e: # Catch parsing errors
             logger.error(f"Error parsing formula for PL query: {e}", exc_info=True)
             raise
@@ -124,4 +163,49 @@ class PLHandler:
             logger.error(f"Unexpected error during PL query: {e}", exc_info=True)
             raise
 
+    def pl_query_batch(self, knowledge_base_str: str, query_formula_strs: list, use_memo: bool = True) -> list:
+        """
+        Checks several query formulas against the same PL knowledge base.
+        The knowledge base is parsed once and every query runs on the same reasoner instance;
+        memoized results (see use_memo in pl_query) skip the reasoner.
+        Returns one dict per query: {"query", "entailed" (bool or None), "error" (str or None)}.
+        A query that fails to parse or to evaluate only affects its own result;
+        knowledge base parsing errors are raised as in pl_query.
+        """
+        logger.debug(f"Performing PL batch query ({len(query_formula_strs)} queries). KB: '{knowledge_base_str}'")
+        kb = None # Parsed only if at least one query is not memoized
+
+        results = []
+        for query_formula_str in query_formula_strs:
+            entails = self._memo_lookup(use_memo, knowledge_base_str, OPERATION_QUERY, query_formula_str)
+            if entails is not None:
+                results.append({"query": query_formula_str, "entailed": entails, "error": None})
+                continue
+            if kb is None:
+                kb = self.parse_pl_belief_set(knowledge_base_str)
+            try:
+                query_formula = self.parse_pl_formula(query_formula_str.rstrip('%').strip())
+                entails = bool(self._pl_reasoner.query(kb, query_formula))
+                self._memo_store(use_memo, knowledge_base_str, OPERATION_QUERY, query_formula_str, entails)
+                results.append({"query": query_formula_str, "entailed": entails, "error": None})
+            except ValueError as e: # Catch parsing errors
+                logger.warning(f"Error parsing PL batch query '{query_formula_str}': {e}")
+                results.append({"query": query_formula_str, "entailed": None, "error": str(e)})
+            except jpype.JException as e:
+                logger.error(f"JPype JException during PL batch query '{query_formula_str}': {e.getMessage()}", exc_info=True)
+                results.append({"query": query_formula_str, "entailed": None, "error": f"PL query failed: {e.getMessage()}"})
+
+        logger.info(f"PL batch query: {sum(1 for r in results if r['entailed'])}/{len(results)} queries entailed.")
+        return results
+
+    def create_session(self, knowledge_base_str: str = None) -> PLReasoningSession:
+        """
+        Creates an incremental reasoning session, optionally loaded with a knowledge base
+        (formulas separated by ';' or newlines).
+        """
+        session = PLReasoningSession(self)
+        if knowledge_base_str:
+            session.sync(knowledge_base_str)
+        return session
+
     # Add other PL-specific methods as needed, e.g., model finding, transformations, etc.
\ No newline at end of file
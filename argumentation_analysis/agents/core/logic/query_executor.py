@@ -7,7 +7,7 @@ import logging
 from typing import Dict, List, Optional, Any, Tuple
 
 from .belief_set import BeliefSet
-from .tweety_bridge import TweetyBridge
+from .tweety_bridge import TIMEOUT_PREFIX, TweetyBridge
 
 # Configuration du logger
 logger = logging.getLogger("Orchestration.QueryExecutor")
@@ -27,7 +27,7 @@ class QueryExecutor:
         self._logger = logger
         self._tweety_bridge = TweetyBridge()
     
-    def execute_query(self, belief_set: BeliefSet, query: str) -> Tuple[Optional[bool], str]:
+    def execute_query(self, belief_set: BeliefSet, query: str, timeout: Optional[float] = None) -> Tuple[Optional[bool], str]:
         """
         Exécute une requête logique sur un ensemble de croyances donné.
 
@@ -39,10 +39,14 @@ class QueryExecutor:
         :type belief_set: BeliefSet
         :param query: La requête logique (chaîne de caractères) à exécuter.
         :type query: str
+        :param timeout: Délai maximal en secondes d'une requête FOL ou modale
+                        (par défaut celui de `TweetyBridge`).
+        :type timeout: Optional[float]
         :return: Un tuple contenant:
-                 - Le résultat booléen de la requête (True, False, ou None si indéterminé
-                   ou si une erreur survient).
-                 - Un message formaté (str) décrivant le résultat ou l'erreur.
+                 - Le résultat booléen de la requête (True, False, ou None si indéterminé,
+                   si une erreur survient ou si le délai est dépassé).
+                 - Un message formaté (str) décrivant le résultat ou l'erreur ; il commence
+                   par `TIMEOUT_PREFIX` si le délai est dépassé.
         :rtype: Tuple[Optional[bool], str]
         """
         self._logger.info(f"Exécution de la requête '{query}' sur un ensemble de croyances de type '{belief_set.logic_type}'")
@@ -57,15 +61,15 @@ class QueryExecutor:
         if belief_set.logic_type == "propositional":
             return self._execute_propositional_query(belief_set, query)
         elif belief_set.logic_type == "first_order":
-            return self._execute_first_order_query(belief_set, query)
+            return self._execute_first_order_query(belief_set, query, timeout)
         elif belief_set.logic_type == "modal":
-            return self._execute_modal_query(belief_set, query)
+            return self._execute_modal_query(belief_set, query, timeout)
         else:
             error_msg = f"Type de logique non supporté: {belief_set.logic_type}"
             self._logger.error(error_msg)
             return None, f"FUNC_ERROR: {error_msg}"
     
-    def execute_queries(self, belief_set: BeliefSet, queries: List[str]) -> List[Tuple[str, Optional[bool], str]]:
+    def execute_queries(self, belief_set: BeliefSet, queries: List[str], timeout: Optional[float] = None) -> List[Tuple[str, Optional[bool], str]]:
         """
         Exécute une liste de requêtes logiques sur un ensemble de croyances.
 
@@ -75,6 +79,8 @@ class QueryExecutor:
         :type belief_set: BeliefSet
         :param queries: Une liste de requêtes logiques (chaînes de caractères).
         :type queries: List[str]
+        :param timeout: Délai maximal en secondes de chaque requête FOL ou modale.
+        :type timeout: Optional[float]
         :return: Une liste de tuples. Chaque tuple contient la requête originale (str),
                  son résultat booléen (Optional[bool]), et le message formaté (str).
         :rtype: List[Tuple[str, Optional[bool], str]]
@@ -83,11 +89,38 @@ class QueryExecutor:
         
         results = []
         for query in queries:
-            result, message = self.execute_query(belief_set, query)
+            result, message = self.execute_query(belief_set, query, timeout)
             results.append((query, result, message))
         
         return results
-    
+
+    def execute_queries_batch(self, belief_set: BeliefSet, queries: List[str]) -> List[Tuple[str, Optional[bool], str]]:
+        """
+        Exécute une liste de requêtes en un seul appel groupé à `TweetyBridge`.
+
+        Contrairement à `execute_queries`, l'ensemble de croyances n'est parsé
+        qu'une fois pour toutes les requêtes (voir `TweetyBridge.execute_queries_batch`).
+
+        :param belief_set: L'objet `BeliefSet` sur lequel exécuter les requêtes.
+        :type belief_set: BeliefSet
+        :param queries: Une liste de requêtes logiques (chaînes de caractères).
+        :type queries: List[str]
+        :return: Une liste de tuples (requête, résultat booléen, message formaté),
+                 dans le même format que `execute_queries`.
+        :rtype: List[Tuple[str, Optional[bool], str]]
+        """
+        self._logger.info(f"Exécution groupée de {len(queries)} requêtes sur un ensemble de croyances de type '{belief_set.logic_type}'")
+
+        if not self._tweety_bridge.is_jvm_ready():
+            error_msg = "JVM non prête ou composants Tweety non chargés"
+            self._logger.error(error_msg)
+            return [(query, None, f"FUNC_ERROR: {error_msg}") for query in queries]
+
+        return [
+            (result["query"], result["result"], result["message"])
+            for result in self._tweety_bridge.execute_queries_batch(belief_set, queries)
+        ]
+
     def _execute_propositional_query(self, belief_set: BeliefSet, query: str) -> Tuple[Optional[bool], str]:
         """
         Exécute une requête de logique propositionnelle via `TweetyBridge`.
@@ -128,7 +161,7 @@ class QueryExecutor:
             self._logger.error(error_msg, exc_info=True)
             return None, f"FUNC_ERROR: {error_msg}"
     
-    def _execute_first_order_query(self, belief_set: BeliefSet, query: str) -> Tuple[Optional[bool], str]:
+    def _execute_first_order_query(self, belief_set: BeliefSet, query: str, timeout: Optional[float] = None) -> Tuple[Optional[bool], str]:
         """
         Exécute une requête de logique du premier ordre (FOL) via `TweetyBridge`.
 
@@ -138,6 +171,8 @@ class QueryExecutor:
         :type belief_set: BeliefSet
         :param query: La requête en logique du premier ordre.
         :type query: str
+        :param timeout: Délai maximal de la requête en secondes.
+        :type timeout: Optional[float]
         :return: Tuple (résultat booléen, message formaté).
         :rtype: Tuple[Optional[bool], str]
         """
@@ -149,9 +184,15 @@ class QueryExecutor:
                 return None, f"FUNC_ERROR: Requête invalide: {validation_msg}"
             
             # Exécuter la requête
-            result_str = self._tweety_bridge.execute_fol_query(belief_set.content, query)
+            # Le délai n'est transmis que s'il est indiqué (sinon celui de TweetyBridge s'applique)
+            timeout_kwargs = {"timeout": timeout} if timeout is not None else {}
+            result_str = self._tweety_bridge.execute_fol_query(belief_set.content, query, **timeout_kwargs)
             
             # Analyser le résultat
+            if result_str.startswith(TIMEOUT_PREFIX):
+                self._logger.warning(f"Délai dépassé pour la requête du premier ordre: {result_str}")
+                return None, result_str
+
             if "FUNC_ERROR" in result_str:
                 self._logger.error(f"Erreur lors de l'exécution de la requête du premier ordre: {result_str}")
                 return None, result_str
@@ -168,7 +209,7 @@ class QueryExecutor:
             self._logger.error(error_msg, exc_info=True)
             return None, f"FUNC_ERROR: {error_msg}"
     
-    def _execute_modal_query(self, belief_set: BeliefSet, query: str) -> Tuple[Optional[bool], str]:
+    def _execute_modal_query(self, belief_set: BeliefSet, query: str, timeout: Optional[float] = None) -> Tuple[Optional[bool], str]:
         """
         Exécute une requête de logique modale via `TweetyBridge`.
 
@@ -178,6 +219,8 @@ class QueryExecutor:
         :type belief_set: BeliefSet
         :param query: La requête en logique modale.
         :type query: str
+        :param timeout: Délai maximal de la requête en secondes.
+        :type timeout: Optional[float]
         :return: Tuple (résultat booléen, message formaté).
         :rtype: Tuple[Optional[bool], str]
         """
@@ -189,9 +232,15 @@ class QueryExecutor:
                 return None, f"FUNC_ERROR: Requête invalide: {validation_msg}"
             
             # Exécuter la requête
-            result_str = self._tweety_bridge.execute_modal_query(belief_set.content, query)
+            # Le délai n'est transmis que s'il est indiqué (sinon celui de TweetyBridge s'applique)
+            timeout_kwargs = {"timeout": timeout} if timeout is not None else {}
+            result_str = self._tweety_bridge.execute_modal_query(belief_set.content, query, **timeout_kwargs)
             
             # Analyser le résultat
+            if result_str.startswith(TIMEOUT_PREFIX):
+                self._logger.warning(f"Délai dépassé pour la requête modale: {result_str}")
+                return None, result_str
+
             if "FUNC_ERROR" in result_str:
                 self._logger.error(f"Erreur lors de l'exécution de la requête modale: {result_str}")
                 return None, result_str
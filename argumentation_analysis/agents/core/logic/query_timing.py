@@ -0,0 +1,163 @@
+# argumentation_analysis/agents/core/logic/query_timing.py
+"""
+Délais des requêtes logiques et histogrammes de latence par logique.
+
+Les appels aux raisonneurs Java sont synchrones : un ensemble de croyances
+pathologique peut bloquer une requête indéfiniment. `run_with_deadline`
+exécute un appel dans un thread dédié et rend la main à l'expiration du
+délai en levant `ReasoningTimeout` ; le thread Java de l'appel est alors
+interrompu (`Thread.interrupt()`), ce que les raisonneurs Tweety prennent
+en compte lorsqu'ils testent l'interruption. L'appel abandonné se poursuit
+sinon en arrière-plan jusqu'à son terme.
+
+`QueryLatencyStats` répartit la durée des requêtes de chaque logique dans
+les histogrammes logarithmiques des statistiques du middleware.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import jpype
+
+from argumentation_analysis.core.utils.latency_stats import (
+    ThreadLocalCounters, latency_bucket, summarize_latency
+)
+
+logger = logging.getLogger("Orchestration.QueryTiming")
+
+# Issues possibles d'une requête
+QUERY_OUTCOMES = ("ok", "error", "timeout")
+
+
+class ReasoningTimeout(TimeoutError):
+    """
+    Exception levée lorsqu'une requête logique dépasse son délai.
+
+    Attributes:
+        timeout (float): Le délai dépassé, en secondes.
+    """
+
+    def __init__(self, timeout: float):
+        super().__init__(f"Reasoning exceeded its {timeout} s deadline")
+        self.timeout = timeout
+
+
+def run_with_deadline(func: Callable[[], Any], timeout: Optional[float], name: str = "tweety_query") -> Any:
+    """
+    Exécute un appel avec un délai maximal.
+
+    Args:
+        func: L'appel à exécuter
+        timeout: Le délai en secondes (None : appel direct, sans délai)
+        name: Nom du thread d'exécution (pour les logs)
+
+    Returns:
+        Le résultat de l'appel
+
+    Raises:
+        ReasoningTimeout: Si l'appel ne se termine pas dans le délai
+        Exception: Toute exception levée par l'appel
+    """
+    if timeout is None:
+        return func()
+
+    outcome: Dict[str, Any] = {}
+
+    def target():
+        if jpype.isJVMStarted():
+            outcome["java_thread"] = jpype.JClass("java.lang.Thread").currentThread()
+        try:
+            outcome["result"] = func()
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, name=name, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        java_thread = outcome.get("java_thread")
+        if java_thread is not None:
+            try:
+                java_thread.interrupt()
+            except Exception as e:
+                logger.warning(f"Could not interrupt Java thread of {name}: {e}")
+        raise ReasoningTimeout(timeout)
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+class QueryLatencyStats:
+    """
+    Histogrammes de latence et issues des requêtes, par logique.
+
+    Les mesures sont enregistrées sans verrou partagé (`ThreadLocalCounters`).
+    """
+
+    def __init__(self):
+        """Initialise des statistiques vides."""
+        self._counters = ThreadLocalCounters()
+
+    def record(self, logic: str, outcome: str, latency_ns: int) -> None:
+        """
+        Enregistre une requête.
+
+        Args:
+            logic: La logique ("pl", "fol" ou "modal")
+            outcome: L'issue de la requête ("ok", "error" ou "timeout")
+            latency_ns: La durée de la requête en nanosecondes
+        """
+        shard = self._counters.shard()
+        shard[("outcome", logic, outcome)] += 1
+        shard[("bucket", logic, latency_bucket(latency_ns))] += 1
+        shard[("sum", logic)] += latency_ns
+
+    def measure(self, logic: str, func: Callable[[], Any]) -> Any:
+        """
+        Exécute un appel et enregistre sa durée et son issue.
+
+        Args:
+            logic: La logique de la requête
+            func: L'appel à mesurer
+
+        Returns:
+            Le résultat de l'appel (les exceptions sont propagées)
+        """
+        start_ns = time.perf_counter_ns()
+        outcome = "error"
+        try:
+            result = func()
+            outcome = "ok"
+            return result
+        except ReasoningTimeout:
+            outcome = "timeout"
+            raise
+        finally:
+            self.record(logic, outcome, time.perf_counter_ns() - start_ns)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupère les statistiques de chaque logique.
+
+        Returns:
+            Pour chaque logique, le résumé de `summarize_latency` (nombre, moyenne,
+            percentiles, histogramme) et le nombre de requêtes par issue
+        """
+        histograms: Dict[str, Dict[int, int]] = {}
+        totals: Dict[str, int] = {}
+        outcomes: Dict[str, Dict[str, int]] = {}
+        for key, value in self._counters.snapshot().items():
+            if key[0] == "bucket":
+                histograms.setdefault(key[1], {})[key[2]] = value
+            elif key[0] == "sum":
+                totals[key[1]] = value
+            else:
+                outcomes.setdefault(key[1], dict.fromkeys(QUERY_OUTCOMES, 0))[key[2]] = value
+
+        stats = {}
+        for logic, histogram in histograms.items():
+            stats[logic] = summarize_latency(histogram, totals.get(logic, 0))
+            stats[logic]["outcomes"] = outcomes.get(logic, dict.fromkeys(QUERY_OUTCOMES, 0))
+        return stats
@@ -0,0 +1,127 @@
+# argumentation_analysis/agents/core/logic/reasoner_pool.py
+"""
+Pool d'instances de parseurs/raisonneurs Tweety, avec emprunt et restitution.
+
+`TweetyInitializer` ne conserve qu'un parseur et un raisonneur par logique,
+partagés par tous les appelants : les parseurs Tweety ont un état (signature
+courante) et ne peuvent pas être utilisés par deux threads à la fois.
+`ReasonerPool` crée à la demande, jusqu'à une taille maximale, des handlers
+disposant chacun de leurs propres instances Java ; un thread emprunte un
+handler (`checkout`), l'utilise seul, puis le restitue. Lorsque tous les
+handlers sont empruntés, les appelants suivants attendent.
+
+Le pool est générique : il ne connaît que la fabrique qui crée ses éléments.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger("Orchestration.ReasonerPool")
+
+
+class ReasonerPool:
+    """
+    Pool borné d'éléments créés à la demande et empruntés par un seul appelant à la fois.
+
+    Attributes:
+        name (str): Nom du pool (pour les logs).
+        max_size (int): Nombre maximum d'éléments créés.
+    """
+
+    def __init__(self, factory: Callable[[int], Any], max_size: int, name: str = "pool"):
+        """
+        Crée un pool vide.
+
+        Args:
+            factory: Fonction créant un élément à partir de son indice de création (0, 1, ...)
+            max_size: Nombre maximum d'éléments
+            name: Nom du pool
+
+        Raises:
+            ValueError: Si max_size est inférieur à 1
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.name = name
+        self.max_size = max_size
+        self._factory = factory
+        self._condition = threading.Condition()
+        self._idle: List[Any] = []
+        self._created = 0
+        self._stats = {"checkouts": 0, "waits": 0, "timeouts": 0}
+
+    def _acquire(self, timeout: Optional[float]) -> Any:
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            waited = False
+            while not self._idle and self._created >= self.max_size:
+                if not waited:
+                    self._stats["waits"] += 1
+                    waited = True
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise TimeoutError(f"No {self.name} instance available after {timeout} s")
+                self._condition.wait(remaining)
+            self._stats["checkouts"] += 1
+            if self._idle:
+                # LIFO : l'élément le plus récemment utilisé est le plus « chaud »
+                return self._idle.pop()
+            index = self._created
+            self._created += 1
+
+        # Création hors verrou : elle peut être longue (appels Java)
+        try:
+            item = self._factory(index)
+        except Exception:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+        logger.debug(f"{self.name}: created instance #{index}")
+        return item
+
+    def _release(self, item: Any) -> None:
+        with self._condition:
+            self._idle.append(item)
+            self._condition.notify()
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Emprunte un élément pour la durée du bloc `with`.
+
+        Args:
+            timeout: Attente maximale en secondes lorsque le pool est épuisé (None : sans limite)
+
+        Yields:
+            Un élément, utilisé par ce seul appelant jusqu'à sa restitution
+
+        Raises:
+            TimeoutError: Si aucun élément ne se libère dans le délai
+        """
+        item = self._acquire(timeout)
+        try:
+            yield item
+        finally:
+            self._release(item)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Récupère les compteurs du pool.
+
+        Returns:
+            Un dictionnaire avec le nombre d'éléments créés, libres et empruntés,
+            d'emprunts, d'attentes et d'expirations
+        """
+        with self._condition:
+            return {
+                **self._stats,
+                "created": self._created,
+                "idle": len(self._idle),
+                "in_use": self._created - len(self._idle),
+                "max_size": self.max_size
+            }
@@ -0,0 +1,248 @@
+# argumentation_analysis/agents/core/logic/reasoning_session.py
+"""
+Sessions de raisonnement propositionnel incrémental.
+
+Les enquêtes (Cluedo, Watson) font grossir un ensemble de croyances formule
+par formule, et chaque `pl_query` reconstruisait un `PlBeliefSet` puis
+relançait le solveur SAT sur l'ensemble complet. `PLReasoningSession`
+conserve côté Java un `PlBeliefSet` propre à la session, modifié en place
+par ajout et retrait de formules, et réutilise le travail déjà fait :
+
+- les modèles (témoins) trouvés par le solveur sont conservés tant qu'ils
+  satisfont l'ensemble ; un modèle connu qui satisfait les hypothèses et
+  falsifie une requête prouve sa non-inférence sans appel SAT ;
+- l'inférence est monotone : après un ajout, les requêtes inférées le
+  restent ; après un retrait, les requêtes non inférées le restent ;
+- la cohérence est conservée après un ajout tant qu'un modèle connu
+  satisfait la nouvelle formule.
+
+Les requêtes acceptent des hypothèses temporaires (`assumptions`), ajoutées
+à l'ensemble le temps d'un appel au solveur sans modifier la session.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+import jpype
+
+from .belief_set import split_formulas, strip_comment
+
+logger = logging.getLogger("Orchestration.ReasoningSession")
+
+
+class PLReasoningSession:
+    """
+    Ensemble de croyances propositionnel vivant côté Java, interrogé de façon incrémentale.
+
+    Une session n'est pas thread-safe : elle est destinée à un fil
+    d'enquête (un agent, un workflow).
+
+    Attributes:
+        max_models (int): Nombre maximum de modèles conservés.
+    """
+
+    def __init__(self, pl_handler, formulas: Optional[Iterable[str]] = None, max_models: int = 32):
+        """
+        Crée une session, éventuellement initialisée avec des formules.
+
+        Args:
+            pl_handler: Le PLHandler utilisé pour parser les formules
+            formulas: Formules initiales (optionnel)
+            max_models: Nombre maximum de modèles conservés
+
+        Raises:
+            ValueError: Si une formule initiale est invalide
+        """
+        self._handler = pl_handler
+        self.max_models = max_models
+        self._kb = jpype.JClass("org.tweetyproject.logics.pl.syntax.PlBeliefSet")()
+        self._negation_class = jpype.JClass("org.tweetyproject.logics.pl.syntax.Negation")
+        self._solver = jpype.JClass("org.tweetyproject.logics.pl.sat.SatSolver").getDefaultSolver()
+
+        self._formulas: "OrderedDict[str, Any]" = OrderedDict()
+        self._models: List[Any] = []
+        self._consistent: Optional[bool] = True
+        self._entailed: Dict[str, bool] = {}
+        self.stats = {"sat_calls": 0, "model_hits": 0, "result_hits": 0}
+
+        if formulas:
+            self.add_formulas(formulas)
+
+    @property
+    def formulas(self) -> List[str]:
+        """Les formules de la session, dans leur ordre d'ajout."""
+        return list(self._formulas)
+
+    @property
+    def content(self) -> str:
+        """Le contenu de la session au format attendu par `PLHandler` (formules séparées par ';')."""
+        return "; ".join(self._formulas)
+
+    @staticmethod
+    def _normalize(formula_str: str) -> str:
+        """Normalise une formule comme le découpage des ensembles de croyances (commentaire '%' et espaces retirés)."""
+        return strip_comment(formula_str)
+
+    def add_formula(self, formula_str: str) -> bool:
+        """
+        Ajoute une formule à la session.
+
+        Args:
+            formula_str: La formule à ajouter
+
+        Returns:
+            True si la formule a été ajoutée, False si elle était déjà présente
+
+        Raises:
+            ValueError: Si la formule est invalide
+        """
+        key = self._normalize(formula_str)
+        if not key or key in self._formulas:
+            return False
+
+        formula = self._handler.parse_pl_formula(key)
+        self._kb.add(formula)
+        self._formulas[key] = formula
+
+        # Seuls les modèles satisfaisant la nouvelle formule restent des modèles de l'ensemble
+        self._models = [model for model in self._models if bool(model.satisfies(formula))]
+        if self._consistent is True and not self._models:
+            self._consistent = None
+        # Monotonie : ce qui était inféré le reste
+        self._entailed = {query: True for query, entailed in self._entailed.items() if entailed}
+        return True
+
+    def add_formulas(self, formulas: Iterable[str]) -> int:
+        """
+        Ajoute plusieurs formules à la session.
+
+        Args:
+            formulas: Les formules à ajouter
+
+        Returns:
+            Le nombre de formules effectivement ajoutées
+        """
+        return sum(1 for formula_str in formulas if self.add_formula(formula_str))
+
+    def retract_formula(self, formula_str: str) -> bool:
+        """
+        Retire une formule de la session.
+
+        Args:
+            formula_str: La formule à retirer
+
+        Returns:
+            True si la formule a été retirée, False si elle était absente
+        """
+        formula = self._formulas.pop(self._normalize(formula_str), None)
+        if formula is None:
+            return False
+
+        self._kb.remove(formula)
+        # Les modèles de l'ensemble restent des modèles d'un sous-ensemble
+        if self._consistent is False:
+            self._consistent = None
+        # Monotonie : ce qui n'était pas inféré ne l'est toujours pas
+        self._entailed = {query: False for query, entailed in self._entailed.items() if not entailed}
+        return True
+
+    def sync(self, knowledge_base_str: str) -> Dict[str, int]:
+        """
+        Aligne la session sur un ensemble de croyances complet, par différence.
+
+        Permet de suivre un état qui remplace le contenu entier d'un ensemble de
+        croyances (par exemple `add_or_update_belief_set`) sans tout re-résoudre.
+
+        Args:
+            knowledge_base_str: Le nouveau contenu (formules séparées par ';' ou des retours à la ligne)
+
+        Returns:
+            Le nombre de formules ajoutées et retirées
+        """
+        target = [self._normalize(formula_str) for formula_str in split_formulas(knowledge_base_str)]
+        target_set = set(target)
+        retracted = sum(1 for key in list(self._formulas) if key not in target_set and self.retract_formula(key))
+        added = self.add_formulas(target)
+        return {"added": added, "retracted": retracted}
+
+    def _remember_model(self, model: Any) -> None:
+        """Conserve un modèle de l'ensemble de croyances, en évinçant le plus ancien."""
+        self._models.insert(0, model)
+        del self._models[self.max_models:]
+
+    def _witness(self, extra_formulas: List[Any]) -> Any:
+        """Appelle le solveur sur l'ensemble de la session augmenté de formules temporaires."""
+        formulas = jpype.JClass("java.util.ArrayList")(self._kb)
+        for formula in extra_formulas:
+            formulas.add(formula)
+        self.stats["sat_calls"] += 1
+        return self._solver.getWitness(formulas)
+
+    def is_consistent(self) -> bool:
+        """
+        Vérifie la cohérence de la session.
+
+        Returns:
+            True si l'ensemble de croyances a au moins un modèle
+        """
+        if self._consistent is not None:
+            self.stats["result_hits"] += 1
+            return self._consistent
+
+        witness = self._witness([])
+        self._consistent = witness is not None
+        if witness is not None:
+            self._remember_model(witness)
+        return self._consistent
+
+    def entails(self, query_str: str, assumptions: Optional[Iterable[str]] = None) -> bool:
+        """
+        Vérifie si la session, augmentée d'hypothèses temporaires, infère une requête.
+
+        Args:
+            query_str: La requête
+            assumptions: Formules supposées vraies le temps de cette requête (optionnel)
+
+        Returns:
+            True si la requête est inférée
+
+        Raises:
+            ValueError: Si la requête ou une hypothèse est invalide
+        """
+        key = self._normalize(query_str)
+        assumption_formulas = [self._handler.parse_pl_formula(self._normalize(a)) for a in assumptions or []]
+        if not assumption_formulas and key in self._entailed:
+            self.stats["result_hits"] += 1
+            return self._entailed[key]
+
+        query_formula = self._handler.parse_pl_formula(key)
+        entailed = None
+        for model in self._models:
+            if all(bool(model.satisfies(a)) for a in assumption_formulas) and not bool(model.satisfies(query_formula)):
+                self.stats["model_hits"] += 1
+                entailed = False
+                break
+
+        if entailed is None:
+            # KB ∪ hypothèses ⊨ q ssi KB ∪ hypothèses ∪ {¬q} est insatisfiable
+            witness = self._witness(assumption_formulas + [self._negation_class(query_formula)])
+            entailed = witness is None
+            if witness is not None:
+                self._remember_model(witness)
+                self._consistent = True
+
+        if not assumption_formulas:
+            self._entailed[key] = entailed
+        logger.debug(f"Session query '{query_str}' (assumptions: {len(assumption_formulas)}): {entailed}")
+        return entailed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Récupère les compteurs de la session.
+
+        Returns:
+            Un dictionnaire avec le nombre de formules, de modèles conservés,
+            d'appels au solveur et de réponses obtenues sans solveur
+        """
+        return {**self.stats, "formulas": len(self._formulas), "models": len(self._models)}
@@ -10,8 +10,13 @@ premier ordre, et la logique modale. L'interaction avec Java est gérée
 par la bibliothèque JPype.
 """
 
+import functools
 import logging
-from typing import Tuple, Optional, Any, Dict, List
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import Tuple, Optional, Any, Dict, List, Union
 
 import jpype
 # from argumentation_analysis.core.jvm_setup import initialize_jvm # Remplacé par TweetyInitializer
@@ -22,10 +27,49 @@ from .tweety_initializer import TweetyInitializer
 from .pl_handler import PLHandler
 from .fol_handler import FOLHandler
 from .modal_handler import ModalHandler
+from .parse_cache import ParseCache, get_shared_parse_cache
+from .entailment_memo import EntailmentMemo
+from .belief_set import BeliefSet
+from .reasoning_session import PLReasoningSession
+from .native_pl import NativePLHandler
+from .reasoner_pool import ReasonerPool
+from .query_timing import QueryLatencyStats, ReasoningTimeout, run_with_deadline
 
 # Configuration du logger
 logger = logging.getLogger("Orchestration.TweetyBridge")
 
+# Backends de la logique propositionnelle : TweetyProject, moteur Python pur,
+# ou moteur Python pur pour les petits ensembles avec repli sur TweetyProject
+PL_BACKEND_ENV_VAR = "TWEETY_PL_BACKEND"
+PL_BACKENDS = ("tweety", "native", "auto")
+NATIVE_PL_MAX_FORMULAS = 100
+
+# Nombre de handlers (et donc d'instances de parseur/raisonneur Java) par logique
+# pouvant travailler en parallèle, et de threads de l'exécuteur de TweetyBridge
+POOL_SIZE_ENV_VAR = "TWEETY_POOL_SIZE"
+DEFAULT_POOL_SIZE = min(4, os.cpu_count() or 1)
+
+# Délai par défaut (en secondes) des requêtes FOL et modales, et préfixe des
+# messages de résultat des requêtes interrompues à son expiration
+QUERY_TIMEOUT_ENV_VAR = "TWEETY_QUERY_TIMEOUT"
+TIMEOUT_PREFIX = "TIMEOUT:"
+
+
+def _pooled(method):
+    """Exécute une méthode de TweetyBridge avec des handlers empruntés aux pools (voir `_pooled_scope`)."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._pooled_scope():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _attach_worker_thread() -> None:
+    """Attache un thread de l'exécuteur à la JVM avant sa première tâche."""
+    if jpype.isJVMStarted() and not jpype.isThreadAttachedToJVM():
+        jpype.attachThreadToJVM()
+
+
 class TweetyBridge:
     """
     Interface avec TweetyProject via JPype pour différents types de logiques.
@@ -37,25 +81,88 @@ class TweetyBridge:
     FOLHandler, ModalHandler) qui s'appuient sur TweetyInitializer pour la
     gestion de la JVM et des composants Java de TweetyProject.
 
+    La JVM est démarrée à la construction, mais les composants Java et le
+    handler de chaque logique ne sont initialisés qu'à sa première
+    utilisation : un usage purement propositionnel ne charge ni FOL ni ML.
+
+    Les parseurs Tweety ayant un état, un handler n'est utilisé que par un
+    thread à la fois : les méthodes publiques empruntent leurs handlers à un
+    pool par logique (`ReasonerPool`), qui crée au besoin jusqu'à `pool_size`
+    handlers disposant chacun de leurs propres instances Java. Le premier
+    élément de chaque pool est le handler principal de la logique.
+    `submit` et `execute_queries_parallel` répartissent les requêtes sur un
+    exécuteur borné dont les threads sont attachés à la JVM.
+
     Attributes:
         _logger (logging.Logger): Logger pour cette classe.
-        _jvm_ok (bool): Indique si les handlers Python sont prêts.
+        _jvm_ok (bool): Indique si la JVM est prête.
         _initializer (TweetyInitializer): Instance du gestionnaire d'initialisation Tweety.
-        _pl_handler (PLHandler): Handler pour la logique propositionnelle.
-        _fol_handler (FOLHandler): Handler pour la logique du premier ordre.
-        _modal_handler (ModalHandler): Handler pour la logique modale.
+        _pl_handler (PLHandler): Handler pour la logique propositionnelle (initialisé au premier accès).
+        _fol_handler (FOLHandler): Handler pour la logique du premier ordre (initialisé au premier accès).
+        _modal_handler (ModalHandler): Handler pour la logique modale (initialisé au premier accès).
+        _parse_cache (ParseCache): Cache des formules et ensembles de croyances parsés,
+            partagé par les handlers (et par défaut entre instances de TweetyBridge).
+        _pl_backend (str): Backend de la logique propositionnelle ("tweety", "native" ou "auto").
+        _native_pl_handler (NativePLHandler): Handler propositionnel en Python pur.
+        _pool_size (int): Taille des pools de handlers et nombre de threads de l'exécuteur.
+        _pools (Dict[str, ReasonerPool]): Pool de handlers de chaque logique (créé au premier emprunt).
+        _query_timeout (Optional[float]): Délai par défaut des requêtes FOL et modales, en secondes.
+        _latency_stats (QueryLatencyStats): Histogrammes de latence des requêtes, par logique.
     """
     
-    def __init__(self):
+    def __init__(self, parse_cache: Optional[ParseCache] = None, entailment_memo: Optional[EntailmentMemo] = None,
+                 pl_backend: Optional[str] = None, pool_size: Optional[int] = None, pool_timeout: Optional[float] = None,
+                 query_timeout: Optional[float] = None):
         """
         Initialise l'interface TweetyBridge et ses handlers.
 
         S'appuie sur TweetyInitializer pour la gestion de la JVM et des
         composants Java sous-jacents.
+
+        :param parse_cache: Cache de parsing à utiliser (par défaut le cache
+                            partagé du processus).
+        :type parse_cache: Optional[ParseCache]
+        :param entailment_memo: Mémoïsation persistante des résultats PL (par défaut
+                                celle configurée par TWEETY_ENTAILMENT_MEMO, si définie).
+        :type entailment_memo: Optional[EntailmentMemo]
+        :param pl_backend: Backend des requêtes propositionnelles : "tweety" (par défaut),
+                           "native" (moteur Python pur, sans appel Java) ou "auto" (moteur
+                           Python pur jusqu'à NATIVE_PL_MAX_FORMULAS formules, TweetyProject
+                           au-delà ou si la syntaxe n'est pas reconnue). Par défaut, la valeur
+                           de TWEETY_PL_BACKEND si elle est définie.
+        :type pl_backend: Optional[str]
+        :param pool_size: Nombre maximum de handlers par logique et de threads de l'exécuteur
+                          (par défaut TWEETY_POOL_SIZE, sinon min(4, nombre de processeurs)).
+        :type pool_size: Optional[int]
+        :param pool_timeout: Attente maximale, en secondes, d'un handler libre (par défaut sans limite).
+        :type pool_timeout: Optional[float]
+        :param query_timeout: Délai par défaut, en secondes, des requêtes FOL et modales
+                              (par défaut TWEETY_QUERY_TIMEOUT, sinon sans limite).
+        :type query_timeout: Optional[float]
+        :raises ValueError: Si le backend demandé est inconnu ou si la taille des pools est inférieure à 1.
         """
         self._logger = logger
+        self._pl_backend = pl_backend or os.getenv(PL_BACKEND_ENV_VAR, "tweety")
+        if self._pl_backend not in PL_BACKENDS:
+            raise ValueError(f"Backend PL inconnu: '{self._pl_backend}' (attendu: {', '.join(PL_BACKENDS)})")
         self._logger.info("TWEETY_BRIDGE: __init__ - Début (Refactored)")
-        self._jvm_ok = False # Sera mis à True si tous les handlers s'initialisent correctement
+        self._jvm_ok = False # Sera mis à True une fois la JVM prête
+        self._parse_cache = parse_cache if parse_cache is not None else get_shared_parse_cache()
+        self._entailment_memo = entailment_memo
+        self._handlers: Dict[str, Any] = {}
+        self._handlers_lock = threading.Lock()
+        self._native_pl_handler = NativePLHandler(self._parse_cache)
+        self._pool_size = pool_size or int(os.getenv(POOL_SIZE_ENV_VAR, DEFAULT_POOL_SIZE))
+        if self._pool_size < 1:
+            raise ValueError(f"Taille de pool invalide: {self._pool_size}")
+        self._pool_timeout = pool_timeout
+        self._pools: Dict[str, ReasonerPool] = {}
+        self._local = threading.local()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_slots = threading.BoundedSemaphore(2 * self._pool_size)
+        env_timeout = os.getenv(QUERY_TIMEOUT_ENV_VAR)
+        self._query_timeout = query_timeout if query_timeout is not None else (float(env_timeout) if env_timeout else None)
+        self._latency_stats = QueryLatencyStats()
 
         # Initialiser TweetyInitializer (qui gère la JVM et les composants Java)
         # TweetyInitializer est instancié ici.
@@ -73,45 +180,299 @@ class TweetyBridge:
         else:
             self._logger.info("TWEETY_BRIDGE: __init__ - JVM déjà prête ou initialisée par TweetyInitializer.")
 
-        # S'assurer que les composants spécifiques sont initialisés (PL, FOL, Modal)
-        # Ces appels sont idempotents dans TweetyInitializer s'ils ont déjà été faits.
-        self._initializer.initialize_pl_components()
-        self._initializer.initialize_fol_components()
-        self._initializer.initialize_modal_components()
+        # Les composants PL, FOL et Modal sont initialisés à la première utilisation (voir _get_handler).
+        self._jvm_ok = True
+        self._logger.info(f"TWEETY_BRIDGE: __init__ - Fin (Refactored). _jvm_ok: {self._jvm_ok}")
+
+    def _get_handler(self, logic: str):
+        """
+        Retourne le handler d'une logique, en initialisant ses composants Java au premier appel.
 
-        # Initialiser les handlers spécifiques
+        :param logic: "pl", "fol" ou "modal".
+        :type logic: str
+        :return: Le handler de la logique.
+        :raises RuntimeError: Si l'initialisation des composants ou du handler échoue.
+        """
+        handler = self._handlers.get(logic)
+        if handler is not None:
+            return handler
+        with self._handlers_lock:
+            handler = self._handlers.get(logic)
+            if handler is None:
+                try:
+                    self._initializer.initialize_components(logic)
+                    if logic == "pl":
+                        handler = PLHandler(self._initializer, self._parse_cache, self._entailment_memo)
+                    elif logic == "fol":
+                        handler = FOLHandler(self._initializer, self._parse_cache)
+                    else:
+                        handler = ModalHandler(self._initializer, self._parse_cache)
+                except Exception as e:
+                    self._logger.error(f"TWEETY_BRIDGE: Erreur lors de l'initialisation du handler {logic}: {e}", exc_info=True)
+                    raise RuntimeError(f"Échec de l'initialisation d'un handler dans TweetyBridge: {e}") from e
+                self._handlers[logic] = handler
+                self._logger.info(f"TWEETY_BRIDGE: Handler {logic} initialisé à la première utilisation.")
+        return handler
+
+    def _handler_ready(self, logic: str) -> bool:
+        """Initialise au besoin le handler d'une logique ; retourne False si son initialisation échoue."""
         try:
-            self._pl_handler = PLHandler(self._initializer)
-            self._fol_handler = FOLHandler(self._initializer)
-            self._modal_handler = ModalHandler(self._initializer)
-            self._jvm_ok = True # Indique que les handlers Python sont prêts
-            self._logger.info("TWEETY_BRIDGE: __init__ - Handlers PL, FOL, Modal initialisés avec succès.")
-        except RuntimeError as e:
-            self._logger.error(f"TWEETY_BRIDGE: __init__ - Erreur lors de l'initialisation des handlers: {e}", exc_info=True)
-            self._jvm_ok = False # Marquer comme non prêt si un handler échoue
-            # Il est important de lever l'exception ici pour signaler que TweetyBridge n'est pas fonctionnel.
-            raise RuntimeError(f"Échec de l'initialisation d'un handler dans TweetyBridge: {e}") from e
-        
-        self._logger.info(f"TWEETY_BRIDGE: __init__ - Fin (Refactored). _jvm_ok: {self._jvm_ok}")
-    
+            self._get_handler(logic)
+            return True
+        except RuntimeError:
+            return False
+
+    @property
+    def _pl_handler(self) -> PLHandler:
+        return self._current_handler("pl")
+
+    @_pl_handler.setter
+    def _pl_handler(self, handler: PLHandler):
+        self._handlers["pl"] = handler
+
+    @property
+    def _fol_handler(self) -> FOLHandler:
+        return self._current_handler("fol")
+
+    @_fol_handler.setter
+    def _fol_handler(self, handler: FOLHandler):
+        self._handlers["fol"] = handler
+
+    @property
+    def _modal_handler(self) -> ModalHandler:
+        return self._current_handler("modal")
+
+    @_modal_handler.setter
+    def _modal_handler(self, handler: ModalHandler):
+        self._handlers["modal"] = handler
+
+    def _create_pooled_handler(self, logic: str, index: int):
+        """Fabrique des pools : le handler principal, puis des handlers disposant de leurs propres instances Java."""
+        if index == 0:
+            return self._get_handler(logic)
+        return self._create_private_handler(logic)
+
+    def _create_private_handler(self, logic: str):
+        """Crée un handler disposant de ses propres instances Java (parseur, raisonneur), hors des pools."""
+        components = self._initializer.create_components(logic)
+        if logic == "pl":
+            return PLHandler(self._initializer, self._parse_cache, self._entailment_memo, **components)
+        if logic == "fol":
+            return FOLHandler(self._initializer, self._parse_cache, **components)
+        return ModalHandler(self._initializer, self._parse_cache, **components)
+
+    def _get_pool(self, logic: str) -> ReasonerPool:
+        """Retourne le pool de handlers d'une logique, créé au premier appel."""
+        with self._handlers_lock:
+            pool = self._pools.get(logic)
+            if pool is None:
+                pool = ReasonerPool(functools.partial(self._create_pooled_handler, logic), self._pool_size, name=f"{logic}_handler")
+                self._pools[logic] = pool
+        return pool
+
+    @contextmanager
+    def _pooled_scope(self):
+        """
+        Délimite un appel pendant lequel les handlers utilisés par le thread courant sont empruntés.
+
+        Un handler est emprunté au pool de sa logique lors de son premier accès dans
+        la portée (une requête native n'emprunte donc rien) et restitué à sa sortie.
+        Les portées imbriquées réutilisent les handlers déjà empruntés.
+        """
+        local = getattr(self, "_local", None)
+        if local is None or getattr(local, "borrowed", None) is not None:
+            yield
+            return
+        with ExitStack() as stack:
+            local.borrowed = {}
+            local.stack = stack
+            try:
+                yield
+            finally:
+                local.borrowed = None
+                local.stack = None
+
+    def _current_handler(self, logic: str):
+        """Handler à utiliser par le thread courant : emprunté au pool dans une portée `_pooled_scope`, principal sinon."""
+        local = getattr(self, "_local", None)
+        borrowed = getattr(local, "borrowed", None)
+        if borrowed is None:
+            return self._get_handler(logic)
+        handler = borrowed.get(logic)
+        if handler is None:
+            try:
+                handler = local.stack.enter_context(self._get_pool(logic).checkout(self._pool_timeout))
+            except TimeoutError as e:
+                raise RuntimeError(f"Aucun handler {logic} disponible: {e}") from e
+            borrowed[logic] = handler
+        return handler
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Retourne l'exécuteur de TweetyBridge, créé au premier appel."""
+        with self._handlers_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._pool_size, thread_name_prefix="tweety_worker", initializer=_attach_worker_thread
+                )
+        return self._executor
+
+    def submit(self, method_name: str, *args, **kwargs) -> Future:
+        """
+        Exécute une méthode publique de TweetyBridge dans un thread de l'exécuteur.
+
+        Au plus deux tâches par thread peuvent être en attente : au-delà, l'appel
+        bloque jusqu'à ce qu'une tâche se termine.
+
+        :param method_name: Nom de la méthode (par ex. "execute_fol_query").
+        :type method_name: str
+        :return: Le Future du résultat de la méthode.
+        :rtype: Future
+        :raises AttributeError: Si la méthode n'existe pas ou n'est pas publique.
+        """
+        if method_name.startswith("_"):
+            raise AttributeError(f"Méthode non publique: {method_name}")
+        method = getattr(self, method_name)
+        self._executor_slots.acquire()
+        try:
+            future = self._get_executor().submit(method, *args, **kwargs)
+        except Exception:
+            self._executor_slots.release()
+            raise
+        future.add_done_callback(lambda _: self._executor_slots.release())
+        return future
+
+    def execute_queries_parallel(self, belief_set: BeliefSet, queries: List[str], modal_logic_str: str = "S4",
+                                 signature_declarations_str: Optional[str] = None, use_memo: bool = True,
+                                 timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Exécute plusieurs requêtes sur un même ensemble de croyances, réparties entre les threads de l'exécuteur.
+
+        Les requêtes sont découpées en au plus `pool_size` lots exécutés par
+        `execute_queries_batch`, chacun avec son propre handler.
+
+        :param belief_set: L'ensemble de croyances (propositionnel, premier ordre ou modal).
+        :type belief_set: BeliefSet
+        :param queries: Les requêtes à exécuter.
+        :type queries: List[str]
+        :return: Les résultats, dans l'ordre des requêtes, au format de `execute_queries_batch`.
+        :rtype: List[Dict[str, Any]]
+        """
+        if len(queries) <= 1 or self._pool_size == 1:
+            return self.execute_queries_batch(belief_set, queries, modal_logic_str, signature_declarations_str, use_memo, timeout)
+        chunk_size = -(-len(queries) // self._pool_size)
+        futures = [
+            self.submit("execute_queries_batch", belief_set, queries[start:start + chunk_size],
+                        modal_logic_str, signature_declarations_str, use_memo, timeout)
+            for start in range(0, len(queries), chunk_size)
+        ]
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def _run_timed(self, logic: str, func, timeout: Optional[float] = None):
+        """
+        Exécute un appel de handler en enregistrant sa latence, avec un délai maximal s'il est indiqué.
+
+        Avec un délai, l'appel s'exécute dans un thread dédié qui emprunte ses
+        propres handlers : un appel abandonné à l'expiration du délai garde son
+        handler jusqu'à sa fin au lieu de le rendre au pool en cours d'usage.
+
+        :raises ReasoningTimeout: Si l'appel dépasse le délai.
+        """
+        if timeout is None:
+            return self._latency_stats.measure(logic, func)
+
+        def scoped_call():
+            with self._pooled_scope():
+                return func()
+
+        return self._latency_stats.measure(
+            logic, lambda: run_with_deadline(scoped_call, timeout, name=f"tweety_{logic}_query")
+        )
+
+    def _effective_timeout(self, timeout: Optional[float]) -> Optional[float]:
+        """Délai d'une requête : celui de l'appel, sinon le délai par défaut de TweetyBridge."""
+        return timeout if timeout is not None else self._query_timeout
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupère les histogrammes de latence des requêtes.
+
+        :return: Pour chaque logique ("pl", "fol", "modal"), le nombre de requêtes,
+                 la latence moyenne et les percentiles 50/90/99 en millisecondes,
+                 l'histogramme (borne supérieure en µs -> nombre) et le nombre de
+                 requêtes par issue ("ok", "error", "timeout").
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        return self._latency_stats.get_stats()
+
+    def get_pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupère les compteurs des pools de handlers.
+
+        :return: Pour chaque logique utilisée, les compteurs de `ReasonerPool.get_stats`.
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        return {logic: pool.get_stats() for logic, pool in list(self._pools.items())}
+
+    def shutdown_executor(self, wait: bool = True) -> None:
+        """
+        Arrête l'exécuteur de TweetyBridge (il est recréé au prochain appel de `submit`).
+
+        :param wait: Attendre la fin des tâches en cours.
+        :type wait: bool
+        """
+        with self._handlers_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def preload_logics(self, logics: List[str] = ("pl", "fol", "modal")) -> Dict[str, bool]:
+        """
+        Initialise à l'avance les composants et handlers des logiques indiquées.
+
+        :param logics: Les logiques à initialiser ("pl", "fol", "modal").
+        :type logics: List[str]
+        :return: Pour chaque logique, True si son initialisation a réussi.
+        :rtype: Dict[str, bool]
+        """
+        return {logic: self._handler_ready(logic) for logic in logics}
+
+    def get_startup_timings(self) -> Dict[str, float]:
+        """
+        Récupère la durée des étapes de démarrage (JVM, chargement des classes, composants par logique).
+
+        :return: La durée en millisecondes de chaque étape effectuée dans le processus.
+        :rtype: Dict[str, float]
+        """
+        return TweetyInitializer.get_startup_timings()
+
     def is_jvm_ready(self) -> bool:
         """
-        Vérifie si la JVM, TweetyInitializer et les handlers Python sont prêts.
+        Vérifie si la JVM et TweetyInitializer sont prêts.
+
+        Les handlers n'étant initialisés qu'à leur première utilisation, cette
+        vérification ne les force pas.
 
         :return: True si tout est initialisé correctement, False sinon.
         :rtype: bool
         """
-        # Vérifie que l'initializer est là, que la JVM est prête via l'initializer,
-        # et que les handlers Python ont été instanciés (indiqué par self._jvm_ok dans __init__).
         return (
             self._initializer is not None and
             self._initializer.is_jvm_started() and # Utiliser la méthode correcte de TweetyInitializer
-            hasattr(self, '_pl_handler') and self._pl_handler is not None and
-            hasattr(self, '_fol_handler') and self._fol_handler is not None and
-            hasattr(self, '_modal_handler') and self._modal_handler is not None and
-            self._jvm_ok # Ce flag interne à TweetyBridge indique si les handlers Python sont OK
+            self._jvm_ok # Ce flag interne à TweetyBridge indique si la JVM est OK
         )
 
+    def get_parse_cache_stats(self) -> Dict[str, Any]:
+        """
+        Récupère les statistiques du cache des formules et ensembles de croyances parsés.
+
+        :return: Les compteurs de succès/échecs/évictions et l'occupation du cache.
+        :rtype: Dict[str, Any]
+        """
+        return self._parse_cache.get_stats()
+
     # Les méthodes _initialize_jvm_components, _initialize_pl_components,
     # _initialize_fol_components, et _initialize_modal_components
     # sont maintenant gérées par TweetyInitializer et appelées depuis __init__.
@@ -150,20 +511,66 @@ class TweetyBridge:
         return final_formulas
 
     # --- Méthodes pour la logique propositionnelle ---
+
+    def _use_native_pl(self, knowledge_base) -> bool:
+        """Indique si un ensemble de croyances propositionnel (texte ou BeliefSet) est traité par le moteur Python pur."""
+        if self._pl_backend == "auto":
+            if isinstance(knowledge_base, BeliefSet):
+                return len(knowledge_base.formulas) <= NATIVE_PL_MAX_FORMULAS
+            return knowledge_base.count(';') + 1 <= NATIVE_PL_MAX_FORMULAS
+        return self._pl_backend == "native"
+
+    def _run_pl_query(self, knowledge_base_str: str, query_string: str) -> bool:
+        """Exécute une requête PL sur le backend sélectionné (repli sur TweetyProject en mode "auto")."""
+        if self._use_native_pl(knowledge_base_str):
+            try:
+                return self._native_pl_handler.pl_query(knowledge_base_str, query_string)
+            except ValueError as e:
+                if self._pl_backend != "auto":
+                    raise
+                self._logger.debug(f"Syntaxe non reconnue par le moteur PL natif, repli sur TweetyProject: {e}")
+        return self._pl_handler.pl_query(knowledge_base_str, query_string)
+
+    def _run_pl_query_batch(self, knowledge_base: Union[str, BeliefSet], queries: List[str], use_memo: bool) -> List[Dict[str, Any]]:
+        """Exécute des requêtes PL groupées (ensemble en texte ou BeliefSet) sur le backend sélectionné (repli sur TweetyProject en mode "auto")."""
+        if not self._use_native_pl(knowledge_base):
+            return self._pl_handler.pl_query_batch(knowledge_base, queries, use_memo)
+        try:
+            results = self._native_pl_handler.pl_query_batch(knowledge_base, queries)
+        except ValueError:
+            if self._pl_backend != "auto":
+                raise
+            return self._pl_handler.pl_query_batch(knowledge_base, queries, use_memo)
+
+        failed = [index for index, result in enumerate(results) if result["error"] is not None]
+        if failed and self._pl_backend == "auto":
+            retried = self._pl_handler.pl_query_batch(knowledge_base, [queries[index] for index in failed], use_memo)
+            for index, result in zip(failed, retried):
+                results[index] = result
+        return results
+
+    def _pl_ready(self) -> bool:
+        """Indique si les requêtes PL peuvent être traitées (sans initialiser TweetyProject en mode "native")."""
+        return self._pl_backend == "native" or self._handler_ready("pl")
+
+    def _pl_validation_handler(self):
+        """Handler utilisé pour valider la syntaxe PL (TweetyProject sauf en mode "native")."""
+        return self._native_pl_handler if self._pl_backend == "native" else self._pl_handler
     
+    @_pooled
     def validate_formula(self, formula_string: str) -> Tuple[bool, str]:
         """
         Valide la syntaxe d'une formule de logique propositionnelle.
         Délègue la validation au PLHandler.
         """
-        if not self.is_jvm_ready() or not hasattr(self, '_pl_handler'):
+        if not self.is_jvm_ready() or not self._pl_ready():
             return False, "TweetyBridge ou PLHandler non prêt."
         
         self._logger.debug(f"TweetyBridge.validate_formula (PL) appelée pour: '{formula_string}'")
         try:
             # PLHandler.parse_pl_formula lève une ValueError en cas d'échec de parsing.
             # Si elle ne lève pas d'exception, la formule est syntaxiquement valide.
-            self._pl_handler.parse_pl_formula(formula_string)
+            self._pl_validation_handler().parse_pl_formula(formula_string)
             self._logger.info(f"Formule PL '{formula_string}' validée avec succès par PLHandler.")
             return True, "Formule valide"
         except ValueError as e_val:
@@ -173,12 +580,13 @@ class TweetyBridge:
             self._logger.error(f"Erreur inattendue lors de la validation PL de '{formula_string}': {e_generic}", exc_info=True)
             return False, f"Erreur inattendue: {str(e_generic)}"
 
+    @_pooled
     def validate_belief_set(self, belief_set_string: str) -> Tuple[bool, str]:
         """
         Valide la syntaxe d'un ensemble de croyances en logique propositionnelle.
         Délègue la validation au PLHandler.
         """
-        if not self.is_jvm_ready() or not hasattr(self, '_pl_handler'):
+        if not self.is_jvm_ready() or not self._pl_ready():
             return False, "TweetyBridge ou PLHandler non prêt."
 
         self._logger.debug(f"TweetyBridge.validate_belief_set (PL) appelée pour BS: '{belief_set_string[:100]}...'")
@@ -204,7 +612,7 @@ class TweetyBridge:
                 return False, "Ensemble de croyances vide ou ne contenant que des commentaires"
 
             for formula_str in cleaned_formulas:
-                self._pl_handler.parse_pl_formula(formula_str) # Lèvera ValueError si invalide
+                self._pl_validation_handler().parse_pl_formula(formula_str) # Lèvera ValueError si invalide
 
             self._logger.info(f"Ensemble de croyances PL validé avec succès par PLHandler (parsing individuel).")
             return True, "Ensemble de croyances valide"
@@ -220,21 +628,22 @@ class TweetyBridge:
         description="Exécute une requête en Logique Propositionnelle (syntaxe Tweety: !,||,=>,<=>,^^) sur un Belief Set fourni.",
         name="execute_pl_query"
     )
+    @_pooled
     def execute_pl_query(self, belief_set_content: str, query_string: str) -> str:
         """
         Exécute une requête en logique propositionnelle sur un ensemble de croyances donné.
-        Délègue l'exécution au PLHandler.
+        Délègue l'exécution au PLHandler, ou au NativePLHandler selon le backend PL.
         """
         self._logger.info(f"TweetyBridge.execute_pl_query: Query='{query_string}' sur BS: ('{belief_set_content[:60]}...')")
         
-        if not self.is_jvm_ready() or not hasattr(self, '_pl_handler'):
+        if not self.is_jvm_ready() or not self._pl_ready():
             self._logger.error("TweetyBridge.execute_pl_query: TweetyBridge ou PLHandler non prêt.")
             return "FUNC_ERROR: TweetyBridge ou PLHandler non prêt."
         
         try:
             # PLHandler.pl_query gère le parsing du BS et de la requête, et l'exécution.
             # Il devrait retourner True, False, ou lever une exception.
-            result_bool = self._pl_handler.pl_query(belief_set_content, query_string)
+            result_bool = self._run_timed("pl", lambda: self._run_pl_query(belief_set_content, query_string))
             
             # Formater le résultat comme attendu par l'ancienne interface
             if result_bool is None: # Cas où le handler pourrait retourner None (même si non prévu actuellement)
@@ -259,14 +668,42 @@ class TweetyBridge:
     # Les méthodes _parse_pl_formula, _parse_pl_belief_set, _execute_pl_query_internal
     # sont maintenant encapsulées dans PLHandler et peuvent être supprimées ici.
             
+    def create_pl_session(self, belief_set_content: Optional[str] = None) -> PLReasoningSession:
+        """
+        Crée une session de raisonnement propositionnel incrémental.
+
+        La session garde son ensemble de croyances côté Java et répond aux
+        requêtes sans re-résoudre l'ensemble complet après chaque ajout ou
+        retrait de formule (voir `PLReasoningSession`).
+
+        La session dispose de son propre handler (et donc de ses propres
+        parseur et raisonneur Java) : elle peut être utilisée depuis un autre
+        thread que les handlers du pool, sans en immobiliser un.
+
+        :param belief_set_content: Contenu initial (formules séparées par ';' ou des retours à la ligne).
+        :type belief_set_content: Optional[str]
+        :return: La session créée.
+        :rtype: PLReasoningSession
+        :raises RuntimeError: Si TweetyBridge n'est pas prêt.
+        """
+        if not self.is_jvm_ready():
+            raise RuntimeError("TweetyBridge ou PLHandler non prêt.")
+        try:
+            handler = self._create_private_handler("pl")
+        except Exception as e:
+            self._logger.error(f"TWEETY_BRIDGE: Erreur lors de la création du handler de session PL: {e}", exc_info=True)
+            raise RuntimeError(f"Échec de la création d'un handler de session PL: {e}") from e
+        return handler.create_session(belief_set_content)
+
     # --- Méthodes pour la logique du premier ordre ---
 
+    @_pooled
     def validate_fol_formula(self, formula_string: str, signature_declarations_str: Optional[str] = None) -> Tuple[bool, str]:
         """
         Valide la syntaxe d'une formule de logique du premier ordre (FOL).
         Délègue la validation au FOLHandler.
         """
-        if not self.is_jvm_ready() or not hasattr(self, '_fol_handler'):
+        if not self.is_jvm_ready() or not self._handler_ready("fol"):
             return False, "TweetyBridge ou FOLHandler non prêt."
 
         self._logger.debug(f"TweetyBridge.validate_fol_formula appelée pour: '{formula_string}'")
@@ -283,12 +720,13 @@ class TweetyBridge:
             self._logger.error(f"Erreur inattendue lors de la validation FOL de '{formula_string}': {e_generic}", exc_info=True)
             return False, f"Erreur FOL inattendue: {str(e_generic)}"
 
+    @_pooled
     def validate_fol_belief_set(self, belief_set_string: str, signature_declarations_str: Optional[str] = None) -> Tuple[bool, str]:
         """
         Valide la syntaxe d'un ensemble de croyances en logique du premier ordre (FOL).
         Délègue la validation au FOLHandler.
         """
-        if not self.is_jvm_ready() or not hasattr(self, '_fol_handler'):
+        if not self.is_jvm_ready() or not self._handler_ready("fol"):
             return False, "TweetyBridge ou FOLHandler non prêt."
 
         self._logger.debug(f"TweetyBridge.validate_fol_belief_set appelée pour BS: '{belief_set_string[:100]}...'")
@@ -320,19 +758,27 @@ class TweetyBridge:
         description="Exécute une requête en Logique du Premier Ordre sur un Belief Set fourni. Peut inclure des déclarations de signature.",
         name="execute_fol_query"
     )
-    def execute_fol_query(self, belief_set_content: str, query_string: str, signature_declarations_str: Optional[str] = None) -> str:
+    @_pooled
+    def execute_fol_query(self, belief_set_content: str, query_string: str, signature_declarations_str: Optional[str] = None,
+                          timeout: Optional[float] = None) -> str:
         """
         Exécute une requête en logique du premier ordre (FOL) sur un ensemble de croyances.
         Délègue l'exécution au FOLHandler.
+        Au-delà du délai (timeout, sinon celui de TweetyBridge), la requête est interrompue
+        et le résultat commence par TIMEOUT_PREFIX.
         """
         self._logger.info(f"TweetyBridge.execute_fol_query: Query='{query_string}' sur BS: ('{belief_set_content[:60]}...'), Signature: '{str(signature_declarations_str)[:60]}...'")
         
-        if not self.is_jvm_ready() or not hasattr(self, '_fol_handler'):
+        if not self.is_jvm_ready() or not self._handler_ready("fol"):
             self._logger.error("TweetyBridge.execute_fol_query: TweetyBridge ou FOLHandler non prêt.")
             return "FUNC_ERROR: TweetyBridge ou FOLHandler non prêt."
         
         try:
-            result_bool = self._fol_handler.fol_query(belief_set_content, query_string, signature_declarations_str)
+            result_bool = self._run_timed(
+                "fol",
+                lambda: self._fol_handler.fol_query(belief_set_content, query_string, signature_declarations_str),
+                self._effective_timeout(timeout)
+            )
             
             if result_bool is None: # FOLHandler.fol_query peut retourner None si le raisonneur ne peut pas conclure
                 result_str = f"Tweety Result: Unknown for FOL query '{query_string}'."
@@ -343,7 +789,10 @@ class TweetyBridge:
                 self._logger.info(f"Résultat formaté requête FOL '{query_string}' via FOLHandler: {result_label}")
             
             return result_str
-            
+
+        except ReasoningTimeout as e_timeout:
+            self._logger.warning(f"Requête FOL '{query_string}' interrompue après {e_timeout.timeout} s.")
+            return f"{TIMEOUT_PREFIX} La requête FOL '{query_string}' a dépassé son délai de {e_timeout.timeout} s."
         except ValueError as e_val: # Erreurs de parsing ou autres du handler
             error_msg = f"Erreur lors de l'exécution de la requête FOL via FOLHandler: {str(e_val)}"
             self._logger.error(error_msg, exc_info=True)
@@ -358,12 +807,13 @@ class TweetyBridge:
     
     # --- Méthodes pour la logique modale ---
 
+    @_pooled
     def validate_modal_formula(self, formula_string: str, modal_logic_str: str = "S4", signature_declarations_str: Optional[str] = None) -> Tuple[bool, str]:
         """
         Valide la syntaxe d'une formule de logique modale (ML).
         Délègue la validation au ModalHandler.
         """
-        if not self.is_jvm_ready() or not hasattr(self, '_modal_handler'):
+        if not self.is_jvm_ready() or not self._handler_ready("modal"):
             return False, "TweetyBridge ou ModalHandler non prêt."
 
         self._logger.debug(f"TweetyBridge.validate_modal_formula appelée pour: '{formula_string}', Logic: {modal_logic_str}")
@@ -379,12 +829,13 @@ class TweetyBridge:
             self._logger.error(f"Erreur inattendue lors de la validation Modale de '{formula_string}': {e_generic}", exc_info=True)
             return False, f"Erreur Modale inattendue: {str(e_generic)}"
 
+    @_pooled
     def validate_modal_belief_set(self, belief_set_string: str, modal_logic_str: str = "S4", signature_declarations_str: Optional[str] = None) -> Tuple[bool, str]:
         """
         Valide la syntaxe d'un ensemble de croyances en logique modale (ML).
         Délègue la validation au ModalHandler.
         """
-        if not self.is_jvm_ready() or not hasattr(self, '_modal_handler'):
+        if not self.is_jvm_ready() or not self._handler_ready("modal"):
             return False, "TweetyBridge ou ModalHandler non prêt."
 
         self._logger.debug(f"TweetyBridge.validate_modal_belief_set appelée pour BS: '{belief_set_string[:100]}...', Logic: {modal_logic_str}")
@@ -412,19 +863,27 @@ class TweetyBridge:
         description="Exécute une requête en Logique Modale sur un Belief Set fourni. Spécifier la logique modale (ex: S4, K) et optionnellement les déclarations de signature.",
         name="execute_modal_query"
     )
-    def execute_modal_query(self, belief_set_content: str, query_string: str, modal_logic_str: str = "S4", signature_declarations_str: Optional[str] = None) -> str:
+    @_pooled
+    def execute_modal_query(self, belief_set_content: str, query_string: str, modal_logic_str: str = "S4", signature_declarations_str: Optional[str] = None,
+                            timeout: Optional[float] = None) -> str:
         """
         Exécute une requête en logique modale (ML) sur un ensemble de croyances.
         Délègue l'exécution au ModalHandler.
+        Au-delà du délai (timeout, sinon celui de TweetyBridge), la requête est interrompue
+        et le résultat commence par TIMEOUT_PREFIX.
         """
         self._logger.info(f"TweetyBridge.execute_modal_query: Query='{query_string}' sur BS: ('{belief_set_content[:60]}...'), Logic: {modal_logic_str}, Signature: '{str(signature_declarations_str)[:60]}...'")
         
-        if not self.is_jvm_ready() or not hasattr(self, '_modal_handler'):
+        if not self.is_jvm_ready() or not self._handler_ready("modal"):
             self._logger.error("TweetyBridge.execute_modal_query: TweetyBridge ou ModalHandler non prêt.")
             return "FUNC_ERROR: TweetyBridge ou ModalHandler non prêt."
         
         try:
-            result_bool = self._modal_handler.modal_query(belief_set_content, query_string, modal_logic_str, signature_declarations_str)
+            result_bool = self._run_timed(
+                "modal",
+                lambda: self._modal_handler.modal_query(belief_set_content, query_string, modal_logic_str, signature_declarations_str),
+                self._effective_timeout(timeout)
+            )
             
             if result_bool is None: # ModalHandler.modal_query peut retourner None
                 result_str = f"Tweety Result: Unknown for Modal query '{query_string}' (Logic: {modal_logic_str})."
@@ -435,7 +894,10 @@ class TweetyBridge:
                 self._logger.info(f"Résultat formaté requête Modale '{query_string}' (Logic: {modal_logic_str}) via ModalHandler: {result_label}")
             
             return result_str
-            
+
+        except ReasoningTimeout as e_timeout:
+            self._logger.warning(f"Requête Modale '{query_string}' (Logic: {modal_logic_str}) interrompue après {e_timeout.timeout} s.")
+            return f"{TIMEOUT_PREFIX} La requête Modale '{query_string}' (Logic: {modal_logic_str}) a dépassé son délai de {e_timeout.timeout} s."
         except ValueError as e_val:
             error_msg = f"Erreur lors de l'exécution de la requête Modale via ModalHandler: {str(e_val)}"
             self._logger.error(error_msg, exc_info=True)
@@ -448,4 +910,89 @@ class TweetyBridge:
     # Les méthodes _parse_modal_formula, _parse_modal_belief_set, _execute_modal_query_internal
     # sont maintenant encapsulées dans ModalHandler et peuvent être supprimées ici.
 
+    # --- Exécution groupée ---
+
+    @_pooled
+    def execute_queries_batch(self, belief_set: BeliefSet, queries: List[str], modal_logic_str: str = "S4",
+                              signature_declarations_str: Optional[str] = None, use_memo: bool = True,
+                              timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Exécute plusieurs requêtes sur un même ensemble de croyances.
+
+        L'ensemble de croyances est parsé une seule fois et toutes les requêtes
+        sont évaluées par la même instance de raisonneur, au lieu d'un appel
+        `execute_*_query` complet par requête. Une requête invalide n'affecte
+        que son propre résultat. L'objet `BeliefSet` est transmis tel quel aux
+        handlers : ses formules déjà découpées et son condensat sont réutilisés,
+        et il garde l'objet Java construit pour les appels suivants.
+
+        :param belief_set: L'ensemble de croyances (propositionnel, premier ordre ou modal).
+        :type belief_set: BeliefSet
+        :param queries: Les requêtes à exécuter.
+        :type queries: List[str]
+        :param modal_logic_str: La logique modale utilisée pour un ensemble modal.
+        :type modal_logic_str: str
+        :param signature_declarations_str: Déclarations de signature (FOL ou modal), optionnelles.
+        :type signature_declarations_str: Optional[str]
+        :param use_memo: Consulter et alimenter la mémoïsation des résultats PL, si elle est activée.
+        :type use_memo: bool
+        :param timeout: Délai de l'ensemble du lot FOL ou modal, en secondes (par défaut celui de TweetyBridge).
+        :type timeout: Optional[float]
+        :return: Un dictionnaire par requête, dans l'ordre, avec les clés "query",
+                 "result" (True, False ou None) et "message" (même format que
+                 `execute_*_query`, préfixé par "FUNC_ERROR:" en cas d'erreur
+                 et par TIMEOUT_PREFIX si le lot a dépassé son délai).
+        :rtype: List[Dict[str, Any]]
+        """
+        logic_type = belief_set.logic_type
+        self._logger.info(f"TweetyBridge.execute_queries_batch: {len(queries)} requêtes {logic_type} sur BS: ('{belief_set.content[:60]}...')")
+
+        if not self.is_jvm_ready():
+            return [{"query": query, "result": None, "message": "FUNC_ERROR: TweetyBridge non prêt."} for query in queries]
+
+        try:
+            if logic_type == "propositional":
+                handler_results = self._run_timed("pl", lambda: self._run_pl_query_batch(belief_set, queries, use_memo))
+                label_prefix = "Query"
+            elif logic_type == "first_order":
+                handler_results = self._run_timed(
+                    "fol",
+                    lambda: self._fol_handler.fol_query_batch(belief_set, queries, signature_declarations_str),
+                    self._effective_timeout(timeout)
+                )
+                label_prefix = "FOL Query"
+            elif logic_type == "modal":
+                handler_results = self._run_timed(
+                    "modal",
+                    lambda: self._modal_handler.modal_query_batch(belief_set, queries, modal_logic_str, signature_declarations_str),
+                    self._effective_timeout(timeout)
+                )
+                label_prefix = "Modal Query"
+            else:
+                error_msg = f"Type de logique non supporté: {logic_type}"
+                self._logger.error(error_msg)
+                return [{"query": query, "result": None, "message": f"FUNC_ERROR: {error_msg}"} for query in queries]
+        except ReasoningTimeout as e_timeout:
+            self._logger.warning(f"Lot de {len(queries)} requêtes {logic_type} interrompu après {e_timeout.timeout} s.")
+            message = f"{TIMEOUT_PREFIX} Le lot de requêtes {logic_type} a dépassé son délai de {e_timeout.timeout} s."
+            return [{"query": query, "result": None, "message": message} for query in queries]
+        except Exception as e:
+            # Erreur commune à toutes les requêtes (parsing de l'ensemble de croyances...)
+            error_msg = f"Erreur lors de l'exécution groupée des requêtes {logic_type}: {str(e)}"
+            self._logger.error(error_msg, exc_info=True)
+            return [{"query": query, "result": None, "message": f"FUNC_ERROR: {error_msg}"} for query in queries]
+
+        logic_suffix = f" (Logic: {modal_logic_str})" if logic_type == "modal" else ""
+        results = []
+        for handler_result in handler_results:
+            query = handler_result["query"]
+            entailed = handler_result["entailed"]
+            if handler_result["error"] is not None:
+                message = f"FUNC_ERROR: Erreur lors de l'exécution de la requête '{query}': {handler_result['error']}"
+            else:
+                result_label = "ACCEPTED (True)" if entailed else "REJECTED (False)"
+                message = f"Tweety Result: {label_prefix} '{query}'{logic_suffix} is {result_label}."
+            results.append({"query": query, "result": entailed, "message": message})
+        return results
+
 # Fin des méthodes de la classe TweetyBridge
\ No newline at end of file
@@ -7,6 +7,10 @@ from argumentation_analysis.utils.core_utils.logging_utils import setup_logging
 from pathlib import Path
 import os # Ajout de l'import os
 import subprocess # Ajout pour exécuter des commandes shell
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Optional
 
 # Initialisation du logger pour ce module.
 # setup_logging() est appelé pour configurer le logging global.
@@ -14,6 +18,37 @@ import subprocess # Ajout pour exécuter des commandes shell
 setup_logging("INFO")  # Appel avec un niveau de log valide comme "INFO" ou selon la config souhaitée.
 logger = logging.getLogger(__name__) # Obtention correcte du logger pour ce module.
 
+# Java classes loaded per component: only the logics actually used pay for their class loading.
+COMPONENT_CLASSES = {
+    "core": [
+        "org.tweetyproject.commons.ParserException",
+        "org.tweetyproject.logics.commons.syntax.Sort",
+    ],
+    "pl": [
+        "org.tweetyproject.logics.pl.syntax.PlSignature",
+        "org.tweetyproject.logics.pl.syntax.Proposition",
+        "org.tweetyproject.logics.pl.syntax.PlBeliefSet",
+        "org.tweetyproject.logics.pl.reasoner.SatReasoner",
+        "org.tweetyproject.logics.pl.sat.Sat4jSolver",
+        "org.tweetyproject.logics.pl.parser.PlParser",
+    ],
+    "fol": [
+        "org.tweetyproject.logics.fol.syntax.FolSignature",
+        "org.tweetyproject.logics.fol.syntax.FolBeliefSet",
+        "org.tweetyproject.logics.fol.reasoner.SimpleFolReasoner",
+        "org.tweetyproject.logics.fol.parser.FolParser",
+    ],
+    "modal": [
+        "org.tweetyproject.logics.ml.syntax.MlFormula", # Attempting to use MlFormula for ModalLogic types
+        "org.tweetyproject.logics.ml.syntax.MlBeliefSet",
+        "org.tweetyproject.logics.ml.reasoner.SimpleMlReasoner", # KrHyperModalReasoner non trouvé dans le JAR
+        "org.tweetyproject.logics.ml.parser.MlParser",
+    ],
+}
+
+# Comma-separated logics ("pl,fol,modal") to warm up in a background thread at import time.
+WARMUP_ENV_VAR = "TWEETY_WARMUP"
+
 class TweetyInitializer:
     """
     Handles the initialization of JVM components for TweetyProject.
@@ -31,11 +66,49 @@ class TweetyInitializer:
     _modal_reasoner = None
     _tweety_bridge = None # Reference to the main bridge
 
+    # Startup is shared by the bridges and the warm-up thread: one lock serializes it.
+    _init_lock = threading.RLock()
+    _jclass_registry: Dict[str, Any] = {}
+    _startup_timings: Dict[str, float] = {}
+    _warmup_thread: Optional[threading.Thread] = None
+
     def __init__(self, tweety_bridge_instance):
         self._tweety_bridge = tweety_bridge_instance
         if not TweetyInitializer._jvm_started:
             self._start_jvm()
 
+    @staticmethod
+    @contextmanager
+    def _timed(component: str):
+        """Records the duration of a startup step, in milliseconds, under the component name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            TweetyInitializer._startup_timings[component] = duration_ms
+            logger.info(f"Startup timing: {component} took {duration_ms:.1f} ms")
+
+    @staticmethod
+    def get_startup_timings() -> Dict[str, float]:
+        """Returns the duration (ms) of each startup step done so far: "jvm", "classes.<component>", "pl", "fol", "modal"."""
+        return dict(TweetyInitializer._startup_timings)
+
+    @staticmethod
+    def get_jclass(class_name: str):
+        """Returns a Java class, loading it through JPype on first use only."""
+        java_class = TweetyInitializer._jclass_registry.get(class_name)
+        if java_class is None:
+            java_class = jpype.JClass(class_name)
+            TweetyInitializer._jclass_registry[class_name] = java_class
+        return java_class
+
+    def _import_component_classes(self, component: str):
+        """Loads the Java classes of one component (see COMPONENT_CLASSES) into the registry."""
+        with TweetyInitializer._timed(f"classes.{component}"):
+            for class_name in COMPONENT_CLASSES[component]:
+                TweetyInitializer.get_jclass(class_name)
+
     def _start_jvm(self):
         """Starts the JVM and sets up the classpath."""
         global logger # Assurer qu'on référence le logger du module
@@ -47,10 +120,15 @@ class TweetyInitializer:
             logger = logging.getLogger(__name__)
             logger.error("CRITICAL: TweetyInitializer module logger was None and had to be re-initialized in _start_jvm. This indicates an issue in module loading or initial logger setup.")
 
-        if TweetyInitializer._jvm_started:
-            logger.info("JVM already started.")
-            return
+        with TweetyInitializer._init_lock:
+            if TweetyInitializer._jvm_started:
+                logger.info("JVM already started.")
+                return
+            with TweetyInitializer._timed("jvm"):
+                self._start_jvm_locked()
 
+    def _start_jvm_locked(self):
+        """Starts the JVM; called by _start_jvm with the initialization lock held."""
         try:
             # Importation dynamique de get_project_root UNIQUEMENT si on doit démarrer la JVM
             from argumentation_analysis.utils.system_utils import get_project_root # Chemin corrigé
@@ -161,95 +239,148 @@ class TweetyInitializer:
                 # Ne pas lever d'erreur ici, pour voir si les classes Tweety échouent ensuite
         # --- FIN BLOC DE DIAGNOSTIC ArrayList ---
 
-        logger.info("Attempting to import TweetyProject Java classes...")
+        # Only the classes shared by every logic are loaded with the JVM; the classes of
+        # each logic are loaded by the corresponding initialize_*_components call.
+        logger.info("Attempting to import core TweetyProject Java classes...")
         try:
-            # Propositional Logic
-            # jpype.imports.org.tweetyproject.logics.pl.syntax # Old way
-            _ = jpype.JClass("org.tweetyproject.logics.pl.syntax.PlSignature")
-            _ = jpype.JClass("org.tweetyproject.logics.pl.syntax.Proposition")
-            _ = jpype.JClass("org.tweetyproject.logics.pl.syntax.PlBeliefSet")
-            # jpype.imports.org.tweetyproject.logics.pl.reasoner # Old way
-            _ = jpype.JClass("org.tweetyproject.logics.pl.reasoner.SatReasoner")
-            # jpype.imports.org.tweetyproject.logics.pl.sat # Old way
-            _ = jpype.JClass("org.tweetyproject.logics.pl.sat.Sat4jSolver")
-            
-            # First-Order Logic
-            # jpype.imports.org.tweetyproject.logics.fol.syntax # Old way
-            _ = jpype.JClass("org.tweetyproject.logics.fol.syntax.FolSignature")
-            _ = jpype.JClass("org.tweetyproject.logics.fol.syntax.FolBeliefSet")
-            # jpype.imports.org.tweetyproject.logics.fol.reasoner # Old way
-            _ = jpype.JClass("org.tweetyproject.logics.fol.reasoner.SimpleFolReasoner")
-            
-            # Modal Logic
-            # jpype.imports.org.tweetyproject.logics.ml.syntax # Old way
-            _ = jpype.JClass("org.tweetyproject.logics.ml.syntax.MlFormula") # Attempting to use MlFormula for ModalLogic types
-            _ = jpype.JClass("org.tweetyproject.logics.ml.syntax.MlBeliefSet")
-            # jpype.imports.org.tweetyproject.logics.ml.reasoner # Old way
-            _ = jpype.JClass("org.tweetyproject.logics.ml.reasoner.SimpleMlReasoner") # KrHyperModalReasoner non trouvé dans le JAR
-            # jpype.imports.org.tweetyproject.logics.ml.parser.MlParser # Old way
-            _ = jpype.JClass("org.tweetyproject.logics.ml.parser.MlParser")
-            
-            # General TweetyProject classes
-            _ = jpype.JClass("org.tweetyproject.commons.ParserException")
-            _ = jpype.JClass("org.tweetyproject.logics.commons.syntax.Sort")
-            logger.info("Successfully imported TweetyProject Java classes.")
+            self._import_component_classes("core")
+            logger.info("Successfully imported core TweetyProject Java classes.")
         except Exception as e:
             logger.error(f"Error importing Java classes: {e}", exc_info=True)
             raise RuntimeError(f"Java class import failed: {e}") from e
 
 
     def initialize_pl_components(self):
-        """Initializes components for Propositional Logic."""
+        """Initializes components for Propositional Logic (once; later calls return the same instances)."""
         if not TweetyInitializer._jvm_started:
             self._start_jvm()
-        try:
-            logger.debug("Initializing PL components...")
-            TweetyInitializer._pl_reasoner = jpype.JClass("org.tweetyproject.logics.pl.reasoner.SatReasoner")()
-            TweetyInitializer._pl_parser = jpype.JClass("org.tweetyproject.logics.pl.parser.PlParser")()
-            logger.info("PL components initialized.")
-            return TweetyInitializer._pl_parser, TweetyInitializer._pl_reasoner
-        except Exception as e:
-            logger.error(f"Error initializing PL components: {e}", exc_info=True)
-            raise
+        with TweetyInitializer._init_lock:
+            if TweetyInitializer._pl_parser is not None and TweetyInitializer._pl_reasoner is not None:
+                return TweetyInitializer._pl_parser, TweetyInitializer._pl_reasoner
+            try:
+                logger.debug("Initializing PL components...")
+                with TweetyInitializer._timed("pl"):
+                    self._import_component_classes("pl")
+                    TweetyInitializer._pl_reasoner = TweetyInitializer.get_jclass("org.tweetyproject.logics.pl.reasoner.SatReasoner")()
+                    TweetyInitializer._pl_parser = TweetyInitializer.get_jclass("org.tweetyproject.logics.pl.parser.PlParser")()
+                logger.info("PL components initialized.")
+                return TweetyInitializer._pl_parser, TweetyInitializer._pl_reasoner
+            except Exception as e:
+                logger.error(f"Error initializing PL components: {e}", exc_info=True)
+                raise
 
     def initialize_fol_components(self):
-        """Initializes components for First-Order Logic."""
+        """Initializes components for First-Order Logic (once; later calls return the same parser)."""
         if not TweetyInitializer._jvm_started:
             self._start_jvm()
-        try:
-            logger.debug("Initializing FOL components...")
-            TweetyInitializer._fol_parser = jpype.JClass("org.tweetyproject.logics.fol.parser.FolParser")()
-            # FOL reasoner might depend on specific setup or be a more general interface
-            # For now, let's assume a default or no specific reasoner instance needed at class level
-            # TweetyInitializer._fol_reasoner = ...
-            logger.info("FOL parser initialized.")
-            return TweetyInitializer._fol_parser
-        except Exception as e:
-            logger.error(f"Error initializing FOL components: {e}", exc_info=True)
-            raise
+        with TweetyInitializer._init_lock:
+            if TweetyInitializer._fol_parser is not None:
+                return TweetyInitializer._fol_parser
+            try:
+                logger.debug("Initializing FOL components...")
+                with TweetyInitializer._timed("fol"):
+                    self._import_component_classes("fol")
+                    TweetyInitializer._fol_parser = TweetyInitializer.get_jclass("org.tweetyproject.logics.fol.parser.FolParser")()
+                # FOL reasoner might depend on specific setup or be a more general interface
+                # For now, let's assume a default or no specific reasoner instance needed at class level
+                # TweetyInitializer._fol_reasoner = ...
+                logger.info("FOL parser initialized.")
+                return TweetyInitializer._fol_parser
+            except Exception as e:
+                logger.error(f"Error initializing FOL components: {e}", exc_info=True)
+                raise
 
     def initialize_modal_components(self):
-        """Initializes components for Modal Logic."""
+        """Initializes components for Modal Logic (once; later calls return the same parser)."""
         if not TweetyInitializer._jvm_started:
             self._start_jvm()
-        try:
-            logger.debug("Initializing Modal Logic components...")
-            # Modal logic might have different types (K, S4, S5 etc.)
-            # For now, let's assume a general parser and perhaps a default logic
-            # The MlParser class was specifically imported
-            TweetyInitializer._modal_parser = jpype.JClass("org.tweetyproject.logics.ml.parser.MlParser")()
-            
-            # Example: Defaulting to S4 logic if a specific one is needed for the reasoner
-            # TweetyLogic = jpype.JClass("org.tweetyproject.logics.ml.syntax.ModalLogicType")
-            # TweetyInitializer._modal_logic = TweetyLogic.S4
-
-            # Modal reasoner might also depend on the specific modal logic type
-            # TweetyInitializer._modal_reasoner = ...
-            logger.info("Modal Logic parser initialized.")
-            return TweetyInitializer._modal_parser
-        except Exception as e:
-            logger.error(f"Error initializing Modal Logic components: {e}", exc_info=True)
-            raise
+        with TweetyInitializer._init_lock:
+            if TweetyInitializer._modal_parser is not None:
+                return TweetyInitializer._modal_parser
+            try:
+                logger.debug("Initializing Modal Logic components...")
+                # Modal logic might have different types (K, S4, S5 etc.)
+                # For now, let's assume a general parser and perhaps a default logic
+                # The MlParser class was specifically imported
+                with TweetyInitializer._timed("modal"):
+                    self._import_component_classes("modal")
+                    TweetyInitializer._modal_parser = TweetyInitializer.get_jclass("org.tweetyproject.logics.ml.parser.MlParser")()
+
+                # Example: Defaulting to S4 logic if a specific one is needed for the reasoner
+                # TweetyLogic = jpype.JClass("org.tweetyproject.logics.ml.syntax.ModalLogicType")
+                # TweetyInitializer._modal_logic = TweetyLogic.S4
+
+                # Modal reasoner might also depend on the specific modal logic type
+                # TweetyInitializer._modal_reasoner = ...
+                logger.info("Modal Logic parser initialized.")
+                return TweetyInitializer._modal_parser
+            except Exception as e:
+                logger.error(f"Error initializing Modal Logic components: {e}", exc_info=True)
+                raise
+
+    def initialize_components(self, logic: str):
+        """Initializes the components of one logic: "pl", "fol" or "modal"."""
+        initializers = {
+            "pl": self.initialize_pl_components,
+            "fol": self.initialize_fol_components,
+            "modal": self.initialize_modal_components,
+        }
+        if logic not in initializers:
+            raise ValueError(f"Unknown logic '{logic}', expected one of {sorted(initializers)}")
+        return initializers[logic]()
+
+    def create_components(self, logic: str) -> Dict[str, Any]:
+        """
+        Creates new parser/reasoner instances for one logic, independent of the shared ones,
+        so that a pooled handler can use them from its own thread.
+        Returns them as handler keyword arguments (e.g. {"pl_parser": ..., "pl_reasoner": ...}).
+        """
+        self.initialize_components(logic)
+        if logic == "pl":
+            return {
+                "pl_parser": TweetyInitializer.get_jclass("org.tweetyproject.logics.pl.parser.PlParser")(),
+                "pl_reasoner": TweetyInitializer.get_jclass("org.tweetyproject.logics.pl.reasoner.SatReasoner")(),
+            }
+        if logic == "fol":
+            return {"fol_parser": TweetyInitializer.get_jclass("org.tweetyproject.logics.fol.parser.FolParser")()}
+        return {"modal_parser": TweetyInitializer.get_jclass("org.tweetyproject.logics.ml.parser.MlParser")()}
+
+    @staticmethod
+    def start_warmup(logics: Iterable[str] = ("pl",)) -> threading.Thread:
+        """
+        Starts the JVM and initializes the given logics in a background daemon thread,
+        so that the first TweetyBridge of the process finds them ready.
+        Errors are logged, not raised: the bridge will retry and report them on first use.
+        Returns the warm-up thread (the running one if a warm-up was already started).
+        """
+        with TweetyInitializer._init_lock:
+            if TweetyInitializer._warmup_thread is not None:
+                return TweetyInitializer._warmup_thread
+            logics = list(logics)
+
+            def warmup():
+                try:
+                    with TweetyInitializer._timed("warmup"):
+                        initializer = TweetyInitializer(None)
+                        for logic in logics:
+                            initializer.initialize_components(logic)
+                except Exception as e:
+                    logger.error(f"Tweety warm-up failed: {e}", exc_info=True)
+
+            thread = threading.Thread(target=warmup, name="TweetyWarmup", daemon=True)
+            TweetyInitializer._warmup_thread = thread
+            thread.start()
+            logger.info(f"Tweety warm-up started for logics: {logics}")
+            return thread
+
+    @staticmethod
+    def wait_for_warmup(timeout: Optional[float] = None) -> bool:
+        """Waits for the warm-up thread, if any. Returns False if it is still running after the timeout."""
+        thread = TweetyInitializer._warmup_thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
 
     @staticmethod
     def get_pl_parser():
@@ -290,6 +421,7 @@ class TweetyInitializer:
                 TweetyInitializer._modal_logic = None
                 TweetyInitializer._modal_parser = None
                 TweetyInitializer._modal_reasoner = None
+                TweetyInitializer._jclass_registry.clear()
                 
                 logger.info("Shutting down JVM...")
                 jpype.shutdownJVM()
@@ -300,4 +432,9 @@ class TweetyInitializer:
         elif not TweetyInitializer._jvm_started:
             logger.info("JVM was not started by this class or already shut down.")
         else:
-            logger.info("JVM is started but perhaps not by this class, not shutting down.")
\ No newline at end of file
+            logger.info("JVM is started but perhaps not by this class, not shutting down.")
+
+
+_warmup_logics = [logic.strip() for logic in os.getenv(WARMUP_ENV_VAR, "").split(",") if logic.strip()]
+if _warmup_logics:
+    TweetyInitializer.start_warmup(_warmup_logics)
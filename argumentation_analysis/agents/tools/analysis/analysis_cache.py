@@ -0,0 +1,355 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Cache borné des résultats d'analyse, indexé par condensat de contenu.
+
+`EnhancedContextualFallacyAnalyzer` conservait ses analyses de contexte dans
+un dictionnaire propre à chaque instance, sans limite de taille, indexé par
+les 100 premiers caractères du contexte : la mémoire d'un processus de longue
+durée (API) croissait sans fin, deux contextes de même début partageaient une
+entrée, et tout était perdu au redémarrage. `AnalysisCache` remplace ce
+dictionnaire :
+
+- les clés combinent un espace de noms (type de résultat) et le condensat du
+  texte ; `normalize_text` permet d'indexer un contexte indépendamment de la
+  casse et des espaces ;
+- le niveau mémoire est un LRU borné en nombre d'entrées, avec une durée de
+  vie (TTL) optionnelle ;
+- un niveau disque optionnel (SQLite) conserve les résultats sérialisables en
+  JSON d'un lancement à l'autre et entre processus.
+
+Le cache partagé (`get_analysis_cache`) est configuré par les variables
+d'environnement ANALYSIS_CACHE_MAX_ENTRIES, ANALYSIS_CACHE_TTL (secondes) et
+ANALYSIS_CACHE_PATH (fichier SQLite du niveau disque).
+
+Les résultats mis en cache sont partagés entre appelants et ne doivent pas
+être modifiés.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger("AnalysisCache")
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_DISK_ENTRIES = 100000
+
+MAX_ENTRIES_ENV_VAR = "ANALYSIS_CACHE_MAX_ENTRIES"
+TTL_ENV_VAR = "ANALYSIS_CACHE_TTL"
+PATH_ENV_VAR = "ANALYSIS_CACHE_PATH"
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalise un texte pour l'indexation : minuscules et espaces réduits.
+
+    Args:
+        text: Le texte à normaliser
+
+    Returns:
+        Le texte normalisé
+    """
+    return " ".join(text.lower().split())
+
+
+def _json_default(value: Any) -> Any:
+    # Scalaires numpy (scores des pipelines transformers)
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class AnalysisCache:
+    """
+    Cache LRU/TTL thread-safe de résultats d'analyse, avec niveau disque optionnel.
+
+    Attributes:
+        max_entries (int): Nombre maximum d'entrées en mémoire.
+        ttl (Optional[float]): Durée de vie des entrées en secondes (None : illimitée).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: Optional[float] = None,
+                 disk_path: Optional[Union[str, Path]] = None, max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialise un cache vide.
+
+        Args:
+            max_entries: Nombre maximum d'entrées en mémoire
+            ttl: Durée de vie des entrées en secondes (None : illimitée)
+            disk_path: Fichier SQLite du niveau disque (None : pas de niveau disque)
+            max_disk_entries: Nombre maximum d'entrées sur disque
+            clock: Horloge (secondes, temps réel : les dates sont conservées sur disque)
+
+        Raises:
+            ValueError: Si une des limites n'est pas strictement positive
+        """
+        if max_entries < 1 or max_disk_entries < 1 or (ttl is not None and ttl <= 0):
+            raise ValueError("max_entries, max_disk_entries and ttl must be positive")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_disk_entries = max_disk_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "disk_hits": 0, "disk_writes": 0}
+        self._disk: Optional[sqlite3.Connection] = None
+        self._disk_count = 0
+        if disk_path is not None:
+            self._open_disk(Path(disk_path))
+
+    def _open_disk(self, path: Path) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._disk = sqlite3.connect(str(path), check_same_thread=False)
+            self._disk.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._disk.execute("CREATE INDEX IF NOT EXISTS entries_created ON entries (created)")
+            self._disk.commit()
+            self._disk_count = self._disk.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        except sqlite3.Error as e:
+            logger.error(f"Impossible d'ouvrir le cache disque {path}: {e}")
+            self._disk = None
+
+    @staticmethod
+    def make_key(namespace: str, text: str) -> str:
+        """
+        Calcule la clé d'un résultat.
+
+        Args:
+            namespace: Le type de résultat (ex: "context_analysis", "nlp:sentiment")
+            text: Le texte analysé (normalisé par l'appelant si besoin)
+
+        Returns:
+            La clé "espace de noms:condensat"
+        """
+        return f"{namespace}:{hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()}"
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl is not None and now - created > self.ttl
+
+    def _store(self, key: str, value: Any, created: float) -> None:
+        # Appelé sous verrou
+        self._entries[key] = (value, created)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def get(self, namespace: str, text: str) -> Optional[Any]:
+        """
+        Récupère un résultat.
+
+        Args:
+            namespace: Le type de résultat
+            text: Le texte analysé
+
+        Returns:
+            Le résultat, ou None s'il est absent ou expiré
+        """
+        key = self.make_key(namespace, text)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry[1], now):
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return entry[0]
+                del self._entries[key]
+                self._stats["expirations"] += 1
+
+            if self._disk is not None:
+                row = self._disk.execute("SELECT value, created FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is not None and not self._expired(row[1], now):
+                    value = json.loads(row[0])
+                    self._store(key, value, row[1])
+                    self._stats["hits"] += 1
+                    self._stats["disk_hits"] += 1
+                    return value
+
+            self._stats["misses"] += 1
+            return None
+
+    def put(self, namespace: str, text: str, value: Any) -> None:
+        """
+        Enregistre un résultat.
+
+        Les résultats non sérialisables en JSON ne sont conservés qu'en mémoire.
+
+        Args:
+            namespace: Le type de résultat
+            text: Le texte analysé
+            value: Le résultat (ne doit plus être modifié)
+        """
+        self.put_many(namespace, [(text, value)])
+
+    def put_many(self, namespace: str, items: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Enregistre plusieurs résultats d'un même type, écrits sur disque en une seule transaction.
+
+        Args:
+            namespace: Le type de résultat
+            items: Couples (texte analysé, résultat)
+        """
+        now = self._clock()
+        entries: List[Tuple[str, Any, Optional[str]]] = []
+        for text, value in items:
+            try:
+                serialized = json.dumps(value, default=_json_default, ensure_ascii=False)
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Résultat '{namespace}' non sérialisable, conservé en mémoire seulement: {e}")
+                serialized = None
+            entries.append((self.make_key(namespace, text), value, serialized))
+
+        with self._lock:
+            for key, value, _ in entries:
+                self._store(key, value, now)
+            if self._disk is None:
+                return
+            rows = [(key, serialized, now) for key, _, serialized in entries if serialized is not None]
+            if not rows:
+                return
+            try:
+                for key, serialized, created in rows:
+                    cursor = self._disk.execute(
+                        "INSERT OR IGNORE INTO entries (key, value, created) VALUES (?, ?, ?)", (key, serialized, created)
+                    )
+                    if cursor.rowcount:
+                        self._disk_count += 1
+                    else:
+                        self._disk.execute("UPDATE entries SET value = ?, created = ? WHERE key = ?",
+                                           (serialized, created, key))
+                if self._disk_count > self.max_disk_entries:
+                    self._trim_disk()
+                self._disk.commit()
+                self._stats["disk_writes"] += len(rows)
+            except sqlite3.Error as e:
+                self._disk.rollback()
+                self._disk_count = self._disk.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+                logger.warning(f"Erreur d'écriture dans le cache disque: {e}")
+
+    def _trim_disk(self) -> None:
+        """
+        Supprime les entrées disque les plus anciennes (appelé sous verrou, hors commit).
+
+        La table est ramenée un dixième sous `max_disk_entries` : le tri par
+        date (indexé) n'est fait qu'une fois tous les `max_disk_entries / 10`
+        ajouts, et non à chaque écriture.
+        """
+        target = self.max_disk_entries - self.max_disk_entries // 10
+        excess = self._disk_count - target
+        self._disk.execute(
+            "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY created LIMIT ?)", (excess,)
+        )
+        self._disk_count = target
+
+    def get_or_compute(self, namespace: str, text: str, compute: Callable[[], Any]) -> Any:
+        """
+        Récupère un résultat ou le calcule et l'enregistre.
+
+        Args:
+            namespace: Le type de résultat
+            text: Le texte analysé
+            compute: Fonction sans argument calculant le résultat
+
+        Returns:
+            Le résultat
+        """
+        value = self.get(namespace, text)
+        if value is None:
+            value = compute()
+            self.put(namespace, text, value)
+        return value
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        Vide le cache mémoire.
+
+        Args:
+            disk: Vider aussi le niveau disque
+        """
+        with self._lock:
+            self._entries.clear()
+            if disk and self._disk is not None:
+                self._disk.execute("DELETE FROM entries")
+                self._disk.commit()
+                self._disk_count = 0
+
+    def close(self) -> None:
+        """Ferme le niveau disque (le cache mémoire reste utilisable)."""
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Récupère les statistiques du cache.
+
+        Returns:
+            Un dictionnaire avec le nombre d'entrées, les limites, les compteurs
+            (succès, échecs, évictions, expirations, accès et écritures disque)
+            et le taux de succès
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["max_entries"] = self.max_entries
+            stats["disk_enabled"] = self._disk is not None
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+
+_cache: Optional[AnalysisCache] = None
+_cache_lock = threading.Lock()
+
+
+def _env_number(name: str, cast: Callable[[str], Any]) -> Optional[Any]:
+    # Une valeur illisible ou non strictement positive est ignorée (valeur par défaut)
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return None
+    try:
+        value = cast(raw)
+    except ValueError:
+        value = None
+    if value is None or not value > 0:
+        logger.warning(f"Valeur invalide pour {name}: '{raw}' (ignorée)")
+        return None
+    return value
+
+
+def get_analysis_cache() -> AnalysisCache:
+    """
+    Récupère le cache partagé par tous les analyseurs du processus.
+
+    Il est créé au premier appel, configuré par les variables d'environnement
+    ANALYSIS_CACHE_MAX_ENTRIES, ANALYSIS_CACHE_TTL et ANALYSIS_CACHE_PATH.
+
+    Returns:
+        Le cache partagé
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = AnalysisCache(
+                max_entries=_env_number(MAX_ENTRIES_ENV_VAR, int) or DEFAULT_MAX_ENTRIES,
+                ttl=_env_number(TTL_ENV_VAR, float) or None,
+                disk_path=os.environ.get(PATH_ENV_VAR) or None
+            )
+        return _cache
@@ -16,6 +16,8 @@ import logging
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
+from argumentation_analysis.agents.tools.analysis.pattern_matcher import PatternMatcher
+
 # Ajouter le répertoire parent au chemin de recherche des modules
 # current_dir = Path(__file__).parent # Commenté car start_api.py devrait gérer sys.path
 # parent_dir = current_dir.parent.parent.parent
@@ -30,6 +32,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger("ContextualFallacyAnalyzer")
 
+# Mots-clés associés à des sophismes courants
+FALLACY_KEYWORDS = {
+    "Appel à l'autorité": ["expert", "autorité", "scientifique", "étude", "recherche", "unanime"],
+    "Appel à la popularité": ["tout le monde", "majorité", "populaire", "commun", "consensus"],
+    "Appel à la tradition": ["tradition", "toujours", "depuis longtemps", "historiquement", "ancestral"],
+    "Appel à la nouveauté": ["nouveau", "moderne", "récent", "innovation", "dernière"],
+    "Appel à l'émotion": ["peur", "crainte", "inquiétude", "espoir", "rêve", "cauchemar"],
+    "Faux dilemme": ["soit", "ou bien", "alternative", "choix", "uniquement"],
+    "Pente glissante": ["mènera à", "conduira à", "finira par", "inévitablement"],
+    "Homme de paille": ["prétendre", "caricature", "déformer", "exagérer"],
+    "Ad hominem": ["personne", "caractère", "intégrité", "moralité", "crédibilité"]
+}
+
 
 class ContextualFallacyAnalyzer:
     """
@@ -49,6 +64,7 @@ class ContextualFallacyAnalyzer:
         """
         self.logger = logger
         self.taxonomy_df = self._load_taxonomy(taxonomy_path)
+        self.keyword_matcher = PatternMatcher(FALLACY_KEYWORDS)
         self.logger.info("Analyseur contextuel de sophismes initialisé.")
     
     def _load_taxonomy(self, taxonomy_path: Optional[str] = None) -> Any:
@@ -164,36 +180,19 @@ class ContextualFallacyAnalyzer:
         
         potential_fallacies = []
         
-        # Recherche de mots-clés associés à des sophismes courants
-        fallacy_keywords = {
-            "Appel à l'autorité": ["expert", "autorité", "scientifique", "étude", "recherche", "unanime"],
-            "Appel à la popularité": ["tout le monde", "majorité", "populaire", "commun", "consensus"],
-            "Appel à la tradition": ["tradition", "toujours", "depuis longtemps", "historiquement", "ancestral"],
-            "Appel à la nouveauté": ["nouveau", "moderne", "récent", "innovation", "dernière"],
-            "Appel à l'émotion": ["peur", "crainte", "inquiétude", "espoir", "rêve", "cauchemar"],
-            "Faux dilemme": ["soit", "ou bien", "alternative", "choix", "uniquement"],
-            "Pente glissante": ["mènera à", "conduira à", "finira par", "inévitablement"],
-            "Homme de paille": ["prétendre", "caricature", "déformer", "exagérer"],
-            "Ad hominem": ["personne", "caractère", "intégrité", "moralité", "crédibilité"]
-        }
-        
-        text_lower = text.lower()
-        
-        for fallacy_type, keywords in fallacy_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in text_lower:
-                    # Trouver le contexte autour du mot-clé
-                    keyword_index = text_lower.find(keyword.lower())
-                    start_index = max(0, keyword_index - 50)
-                    end_index = min(len(text), keyword_index + len(keyword) + 50)
-                    context_text = text[start_index:end_index]
-                    
-                    potential_fallacies.append({
-                        "fallacy_type": fallacy_type,
-                        "keyword": keyword,
-                        "context_text": context_text,
-                        "confidence": 0.5  # Confiance par défaut
-                    })
+        # Recherche, en un seul parcours du texte, des mots-clés associés à des sophismes courants
+        for match in self.keyword_matcher.first_matches(text):
+            # Trouver le contexte autour du mot-clé
+            start_index = max(0, match.start - 50)
+            end_index = min(len(text), match.end + 50)
+            context_text = text[start_index:end_index]
+            
+            potential_fallacies.append({
+                "fallacy_type": match.label,
+                "keyword": match.pattern,
+                "context_text": context_text,
+                "confidence": 0.5  # Confiance par défaut
+            })
         
         return potential_fallacies
     
@@ -27,6 +27,7 @@ if str(parent_dir) not in sys.path:
 
 # Importer l'analyseur de sophismes complexes de base
 from argumentation_analysis.agents.tools.analysis.complex_fallacy_analyzer import ComplexFallacyAnalyzer as BaseAnalyzer
+from argumentation_analysis.agents.tools.analysis.pattern_matcher import PatternMatcher
 
 # Fonction d'importation paresseuse pour éviter les importations circulaires
 def _lazy_imports():
@@ -71,6 +72,9 @@ class EnhancedComplexFallacyAnalyzer(BaseAnalyzer):
         
         # Définir les modèles de structure argumentative
         self.argument_structure_patterns = self._define_argument_structure_patterns()
+        self.structure_matcher = PatternMatcher({
+            name: info["detection_pattern"] for name, info in self.argument_structure_patterns.items()
+        })
         
         # Définir les modèles de sophismes composés avancés
         self.advanced_fallacy_combinations = self._define_advanced_fallacy_combinations()
@@ -274,12 +278,15 @@ class EnhancedComplexFallacyAnalyzer(BaseAnalyzer):
             Liste des structures argumentatives identifiées
         """
         identified_structures = []
-        argument_lower = argument.lower()
+        
+        # Mots-clés de tous les modèles présents dans l'argument, trouvés en un seul parcours
+        matches_by_structure = self.structure_matcher.matches_by_label(argument)
         
         # Vérifier chaque modèle de structure
         for structure_name, structure_info in self.argument_structure_patterns.items():
             # Compter les occurrences des mots-clés du modèle
-            pattern_matches = sum(1 for pattern in structure_info["detection_pattern"] if pattern in argument_lower)
+            matched_patterns = [match.pattern for match in matches_by_structure.get(structure_name, [])]
+            pattern_matches = len(matched_patterns)
             
             # Si suffisamment de mots-clés sont présents, considérer que la structure est présente
             if pattern_matches >= 2:  # Seuil arbitraire, à ajuster selon les besoins
@@ -292,7 +299,7 @@ class EnhancedComplexFallacyAnalyzer(BaseAnalyzer):
                     "confidence": confidence,
                     "fallacy_risk": structure_info["fallacy_risk"],
                     "complexity_score": structure_info["complexity_score"],
-                    "matched_patterns": [pattern for pattern in structure_info["detection_pattern"] if pattern in argument_lower]
+                    "matched_patterns": matched_patterns
                 })
         
         return identified_structures
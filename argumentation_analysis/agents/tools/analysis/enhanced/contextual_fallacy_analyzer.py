@@ -11,6 +11,7 @@ des mécanismes d'apprentissage continu pour améliorer la précision de l'analy
 
 import os
 import sys
+import copy
 import json
 import logging
 import numpy as np
@@ -27,6 +28,9 @@ if str(parent_dir) not in sys.path:
 # Importer l'analyseur contextuel de base
 from argumentation_analysis.agents.tools.analysis.contextual_fallacy_analyzer import ContextualFallacyAnalyzer as BaseAnalyzer
 
+from argumentation_analysis.agents.tools.analysis.analysis_cache import AnalysisCache, get_analysis_cache, normalize_text
+from argumentation_analysis.agents.tools.analysis.model_registry import LazyModels, get_model_registry
+
 # Importations pour les modèles de langage avancés
 from argumentation_analysis.paths import DATA_DIR
 
@@ -58,6 +62,47 @@ logging.basicConfig(
 )
 logger = logging.getLogger("EnhancedContextualFallacyAnalyzer")
 
+# Nombre de phrases passées ensemble aux pipelines transformers
+DEFAULT_NLP_BATCH_SIZE = 16
+
+# Espace de noms des analyses de contexte dans le cache d'analyse
+CONTEXT_ANALYSIS_NAMESPACE = "context_analysis"
+
+
+def run_pipeline_in_batches(nlp_pipeline: Any, texts: List[str], batch_size: int = DEFAULT_NLP_BATCH_SIZE) -> List[Any]:
+    """
+    Applique un pipeline transformers à des textes, par lots de longueurs voisines.
+    
+    Les textes sont triés par longueur avant d'être découpés en lots : chaque lot
+    réunit des textes de longueurs proches, ce qui limite le remplissage (padding)
+    des séquences. Les résultats sont remis dans l'ordre des textes.
+    
+    Args:
+        nlp_pipeline: Pipeline transformers (appelable sur une liste de textes)
+        texts: Textes à analyser
+        batch_size: Nombre maximal de textes par appel au pipeline
+        
+    Returns:
+        Le résultat du pipeline pour chaque texte, dans l'ordre de `texts`
+        
+    Raises:
+        ValueError: Si batch_size est inférieur à 1 ou si le pipeline ne retourne
+            pas un résultat par texte
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    
+    order = sorted(range(len(texts)), key=lambda index: len(texts[index]))
+    results: List[Any] = [None] * len(texts)
+    for start in range(0, len(order), batch_size):
+        batch = order[start:start + batch_size]
+        outputs = nlp_pipeline([texts[index] for index in batch], batch_size=len(batch))
+        if len(outputs) != len(batch):
+            raise ValueError(f"Pipeline returned {len(outputs)} results for {len(batch)} inputs")
+        for index, output in zip(batch, outputs):
+            results[index] = output
+    return results
+
 
 class EnhancedContextualFallacyAnalyzer(BaseAnalyzer):
     """
@@ -68,13 +113,17 @@ class EnhancedContextualFallacyAnalyzer(BaseAnalyzer):
     la précision de l'analyse des sophismes dans leur contexte.
     """
     
-    def __init__(self, taxonomy_path: Optional[str] = None, model_name: str = "distilbert-base-uncased"):
+    def __init__(self, taxonomy_path: Optional[str] = None, model_name: str = "distilbert-base-uncased",
+                 nlp_batch_size: int = DEFAULT_NLP_BATCH_SIZE, analysis_cache: Optional[AnalysisCache] = None):
         """
         Initialise l'analyseur contextuel de sophismes amélioré.
         
         Args:
             taxonomy_path: Chemin vers le fichier de taxonomie des sophismes (optionnel)
             model_name: Nom du modèle de langage à utiliser (optionnel)
+            nlp_batch_size: Nombre de phrases par appel aux pipelines de sentiment et d'entités nommées (optionnel)
+            analysis_cache: Cache des analyses de contexte et des résultats NLP par phrase
+                (optionnel, par défaut le cache partagé par les analyseurs du processus)
         """
         # Appeler la fonction d'importation paresseuse
         _lazy_imports()
@@ -82,8 +131,9 @@ class EnhancedContextualFallacyAnalyzer(BaseAnalyzer):
         super().__init__(taxonomy_path)
         self.logger = logger
         self.model_name = model_name
+        self.nlp_batch_size = nlp_batch_size
         self.feedback_history = []
-        self.context_embeddings_cache = {}
+        self.context_embeddings_cache = analysis_cache if analysis_cache is not None else get_analysis_cache()
         self.last_analysis_fallacies = {}
         
         # Initialiser les modèles de langage si disponibles
@@ -98,34 +148,40 @@ class EnhancedContextualFallacyAnalyzer(BaseAnalyzer):
         """
         Initialise les modèles de langage avancés.
         
+        Les modèles sont déclarés dans le registre partagé par tous les analyseurs
+        du processus : chacun n'est chargé qu'une fois, à sa première utilisation
+        (le pipeline de génération GPT-2 n'est donc chargé que si une explication
+        générée est demandée).
+        
         Returns:
-            Dictionnaire contenant les modèles de langage initialisés
+            Dictionnaire (chargé à l'accès) des modèles de langage
         """
-        models = {}
-        
-        if HAS_TRANSFORMERS:
-            try:
-                # Modèle pour la classification de texte
-                self.logger.info(f"Initialisation du modèle de langage {self.model_name}")
-                models["tokenizer"] = AutoTokenizer.from_pretrained(self.model_name)
-                models["model"] = AutoModelForSequenceClassification.from_pretrained(self.model_name)
-                
-                # Pipeline pour l'analyse de sentiment (utile pour détecter les appels à l'émotion)
-                models["sentiment"] = pipeline("sentiment-analysis")
-                
-                # Pipeline pour la génération de texte (utile pour l'explication des sophismes)
-                models["text_generation"] = pipeline("text-generation", model="gpt2")
-                
-                # Pipeline pour l'extraction d'entités nommées (utile pour identifier les autorités)
-                models["ner"] = pipeline("ner")
-                
-                self.logger.info("Modèles de langage initialisés avec succès.")
-            except Exception as e:
-                self.logger.error(f"Erreur lors de l'initialisation des modèles de langage: {e}")
-        else:
+        if not HAS_TRANSFORMERS:
             self.logger.warning("Fonctionnalités des modèles de langage désactivées.")
-        
-        return models
+            return {}
+        
+        registry = get_model_registry()
+        names = {
+            # Modèle pour la classification de texte
+            "tokenizer": f"tokenizer:{self.model_name}",
+            "model": f"sequence-classification:{self.model_name}",
+            # Pipeline pour l'analyse de sentiment (utile pour détecter les appels à l'émotion)
+            "sentiment": "pipeline:sentiment-analysis",
+            # Pipeline pour la génération de texte (utile pour l'explication des sophismes)
+            "text_generation": "pipeline:text-generation:gpt2",
+            # Pipeline pour l'extraction d'entités nommées (utile pour identifier les autorités)
+            "ner": "pipeline:ner",
+        }
+        model_name = self.model_name
+        registry.register(names["tokenizer"], lambda: AutoTokenizer.from_pretrained(model_name))
+        registry.register(names["model"], lambda: AutoModelForSequenceClassification.from_pretrained(model_name),
+                          quantizable=True)
+        registry.register(names["sentiment"], lambda: pipeline("sentiment-analysis"), quantizable=True)
+        registry.register(names["text_generation"], lambda: pipeline("text-generation", model="gpt2"), quantizable=True)
+        registry.register(names["ner"], lambda: pipeline("ner"), quantizable=True)
+        
+        self.logger.info("Modèles de langage déclarés (chargement à la première utilisation).")
+        return LazyModels(registry, names)
     
     def _load_learning_data(self) -> Dict[str, Any]:
         """
@@ -227,10 +283,16 @@ class EnhancedContextualFallacyAnalyzer(BaseAnalyzer):
         Returns:
             Dictionnaire contenant l'analyse du contexte
         """
-        # Vérifier si nous avons déjà analysé ce contexte
-        context_key = context.lower()[:100]  # Utiliser une version tronquée comme clé
-        if context_key in self.context_embeddings_cache:
-            return self.context_embeddings_cache[context_key]
+        # Vérifier si nous avons déjà analysé ce contexte (le résultat dépend de la disponibilité des modèles ;
+        # après un échec de chargement mémorisé, les modèles ne sont plus disponibles)
+        use_nlp = bool(HAS_TRANSFORMERS and self.nlp_models)
+        cache_namespace = CONTEXT_ANALYSIS_NAMESPACE + (":nlp" if use_nlp else "")
+        context_key = normalize_text(context)
+        cached_analysis = self.context_embeddings_cache.get(cache_namespace, context_key)
+        if cached_analysis is not None:
+            # Copie : l'appelant ne doit pas modifier l'entrée du cache
+            return copy.deepcopy(cached_analysis)
+        nlp_failed = False
         
         # Déterminer le type de contexte de base
         context_type = self._determine_context_type(context)
@@ -241,7 +303,7 @@ class EnhancedContextualFallacyAnalyzer(BaseAnalyzer):
         formality_level = "moyen"
         confidence = 0.7  # Confiance par défaut
         
-        if HAS_TRANSFORMERS and self.nlp_models:
+        if use_nlp:
             try:
                 # Analyser le sentiment du contexte
                 sentiment_result = self.nlp_models["sentiment"](context)
@@ -280,6 +342,7 @@ class EnhancedContextualFallacyAnalyzer(BaseAnalyzer):
                 
             except Exception as e:
                 self.logger.error(f"Erreur lors de l'analyse approfondie du contexte: {e}")
+                nlp_failed = True
         
         # Préparer les résultats de l'analyse
         context_analysis = {
@@ -290,8 +353,9 @@ class EnhancedContextualFallacyAnalyzer(BaseAnalyzer):
             "confidence": confidence
         }
         
-        # Mettre en cache les résultats
-        self.context_embeddings_cache[context_key] = context_analysis
+        # Mettre en cache les résultats (pas ceux d'une analyse dégradée par une erreur)
+        if not nlp_failed:
+            self.context_embeddings_cache.put(cache_namespace, context_key, copy.deepcopy(context_analysis))
         
         return context_analysis
     
@@ -312,16 +376,19 @@ class EnhancedContextualFallacyAnalyzer(BaseAnalyzer):
         if HAS_TRANSFORMERS and self.nlp_models:
             try:
                 # Diviser le texte en phrases pour une analyse plus précise
-                sentences = text.split(". ")
+                sentences = [sentence for sentence in text.split(". ") if sentence.strip()]
                 
-                for i, sentence in enumerate(sentences):
-                    if not sentence.strip():
-                        continue
-                    
-                    # Analyser le sentiment pour détecter les appels à l'émotion
-                    sentiment_result = self.nlp_models["sentiment"](sentence)
-                    sentiment = sentiment_result[0]["label"]
-                    sentiment_score = sentiment_result[0]["score"]
+                # Analyser toutes les phrases par lots : sentiment (appels à l'émotion)
+                # et entités nommées (appels à l'autorité)
+                sentiment_results = self._run_pipeline_cached("sentiment", sentences)
+                ner_results_by_sentence = self._run_pipeline_cached("ner", sentences)
+                
+                for sentence, sentiment_result, ner_results in zip(sentences, sentiment_results, ner_results_by_sentence):
+                    # Un pipeline appelé sur une liste retourne un dictionnaire par phrase (une liste avec top_k)
+                    if isinstance(sentiment_result, list):
+                        sentiment_result = sentiment_result[0]
+                    sentiment = sentiment_result["label"]
+                    sentiment_score = sentiment_result["score"]
                     
                     # Si le sentiment est très positif ou très négatif, vérifier s'il s'agit d'un appel à l'émotion
                     if sentiment_score > 0.8:
@@ -335,8 +402,7 @@ class EnhancedContextualFallacyAnalyzer(BaseAnalyzer):
                                 "detection_method": "sentiment_analysis"
                             })
                     
-                    # Extraire les entités nommées pour détecter les appels à l'autorité
-                    ner_results = self.nlp_models["ner"](sentence)
+                    # Entités nommées pour détecter les appels à l'autorité
                     person_entities = [entity for entity in ner_results if entity["entity"] in ["B-PER", "I-PER"]]
                     
                     if person_entities and ("expert" in sentence.lower() or "autorité" in sentence.lower() or "scientifique" in sentence.lower()):
@@ -364,6 +430,35 @@ class EnhancedContextualFallacyAnalyzer(BaseAnalyzer):
         
         return potential_fallacies
         
+    def _run_pipeline_cached(self, model_key: str, sentences: List[str]) -> List[Any]:
+        """
+        Applique un pipeline aux phrases, par lots, en réutilisant les résultats en cache.
+
+        Seules les phrases absentes du cache sont soumises au pipeline, qui n'est
+        pas chargé si toutes y sont. Les phrases sont indexées telles quelles :
+        les résultats (entités nommées, positions) dépendent de la casse. Les
+        résultats retournés sont des copies des entrées du cache.
+
+        Args:
+            model_key: Clé du pipeline dans `self.nlp_models` ("sentiment" ou "ner")
+            sentences: Les phrases à analyser
+
+        Returns:
+            Les résultats du pipeline, dans l'ordre des phrases
+        """
+        namespace = f"nlp:{model_key}"
+        results = [self.context_embeddings_cache.get(namespace, sentence) for sentence in sentences]
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            computed = run_pipeline_in_batches(
+                self.nlp_models[model_key], [sentences[index] for index in missing], self.nlp_batch_size
+            )
+            for index, result in zip(missing, computed):
+                results[index] = result
+            # Une seule transaction disque pour toutes les phrases du lot
+            self.context_embeddings_cache.put_many(namespace, [(sentences[index], results[index]) for index in missing])
+        return copy.deepcopy(results)
+
     def _filter_by_context_semantic(
         self, 
         potential_fallacies: List[Dict[str, Any]], 
@@ -0,0 +1,350 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Registre partagé des modèles de langage des analyseurs.
+
+Chaque instance d'analyseur chargeait ses propres modèles transformers à sa
+création, qu'ils servent ou non. `ModelRegistry` centralise ces modèles pour
+tout le processus :
+
+- un modèle est déclaré par son nom et sa fonction de chargement, puis chargé
+  au plus une fois, à sa première utilisation ;
+- les modèles compatibles peuvent être quantifiés dynamiquement en int8 pour
+  l'inférence sur CPU (`torch.quantization.quantize_dynamic` sur les couches
+  linéaires) ;
+- un modèle inutilisé depuis plus de `idle_timeout` secondes est libéré ; il
+  sera rechargé à la demande.
+
+Les analyseurs accèdent à leurs modèles par une vue (`LazyModels`) qui se
+comporte comme un dictionnaire et ne charge un modèle qu'à l'accès ; la vue
+devient « fausse » après un échec de chargement, ce qui permet aux analyseurs
+de revenir sans bruit à leurs méthodes alternatives.
+
+Configuration par défaut du registre partagé (`get_model_registry`) :
+
+- NLP_MODEL_QUANTIZE=1 : quantification int8 des modèles compatibles
+- NLP_MODEL_IDLE_TIMEOUT=<secondes> : délai d'inactivité avant libération
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger("ModelRegistry")
+
+QUANTIZE_ENV_VAR = "NLP_MODEL_QUANTIZE"
+IDLE_TIMEOUT_ENV_VAR = "NLP_MODEL_IDLE_TIMEOUT"
+
+
+def quantize_for_cpu(model: Any) -> Any:
+    """
+    Quantifie dynamiquement en int8 les couches linéaires d'un modèle PyTorch.
+
+    Un pipeline transformers est quantifié en place (son attribut `model`).
+
+    Args:
+        model: Un modèle PyTorch ou un pipeline transformers
+
+    Returns:
+        Le modèle quantifié (le pipeline lui-même pour un pipeline), ou le
+        modèle inchangé s'il n'est pas quantifiable ou n'est pas sur CPU
+    """
+    import torch
+
+    target = getattr(model, "model", model)
+    if not isinstance(target, torch.nn.Module):
+        return model
+    device = getattr(target, "device", None)
+    if device is not None and torch.device(device).type != "cpu":
+        return model
+
+    quantized = torch.quantization.quantize_dynamic(target, {torch.nn.Linear}, dtype=torch.qint8)
+    if target is model:
+        return quantized
+    model.model = quantized
+    return model
+
+
+class _ModelEntry:
+    """État d'un modèle déclaré dans le registre."""
+
+    def __init__(self, loader: Callable[[], Any], quantizable: bool):
+        self.loader = loader
+        self.quantizable = quantizable
+        self.lock = threading.Lock()
+        self.model: Any = None
+        self.loaded = False
+        self.error: Optional[Exception] = None
+        self.last_used = 0.0
+        self.stats = {"loads": 0, "hits": 0, "evictions": 0, "load_seconds": 0.0}
+
+
+class ModelRegistry:
+    """
+    Registre de modèles chargés à la demande, au plus une fois, et libérés après inactivité.
+
+    Attributes:
+        quantize (bool): Si True, les modèles déclarés quantifiables sont quantifiés en int8.
+        idle_timeout (Optional[float]): Délai d'inactivité (secondes) avant libération (None : jamais).
+    """
+
+    def __init__(self, quantize: bool = False, idle_timeout: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Crée un registre vide.
+
+        Args:
+            quantize: Quantifier en int8 les modèles déclarés quantifiables
+            idle_timeout: Délai d'inactivité en secondes avant libération d'un modèle (None : jamais)
+            clock: Horloge utilisée pour mesurer l'inactivité
+        """
+        self.quantize = quantize
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _ModelEntry] = {}
+
+    def register(self, name: str, loader: Callable[[], Any], quantizable: bool = False) -> None:
+        """
+        Déclare un modèle sans le charger.
+
+        Une déclaration sous un nom déjà connu est ignorée : la première fonction
+        de chargement est conservée et le modèle reste partagé.
+
+        Args:
+            name: Nom du modèle dans le registre (il doit identifier le modèle chargé)
+            loader: Fonction sans argument qui charge le modèle
+            quantizable: Si le modèle peut être quantifié (modèle PyTorch ou pipeline)
+        """
+        with self._lock:
+            self._entries.setdefault(name, _ModelEntry(loader, quantizable))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def _entry(self, name: str) -> _ModelEntry:
+        try:
+            return self._entries[name]
+        except KeyError:
+            raise KeyError(f"Modèle non déclaré dans le registre: {name}") from None
+
+    def get(self, name: str) -> Any:
+        """
+        Récupère un modèle, en le chargeant s'il ne l'est pas encore.
+
+        Args:
+            name: Nom du modèle
+
+        Returns:
+            Le modèle
+
+        Raises:
+            KeyError: Si le modèle n'est pas déclaré
+            RuntimeError: Si un chargement précédent a échoué (il n'est retenté qu'après `evict`)
+            Exception: Toute erreur de la fonction de chargement
+        """
+        self.evict_idle(exclude=name)
+        entry = self._entry(name)
+        with entry.lock:
+            if entry.loaded:
+                entry.stats["hits"] += 1
+            else:
+                if entry.error is not None:
+                    raise RuntimeError(f"Le chargement du modèle '{name}' a échoué: {entry.error}")
+                logger.info(f"Chargement du modèle '{name}'")
+                start = time.perf_counter()
+                try:
+                    model = entry.loader()
+                    if self.quantize and entry.quantizable:
+                        model = quantize_for_cpu(model)
+                except Exception as e:
+                    # Ne pas retenter à chaque analyse un chargement (téléchargement) voué à l'échec
+                    logger.error(f"Erreur lors du chargement du modèle '{name}': {e}")
+                    entry.error = e
+                    raise
+                entry.stats["load_seconds"] += time.perf_counter() - start
+                entry.stats["loads"] += 1
+                entry.model, entry.loaded = model, True
+            entry.last_used = self._clock()
+            return entry.model
+
+    def is_loaded(self, name: str) -> bool:
+        """
+        Indique si un modèle est actuellement chargé.
+
+        Args:
+            name: Nom du modèle
+
+        Returns:
+            True si le modèle est chargé
+        """
+        entry = self._entries.get(name)
+        return entry is not None and entry.loaded
+
+    def has_failed(self, name: str) -> bool:
+        """
+        Indique si le chargement d'un modèle a échoué (échec mémorisé jusqu'à `evict`).
+
+        Args:
+            name: Nom du modèle
+
+        Returns:
+            True si le dernier chargement a échoué
+        """
+        entry = self._entries.get(name)
+        return entry is not None and entry.error is not None
+
+    def evict(self, name: str) -> bool:
+        """
+        Libère un modèle ; il sera rechargé à sa prochaine utilisation.
+
+        Un échec de chargement mémorisé est oublié. Les appelants qui détiennent encore une référence au modèle peuvent
+        continuer à l'utiliser.
+
+        Args:
+            name: Nom du modèle
+
+        Returns:
+            True si le modèle était chargé
+        """
+        entry = self._entry(name)
+        with entry.lock:
+            entry.error = None
+            return self._unload(name, entry)
+
+    @staticmethod
+    def _unload(name: str, entry: _ModelEntry) -> bool:
+        if not entry.loaded:
+            return False
+        entry.model, entry.loaded = None, False
+        entry.stats["evictions"] += 1
+        logger.info(f"Modèle '{name}' libéré")
+        return True
+
+    def evict_idle(self, exclude: Optional[str] = None) -> List[str]:
+        """
+        Libère les modèles inutilisés depuis plus de `idle_timeout` secondes.
+
+        Args:
+            exclude: Nom d'un modèle à conserver
+
+        Returns:
+            Les noms des modèles libérés
+        """
+        if self.idle_timeout is None:
+            return []
+        deadline = self._clock() - self.idle_timeout
+        evicted = []
+        for name, entry in list(self._entries.items()):
+            if name == exclude or not entry.loaded or entry.last_used >= deadline:
+                continue
+            # Un modèle en cours de chargement ou d'accès n'est pas libéré
+            if entry.lock.acquire(blocking=False):
+                try:
+                    if entry.last_used < deadline and self._unload(name, entry):
+                        evicted.append(name)
+                finally:
+                    entry.lock.release()
+        return evicted
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupère les statistiques de chaque modèle déclaré.
+
+        Returns:
+            Pour chaque modèle : état de chargement, échec éventuel, nombre de chargements, d'accès
+            sans chargement, de libérations et durée cumulée de chargement
+        """
+        return {
+            name: {"loaded": entry.loaded, "failed": entry.error is not None, **entry.stats}
+            for name, entry in list(self._entries.items())
+        }
+
+
+class LazyModels(Mapping):
+    """
+    Vue d'un analyseur sur le registre : {clé locale: nom du modèle dans le registre}.
+
+    L'accès à une clé charge le modèle correspondant ; la vue est « vraie »
+    tant qu'elle contient une clé et qu'aucun chargement n'a échoué, sans rien
+    charger (voir `available`).
+    """
+
+    def __init__(self, registry: ModelRegistry, names: Dict[str, str]):
+        """
+        Crée une vue.
+
+        Args:
+            registry: Le registre des modèles
+            names: Dictionnaire {clé locale: nom du modèle dans le registre}
+        """
+        self._registry = registry
+        self._names = dict(names)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._registry.get(self._names[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __bool__(self) -> bool:
+        return self.available
+
+    @property
+    def available(self) -> bool:
+        """
+        Indique si les modèles de la vue sont utilisables : la vue n'est pas
+        vide et aucun chargement n'a échoué. Rien n'est chargé.
+
+        Returns:
+            True si les modèles sont utilisables
+        """
+        return bool(self._names) and not any(self._registry.has_failed(name) for name in self._names.values())
+
+    def is_loaded(self, key: str) -> bool:
+        """
+        Indique si le modèle d'une clé est chargé, sans le charger.
+
+        Args:
+            key: Clé locale
+
+        Returns:
+            True si le modèle est chargé
+        """
+        return self._registry.is_loaded(self._names[key])
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """
+    Récupère le registre partagé par tous les analyseurs du processus.
+
+    Il est créé au premier appel, configuré par les variables d'environnement
+    NLP_MODEL_QUANTIZE et NLP_MODEL_IDLE_TIMEOUT.
+
+    Returns:
+        Le registre partagé
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            quantize = os.environ.get(QUANTIZE_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+            idle_timeout = None
+            raw_timeout = os.environ.get(IDLE_TIMEOUT_ENV_VAR, "").strip()
+            if raw_timeout:
+                try:
+                    idle_timeout = float(raw_timeout)
+                except ValueError:
+                    logger.warning(f"Valeur invalide pour {IDLE_TIMEOUT_ENV_VAR}: '{raw_timeout}' (ignorée)")
+            _registry = ModelRegistry(quantize=quantize, idle_timeout=idle_timeout)
+        return _registry
@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Recherche compilée de mots-clés et de patterns pour la détection de sophismes.
+
+Les analyseurs testaient chaque mot-clé de leurs tables par une recherche de
+sous-chaîne (un parcours du texte par mot-clé) et le service web recompilait
+une expression régulière par pattern et par requête. `PatternMatcher` compile
+une table `{étiquette: [patterns]}` une seule fois :
+
+- les mots-clés littéraux sont dédoublonnés et réunis dans un automate
+  d'Aho-Corasick, qui trouve toutes leurs occurrences en un seul parcours du
+  texte ;
+- les patterns à joker (`.*`) sont compilés une fois en expressions régulières
+  non gourmandes ; leurs segments littéraux sont ajoutés à l'automate et
+  l'expression n'est évaluée que si tous ses segments sont présents.
+
+L'automate est écrit en Python : pour les petites tables des analyseurs (une
+cinquantaine de mots-clés), chercher la première occurrence de chaque
+mot-clé avec `str.find` (exécuté en C) reste plus rapide qu'un parcours
+caractère par caractère. `first_matches` n'utilise donc l'automate qu'à partir
+de `AUTOMATON_MIN_KEYWORDS` mots-clés distincts ; `find_all` l'utilise toujours.
+
+La recherche est insensible à la casse : patterns et texte sont mis en
+minuscules, et les positions retournées se rapportent au texte en minuscules
+(identiques à celles du texte d'origine, sauf rares caractères Unicode dont la
+minuscule change de longueur).
+"""
+
+import logging
+import re
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger("PatternMatcher")
+
+WILDCARD = ".*"
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# Nombre de mots-clés distincts à partir duquel l'automate est plus rapide que str.find
+AUTOMATON_MIN_KEYWORDS = 200
+
+
+class PatternMatch(NamedTuple):
+    """Occurrence d'un pattern dans un texte."""
+
+    label: str
+    pattern: str
+    start: int
+    end: int
+
+
+class KeywordAutomaton:
+    """
+    Automate d'Aho-Corasick sur un ensemble de mots-clés littéraux.
+
+    Toutes les occurrences (y compris chevauchantes) de tous les mots-clés sont
+    trouvées en un seul parcours du texte.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Construit l'automate.
+
+        Args:
+            keywords: Les mots-clés (les doublons et les chaînes vides sont ignorés)
+        """
+        self.keywords: List[str] = list(dict.fromkeys(k for k in keywords if k))
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        for keyword_id, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = next_state
+            self._output[state] += (keyword_id,)
+
+        # Liens d'échec en largeur ; chaque état hérite des sorties de son lien d'échec
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+                queue.append(next_state)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Parcourt le texte et produit chaque occurrence de mot-clé.
+
+        Args:
+            text: Le texte à parcourir
+
+        Yields:
+            Des tuples (début, fin, indice du mot-clé dans `keywords`), par position de fin croissante
+        """
+        goto, fail, output, keywords = self._goto, self._fail, self._output, self.keywords
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword_id in output[state]:
+                yield index + 1 - len(keywords[keyword_id]), index + 1, keyword_id
+
+    def first_occurrences(self, text: str) -> Dict[int, int]:
+        """
+        Trouve la première occurrence de chaque mot-clé présent dans le texte.
+
+        Args:
+            text: Le texte à parcourir
+
+        Returns:
+            Un dictionnaire {indice du mot-clé: position de début}
+        """
+        first: Dict[int, int] = {}
+        for start, _, keyword_id in self.iter_matches(text):
+            if keyword_id not in first:
+                first[keyword_id] = start
+                if len(first) == len(self.keywords):
+                    break
+        return first
+
+
+class PatternMatcher:
+    """
+    Table de patterns de sophismes compilée une fois pour toutes.
+
+    Attributes:
+        pattern_table (Dict[str, Tuple[str, ...]]): Les patterns (en minuscules) de chaque étiquette.
+    """
+
+    def __init__(self, pattern_table: Mapping[str, Iterable[str]],
+                 automaton_min_keywords: int = AUTOMATON_MIN_KEYWORDS):
+        """
+        Compile une table de patterns.
+
+        Args:
+            pattern_table: Dictionnaire {étiquette: patterns} ; un pattern contenant `.*`
+                est une expression régulière, les autres sont des mots-clés littéraux
+            automaton_min_keywords: Nombre de mots-clés distincts à partir duquel
+                `first_matches` parcourt le texte avec l'automate
+        """
+        self.pattern_table: Dict[str, Tuple[str, ...]] = {
+            label: tuple(pattern.lower() for pattern in patterns)
+            for label, patterns in pattern_table.items()
+        }
+
+        # Pattern -> (expression compilée ou None, segments littéraux requis)
+        self._regexes: Dict[str, Tuple[Optional["re.Pattern"], Tuple[str, ...]]] = {}
+        keywords: List[str] = []
+        for patterns in self.pattern_table.values():
+            for pattern in patterns:
+                if WILDCARD not in pattern:
+                    keywords.append(pattern)
+                elif pattern not in self._regexes:
+                    self._regexes[pattern] = self._compile(pattern)
+                    keywords.extend(self._regexes[pattern][1])
+
+        self._automaton = KeywordAutomaton(keywords)
+        self._keyword_ids = {keyword: i for i, keyword in enumerate(self._automaton.keywords)}
+        self._use_automaton = len(self._automaton.keywords) >= automaton_min_keywords
+        # (étiquette, pattern, indice du mot-clé ou None pour un pattern à joker), dans l'ordre de la table
+        self._entries = [
+            (label, pattern, None if WILDCARD in pattern else self._keyword_ids.get(pattern))
+            for label, patterns in self.pattern_table.items() for pattern in patterns
+        ]
+
+    def _first_occurrences(self, text: str) -> Dict[int, int]:
+        if self._use_automaton:
+            return self._automaton.first_occurrences(text)
+        first = {}
+        for keyword_id, keyword in enumerate(self._automaton.keywords):
+            position = text.find(keyword)
+            if position >= 0:
+                first[keyword_id] = position
+        return first
+
+    @staticmethod
+    def _compile(pattern: str) -> Tuple[Optional["re.Pattern"], Tuple[str, ...]]:
+        segments = tuple(segment for segment in pattern.split(WILDCARD) if segment)
+        try:
+            regex = re.compile(pattern.replace(WILDCARD, ".*?"), re.IGNORECASE)
+        except re.error as e:
+            logger.warning(f"Invalid pattern '{pattern}', matching it as a literal: {e}")
+            return None, ("".join(segments),)
+        # Les segments ne servent de préfiltre que s'ils sont littéraux
+        if any(REGEX_METACHARACTERS.intersection(segment) for segment in segments):
+            return regex, ()
+        return regex, segments
+
+    def _search(self, pattern: str, text: str, first: Dict[int, int]) -> Iterator[Tuple[int, int]]:
+        if WILDCARD not in pattern:
+            position = first.get(self._keyword_ids.get(pattern, -1))
+            if position is not None:
+                yield position, position + len(pattern)
+            return
+
+        regex, segments = self._regexes[pattern]
+        if any(self._keyword_ids[segment] not in first for segment in segments):
+            return
+        if regex is None:
+            position = first[self._keyword_ids[segments[0]]]
+            yield position, position + len(segments[0])
+            return
+        for match in regex.finditer(text):
+            yield match.start(), match.end()
+
+    def first_matches(self, text: str) -> List[PatternMatch]:
+        """
+        Trouve la première occurrence de chaque pattern présent dans le texte.
+
+        Args:
+            text: Le texte à analyser
+
+        Returns:
+            Les occurrences, dans l'ordre de la table (étiquettes puis patterns)
+        """
+        text_lower = text.lower()
+        first = self._first_occurrences(text_lower)
+        matches = []
+        for label, pattern, keyword_id in self._entries:
+            if keyword_id is not None:
+                position = first.get(keyword_id)
+                if position is not None:
+                    matches.append(PatternMatch(label, pattern, position, position + len(pattern)))
+            elif WILDCARD in pattern:
+                for start, end in self._search(pattern, text_lower, first):
+                    matches.append(PatternMatch(label, pattern, start, end))
+                    break
+        return matches
+
+    def find_all(self, text: str) -> List[PatternMatch]:
+        """
+        Trouve toutes les occurrences de tous les patterns dans le texte.
+
+        Les mots-clés littéraux sont trouvés en un seul parcours de l'automate ;
+        les occurrences d'un même pattern à joker ne se chevauchent pas.
+
+        Args:
+            text: Le texte à analyser
+
+        Returns:
+            Les occurrences, triées par position de début
+        """
+        text_lower = text.lower()
+        occurrences: Dict[int, List[Tuple[int, int]]] = {}
+        for start, end, keyword_id in self._automaton.iter_matches(text_lower):
+            occurrences.setdefault(keyword_id, []).append((start, end))
+        first = {keyword_id: spans[0][0] for keyword_id, spans in occurrences.items()}
+
+        matches = []
+        for label, patterns in self.pattern_table.items():
+            for pattern in patterns:
+                if WILDCARD in pattern:
+                    spans = self._search(pattern, text_lower, first)
+                else:
+                    spans = occurrences.get(self._keyword_ids.get(pattern, -1), ())
+                matches.extend(PatternMatch(label, pattern, start, end) for start, end in spans)
+        matches.sort(key=lambda match: (match.start, match.end))
+        return matches
+
+    def matches_by_label(self, text: str) -> Dict[str, List[PatternMatch]]:
+        """
+        Regroupe par étiquette la première occurrence de chaque pattern présent.
+
+        Args:
+            text: Le texte à analyser
+
+        Returns:
+            Un dictionnaire {étiquette: occurrences}, limité aux étiquettes ayant au moins une occurrence
+        """
+        grouped: Dict[str, List[PatternMatch]] = {}
+        for match in self.first_matches(text):
+            grouped.setdefault(match.label, []).append(match)
+        return grouped
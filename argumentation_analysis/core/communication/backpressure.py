@@ -0,0 +1,182 @@
+"""
+Contre-pression sur les files par destinataire des canaux de communication.
+
+Sans limite, un agent opérationnel lent laisse sa file grossir indéfiniment
+pendant que le coordinateur tactique continue de lui assigner des tâches.
+`QueuePressure` borne la profondeur de chaque file et applique une politique
+de débordement :
+- `block` : l'émetteur attend qu'une place se libère (jusqu'à `block_timeout`) ;
+- `drop_lowest_priority` : le message le moins prioritaire est abandonné,
+  qu'il soit dans la file ou qu'il s'agisse du nouveau message ;
+- `reject` : l'envoi échoue avec une `ChannelFullException`.
+
+Deux seuils (hautes et basses eaux) encadrent l'état « congestionné » d'un
+destinataire ; les canaux signalent ses transitions à leurs écouteurs afin
+que les émetteurs ralentissent avant d'atteindre la capacité.
+"""
+
+import enum
+import logging
+import math
+import threading
+from typing import Any, Callable, Dict, Optional, Set
+
+from .channel_interface import ChannelFullException
+from .message import Message
+from .message_queue import PRIORITY_VALUES
+
+
+class OverflowPolicy(enum.Enum):
+    """Politiques appliquées lorsqu'une file a atteint sa capacité."""
+    BLOCK = "block"
+    DROP_LOWEST_PRIORITY = "drop_lowest_priority"
+    REJECT = "reject"
+
+
+class QueuePressure:
+    """
+    Capacité, politique de débordement et seuils de congestion des files d'un canal.
+
+    La classe n'est pas thread-safe : le canal propriétaire l'utilise sous son
+    propre verrou, celui de la condition passée à `admit`.
+
+    Configuration (clés du dictionnaire de configuration du canal) :
+    - queue_capacity : nombre maximum de messages par destinataire (None : illimité, défaut)
+    - overflow_policy : "block", "drop_lowest_priority" ou "reject" (défaut)
+    - block_timeout : attente maximale d'une place en secondes pour "block" (défaut 5)
+    - high_water_ratio : proportion de la capacité à partir de laquelle un
+      destinataire est congestionné (défaut 0.8)
+    - low_water_ratio : proportion sous laquelle la congestion cesse (défaut 0.5)
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, logger: Optional[logging.Logger] = None):
+        """
+        Initialise les limites à partir de la configuration du canal.
+
+        Args:
+            config: Configuration du canal (optionnel)
+            logger: Logger du canal (optionnel)
+        """
+        config = config or {}
+        self.capacity: Optional[int] = config.get("queue_capacity")
+        self.policy = OverflowPolicy(config.get("overflow_policy", OverflowPolicy.REJECT.value))
+        self.block_timeout = config.get("block_timeout", 5.0)
+        self.logger = logger or logging.getLogger("QueuePressure")
+
+        if self.capacity is not None:
+            if self.capacity < 1:
+                raise ValueError("queue_capacity must be at least 1")
+            self.high_water = max(1, math.ceil(self.capacity * config.get("high_water_ratio", 0.8)))
+            self.low_water = min(self.high_water - 1, math.floor(self.capacity * config.get("low_water_ratio", 0.5)))
+        else:
+            self.high_water = None
+            self.low_water = None
+
+        self.congested: Set[str] = set()
+        self.stats = {"dropped": 0, "rejected": 0, "blocked": 0, "max_depth": 0}
+
+    @property
+    def bounded(self) -> bool:
+        """Indique si les files sont bornées."""
+        return self.capacity is not None
+
+    def admit(self, message: Message, depth: Callable[[], int], condition: threading.Condition,
+              evict: Callable[[int], Optional[Message]]) -> bool:
+        """
+        Fait de la place pour un message avant son dépôt dans une file.
+
+        Doit être appelé avec le verrou de `condition`, que le canal notifie
+        (`notify_all`) chaque fois qu'un message quitte une file.
+
+        Args:
+            message: Le message à déposer
+            depth: Fonction retournant la profondeur courante de la file du destinataire
+            condition: Condition signalée lorsqu'une place se libère
+            evict: Fonction retirant de la file un message de priorité strictement
+                inférieure au rang donné (valeur de `PRIORITY_VALUES`) et le retournant,
+                ou retournant None s'il n'y en a pas
+
+        Returns:
+            True si le message peut être déposé, False s'il doit être abandonné
+
+        Raises:
+            ChannelFullException: Si la file est pleine et la politique est "reject",
+                ou si l'attente de la politique "block" expire
+        """
+        if self.capacity is None or depth() < self.capacity:
+            return True
+
+        recipient_id = message.recipient
+        if self.policy is OverflowPolicy.BLOCK:
+            self.stats["blocked"] += 1
+            if condition.wait_for(lambda: depth() < self.capacity, self.block_timeout):
+                return True
+            self.stats["rejected"] += 1
+            raise ChannelFullException(
+                f"Queue of {recipient_id} still full after {self.block_timeout}s ({self.capacity} messages)"
+            )
+
+        if self.policy is OverflowPolicy.DROP_LOWEST_PRIORITY:
+            self.stats["dropped"] += 1
+            evicted = evict(PRIORITY_VALUES.get(message.priority, 2))
+            if evicted is not None:
+                self.logger.warning(f"Queue of {recipient_id} full: dropped message {evicted.id} ({evicted.priority.value})")
+                return True
+            self.logger.warning(f"Queue of {recipient_id} full: dropped incoming message {message.id} ({message.priority.value})")
+            return False
+
+        self.stats["rejected"] += 1
+        raise ChannelFullException(f"Queue of {recipient_id} is full ({self.capacity} messages)")
+
+    def update(self, recipient_id: str, depth: int) -> Optional[bool]:
+        """
+        Met à jour l'état de congestion d'un destinataire après un dépôt ou un retrait.
+
+        Args:
+            recipient_id: Identifiant du destinataire
+            depth: Nouvelle profondeur de sa file
+
+        Returns:
+            True si le destinataire devient congestionné, False s'il cesse de
+            l'être, None si son état ne change pas
+        """
+        if depth > self.stats["max_depth"]:
+            self.stats["max_depth"] = depth
+        if self.capacity is None:
+            return None
+
+        if recipient_id in self.congested:
+            if depth <= self.low_water:
+                self.congested.discard(recipient_id)
+                return False
+        elif depth >= self.high_water:
+            self.congested.add(recipient_id)
+            return True
+        return None
+
+    def get_gauges(self, depths: Dict[str, int]) -> Dict[str, Any]:
+        """
+        Construit les jauges de profondeur des files pour `get_channel_info`.
+
+        Args:
+            depths: Profondeur de la file de chaque destinataire
+
+        Returns:
+            Un dictionnaire décrivant les limites, les profondeurs et les compteurs
+        """
+        return {
+            "capacity": self.capacity,
+            "policy": self.policy.value,
+            "high_water": self.high_water,
+            "low_water": self.low_water,
+            "queue_depths": {
+                recipient: {
+                    "depth": depth,
+                    "utilization": depth / self.capacity if self.capacity else None,
+                    "congested": recipient in self.congested
+                }
+                for recipient, depth in depths.items()
+            },
+            "congested": sorted(self.congested),
+            **self.stats
+        }
@@ -7,7 +7,10 @@ doivent implémenter, ainsi que les types de canaux supportés.
 
 import enum
 import abc
-from typing import Dict, Any, Optional, List, Callable, Union
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Dict, Any, Optional, List, Callable, Union, Set, Tuple
 import logging # Ajout pour LocalChannel
 from .message import Message, MessageType, MessagePriority
 
@@ -27,17 +30,215 @@ class ChannelType(enum.Enum):
     LOCAL = "local" # Ajout pour LocalChannel
 
 
+class MessageNotifier:
+    """
+    Mécanisme de notification par destinataire.
+    
+    Chaque destinataire possède un numéro de séquence incrémenté à chaque dépôt
+    de message. Un récepteur lit ce numéro, consulte les files d'attente puis
+    attend que le numéro change : les threads attendent sur une condition propre
+    au destinataire et les coroutines sur un futur asyncio, sans attente active.
+    """
+    
+    def __init__(self):
+        """Initialise un notificateur sans destinataire connu."""
+        self._lock = threading.Lock()
+        self._sequences: Dict[str, int] = defaultdict(int)
+        self._conditions: Dict[str, threading.Condition] = {}
+        self._async_waiters: Dict[str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = defaultdict(set)
+    
+    def get_sequence(self, recipient_id: str) -> int:
+        """
+        Récupère le numéro de séquence courant d'un destinataire.
+        
+        Args:
+            recipient_id: Identifiant du destinataire
+            
+        Returns:
+            Le numéro de séquence à passer à `wait` ou `wait_async`
+        """
+        with self._lock:
+            return self._sequences[recipient_id]
+    
+    def notify(self, recipient_id: str) -> None:
+        """
+        Signale qu'un message est disponible pour un destinataire.
+        
+        Args:
+            recipient_id: Identifiant du destinataire
+        """
+        with self._lock:
+            self._sequences[recipient_id] += 1
+            
+            condition = self._conditions.get(recipient_id)
+            if condition is not None:
+                condition.notify_all()
+            
+            waiters = self._async_waiters.pop(recipient_id, None)
+        
+        if waiters:
+            for loop, future in waiters:
+                try:
+                    loop.call_soon_threadsafe(self._resolve_future, future)
+                except RuntimeError:
+                    # La boucle d'événements a été fermée entre-temps
+                    pass
+    
+    def wait(self, recipient_id: str, sequence: int, timeout: Optional[float] = None) -> bool:
+        """
+        Attend qu'un message soit déposé pour un destinataire.
+        
+        Args:
+            recipient_id: Identifiant du destinataire
+            sequence: Numéro de séquence lu avant de consulter les files d'attente
+            timeout: Délai d'attente maximum en secondes (None pour attente indéfinie)
+            
+        Returns:
+            True si un message a été signalé depuis `sequence`, False si timeout
+        """
+        with self._lock:
+            condition = self._conditions.get(recipient_id)
+            if condition is None:
+                condition = threading.Condition(self._lock)
+                self._conditions[recipient_id] = condition
+            
+            return condition.wait_for(
+                lambda: self._sequences[recipient_id] != sequence,
+                timeout
+            )
+    
+    async def wait_async(self, recipient_id: str, sequence: int, timeout: Optional[float] = None) -> bool:
+        """
+        Version asynchrone de `wait`, qui n'occupe aucun thread pendant l'attente.
+        
+        Args:
+            recipient_id: Identifiant du destinataire
+            sequence: Numéro de séquence lu avant de consulter les files d'attente
+            timeout: Délai d'attente maximum en secondes (None pour attente indéfinie)
+            
+        Returns:
+            True si un message a été signalé depuis `sequence`, False si timeout
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = (loop, future)
+        
+        with self._lock:
+            if self._sequences[recipient_id] != sequence:
+                return True
+            self._async_waiters[recipient_id].add(waiter)
+        
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                waiters = self._async_waiters.get(recipient_id)
+                if waiters is not None:
+                    waiters.discard(waiter)
+                    if not waiters:
+                        del self._async_waiters[recipient_id]
+    
+    @staticmethod
+    def _resolve_future(future: asyncio.Future) -> None:
+        """Résout un futur d'attente s'il n'a pas déjà été annulé."""
+        if not future.done():
+            future.set_result(True)
+
+
 class Channel(abc.ABC):
     """
     Interface abstraite pour tous les canaux de communication.
+    
+    Les canaux qui appellent `_signal_message` à chaque dépôt positionnent
+    `supports_notifications` à True : le middleware peut alors bloquer ses
+    récepteurs sur les notifications au lieu d'interroger le canal en boucle.
     """
     
+    supports_notifications = False
+    
     def __init__(self, channel_id: str, channel_type: ChannelType, config: Optional[Dict[str, Any]] = None):
         self.id = channel_id
         self.type = channel_type
         self.config = config or {}
         self.subscribers: Dict[str, Dict[str, Any]] = {} # subscriber_id -> {"callback": callback, "filter": filter}
         self._message_queue: List[Message] = [] # Simple file d'attente en mémoire pour LocalChannel
+        self._message_listeners: List[Callable[[str], None]] = []
+        self._pressure_listeners: List[Callable[[str, bool], None]] = []
+    
+    def add_message_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Enregistre une fonction appelée avec l'identifiant du destinataire à chaque dépôt de message.
+        
+        Args:
+            listener: La fonction à appeler (typiquement `MessageNotifier.notify`)
+        """
+        if listener not in self._message_listeners:
+            self._message_listeners.append(listener)
+    
+    def remove_message_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Retire une fonction précédemment enregistrée par `add_message_listener`.
+        
+        Args:
+            listener: La fonction à retirer
+        """
+        if listener in self._message_listeners:
+            self._message_listeners.remove(listener)
+    
+    def _signal_message(self, recipient_id: str) -> None:
+        """
+        Signale aux écouteurs qu'un message a été déposé pour un destinataire.
+        
+        Doit être appelé après que le message est visible dans la file d'attente.
+        
+        Args:
+            recipient_id: Identifiant du destinataire
+        """
+        for listener in list(self._message_listeners):
+            try:
+                listener(recipient_id)
+            except Exception as e:
+                logger_channel.error(f"Canal '{self.id}': Erreur dans un écouteur de messages: {e}")
+    
+    def add_pressure_listener(self, listener: Callable[[str, bool], None]) -> None:
+        """
+        Enregistre une fonction appelée lorsqu'un destinataire devient congestionné ou cesse de l'être.
+        
+        Args:
+            listener: La fonction à appeler avec l'identifiant du destinataire et
+                True (hautes eaux atteintes) ou False (retour sous les basses eaux)
+        """
+        if listener not in self._pressure_listeners:
+            self._pressure_listeners.append(listener)
+    
+    def remove_pressure_listener(self, listener: Callable[[str, bool], None]) -> None:
+        """
+        Retire une fonction précédemment enregistrée par `add_pressure_listener`.
+        
+        Args:
+            listener: La fonction à retirer
+        """
+        if listener in self._pressure_listeners:
+            self._pressure_listeners.remove(listener)
+    
+    def _signal_pressure(self, recipient_id: str, congested: bool) -> None:
+        """
+        Signale aux écouteurs un changement de congestion de la file d'un destinataire.
+        
+        Doit être appelé hors du verrou du canal : les écouteurs peuvent envoyer des messages.
+        
+        Args:
+            recipient_id: Identifiant du destinataire
+            congested: True si le destinataire devient congestionné, False sinon
+        """
+        for listener in list(self._pressure_listeners):
+            try:
+                listener(recipient_id, congested)
+            except Exception as e:
+                logger_channel.error(f"Canal '{self.id}': Erreur dans un écouteur de contre-pression: {e}")
     
     @abc.abstractmethod
     def send_message(self, message: Message) -> bool:
@@ -185,6 +386,7 @@ class ChannelException(Exception):
     pass
 
 class ChannelFullException(ChannelException):
+    """Exception levée lorsque la file d'un destinataire a atteint sa capacité."""
     pass
 
 class ChannelTimeoutException(ChannelException):
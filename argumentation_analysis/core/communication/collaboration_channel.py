@@ -11,10 +11,12 @@ import threading
 import logging
 from typing import Dict, Any, Optional, List, Callable, Set
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
 
-from .channel_interface import Channel, ChannelType, ChannelException
+from .channel_interface import Channel, ChannelType, ChannelException, ChannelFullException
 from .message import Message, MessageType, MessagePriority, AgentLevel
+from .message_queue import PRIORITY_VALUES
+from .backpressure import QueuePressure
 
 
 class CollaborationGroup:
@@ -145,6 +147,8 @@ class CollaborationChannel(Channel):
     de collaboration et le partage de contexte entre agents.
     """
     
+    supports_notifications = True
+    
     def __init__(self, channel_id: str, config: Optional[Dict[str, Any]] = None):
         """
         Initialise un nouveau canal de collaboration.
@@ -158,8 +162,8 @@ class CollaborationChannel(Channel):
         # Groupes de collaboration
         self.groups = {}
         
-        # Messages directs entre agents
-        self.direct_messages = defaultdict(list)
+        # Messages directs non lus par destinataire, dans l'ordre d'arrivée
+        self.direct_messages = defaultdict(deque)
         
         # Verrou pour les opérations concurrentes
         self.lock = threading.RLock()
@@ -168,6 +172,10 @@ class CollaborationChannel(Channel):
         self.logger = logging.getLogger(f"CollaborationChannel.{channel_id}")
         self.logger.setLevel(logging.INFO)
         
+        # Capacité des messages directs par destinataire et condition signalée lorsqu'une place se libère
+        self.pressure = QueuePressure(self.config, self.logger)
+        self.space_available = threading.Condition(self.lock)
+        
         # Statistiques
         self.stats = {
             "messages_sent": 0,
@@ -191,6 +199,10 @@ class CollaborationChannel(Channel):
             
         Returns:
             True si le message a été envoyé avec succès, False sinon
+            
+        Raises:
+            ChannelFullException: Si la file de messages directs du destinataire est pleine
+                (politiques "reject" et "block")
         """
         try:
             # Vérifier si le message est destiné à un groupe
@@ -203,6 +215,8 @@ class CollaborationChannel(Channel):
                 # Message direct
                 return self._send_direct_message(message)
             
+        except ChannelFullException:
+            raise
         except Exception as e:
             self.logger.error(f"Error sending message: {str(e)}")
             return False
@@ -234,6 +248,10 @@ class CollaborationChannel(Channel):
             # Ajouter le message à l'historique du groupe
             group.add_message(message)
             
+            for member_id in group.members:
+                if member_id != message.sender:
+                    self._signal_message(member_id)
+            
             # Mettre à jour les statistiques
             self.stats["messages_sent"] += 1
             self.stats["group_messages"] += 1
@@ -261,12 +279,17 @@ class CollaborationChannel(Channel):
             return False
         
         with self.lock:
-            # Ajouter le message à la liste des messages du destinataire
-            self.direct_messages[message.recipient].append({
+            # Ajouter le message à la file des messages directs du destinataire
+            entries = self.direct_messages[message.recipient]
+            if not self.pressure.admit(message, entries.__len__, self.space_available,
+                                       lambda rank: self._evict_lowest(entries, rank)):
+                return False
+            entries.append({
                 "message": message,
-                "timestamp": datetime.now(),
-                "read": False
+                "timestamp": datetime.now()
             })
+            transition = self.pressure.update(message.recipient, len(entries))
+            self._signal_message(message.recipient)
             
             # Mettre à jour les statistiques
             self.stats["messages_sent"] += 1
@@ -277,7 +300,36 @@ class CollaborationChannel(Channel):
             self._notify_subscribers(message)
             
             self.logger.info(f"Direct message {message.id} sent to {message.recipient}")
-            return True
+        
+        if transition is not None:
+            self._signal_pressure(message.recipient, transition)
+        return True
+    
+    @staticmethod
+    def _evict_lowest(entries: deque, below: int) -> Optional[Message]:
+        """
+        Retire d'une file pleine le message direct le moins prioritaire, le plus récent à priorité égale.
+        
+        Args:
+            entries: Les messages directs non lus du destinataire
+            below: Rang de priorité du message à déposer (voir `PRIORITY_VALUES`)
+            
+        Returns:
+            Le message retiré, ou None si aucun n'est moins prioritaire que `below`
+        """
+        lowest_index = None
+        lowest_rank = below
+        for index, entry in enumerate(entries):
+            rank = PRIORITY_VALUES.get(entry["message"].priority, 2)
+            if rank > below and rank >= lowest_rank:
+                lowest_index, lowest_rank = index, rank
+        
+        if lowest_index is None:
+            return None
+        
+        evicted = entries[lowest_index]["message"]
+        del entries[lowest_index]
+        return evicted
     
     def receive_message(self, recipient_id: str, timeout: Optional[float] = None) -> Optional[Message]:
         """
@@ -294,19 +346,29 @@ class CollaborationChannel(Channel):
         # Une implémentation complète utiliserait des files d'attente avec blocage
         
         with self.lock:
-            # Vérifier s'il y a des messages directs non lus
-            if recipient_id in self.direct_messages and self.direct_messages[recipient_id]:
-                for i, entry in enumerate(self.direct_messages[recipient_id]):
-                    if not entry["read"]:
-                        # Marquer le message comme lu
-                        self.direct_messages[recipient_id][i]["read"] = True
-                        
-                        # Mettre à jour les statistiques
-                        self.stats["messages_received"] += 1
-                        
-                        self.logger.info(f"Direct message {entry['message'].id} received by {recipient_id}")
-                        return entry["message"]
+            # Retirer le plus ancien message direct non lu
+            entries = self.direct_messages.get(recipient_id)
+            if entries:
+                entry = entries.popleft()
+                transition = self.pressure.update(recipient_id, len(entries))
+                if self.pressure.bounded:
+                    self.space_available.notify_all()
+                
+                # Mettre à jour les statistiques
+                self.stats["messages_received"] += 1
+                
+                self.logger.info(f"Direct message {entry['message'].id} received by {recipient_id}")
+                direct_message = entry["message"]
+            else:
+                direct_message = None
+                transition = None
             
+        if direct_message is not None:
+            if transition is not None:
+                self._signal_pressure(recipient_id, transition)
+            return direct_message
+        
+        with self.lock:
             # Vérifier s'il y a des messages de groupe non lus
             for group_id, group in self.groups.items():
                 if recipient_id in group.members:
@@ -384,10 +446,8 @@ class CollaborationChannel(Channel):
         
         with self.lock:
             # Récupérer les messages directs non lus
-            if recipient_id in self.direct_messages:
-                for entry in self.direct_messages[recipient_id]:
-                    if not entry["read"]:
-                        messages.append(entry["message"])
+            for entry in self.direct_messages.get(recipient_id, ()):
+                messages.append(entry["message"])
             
             # Récupérer les messages de groupe
             for group_id, group in self.groups.items():
@@ -411,12 +471,18 @@ class CollaborationChannel(Channel):
             Un dictionnaire d'informations sur le canal
         """
         with self.lock:
+            queue_sizes = {
+                recipient: len(entries)
+                for recipient, entries in self.direct_messages.items()
+            }
             return {
                 "id": self.id,
                 "type": self.type.value,
                 "stats": self.stats,
                 "group_count": len(self.groups),
-                "subscriber_count": len(self.subscribers)
+                "subscriber_count": len(self.subscribers),
+                "queue_sizes": queue_sizes,
+                "backpressure": self.pressure.get_gauges(queue_sizes)
             }
     
     def _notify_subscribers(self, message: Message) -> None:
@@ -11,13 +11,16 @@ import threading
 import logging
 import json
 import gzip
-import base64
-from typing import Dict, Any, Optional, List, Callable, Set, Tuple
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Callable, Set, Tuple, Union
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
 
-from .channel_interface import Channel, ChannelType, ChannelException
+from .channel_interface import Channel, ChannelType, ChannelException, ChannelFullException
 from .message import Message, MessageType, MessagePriority, AgentLevel
+from .message_queue import PriorityMessageQueue
+from .backpressure import QueuePressure
+from .data_store_backend import DataStoreBackend, MemoryDataStoreBackend, SegmentFileDataStoreBackend
 
 from argumentation_analysis.paths import DATA_DIR
 
@@ -29,25 +32,66 @@ class DataStore:
     
     Cette classe gère le stockage et la récupération des données volumineuses,
     avec support pour la compression, le versionnement et le streaming.
+    
+    Les données sont sérialisées en JSON puis stockées sous forme d'octets bruts
+    (compressés en gzip au-delà de `compression_threshold`) dans un backend
+    interchangeable. Options de configuration :
+    - backend: "memory" (par défaut) ou "segment" pour tout stocker sur disque
+    - compression_threshold: taille à partir de laquelle compresser (1024 octets)
+    - max_versions: nombre de versions conservées par élément (illimité par défaut)
+    - max_bytes: budget d'octets du backend principal (illimité par défaut) ;
+      au-delà, les éléments les moins récemment utilisés sont évincés, sauf
+      les éléments épinglés (référencés par un message non encore livré) qui
+      ne peuvent qu'être déplacés sur disque
+    - spill_to_disk: déplacer les éléments évincés vers un fichier segment au
+      lieu de les supprimer
+    - spill_directory: répertoire des fichiers segments (DATA_DIR/data_store)
     """
     
-    def __init__(self, store_id: str, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, store_id: str, config: Optional[Dict[str, Any]] = None,
+                 backend: Optional[DataStoreBackend] = None):
         """
         Initialise un nouveau stockage de données.
         
         Args:
             store_id: Identifiant unique du stockage
             config: Configuration du stockage (optionnel)
+            backend: Backend de stockage principal (optionnel, déduit de la configuration sinon)
         """
         self.id = store_id
         self.config = config or {}
-        self.data_items = {}  # Dictionnaire des éléments de données par ID
+        self.data_items = {}  # Descripteurs des éléments de données par clé "id:version"
         self.versions = defaultdict(list)  # Historique des versions par ID de données
         self.lock = threading.RLock()
         self.logger = logging.getLogger(f"DataStore.{store_id}")
+        
+        self.compression_threshold = self.config.get("compression_threshold", 1024)
+        self.max_versions = self.config.get("max_versions")
+        self.max_bytes = self.config.get("max_bytes")
+        self.spill_to_disk = self.config.get("spill_to_disk", False)
+        self.spill_directory = Path(self.config.get("spill_directory", DATA_DIR / "data_store"))
+        
+        if backend is None:
+            if self.config.get("backend") == "segment":
+                backend = SegmentFileDataStoreBackend(self.spill_directory, store_id)
+            else:
+                backend = MemoryDataStoreBackend()
+        self.backend = backend
+        self.spill_backend: Optional[DataStoreBackend] = None
+        
+        # Ordre d'utilisation des éléments du backend principal (pour l'éviction LRU)
+        self._lru = OrderedDict()
+        
+        # Nombre de références non livrées par clé "id:version" (éléments non évinçables)
+        self._pins = defaultdict(int)
+        
+        self.stats = {
+            "evicted_items": 0,
+            "spilled_items": 0
+        }
     
     def store_data(self, data_id: str, data: Any, metadata: Optional[Dict[str, Any]] = None,
-                 compress: bool = True) -> str:
+                 compress: bool = True, pin: bool = False) -> str:
         """
         Stocke un élément de données.
         
@@ -56,43 +100,51 @@ class DataStore:
             data: Les données à stocker
             metadata: Métadonnées associées aux données (optionnel)
             compress: Indique si les données doivent être compressées (par défaut: True)
+            pin: Épingler l'élément dès son stockage (voir `pin`), avant toute éviction
             
         Returns:
             L'identifiant de version de l'élément de données
         """
         version_id = f"v-{uuid.uuid4().hex[:8]}"
         
+        # Sérialiser et compresser hors verrou
+        serialized_data = self._serialize_data(data)
+        
+        if compress and len(serialized_data) > self.compression_threshold:
+            payload = gzip.compress(serialized_data)
+            is_compressed = True
+        else:
+            payload = serialized_data
+            is_compressed = False
+        
         with self.lock:
-            # Sérialiser les données
-            serialized_data = self._serialize_data(data)
-            
-            # Compresser les données si nécessaire
-            if compress and len(serialized_data) > 1024:  # Seuil de compression
-                compressed_data = gzip.compress(serialized_data.encode('utf-8'))
-                data_content = base64.b64encode(compressed_data).decode('utf-8')
-                is_compressed = True
-            else:
-                data_content = serialized_data
-                is_compressed = False
+            item_key = f"{data_id}:{version_id}"
             
-            # Créer l'élément de données
+            # Créer le descripteur de l'élément de données
             data_item = {
                 "id": data_id,
                 "version_id": version_id,
-                "content": data_content,
                 "metadata": metadata or {},
                 "is_compressed": is_compressed,
                 "size": len(serialized_data),
-                "compressed_size": len(data_content) if is_compressed else None,
+                "compressed_size": len(payload) if is_compressed else None,
+                "location": "memory" if isinstance(self.backend, MemoryDataStoreBackend) else "disk",
                 "created_at": datetime.now().isoformat()
             }
             
-            # Stocker l'élément de données
-            self.data_items[f"{data_id}:{version_id}"] = data_item
+            # Stocker les octets bruts dans le backend principal
+            self.backend.write(item_key, payload)
+            self.data_items[item_key] = data_item
+            self._lru[item_key] = None
+            if pin:
+                self._pins[item_key] += 1
             
             # Ajouter la version à l'historique
             self.versions[data_id].append(version_id)
             
+            self._apply_retention_policy(data_id)
+            self._enforce_byte_budget(item_key)
+            
             self.logger.info(f"Data item {data_id} stored with version {version_id}")
             return version_id
     
@@ -107,6 +159,53 @@ class DataStore:
         Returns:
             Un tuple (données, métadonnées)
             
+        Raises:
+            KeyError: Si l'élément de données n'existe pas
+        """
+        payload, data_item = self._read_payload(data_id, version_id)
+        
+        # Décompresser les données si nécessaire
+        if data_item["is_compressed"]:
+            payload = gzip.decompress(payload)
+        
+        # Désérialiser les données
+        data = self._deserialize_data(payload)
+        
+        self.logger.info(f"Data item {data_id} with version {data_item['version_id']} retrieved")
+        return data, data_item["metadata"]
+    
+    def get_raw_data(self, data_id: str, version_id: Optional[str] = None) -> Tuple[memoryview, Dict[str, Any]]:
+        """
+        Récupère les octets stockés d'un élément de données sans les décoder.
+        
+        Pour un élément stocké sur disque, la vue porte directement sur la
+        projection mmap du fichier segment, sans copie. Les octets sont
+        compressés si `is_compressed` est vrai dans les informations retournées.
+        
+        Args:
+            data_id: Identifiant de l'élément de données
+            version_id: Identifiant de version (None pour la dernière version)
+            
+        Returns:
+            Un tuple (vue sur les octets stockés, informations sur l'élément)
+            
+        Raises:
+            KeyError: Si l'élément de données n'existe pas
+        """
+        payload, data_item = self._read_payload(data_id, version_id)
+        return payload, dict(data_item)
+    
+    def _read_payload(self, data_id: str, version_id: Optional[str]) -> Tuple[memoryview, Dict[str, Any]]:
+        """
+        Lit les octets stockés d'un élément de données.
+        
+        Args:
+            data_id: Identifiant de l'élément de données
+            version_id: Identifiant de version (None pour la dernière version)
+            
+        Returns:
+            Un tuple (vue sur les octets stockés, descripteur de l'élément)
+            
         Raises:
             KeyError: Si l'élément de données n'existe pas
         """
@@ -125,19 +224,11 @@ class DataStore:
             
             data_item = self.data_items[item_key]
             
-            # Décompresser les données si nécessaire
-            if data_item["is_compressed"]:
-                compressed_data = base64.b64decode(data_item["content"])
-                decompressed_data = gzip.decompress(compressed_data).decode('utf-8')
-                data_content = decompressed_data
-            else:
-                data_content = data_item["content"]
-            
-            # Désérialiser les données
-            data = self._deserialize_data(data_content)
+            if item_key in self._lru:
+                self._lru.move_to_end(item_key)
+                return self.backend.read(item_key), data_item
             
-            self.logger.info(f"Data item {data_id} with version {version_id} retrieved")
-            return data, data_item["metadata"]
+            return self.spill_backend.read(item_key), data_item
     
     def delete_data(self, data_id: str, version_id: Optional[str] = None) -> bool:
         """
@@ -158,9 +249,7 @@ class DataStore:
             if version_id is None:
                 # Supprimer toutes les versions
                 for v_id in self.versions[data_id]:
-                    item_key = f"{data_id}:{v_id}"
-                    if item_key in self.data_items:
-                        del self.data_items[item_key]
+                    self._remove_item(f"{data_id}:{v_id}")
                 
                 del self.versions[data_id]
                 self.logger.info(f"All versions of data item {data_id} deleted")
@@ -172,7 +261,7 @@ class DataStore:
                     self.logger.warning(f"Data item {data_id} with version {version_id} not found")
                     return False
                 
-                del self.data_items[item_key]
+                self._remove_item(item_key)
                 self.versions[data_id].remove(version_id)
                 
                 if not self.versions[data_id]:
@@ -181,6 +270,43 @@ class DataStore:
                 self.logger.info(f"Data item {data_id} with version {version_id} deleted")
                 return True
     
+    def pin(self, data_id: str, version_id: str) -> bool:
+        """
+        Ajoute une référence à un élément : tant qu'il est référencé, il n'est
+        pas évincé pour respecter `max_bytes` (il peut être déplacé sur disque).
+        
+        Args:
+            data_id: Identifiant de l'élément de données
+            version_id: Identifiant de version
+            
+        Returns:
+            True si l'élément existe, False sinon
+        """
+        with self.lock:
+            item_key = f"{data_id}:{version_id}"
+            if item_key not in self.data_items:
+                return False
+            self._pins[item_key] += 1
+            return True
+    
+    def release(self, data_id: str, version_id: str) -> None:
+        """
+        Retire une référence ajoutée par `pin` ; le budget d'octets est
+        appliqué à nouveau lorsque l'élément n'est plus référencé.
+        
+        Args:
+            data_id: Identifiant de l'élément de données
+            version_id: Identifiant de version
+        """
+        with self.lock:
+            item_key = f"{data_id}:{version_id}"
+            if item_key not in self._pins:
+                return
+            self._pins[item_key] -= 1
+            if self._pins[item_key] <= 0:
+                del self._pins[item_key]
+                self._enforce_byte_budget(None)
+    
     def get_versions(self, data_id: str) -> List[str]:
         """
         Récupère la liste des versions d'un élément de données.
@@ -218,16 +344,113 @@ class DataStore:
             if item_key not in self.data_items:
                 return None
             
-            data_item = self.data_items[item_key].copy()
-            
-            # Supprimer le contenu pour alléger l'information
-            data_item.pop("content", None)
-            
-            return data_item
+            return self.data_items[item_key].copy()
+    
+    def get_store_info(self) -> Dict[str, Any]:
+        """
+        Récupère des informations sur l'occupation du stockage.
+        
+        Returns:
+            Un dictionnaire d'informations sur le stockage
+        """
+        with self.lock:
+            return {
+                "id": self.id,
+                "item_count": len(self.data_items),
+                "backend_bytes": self.backend.get_size(),
+                "spilled_bytes": self.spill_backend.get_size() if self.spill_backend else 0,
+                "max_bytes": self.max_bytes,
+                "max_versions": self.max_versions,
+                "pinned_items": len(self._pins),
+                "stats": dict(self.stats)
+            }
+    
+    def close(self) -> None:
+        """Libère les ressources des backends (fichiers segments notamment)."""
+        with self.lock:
+            self.backend.close()
+            if self.spill_backend is not None:
+                self.spill_backend.close()
+    
+    def _remove_item(self, item_key: str) -> None:
+        """
+        Supprime le descripteur et les octets d'un élément, où qu'ils soient stockés.
+        
+        Args:
+            item_key: Clé "id:version" de l'élément
+        """
+        self.data_items.pop(item_key, None)
+        self._pins.pop(item_key, None)
+        
+        if item_key in self._lru:
+            del self._lru[item_key]
+            self.backend.delete(item_key)
+        elif self.spill_backend is not None:
+            self.spill_backend.delete(item_key)
+    
+    def _apply_retention_policy(self, data_id: str) -> None:
+        """
+        Supprime les versions les plus anciennes au-delà de `max_versions`.
+        
+        Args:
+            data_id: Identifiant de l'élément de données
+        """
+        if self.max_versions is None:
+            return
+        
+        versions = self.versions[data_id]
+        while len(versions) > max(1, self.max_versions):
+            old_version = versions.pop(0)
+            self._remove_item(f"{data_id}:{old_version}")
+            self.logger.info(f"Version {old_version} of data item {data_id} dropped by retention policy")
+    
+    def _enforce_byte_budget(self, protected_key: str) -> None:
+        """
+        Évince les éléments les moins récemment utilisés tant que le backend
+        principal dépasse `max_bytes`.
+        
+        Sans déplacement sur disque, les éléments épinglés ne sont pas évincés :
+        le budget est alors dépassé jusqu'à leur libération.
+        
+        Args:
+            protected_key: Clé de l'élément qui vient d'être stocké (jamais évincé)
+        """
+        if self.max_bytes is None:
+            return
+        
+        while self.backend.get_size() > self.max_bytes:
+            victim = next((key for key in self._lru
+                           if key != protected_key and (self.spill_to_disk or key not in self._pins)), None)
+            if victim is None:
+                if self._pins:
+                    self.logger.warning(
+                        f"Byte budget exceeded ({self.backend.get_size()} > {self.max_bytes}): "
+                        f"{len(self._pins)} items are still referenced by undelivered messages"
+                    )
+                break
+            
+            if self.spill_to_disk:
+                if self.spill_backend is None:
+                    self.spill_backend = SegmentFileDataStoreBackend(self.spill_directory, f"{self.id}-spill")
+                
+                self.spill_backend.write(victim, self.backend.read(victim).tobytes())
+                self.backend.delete(victim)
+                del self._lru[victim]
+                self.data_items[victim]["location"] = "disk"
+                self.stats["spilled_items"] += 1
+                self.logger.info(f"Data item {victim} spilled to {self.spill_backend.path}")
+            else:
+                data_id, version_id = victim.rsplit(":", 1)
+                self._remove_item(victim)
+                self.versions[data_id].remove(version_id)
+                if not self.versions[data_id]:
+                    del self.versions[data_id]
+                self.stats["evicted_items"] += 1
+                self.logger.warning(f"Data item {victim} evicted to respect the byte budget")
     
-    def _serialize_data(self, data: Any) -> str:
+    def _serialize_data(self, data: Any) -> bytes:
         """
-        Sérialise des données en chaîne JSON.
+        Sérialise des données en JSON encodé en UTF-8.
         
         Args:
             data: Les données à sérialiser
@@ -235,11 +458,11 @@ class DataStore:
         Returns:
             Les données sérialisées
         """
-        return json.dumps(data)
+        return json.dumps(data).encode("utf-8")
     
-    def _deserialize_data(self, serialized_data: str) -> Any:
+    def _deserialize_data(self, serialized_data: Union[bytes, memoryview]) -> Any:
         """
-        Désérialise des données JSON.
+        Désérialise des données JSON encodées en UTF-8.
         
         Args:
             serialized_data: Les données sérialisées
@@ -247,7 +470,7 @@ class DataStore:
         Returns:
             Les données désérialisées
         """
-        return json.loads(serialized_data)
+        return json.loads(str(serialized_data, "utf-8"))
 
 
 class DataChannel(Channel):
@@ -258,6 +481,8 @@ class DataChannel(Channel):
     entre agents, avec support pour la compression, le streaming et le versionnement.
     """
     
+    supports_notifications = True
+    
     def __init__(self, channel_id: str, config: Optional[Dict[str, Any]] = None):
         """
         Initialise un nouveau canal de données.
@@ -271,8 +496,13 @@ class DataChannel(Channel):
         # Stockage de données
         self.data_store = DataStore(f"{channel_id}-store", config)
         
-        # Files d'attente de messages par destinataire
-        self.message_queues = defaultdict(list)
+        # Files de priorité des messages non lus par destinataire
+        self.message_queues = defaultdict(PriorityMessageQueue)
+        
+        # Historique borné des messages lus par destinataire
+        self.config = config or {}  # S'assurer que config n'est jamais None
+        self.history_size = self.config.get("history_size", 100)
+        self.message_history = defaultdict(lambda: deque(maxlen=self.history_size))
         
         # Verrou pour les opérations concurrentes
         self.lock = threading.RLock()
@@ -281,6 +511,10 @@ class DataChannel(Channel):
         self.logger = logging.getLogger(f"DataChannel.{channel_id}")
         self.logger.setLevel(logging.INFO)
         
+        # Capacité des files par destinataire et condition signalée lorsqu'une place se libère
+        self.pressure = QueuePressure(self.config, self.logger)
+        self.space_available = threading.Condition(self.lock)
+        
         # Statistiques
         self.stats = {
             "messages_sent": 0,
@@ -292,7 +526,6 @@ class DataChannel(Channel):
         }
         
         # Configuration
-        self.config = config or {}  # S'assurer que config n'est jamais None
         self.compression_threshold = self.config.get("compression_threshold", 1024)
         self.max_inline_data_size = self.config.get("max_inline_data_size", 10240)
     
@@ -304,7 +537,11 @@ class DataChannel(Channel):
             message: Le message à envoyer
             
         Returns:
-            True si le message a été envoyé avec succès, False sinon
+            True si le message a été envoyé avec succès, False sinon (y compris
+            lorsqu'il est abandonné par la politique "drop_lowest_priority")
+            
+        Raises:
+            ChannelFullException: Si la file du destinataire est pleine (politiques "reject" et "block")
         """
         try:
             # Vérifier que le message a un destinataire
@@ -326,7 +563,9 @@ class DataChannel(Channel):
                         "recipient": message.recipient,
                         "timestamp": message.timestamp.isoformat()
                     },
-                    compress=True
+                    compress=True,
+                    # Épinglé jusqu'à la livraison : l'éviction ne doit pas laisser de référence pendante
+                    pin=True
                 )
                 
                 # Remplacer les données par une référence
@@ -346,25 +585,70 @@ class DataChannel(Channel):
             
             # Ajouter le message à la file d'attente du destinataire
             with self.lock:
-                self.message_queues[message.recipient].append({
-                    "message": message,
-                    "timestamp": datetime.now(),
-                    "read": False
-                })
+                message_queue = self.message_queues[message.recipient]
+                try:
+                    admitted = self.pressure.admit(
+                        message, message_queue.__len__, self.space_available,
+                        lambda rank: self._evict_lowest(message_queue, rank)
+                    )
+                except ChannelFullException:
+                    self._discard_stored_data(message)
+                    raise
+                if not admitted:
+                    self._discard_stored_data(message)
+                    return False
+                
+                message_queue.put(message)
+                transition = self.pressure.update(message.recipient, len(message_queue))
                 
                 # Mettre à jour les statistiques
                 self.stats["messages_sent"] += 1
             
+            self._signal_message(message.recipient)
+            if transition is not None:
+                self._signal_pressure(message.recipient, transition)
+            
             # Notifier les abonnés
             self._notify_subscribers(message)
             
             self.logger.info(f"Message {message.id} sent to {message.recipient}")
             return True
             
+        except ChannelFullException:
+            raise
         except Exception as e:
             self.logger.error(f"Error sending message: {str(e)}")
             return False
     
+    def _evict_lowest(self, message_queue: PriorityMessageQueue, below: int) -> Optional[Message]:
+        """
+        Retire d'une file pleine un message moins prioritaire et supprime ses données stockées.
+        
+        Doit être appelé avec le verrou du canal.
+        
+        Args:
+            message_queue: La file du destinataire
+            below: Rang de priorité du message à déposer
+            
+        Returns:
+            Le message retiré ou None
+        """
+        evicted = message_queue.pop_lowest(below)
+        if evicted is not None:
+            self._discard_stored_data(evicted)
+        return evicted
+    
+    def _discard_stored_data(self, message: Message) -> None:
+        """
+        Supprime les données stockées séparément pour un message abandonné.
+        
+        Args:
+            message: Le message abandonné
+        """
+        data_reference = message.content.get("data_reference")
+        if data_reference:
+            self.data_store.delete_data(data_reference["data_id"])
+    
     def receive_message(self, recipient_id: str, timeout: Optional[float] = None) -> Optional[Message]:
         """
         Reçoit un message de ce canal pour un destinataire spécifique.
@@ -378,45 +662,54 @@ class DataChannel(Channel):
         """
         try:
             with self.lock:
-                # Vérifier s'il y a des messages non lus
-                if recipient_id in self.message_queues:
-                    for i, entry in enumerate(self.message_queues[recipient_id]):
-                        if not entry["read"]:
-                            # Récupérer le message
-                            message = entry["message"]
-                            
-                            # Vérifier si le message contient une référence à des données
-                            data_reference = message.content.get("data_reference")
-                            if data_reference:
-                                try:
-                                    # Récupérer les données
-                                    data, _ = self.data_store.get_data(
-                                        data_reference["data_id"],
-                                        data_reference.get("version_id")
-                                    )
-                                    
-                                    # Remplacer la référence par les données
-                                    message.content["data"] = data
-                                    message.content.pop("data_reference", None)
-                                    
-                                    # Mettre à jour les statistiques
-                                    self.stats["data_items_retrieved"] += 1
-                                    
-                                    self.logger.info(f"Data for message {message.id} retrieved from storage")
-                                    
-                                except Exception as e:
-                                    self.logger.error(f"Error retrieving data for message {message.id}: {str(e)}")
-                            
-                            # Marquer le message comme lu
-                            self.message_queues[recipient_id][i]["read"] = True
-                            
-                            # Mettre à jour les statistiques
-                            self.stats["messages_received"] += 1
-                            
-                            self.logger.info(f"Message {message.id} received by {recipient_id}")
-                            return message
+                message_queue = self.message_queues.get(recipient_id)
+                if not message_queue:
+                    return None
+                
+                # Récupérer le message le plus prioritaire
+                message = message_queue.pop()
+                
+                # Libérer une place pour les émetteurs en attente
+                transition = self.pressure.update(recipient_id, len(message_queue))
+                if self.pressure.bounded:
+                    self.space_available.notify_all()
+                
+                # Vérifier si le message contient une référence à des données
+                data_reference = message.content.get("data_reference")
+                if data_reference:
+                    try:
+                        # Récupérer les données
+                        data, _ = self.data_store.get_data(
+                            data_reference["data_id"],
+                            data_reference.get("version_id")
+                        )
+                        
+                        # Remplacer la référence par les données
+                        message.content["data"] = data
+                        message.content.pop("data_reference", None)
+                        
+                        # Mettre à jour les statistiques
+                        self.stats["data_items_retrieved"] += 1
+                        
+                        self.logger.info(f"Data for message {message.id} retrieved from storage")
+                        
+                    except Exception as e:
+                        self.logger.error(f"Error retrieving data for message {message.id}: {str(e)}")
+                    finally:
+                        # Le message est livré : ses données peuvent désormais être évincées
+                        self.data_store.release(data_reference["data_id"], data_reference.get("version_id"))
+                
+                # Déplacer le message dans l'historique borné des messages lus
+                self.message_history[recipient_id].append(message)
+                
+                # Mettre à jour les statistiques
+                self.stats["messages_received"] += 1
+                
+                self.logger.info(f"Message {message.id} received by {recipient_id}")
             
-            return None
+            if transition is not None:
+                self._signal_pressure(recipient_id, transition)
+            return message
             
         except Exception as e:
             self.logger.error(f"Error receiving message: {str(e)}")
@@ -482,50 +775,66 @@ class DataChannel(Channel):
         messages = []
         
         with self.lock:
-            # Vérifier s'il y a des messages non lus
-            if recipient_id in self.message_queues:
-                for entry in self.message_queues[recipient_id]:
-                    if not entry["read"]:
-                        message = entry["message"]
+            message_queue = self.message_queues.get(recipient_id)
+            if not message_queue:
+                return []
+            
+            for message in message_queue.peek(max_count):
+                # Vérifier si le message contient une référence à des données
+                data_reference = message.content.get("data_reference")
+                if data_reference:
+                    try:
+                        # Récupérer les données
+                        data, _ = self.data_store.get_data(
+                            data_reference["data_id"],
+                            data_reference.get("version_id")
+                        )
                         
-                        # Vérifier si le message contient une référence à des données
-                        data_reference = message.content.get("data_reference")
-                        if data_reference:
-                            try:
-                                # Récupérer les données
-                                data, _ = self.data_store.get_data(
-                                    data_reference["data_id"],
-                                    data_reference.get("version_id")
-                                )
-                                
-                                # Créer une copie du message avec les données
-                                message_copy = Message(
-                                    message_type=message.type,
-                                    sender=message.sender,
-                                    sender_level=message.sender_level,
-                                    content={**message.content, "data": data, "data_reference": None},
-                                    recipient=message.recipient,
-                                    channel=message.channel,
-                                    priority=message.priority,
-                                    metadata=message.metadata,
-                                    message_id=message.id,
-                                    timestamp=message.timestamp
-                                )
-                                
-                                messages.append(message_copy)
-                                
-                            except Exception as e:
-                                self.logger.error(f"Error retrieving data for message {message.id}: {str(e)}")
-                                messages.append(message)
-                        else:
-                            messages.append(message)
+                        # Créer une copie du message avec les données
+                        message_copy = Message(
+                            message_type=message.type,
+                            sender=message.sender,
+                            sender_level=message.sender_level,
+                            content={**message.content, "data": data, "data_reference": None},
+                            recipient=message.recipient,
+                            channel=message.channel,
+                            priority=message.priority,
+                            metadata=message.metadata,
+                            message_id=message.id,
+                            timestamp=message.timestamp
+                        )
                         
-                        # Limiter le nombre de messages
-                        if max_count is not None and len(messages) >= max_count:
-                            break
+                        messages.append(message_copy)
+                        
+                    except Exception as e:
+                        self.logger.error(f"Error retrieving data for message {message.id}: {str(e)}")
+                        messages.append(message)
+                else:
+                    messages.append(message)
         
         return messages
     
+    def get_message_history(self, recipient_id: str, count: Optional[int] = None) -> List[Message]:
+        """
+        Récupère les derniers messages lus par un destinataire.
+        
+        L'historique est borné par l'option de configuration `history_size`.
+        
+        Args:
+            recipient_id: Identifiant du destinataire
+            count: Nombre maximum de messages à récupérer (None pour tout l'historique)
+            
+        Returns:
+            Liste des messages lus, du plus ancien au plus récent
+        """
+        with self.lock:
+            history = list(self.message_history.get(recipient_id, ()))
+        
+        if count is not None:
+            history = history[-count:] if count > 0 else []
+        
+        return history
+    
     def get_channel_info(self) -> Dict[str, Any]:
         """
         Récupère des informations sur ce canal.
@@ -534,13 +843,21 @@ class DataChannel(Channel):
             Un dictionnaire d'informations sur le canal
         """
         with self.lock:
+            queue_sizes = {
+                recipient: len(message_queue)
+                for recipient, message_queue in self.message_queues.items()
+            }
             return {
                 "id": self.id,
                 "type": self.type.value,
                 "stats": self.stats,
                 "subscriber_count": len(self.subscribers),
+                "queue_sizes": queue_sizes,
+                "backpressure": self.pressure.get_gauges(queue_sizes),
+                "history_size": self.history_size,
                 "compression_threshold": self.compression_threshold,
-                "max_inline_data_size": self.max_inline_data_size
+                "max_inline_data_size": self.max_inline_data_size,
+                "data_store": self.data_store.get_store_info()
             }
     
     def _notify_subscribers(self, message: Message) -> None:
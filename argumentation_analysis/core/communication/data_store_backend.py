@@ -0,0 +1,255 @@
+"""
+Backends de stockage pour le DataStore du canal de données.
+
+Un backend conserve des charges utiles binaires (déjà sérialisées et
+éventuellement compressées) indexées par clé. Deux implémentations sont
+fournies :
+- MemoryDataStoreBackend : charges utiles conservées en mémoire ;
+- SegmentFileDataStoreBackend : charges utiles ajoutées à un fichier segment
+  sur disque et relues via mmap, sans copie.
+"""
+
+import abc
+import logging
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+
+class DataStoreBackend(abc.ABC):
+    """
+    Interface abstraite des backends de stockage du DataStore.
+
+    Les backends ne sont pas thread-safe : le DataStore sérialise leurs accès.
+    """
+
+    @abc.abstractmethod
+    def write(self, key: str, payload: bytes) -> None:
+        """
+        Enregistre une charge utile.
+
+        Args:
+            key: Clé de la charge utile
+            payload: Les octets à stocker
+        """
+        pass
+
+    @abc.abstractmethod
+    def read(self, key: str) -> memoryview:
+        """
+        Lit une charge utile sans la copier.
+
+        Args:
+            key: Clé de la charge utile
+
+        Returns:
+            Une vue mémoire sur les octets stockés
+
+        Raises:
+            KeyError: Si la clé n'existe pas
+        """
+        pass
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> bool:
+        """
+        Supprime une charge utile.
+
+        Args:
+            key: Clé de la charge utile
+
+        Returns:
+            True si la charge utile existait, False sinon
+        """
+        pass
+
+    @abc.abstractmethod
+    def __contains__(self, key: str) -> bool:
+        pass
+
+    @abc.abstractmethod
+    def get_size(self) -> int:
+        """
+        Retourne le nombre d'octets des charges utiles vivantes.
+
+        Returns:
+            La taille totale en octets
+        """
+        pass
+
+    def close(self) -> None:
+        """Libère les ressources du backend."""
+        pass
+
+
+class MemoryDataStoreBackend(DataStoreBackend):
+    """Backend conservant les charges utiles en mémoire."""
+
+    def __init__(self):
+        """Initialise un backend mémoire vide."""
+        self._payloads: Dict[str, bytes] = {}
+        self._size = 0
+
+    def write(self, key: str, payload: bytes) -> None:
+        self.delete(key)
+        self._payloads[key] = bytes(payload)
+        self._size += len(payload)
+
+    def read(self, key: str) -> memoryview:
+        return memoryview(self._payloads[key])
+
+    def delete(self, key: str) -> bool:
+        payload = self._payloads.pop(key, None)
+        if payload is None:
+            return False
+        self._size -= len(payload)
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._payloads
+
+    def get_size(self) -> int:
+        return self._size
+
+
+class SegmentFileDataStoreBackend(DataStoreBackend):
+    """
+    Backend ajoutant les charges utiles à un fichier segment sur disque.
+
+    Les écritures sont des ajouts en fin de fichier et les lectures des vues
+    sur une projection mmap du segment. Les suppressions ne libèrent l'espace
+    qu'au compactage, déclenché lorsque les octets morts dépassent
+    `compaction_ratio` de la taille du segment. Le compactage écrit un nouveau
+    segment au lieu de réécrire l'actuel, de sorte que les vues déjà rendues
+    restent valides.
+    """
+
+    def __init__(self, directory: Union[str, Path], name: str,
+                 compaction_ratio: float = 0.5, min_compaction_size: int = 1024 * 1024):
+        """
+        Initialise un backend sur un nouveau fichier segment.
+
+        Args:
+            directory: Répertoire des fichiers segments
+            name: Nom de base des fichiers segments
+            compaction_ratio: Proportion d'octets morts déclenchant le compactage
+            min_compaction_size: Taille de segment minimale avant tout compactage
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.name = re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+        self.compaction_ratio = compaction_ratio
+        self.min_compaction_size = min_compaction_size
+        self.logger = logging.getLogger(f"SegmentFileDataStoreBackend.{self.name}")
+
+        self._index: Dict[str, Tuple[int, int]] = {}  # clé -> (position, longueur)
+        self._live_size = 0
+        self._generation = 0
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._open_segment()
+
+    @property
+    def path(self) -> Path:
+        """Chemin du fichier segment courant."""
+        return self.directory / f"{self.name}-{self._generation}.seg"
+
+    def _open_segment(self) -> None:
+        """Crée et ouvre un nouveau fichier segment vide."""
+        self._file = open(self.path, "w+b")
+        self._mmap = None
+
+    def _segment_size(self) -> int:
+        """Retourne la taille du segment courant, ce qui inclut les octets morts."""
+        return self._file.seek(0, os.SEEK_END)
+
+    def write(self, key: str, payload: bytes) -> None:
+        self.delete(key)
+
+        offset = self._segment_size()
+        self._file.write(payload)
+        self._file.flush()
+
+        self._index[key] = (offset, len(payload))
+        self._live_size += len(payload)
+
+    def read(self, key: str) -> memoryview:
+        offset, length = self._index[key]
+        if length == 0:
+            return memoryview(b"")
+
+        if self._mmap is None or len(self._mmap) < offset + length:
+            # Le segment a grandi : projeter à nouveau. L'ancienne projection
+            # reste vivante tant que des vues la référencent.
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return memoryview(self._mmap)[offset:offset + length]
+
+    def delete(self, key: str) -> bool:
+        entry = self._index.pop(key, None)
+        if entry is None:
+            return False
+
+        self._live_size -= entry[1]
+        self._maybe_compact()
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def get_size(self) -> int:
+        return self._live_size
+
+    def get_file_size(self) -> int:
+        """
+        Retourne la taille du fichier segment courant.
+
+        Returns:
+            La taille en octets, octets morts compris
+        """
+        return self._segment_size()
+
+    def _maybe_compact(self) -> None:
+        """Compacte le segment si la proportion d'octets morts est trop élevée."""
+        segment_size = self._segment_size()
+        if segment_size < self.min_compaction_size:
+            return
+        if segment_size - self._live_size < segment_size * self.compaction_ratio:
+            return
+        self.compact()
+
+    def compact(self) -> None:
+        """Recopie les charges utiles vivantes dans un nouveau segment."""
+        old_file, old_path = self._file, self.path
+        old_index = self._index
+
+        self._generation += 1
+        self._open_segment()
+        self._index = {}
+        self._live_size = 0
+
+        for key, (offset, length) in old_index.items():
+            old_file.seek(offset)
+            self.write(key, old_file.read(length))
+
+        old_file.close()
+        try:
+            os.remove(old_path)
+        except OSError as e:
+            # Sous Windows, un fichier encore projeté ne peut pas être supprimé
+            self.logger.warning(f"Could not remove compacted segment {old_path}: {e}")
+
+        self.logger.info(f"Segment compacted into {self.path} ({self._live_size} live bytes)")
+
+    def close(self) -> None:
+        self._mmap = None
+        if self._file is not None:
+            path = self.path
+            self._file.close()
+            self._file = None
+            try:
+                os.remove(path)
+            except OSError as e:
+                self.logger.warning(f"Could not remove segment {path}: {e}")
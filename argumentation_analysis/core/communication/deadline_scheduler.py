@@ -0,0 +1,350 @@
+"""
+Échéancier de timeouts pour les protocoles du système de communication multi-canal.
+
+Les échéances sont conservées dans des tas binaires indexés sur l'instant
+d'expiration (horloge monotone). Un unique thread attend jusqu'à la prochaine
+échéance au lieu d'inspecter périodiquement toutes les requêtes, et les
+échéances rattachées à une boucle asyncio sont déclenchées par cette boucle
+elle-même via `call_later`, avec la même structure de tas.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+def is_running_in_loop(loop: asyncio.AbstractEventLoop) -> bool:
+    """
+    Indique si l'appel a lieu dans la boucle d'événements donnée.
+
+    Args:
+        loop: La boucle d'événements
+
+    Returns:
+        True si `loop` est la boucle en cours d'exécution dans ce thread
+    """
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+class DeadlineHeap:
+    """
+    Tas d'échéances avec annulation paresseuse.
+
+    Chaque clé possède au plus une échéance active. Les entrées annulées ou
+    replanifiées restent dans le tas et sont ignorées lorsqu'elles remontent
+    au sommet. La classe n'est pas thread-safe.
+    """
+
+    def __init__(self):
+        """Initialise un tas vide."""
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._deadlines: Dict[Hashable, Tuple[float, int]] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def push(self, key: Hashable, deadline: float) -> None:
+        """
+        Planifie (ou replanifie) l'échéance d'une clé.
+
+        Args:
+            key: Clé de l'échéance
+            deadline: Instant d'expiration (horloge `time.monotonic`)
+        """
+        sequence = next(self._counter)
+        self._deadlines[key] = (deadline, sequence)
+        heapq.heappush(self._heap, (deadline, sequence, key))
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        Annule l'échéance d'une clé.
+
+        Args:
+            key: Clé de l'échéance
+
+        Returns:
+            True si une échéance active a été annulée, False sinon
+        """
+        return self._deadlines.pop(key, None) is not None
+
+    def next_deadline(self) -> Optional[float]:
+        """
+        Retourne la prochaine échéance active.
+
+        Returns:
+            L'instant de la prochaine expiration ou None si le tas est vide
+        """
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_expired(self, now: float) -> List[Tuple[Hashable, float]]:
+        """
+        Retire les échéances expirées.
+
+        Args:
+            now: Instant courant (horloge `time.monotonic`)
+
+        Returns:
+            Liste des couples (clé, échéance) expirés, par ordre d'échéance
+        """
+        expired = []
+        while True:
+            self._discard_stale()
+            if not self._heap or self._heap[0][0] > now:
+                return expired
+
+            deadline, _, key = heapq.heappop(self._heap)
+            del self._deadlines[key]
+            expired.append((key, deadline))
+
+    def _discard_stale(self) -> None:
+        """Retire du sommet du tas les entrées annulées ou replanifiées."""
+        heap = self._heap
+        while heap:
+            deadline, sequence, key = heap[0]
+            if self._deadlines.get(key) == (deadline, sequence):
+                return
+            heapq.heappop(heap)
+
+
+class DeadlineScheduler:
+    """
+    Échéancier déclenchant une fonction à l'expiration de chaque échéance.
+
+    Les échéances sans boucle asyncio sont servies par un thread qui dort
+    jusqu'à la prochaine expiration. Les échéances rattachées à une boucle sont
+    servies par un minuteur unique de cette boucle, réarmé sur la prochaine
+    échéance de son tas, si bien qu'aucun thread n'intervient pour elles.
+    """
+
+    def __init__(self, on_expire: Callable[[Hashable], None], name: str = "DeadlineScheduler"):
+        """
+        Initialise l'échéancier.
+
+        Args:
+            on_expire: Fonction appelée avec la clé de chaque échéance expirée
+            name: Nom utilisé pour le thread et le logger
+        """
+        self.on_expire = on_expire
+        self.name = name
+        self.logger = logging.getLogger(name)
+
+        self._condition = threading.Condition()
+        self._thread_heap = DeadlineHeap()
+        self._loop_heaps: Dict[asyncio.AbstractEventLoop, DeadlineHeap] = {}
+        self._loop_timers: Dict[asyncio.AbstractEventLoop, Tuple[float, asyncio.TimerHandle]] = {}
+        self._owners: Dict[Hashable, Optional[asyncio.AbstractEventLoop]] = {}
+
+        self.metrics = {
+            "scheduled": 0,
+            "cancelled": 0,
+            "expired": 0,
+            "lateness_total_ms": 0.0,
+            "lateness_max_ms": 0.0
+        }
+
+        self.running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Démarre le thread de l'échéancier."""
+        with self._condition:
+            if self.running:
+                return
+            self.running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Arrête l'échéancier et abandonne les échéances restantes.
+
+        Args:
+            timeout: Délai maximum d'attente de l'arrêt du thread
+        """
+        with self._condition:
+            self.running = False
+            self._condition.notify_all()
+            timers = list(self._loop_timers.items())
+            self._loop_timers.clear()
+            self._loop_heaps.clear()
+            self._owners.clear()
+            self._thread_heap = DeadlineHeap()
+
+        for loop, (_, handle) in timers:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(handle.cancel)
+
+        if self._thread is not None and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+
+    def schedule(self, key: Hashable, delay: float, loop: Optional[asyncio.AbstractEventLoop] = None) -> float:
+        """
+        Planifie une échéance.
+
+        Args:
+            key: Clé de l'échéance (remplace une éventuelle échéance existante)
+            delay: Délai avant expiration en secondes
+            loop: Boucle asyncio chargée de l'expiration (None pour le thread de l'échéancier)
+
+        Returns:
+            L'instant d'expiration (horloge `time.monotonic`)
+        """
+        deadline = time.monotonic() + delay
+
+        with self._condition:
+            self._cancel_locked(key)
+            self._owners[key] = loop
+            self.metrics["scheduled"] += 1
+
+            if loop is None:
+                previous = self._thread_heap.next_deadline()
+                self._thread_heap.push(key, deadline)
+                if previous is None or deadline < previous:
+                    self._condition.notify()
+                return deadline
+
+            self._loop_heaps.setdefault(loop, DeadlineHeap()).push(key, deadline)
+
+        if is_running_in_loop(loop):
+            self._arm_loop(loop)
+        else:
+            loop.call_soon_threadsafe(self._arm_loop, loop)
+        return deadline
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        Annule une échéance.
+
+        Args:
+            key: Clé de l'échéance
+
+        Returns:
+            True si une échéance active a été annulée, False sinon
+        """
+        with self._condition:
+            cancelled = self._cancel_locked(key)
+            if cancelled:
+                self.metrics["cancelled"] += 1
+            return cancelled
+
+    def pending_count(self) -> int:
+        """
+        Retourne le nombre d'échéances actives.
+
+        Returns:
+            Le nombre d'échéances actives
+        """
+        with self._condition:
+            return len(self._owners)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Récupère les métriques de l'échéancier.
+
+        Le retard (lateness) est l'écart entre l'échéance et l'instant où
+        l'expiration a effectivement été traitée.
+
+        Returns:
+            Un dictionnaire de métriques
+        """
+        with self._condition:
+            metrics = dict(self.metrics)
+            metrics["pending"] = len(self._owners)
+        expired = metrics["expired"]
+        metrics["lateness_mean_ms"] = metrics["lateness_total_ms"] / expired if expired else 0.0
+        return metrics
+
+    def _cancel_locked(self, key: Hashable) -> bool:
+        """Annule une échéance ; doit être appelé avec la condition."""
+        if key not in self._owners:
+            return False
+
+        loop = self._owners.pop(key)
+        if loop is None:
+            return self._thread_heap.cancel(key)
+
+        heap = self._loop_heaps.get(loop)
+        return heap.cancel(key) if heap is not None else False
+
+    def _record_expiry(self, key: Hashable, deadline: float, now: float) -> None:
+        """Met à jour les métriques pour une échéance expirée ; doit être appelé avec la condition."""
+        self._owners.pop(key, None)
+        lateness_ms = max(0.0, now - deadline) * 1000
+        self.metrics["expired"] += 1
+        self.metrics["lateness_total_ms"] += lateness_ms
+        self.metrics["lateness_max_ms"] = max(self.metrics["lateness_max_ms"], lateness_ms)
+
+    def _dispatch(self, expired: List[Tuple[Hashable, float]]) -> None:
+        """Appelle la fonction d'expiration pour chaque clé expirée."""
+        for key, _ in expired:
+            try:
+                self.on_expire(key)
+            except Exception as e:
+                self.logger.error(f"Error handling expiry of {key}: {e}")
+
+    def _run(self) -> None:
+        """Boucle du thread : dort jusqu'à la prochaine échéance puis déclenche les expirations."""
+        while True:
+            with self._condition:
+                if not self.running:
+                    return
+
+                now = time.monotonic()
+                expired = self._thread_heap.pop_expired(now)
+                for key, deadline in expired:
+                    self._record_expiry(key, deadline, now)
+
+                if not expired:
+                    next_deadline = self._thread_heap.next_deadline()
+                    wait_time = None if next_deadline is None else next_deadline - now
+                    self._condition.wait(wait_time)
+                    continue
+
+            self._dispatch(expired)
+
+    def _arm_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Arme le minuteur d'une boucle sur sa prochaine échéance.
+
+        Doit être appelé dans le thread de la boucle.
+        """
+        with self._condition:
+            heap = self._loop_heaps.get(loop)
+            next_deadline = heap.next_deadline() if heap is not None else None
+            current = self._loop_timers.get(loop)
+
+            if current is not None:
+                if next_deadline is not None and current[0] <= next_deadline:
+                    return
+                current[1].cancel()
+                del self._loop_timers[loop]
+
+            if next_deadline is None:
+                if heap is not None and not len(heap):
+                    del self._loop_heaps[loop]
+                return
+
+            handle = loop.call_later(max(0.0, next_deadline - time.monotonic()), self._fire_loop, loop)
+            self._loop_timers[loop] = (next_deadline, handle)
+
+    def _fire_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Déclenche les échéances expirées d'une boucle puis réarme son minuteur."""
+        with self._condition:
+            self._loop_timers.pop(loop, None)
+            heap = self._loop_heaps.get(loop)
+            now = time.monotonic()
+            expired = heap.pop_expired(now) if heap is not None else []
+            for key, deadline in expired:
+                self._record_expiry(key, deadline, now)
+
+        self._dispatch(expired)
+        self._arm_loop(loop)
@@ -8,13 +8,14 @@ les communications verticales et suit un modèle de communication structuré.
 
 import uuid
 import threading
-import queue
 import logging
 from typing import Dict, Any, Optional, List, Callable, Set
 from datetime import datetime
 
-from .channel_interface import Channel, ChannelType, ChannelException, ChannelTimeoutException
-from .message import Message, MessageType, MessagePriority, AgentLevel
+from .channel_interface import Channel, ChannelType, ChannelException, ChannelFullException, ChannelTimeoutException
+from .message import Message, MessageType, AgentLevel
+from .message_queue import PriorityMessageQueue
+from .backpressure import QueuePressure
 
 
 class HierarchicalChannel(Channel):
@@ -26,26 +27,36 @@ class HierarchicalChannel(Channel):
     ordonnancement des messages.
     """
     
+    supports_notifications = True
+    
     def __init__(self, channel_id: str, config: Optional[Dict[str, Any]] = None):
         """
         Initialise un nouveau canal hiérarchique.
         
         Args:
             channel_id: Identifiant unique du canal
-            config: Configuration spécifique au canal (optionnel)
+            config: Configuration spécifique au canal (optionnel), dont les
+                limites de files décrites par `QueuePressure`
         """
         super().__init__(channel_id, ChannelType.HIERARCHICAL, config)
         
-        # Files d'attente de messages par destinataire
-        self.message_queues = {}
+        # Files de priorité des messages par destinataire
+        self.message_queues: Dict[str, PriorityMessageQueue] = {}
         
         # Verrou pour les opérations concurrentes
         self.lock = threading.RLock()
         
+        # Conditions d'attente par destinataire, adossées au verrou du canal
+        self.queue_conditions: Dict[str, threading.Condition] = {}
+        
         # Configuration du logger
         self.logger = logging.getLogger(f"HierarchicalChannel.{channel_id}")
         self.logger.setLevel(logging.INFO)
         
+        # Capacité des files par destinataire et condition signalée lorsqu'une place se libère
+        self.pressure = QueuePressure(self.config, self.logger)
+        self.space_available = threading.Condition(self.lock)
+        
         # Statistiques
         self.stats = {
             "messages_sent": 0,
@@ -62,9 +73,30 @@ class HierarchicalChannel(Channel):
                 "normal": 0,
                 "high": 0,
                 "critical": 0
-            }
+            },
+            "peek_requests": 0,
+            "peeked_messages": 0
         }
     
+    def _get_queue(self, recipient_id: str) -> PriorityMessageQueue:
+        """
+        Récupère la file d'un destinataire en la créant si nécessaire.
+        
+        Doit être appelé avec le verrou du canal.
+        
+        Args:
+            recipient_id: Identifiant du destinataire
+            
+        Returns:
+            La file de priorité du destinataire
+        """
+        message_queue = self.message_queues.get(recipient_id)
+        if message_queue is None:
+            message_queue = PriorityMessageQueue()
+            self.message_queues[recipient_id] = message_queue
+            self.queue_conditions[recipient_id] = threading.Condition(self.lock)
+        return message_queue
+    
     def send_message(self, message: Message) -> bool:
         """
         Envoie un message via ce canal.
@@ -73,7 +105,11 @@ class HierarchicalChannel(Channel):
             message: Le message à envoyer
             
         Returns:
-            True si le message a été envoyé avec succès, False sinon
+            True si le message a été envoyé avec succès, False sinon (y compris
+            lorsqu'il est abandonné par la politique "drop_lowest_priority")
+            
+        Raises:
+            ChannelFullException: Si la file du destinataire est pleine (politiques "reject" et "block")
         """
         try:
             # Vérifier que le message a un destinataire
@@ -89,22 +125,18 @@ class HierarchicalChannel(Channel):
             if message.type not in valid_types:
                 self.logger.warning(f"Message type {message.type} not ideal for hierarchical channel")
             
-            # Créer la file d'attente du destinataire si elle n'existe pas
+            # Ajouter le message à la file du destinataire et réveiller ses récepteurs
             with self.lock:
-                if message.recipient not in self.message_queues:
-                    self.message_queues[message.recipient] = queue.PriorityQueue()
-            
-            # Déterminer la priorité numérique (plus petit = plus prioritaire)
-            priority_values = {
-                MessagePriority.CRITICAL: 0,
-                MessagePriority.HIGH: 1,
-                MessagePriority.NORMAL: 2,
-                MessagePriority.LOW: 3
-            }
-            priority_value = priority_values.get(message.priority, 2)
-            
-            # Ajouter le message à la file d'attente du destinataire
-            self.message_queues[message.recipient].put((priority_value, datetime.now(), message))
+                message_queue = self._get_queue(message.recipient)
+                if not self.pressure.admit(message, message_queue.__len__, self.space_available,
+                                           message_queue.pop_lowest):
+                    return False
+                message_queue.put(message)
+                self.queue_conditions[message.recipient].notify()
+                transition = self.pressure.update(message.recipient, len(message_queue))
+            self._signal_message(message.recipient)
+            if transition is not None:
+                self._signal_pressure(message.recipient, transition)
             
             # Mettre à jour les statistiques
             with self.lock:
@@ -129,6 +161,8 @@ class HierarchicalChannel(Channel):
             self.logger.info(f"Message {message.id} sent to {message.recipient}")
             return True
             
+        except ChannelFullException:
+            raise
         except Exception as e:
             self.logger.error(f"Error sending message: {str(e)}")
             return False
@@ -145,29 +179,34 @@ class HierarchicalChannel(Channel):
             Le message reçu ou None si timeout
         """
         try:
-            # Vérifier si le destinataire a une file d'attente
-            with self.lock:
-                if recipient_id not in self.message_queues:
-                    self.message_queues[recipient_id] = queue.PriorityQueue()
-            
-            q_size = self.message_queues[recipient_id].qsize()
-            self.logger.info(f"Attempting to get message for {recipient_id}. Queue size: {q_size}. Timeout: {timeout}")
+            # Un timeout nul correspond à une simple consultation (attente gérée par le middleware)
+            non_blocking = timeout is not None and timeout <= 0
             
-            # Récupérer un message de la file d'attente
-            try:
-                priority, timestamp, message_obj = self.message_queues[recipient_id].get(block=True, timeout=timeout)
-                self.logger.info(f"Successfully got message {message_obj.id} for {recipient_id} from queue.")
+            with self.lock:
+                message_queue = self._get_queue(recipient_id)
                 
-                # Mettre à jour les statistiques
-                with self.lock:
-                    self.stats["messages_received"] += 1
+                if not non_blocking:
+                    self.logger.info(f"Attempting to get message for {recipient_id}. Queue size: {len(message_queue)}. Timeout: {timeout}")
+                    self.queue_conditions[recipient_id].wait_for(lambda: len(message_queue) > 0, timeout)
                 
-                self.logger.info(f"Message {message_obj.id} received by {recipient_id}")
-                return message_obj
+                message_obj = message_queue.pop()
+                if message_obj is None:
+                    if not non_blocking:
+                        self.logger.warning(f"Queue empty for {recipient_id} after timeout {timeout}s.")
+                    return None
                 
-            except queue.Empty:
-                self.logger.warning(f"Queue empty for {recipient_id} after timeout {timeout}s.")
-                return None
+                # Mettre à jour les statistiques
+                self.stats["messages_received"] += 1
+                
+                # Libérer une place pour les émetteurs en attente
+                transition = self.pressure.update(recipient_id, len(message_queue))
+                if self.pressure.bounded:
+                    self.space_available.notify_all()
+            
+            if transition is not None:
+                self._signal_pressure(recipient_id, transition)
+            self.logger.info(f"Message {message_obj.id} received by {recipient_id}")
+            return message_obj
             
         except Exception as e:
             self.logger.error(f"Error receiving message: {str(e)}")
@@ -230,41 +269,18 @@ class HierarchicalChannel(Channel):
         Returns:
             Liste des messages en attente
         """
-        messages = []
-        
         with self.lock:
-            # Vérifier si le destinataire a une file d'attente
-            if recipient_id not in self.message_queues:
+            message_queue = self.message_queues.get(recipient_id)
+            if message_queue is None:
                 return []
             
-            # Créer une nouvelle file d'attente pour stocker les messages
-            new_queue = queue.PriorityQueue()
-            original_queue = self.message_queues[recipient_id]
-            
-            # Récupérer tous les messages tout en les préservant
-            count = 0
-            items = []
-            
-            # Extraire tous les éléments de la file d'origine
-            while not original_queue.empty():
-                item = original_queue.get()
-                items.append(item)
-            
-            # Traiter les éléments extraits
-            for item in items:
-                # Ajouter le message à la liste de résultats si la limite n'est pas atteinte
-                if max_count is None or count < max_count:
-                    messages.append(item[2])  # Le message est le 3ème élément du tuple
-                    count += 1
-                
-                # Remettre l'élément dans la nouvelle file d'attente
-                new_queue.put(item)
-            
-            # Remplacer la file d'origine par la nouvelle
-            self.message_queues[recipient_id] = new_queue
+            # Consultation du sommet du tas, sans vider ni reconstruire la file
+            messages = message_queue.peek(max_count)
             
-            self.logger.info(f"Retrieved {len(messages)} pending messages for {recipient_id}")
+            self.stats["peek_requests"] += 1
+            self.stats["peeked_messages"] += len(messages)
         
+        self.logger.debug(f"Retrieved {len(messages)} pending messages for {recipient_id}")
         return messages
     
     def get_channel_info(self) -> Dict[str, Any]:
@@ -276,7 +292,7 @@ class HierarchicalChannel(Channel):
         """
         with self.lock:
             queue_sizes = {
-                recipient: queue_obj.qsize()
+                recipient: len(queue_obj)
                 for recipient, queue_obj in self.message_queues.items()
             }
             
@@ -285,7 +301,9 @@ class HierarchicalChannel(Channel):
                 "type": self.type.value,
                 "stats": self.stats,
                 "queue_sizes": queue_sizes,
-                "subscriber_count": len(self.subscribers)
+                "pending_messages": sum(queue_sizes.values()),
+                "subscriber_count": len(self.subscribers),
+                "backpressure": self.pressure.get_gauges(queue_sizes)
             }
     
     def _notify_subscribers(self, message: Message) -> None:
@@ -320,11 +338,13 @@ class HierarchicalChannel(Channel):
             if recipient_id not in self.message_queues:
                 return 0
             
-            # Compter le nombre de messages
-            count = self.message_queues[recipient_id].qsize()
-            
-            # Créer une nouvelle file vide
-            self.message_queues[recipient_id] = queue.PriorityQueue()
+            count = self.message_queues[recipient_id].clear()
+            transition = self.pressure.update(recipient_id, 0)
+            if self.pressure.bounded:
+                self.space_available.notify_all()
             
             self.logger.info(f"Cleared {count} messages from queue of {recipient_id}")
-            return count
\ No newline at end of file
+        
+        if transition is not None:
+            self._signal_pressure(recipient_id, transition)
+        return count
\ No newline at end of file
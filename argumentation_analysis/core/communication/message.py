@@ -5,9 +5,10 @@ Ce module définit le format commun pour tous les messages, ainsi que les types
 de messages spécifiques et les priorités.
 """
 
-import uuid
 import enum
+import time
 from datetime import datetime
+from random import getrandbits as _random_bits
 from typing import Dict, Any, Optional, List, Union
 import functools
 
@@ -43,14 +44,37 @@ class AgentLevel(enum.Enum):
     SYSTEM = "system"
 
 
+# Tables de correspondance valeur -> membre, plus rapides que l'appel des énumérations
+_MESSAGE_TYPES = {member.value: member for member in MessageType}
+_PRIORITIES = {member.value: member for member in MessagePriority}
+_AGENT_LEVELS = {member.value: member for member in AgentLevel}
+
+# Rang de chaque priorité pour la comparaison des messages
+_PRIORITY_RANK = {
+    MessagePriority.LOW: 0,
+    MessagePriority.NORMAL: 1,
+    MessagePriority.HIGH: 2,
+    MessagePriority.CRITICAL: 3
+}
+
+
 @functools.total_ordering
 class Message:
     """
     Représentation d'un message dans le système de communication multi-canal.
     
     Tous les messages suivent un format commun avec des champs obligatoires et optionnels.
+    
+    La classe utilise `__slots__` ; l'identifiant et l'horodatage générés
+    automatiquement ne sont matérialisés qu'au premier accès, et l'en-tête de
+    `to_dict` est mis en cache tant que les champs du message ne changent pas.
     """
     
+    __slots__ = (
+        "_id", "type", "sender", "sender_level", "recipient", "channel", "priority",
+        "content", "metadata", "_timestamp", "_created", "_dict_cache"
+    )
+    
     def __init__(
         self,
         message_type: MessageType,
@@ -76,10 +100,10 @@ class Message:
             channel: Canal utilisé (peut être déterminé automatiquement)
             priority: Priorité du message (par défaut: NORMAL)
             metadata: Métadonnées additionnelles
-            message_id: Identifiant unique du message (généré automatiquement si None)
-            timestamp: Horodatage de création du message (généré automatiquement si None)
+            message_id: Identifiant unique du message (généré au premier accès si None)
+            timestamp: Horodatage de création du message (instant de création si None)
         """
-        self.id = message_id or f"{message_type.value}-{uuid.uuid4().hex[:8]}"
+        self._id = message_id
         self.type = message_type
         self.sender = sender
         self.sender_level = sender_level
@@ -88,15 +112,34 @@ class Message:
         self.priority = priority
         self.content = content
         self.metadata = metadata or {}
-        self.timestamp = timestamp or datetime.now()
-
-        # Pour la comparaison, mapper les priorités à des valeurs numériques
-        self._priority_map = {
-            MessagePriority.LOW: 0,
-            MessagePriority.NORMAL: 1,
-            MessagePriority.HIGH: 2,
-            MessagePriority.CRITICAL: 3
-        }
+        self._timestamp = timestamp
+        # Instant de création en secondes, converti en datetime au premier accès
+        self._created = time.time() if timestamp is None else None
+        self._dict_cache = None
+    
+    @property
+    def id(self) -> str:
+        """Identifiant unique du message."""
+        if self._id is None:
+            # 32 bits aléatoires, comme le préfixe de uuid4 utilisé auparavant
+            self._id = f"{self.type.value}-{_random_bits(32):08x}"
+        return self._id
+    
+    @id.setter
+    def id(self, value: str) -> None:
+        self._id = value
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Horodatage de création du message."""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self._created)
+        return self._timestamp
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
+        self._created = None
     
     def __eq__(self, other):
         if not isinstance(other, Message):
@@ -105,25 +148,54 @@ class Message:
                 self.timestamp == other.timestamp and
                 self.id == other.id) # Ajouter l'id pour une égalité stricte si nécessaire
 
+    # __eq__ sans __hash__ : les messages restent non hachables
+    __hash__ = None
+
     def __lt__(self, other):
         if not isinstance(other, Message):
             return NotImplemented
         
         # Les priorités plus élevées (valeur numérique plus grande) viennent en premier
-        if self._priority_map[self.priority] != self._priority_map[other.priority]:
-            return self._priority_map[self.priority] > self._priority_map[other.priority]
+        rank = _PRIORITY_RANK[self.priority]
+        other_rank = _PRIORITY_RANK[other.priority]
+        if rank != other_rank:
+            return rank > other_rank
         
         # Si les priorités sont égales, le message le plus ancien (timestamp plus petit) vient en premier
+        if self._created is not None and other._created is not None:
+            return self._created < other._created
         return self.timestamp < other.timestamp
+    
+    def __getstate__(self):
+        return (self.id, self.type, self.sender, self.sender_level, self.recipient, self.channel,
+                self.priority, self.content, self.metadata, self.timestamp)
+    
+    def __setstate__(self, state):
+        (self._id, self.type, self.sender, self.sender_level, self.recipient, self.channel,
+         self.priority, self.content, self.metadata, self._timestamp) = state
+        self._created = None
+        self._dict_cache = None
             
     def to_dict(self) -> Dict[str, Any]:
         """
         Convertit le message en dictionnaire pour la sérialisation.
         
+        Le dictionnaire est mis en cache et partagé entre les appels tant que
+        les champs du message ne sont pas réaffectés : il ne doit pas être
+        modifié par l'appelant. Comme auparavant, `content` et `metadata` y
+        figurent par référence.
+        
         Returns:
             Un dictionnaire représentant le message
         """
-        return {
+        key = (self.id, self.type, self.sender, self.sender_level, self.recipient,
+               self.channel, self.priority, self.timestamp)
+        cache = self._dict_cache
+        if (cache is not None and cache[0] == key and
+                cache[1]["content"] is self.content and cache[1]["metadata"] is self.metadata):
+            return cache[1]
+        
+        data = {
             "id": self.id,
             "type": self.type.value,
             "sender": self.sender,
@@ -135,6 +207,8 @@ class Message:
             "metadata": self.metadata,
             "timestamp": self.timestamp.isoformat()
         }
+        self._dict_cache = (key, data)
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Message':
@@ -148,13 +222,13 @@ class Message:
             Une instance de Message
         """
         return cls(
-            message_type=MessageType(data["type"]),
+            message_type=_MESSAGE_TYPES.get(data["type"]) or MessageType(data["type"]),
             sender=data["sender"],
-            sender_level=AgentLevel(data["sender_level"]),
+            sender_level=_AGENT_LEVELS.get(data["sender_level"]) or AgentLevel(data["sender_level"]),
             content=data["content"],
             recipient=data.get("recipient"),
             channel=data.get("channel"),
-            priority=MessagePriority(data.get("priority", "normal")),
+            priority=_PRIORITIES.get(data.get("priority", "normal")) or MessagePriority(data["priority"]),
             metadata=data.get("metadata", {}),
             message_id=data["id"],
             timestamp=datetime.fromisoformat(data["timestamp"])
@@ -253,6 +327,8 @@ class Message:
 class CommandMessage(Message):
     """Message de commande pour transmettre des directives, des tâches ou des instructions."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         sender: str,
@@ -305,6 +381,8 @@ class CommandMessage(Message):
 class InformationMessage(Message):
     """Message d'information pour partager des informations, des résultats ou des états."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         sender: str,
@@ -346,6 +424,8 @@ class InformationMessage(Message):
 class RequestMessage(Message):
     """Message de requête pour demander des informations ou des actions."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         sender: str,
@@ -400,6 +480,8 @@ class RequestMessage(Message):
 class EventMessage(Message):
     """Message d'événement pour notifier des événements importants dans le système."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         sender: str,
@@ -0,0 +1,282 @@
+"""
+Encodage binaire compact des messages du système de communication multi-canal.
+
+Le format encode la représentation `Message.to_dict` avec une étiquette d'un
+octet par valeur, suivie d'une charge de taille fixe (entiers, flottants) ou
+préfixée par sa longueur (chaînes, octets, listes, dictionnaires). Il est plus
+compact et plus rapide à décoder que JSON et, contrairement à pickle, ne
+peut instancier aucun objet arbitraire à la lecture.
+
+Les valeurs non natives rencontrées dans les messages sont converties comme
+suit : énumérations -> leur valeur, chemins -> chaîne, dates -> ISO 8601,
+tuples et ensembles -> listes.
+"""
+
+import enum
+import os
+import struct
+from datetime import date, datetime
+from typing import Any, Dict, Tuple
+
+from .message import Message
+
+
+# Version du format, placée en tête de chaque message encodé
+CODEC_VERSION = 2
+
+_NONE = 0x00
+_FALSE = 0x01
+_TRUE = 0x02
+_INT = 0x03
+_BIGINT = 0x04
+_FLOAT = 0x05
+_STR = 0x06
+_BYTES = 0x07
+_LIST = 0x08
+_DICT = 0x09
+
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+_LENGTH = struct.Struct("<I")
+_TAGGED_LENGTH = struct.Struct("<BI")
+_TAGGED_INT64 = struct.Struct("<Bq")
+_TAGGED_FLOAT64 = struct.Struct("<Bd")
+
+_ENCODED_NONE = bytes((_NONE,))
+_ENCODED_FALSE = bytes((_FALSE,))
+_ENCODED_TRUE = bytes((_TRUE,))
+
+_ENCODED_VERSION = bytes((CODEC_VERSION,))
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+class CodecError(ValueError):
+    """Exception levée lorsqu'une valeur ne peut pas être encodée ou décodée."""
+    pass
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    Encode une valeur.
+
+    Args:
+        value: La valeur à encoder
+
+    Returns:
+        Les octets encodés
+
+    Raises:
+        CodecError: Si la valeur contient un type non supporté
+    """
+    out = bytearray()
+    _encode(value, out)
+    return bytes(out)
+
+
+def decode_value(data: bytes) -> Any:
+    """
+    Décode une valeur.
+
+    Args:
+        data: Les octets à décoder
+
+    Returns:
+        La valeur décodée
+
+    Raises:
+        CodecError: Si les octets sont tronqués ou invalides
+    """
+    data = bytes(data)
+    try:
+        value, offset = _decode(data, 0)
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise CodecError(f"Invalid encoded value: {e}") from e
+
+    if offset != len(data):
+        raise CodecError(f"Trailing data after encoded value ({len(data) - offset} bytes)")
+    return value
+
+
+def encode_message(message: Message) -> bytes:
+    """
+    Encode un message.
+
+    Les champs d'en-tête sont encodés par position, sans leurs noms, suivis
+    du contenu et des métadonnées.
+
+    Args:
+        message: Le message à encoder
+
+    Returns:
+        Les octets encodés, précédés de la version du format
+    """
+    data = message.to_dict()
+    out = bytearray(_ENCODED_VERSION)
+    _encode([
+        data["id"], data["type"], data["sender"], data["sender_level"], data["recipient"],
+        data["channel"], data["priority"], data["timestamp"], data["content"], data["metadata"]
+    ], out)
+    return bytes(out)
+
+
+def decode_message(data: bytes) -> Message:
+    """
+    Décode un message encodé par `encode_message`.
+
+    Args:
+        data: Les octets à décoder
+
+    Returns:
+        Le message décodé
+
+    Raises:
+        CodecError: Si la version est inconnue ou les octets invalides
+    """
+    version = data[0] if data else None
+    if version != CODEC_VERSION:
+        raise CodecError(f"Unsupported message codec version: {version}")
+
+    fields = decode_value(memoryview(data)[1:])
+    if not isinstance(fields, list) or len(fields) != 10:
+        raise CodecError("Invalid encoded message header")
+
+    try:
+        return Message.from_dict({
+            "id": fields[0], "type": fields[1], "sender": fields[2], "sender_level": fields[3],
+            "recipient": fields[4], "channel": fields[5], "priority": fields[6], "timestamp": fields[7],
+            "content": fields[8], "metadata": fields[9]
+        })
+    except (TypeError, ValueError) as e:
+        raise CodecError(f"Invalid encoded message: {e}") from e
+
+
+def _encode(value: Any, out: bytearray) -> None:
+    """Encode récursivement une valeur à la fin de `out`."""
+    # Types exacts les plus fréquents d'abord ; bool n'est jamais `int` ici
+    cls = type(value)
+    if cls is str:
+        encoded = value.encode("utf-8")
+        out += _TAGGED_LENGTH.pack(_STR, len(encoded))
+        out += encoded
+    elif cls is dict:
+        out += _TAGGED_LENGTH.pack(_DICT, len(value))
+        for key, item in value.items():
+            if type(key) is str:
+                encoded = key.encode("utf-8")
+                out += _TAGGED_LENGTH.pack(_STR, len(encoded))
+                out += encoded
+            else:
+                _encode(key, out)
+            _encode(item, out)
+    elif value is None:
+        out += _ENCODED_NONE
+    elif cls is bool:
+        out += _ENCODED_TRUE if value else _ENCODED_FALSE
+    elif cls is int and _INT64_MIN <= value <= _INT64_MAX:
+        out += _TAGGED_INT64.pack(_INT, value)
+    elif cls is float:
+        out += _TAGGED_FLOAT64.pack(_FLOAT, value)
+    elif cls is list or cls is tuple:
+        out += _TAGGED_LENGTH.pack(_LIST, len(value))
+        for item in value:
+            _encode(item, out)
+    else:
+        _encode_other(value, out)
+
+
+def _encode_other(value: Any, out: bytearray) -> None:
+    """Encode les sous-classes et les types convertis (énumérations, chemins, dates...)."""
+    # bool est une sous-classe de int : le tester en premier
+    if isinstance(value, bool):
+        out += _ENCODED_TRUE if value else _ENCODED_FALSE
+    elif isinstance(value, enum.Enum):
+        _encode(value.value, out)
+    elif isinstance(value, str):
+        _encode(str(value), out)
+    elif isinstance(value, int):
+        if _INT64_MIN <= value <= _INT64_MAX:
+            out += _TAGGED_INT64.pack(_INT, value)
+        else:
+            encoded = str(int(value)).encode("ascii")
+            out += _TAGGED_LENGTH.pack(_BIGINT, len(encoded))
+            out += encoded
+    elif isinstance(value, float):
+        out += _TAGGED_FLOAT64.pack(_FLOAT, value)
+    elif isinstance(value, dict):
+        _encode(dict(value), out)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        _encode(list(value), out)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        # Longueur en octets : len() compte les éléments d'une memoryview de format non octet
+        out += _TAGGED_LENGTH.pack(_BYTES, memoryview(value).nbytes)
+        out += value
+    elif isinstance(value, (datetime, date)):
+        _encode(value.isoformat(), out)
+    elif isinstance(value, os.PathLike):
+        _encode(os.fspath(value), out)
+    else:
+        raise CodecError(f"Cannot encode value of type {type(value).__name__}")
+
+
+def _decode(data: bytes, offset: int) -> Tuple[Any, int]:
+    """Décode récursivement la valeur située à `offset` ; retourne (valeur, position suivante)."""
+    tag = data[offset]
+    offset += 1
+
+    if tag == _STR:
+        end = offset + _LENGTH.size + _LENGTH.unpack_from(data, offset)[0]
+        if end > len(data):
+            raise CodecError("Truncated encoded value")
+        return data[offset + _LENGTH.size:end].decode("utf-8"), end
+
+    if tag == _DICT:
+        count = _LENGTH.unpack_from(data, offset)[0]
+        offset += _LENGTH.size
+        result: Dict[Any, Any] = {}
+        for _ in range(count):
+            if data[offset] == _STR:
+                # Clé chaîne : cas courant décodé sans appel récursif
+                start = offset + 1 + _LENGTH.size
+                offset = start + _LENGTH.unpack_from(data, offset + 1)[0]
+                if offset > len(data):
+                    raise CodecError("Truncated encoded value")
+                key = data[start:offset].decode("utf-8")
+            else:
+                key, offset = _decode(data, offset)
+                if isinstance(key, list):
+                    key = tuple(key)
+            result[key], offset = _decode(data, offset)
+        return result, offset
+
+    if tag == _NONE:
+        return None, offset
+    if tag == _TRUE:
+        return True, offset
+    if tag == _FALSE:
+        return False, offset
+    if tag == _INT:
+        return _INT64.unpack_from(data, offset)[0], offset + _INT64.size
+    if tag == _FLOAT:
+        return _FLOAT64.unpack_from(data, offset)[0], offset + _FLOAT64.size
+
+    if tag == _LIST:
+        count = _LENGTH.unpack_from(data, offset)[0]
+        offset += _LENGTH.size
+        items = []
+        for _ in range(count):
+            item, offset = _decode(data, offset)
+            items.append(item)
+        return items, offset
+
+    if tag == _BYTES or tag == _BIGINT:
+        start = offset + _LENGTH.size
+        end = start + _LENGTH.unpack_from(data, offset)[0]
+        if end > len(data):
+            raise CodecError("Truncated encoded value")
+        if tag == _BYTES:
+            return data[start:end], end
+        return int(data[start:end].decode("ascii")), end
+
+    raise CodecError(f"Unknown value tag 0x{tag:02x}")
@@ -0,0 +1,143 @@
+"""
+File de priorité de messages pour les canaux du système de communication multi-canal.
+
+Ce module fournit une file adossée à un tas binaire (`heapq`) qui reproduit
+l'ordonnancement de `queue.PriorityQueue` utilisé historiquement par les canaux
+(priorité du message, puis ordre de dépôt) tout en permettant de consulter
+les premiers messages sans vider la file.
+"""
+
+import heapq
+import itertools
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from .message import Message, MessagePriority
+
+
+# Priorité numérique des messages (plus petit = plus prioritaire)
+PRIORITY_VALUES = {
+    MessagePriority.CRITICAL: 0,
+    MessagePriority.HIGH: 1,
+    MessagePriority.NORMAL: 2,
+    MessagePriority.LOW: 3
+}
+
+
+class PriorityMessageQueue:
+    """
+    File de priorité de messages non bloquante.
+
+    Les entrées sont des tuples (priorité, numéro de dépôt, horodatage, message) :
+    le numéro de dépôt départage les messages de même priorité dans l'ordre
+    d'arrivée. La classe n'est pas thread-safe, le canal propriétaire doit
+    protéger ses accès par son propre verrou.
+    """
+
+    def __init__(self):
+        """Initialise une file vide."""
+        self._heap: List[Tuple[int, int, datetime, Message]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def put(self, message: Message, enqueued_at: Optional[datetime] = None) -> None:
+        """
+        Ajoute un message à la file.
+
+        Args:
+            message: Le message à ajouter
+            enqueued_at: Horodatage du dépôt (par défaut: maintenant)
+        """
+        entry = (
+            PRIORITY_VALUES.get(message.priority, 2),
+            next(self._counter),
+            enqueued_at or datetime.now(),
+            message
+        )
+        heapq.heappush(self._heap, entry)
+
+    def pop(self) -> Optional[Message]:
+        """
+        Retire et retourne le message le plus prioritaire.
+
+        Returns:
+            Le message le plus prioritaire ou None si la file est vide
+        """
+        if not self._heap:
+            return None
+        return heapq.heappop(self._heap)[3]
+
+    def peek(self, count: Optional[int] = None) -> List[Message]:
+        """
+        Retourne les messages les plus prioritaires sans les retirer de la file.
+
+        Le tas est parcouru en meilleur d'abord depuis la racine : seuls les
+        `count` nœuds retenus et leurs enfants sont examinés, soit un coût en
+        O(count log count) indépendant de la taille de la file.
+
+        Args:
+            count: Nombre maximum de messages à retourner (None pour tous)
+
+        Returns:
+            Liste des messages dans l'ordre où ils seraient reçus
+        """
+        heap = self._heap
+        if count is None or count >= len(heap):
+            return [entry[3] for entry in sorted(heap)]
+
+        messages = []
+        if count <= 0:
+            return messages
+
+        frontier = [(heap[0], 0)]
+        while frontier and len(messages) < count:
+            entry, index = heapq.heappop(frontier)
+            messages.append(entry[3])
+
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+
+        return messages
+
+    def pop_lowest(self, below: Optional[int] = None) -> Optional[Message]:
+        """
+        Retire le message le moins prioritaire, le plus récent à priorité égale.
+
+        Utilisé pour faire de la place dans une file pleine ; le coût est
+        linéaire en la taille de la file.
+
+        Args:
+            below: Si fourni, ne retirer qu'un message de priorité strictement
+                inférieure à ce rang (valeur de `PRIORITY_VALUES`)
+
+        Returns:
+            Le message retiré ou None
+        """
+        heap = self._heap
+        if not heap:
+            return None
+
+        index = max(range(len(heap)), key=lambda i: heap[i][:2])
+        entry = heap[index]
+        if below is not None and entry[0] <= below:
+            return None
+
+        last = heap.pop()
+        if index < len(heap):
+            heap[index] = last
+            heapq.heapify(heap)
+        return entry[3]
+
+    def clear(self) -> int:
+        """
+        Vide la file.
+
+        Returns:
+            Le nombre de messages supprimés
+        """
+        count = len(self._heap)
+        self._heap = []
+        return count
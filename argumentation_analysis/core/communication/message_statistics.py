@@ -0,0 +1,167 @@
+"""
+Statistiques du middleware pour le système de communication multi-canal.
+
+Les compteurs sont tenus par thread (`ThreadLocalCounters`) : chaque thread
+incrémente son propre dictionnaire sans verrou, et les valeurs ne sont
+agrégées qu'à la lecture. Le chemin d'envoi ne prend donc aucun verrou
+partagé pour ses statistiques. Les latences sont réparties dans des
+histogrammes à seaux logarithmiques (voir `latency_stats`), stockés dans les
+mêmes compteurs.
+"""
+
+import itertools
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from argumentation_analysis.core.utils.latency_stats import (
+    ThreadLocalCounters, latency_bucket, summarize_latency
+)
+
+
+class LogSampler:
+    """
+    Échantillonneur déterministe des journaux par message.
+
+    Avec un taux `r`, un message sur `round(1 / r)` est journalisé ; un taux
+    nul désactive la journalisation par message.
+    """
+
+    def __init__(self, rate: float = 1.0):
+        """
+        Initialise l'échantillonneur.
+
+        Args:
+            rate: Proportion des messages à journaliser, entre 0 et 1
+        """
+        self.rate = max(0.0, min(1.0, rate))
+        self._interval = round(1 / self.rate) if self.rate > 0 else 0
+        self._counter = itertools.count()
+
+    def should_log(self) -> bool:
+        """
+        Indique si l'occurrence courante doit être journalisée.
+
+        Returns:
+            True si l'occurrence fait partie de l'échantillon
+        """
+        if self._interval == 1:
+            return True
+        if self._interval == 0:
+            return False
+        return next(self._counter) % self._interval == 0
+
+
+class MessageStatistics:
+    """
+    Statistiques d'envoi et de réception du middleware.
+
+    Les compteurs reprennent la structure historique de `MessageMiddleware.stats`
+    (messages envoyés, reçus, erreurs, répartition par canal, type et priorité)
+    et y ajoutent des histogrammes de latence par canal :
+    - `send` : durée de l'appel à `Channel.send_message` ;
+    - `delivery` : délai entre la création d'un message et sa réception.
+    """
+
+    def __init__(self):
+        """Initialise des statistiques vides."""
+        self.counters = ThreadLocalCounters()
+        self.channels: List[Any] = []
+
+    def register_channel(self, channel_key: Any) -> None:
+        """
+        Déclare un canal pour qu'il figure dans les statistiques même sans trafic.
+
+        Args:
+            channel_key: Identifiant du canal (valeur de son type)
+        """
+        if channel_key not in self.channels:
+            self.channels = self.channels + [channel_key]
+
+    def record_sent(self, channel_key: Any, message_type: str, priority: str, latency_ns: int) -> None:
+        """
+        Enregistre un message envoyé.
+
+        Args:
+            channel_key: Identifiant du canal
+            message_type: Type du message
+            priority: Priorité du message
+            latency_ns: Durée de l'envoi par le canal en nanosecondes
+        """
+        # Chemin chaud : écrire directement dans les compteurs du thread
+        shard = self.counters.shard()
+        shard["messages_sent"] += 1
+        shard[("by_channel", channel_key, "sent")] += 1
+        shard[("by_type", message_type)] += 1
+        shard[("by_priority", priority)] += 1
+        shard[("latency", channel_key, "send", latency_bucket(latency_ns))] += 1
+        shard[("latency_sum", channel_key, "send")] += latency_ns
+
+    def record_received(self, channel_key: Any, delivery_ns: Optional[int] = None) -> None:
+        """
+        Enregistre un message reçu.
+
+        Args:
+            channel_key: Identifiant du canal
+            delivery_ns: Délai de livraison en nanosecondes (optionnel)
+        """
+        shard = self.counters.shard()
+        shard["messages_received"] += 1
+        shard[("by_channel", channel_key, "received")] += 1
+        if delivery_ns is not None:
+            shard[("latency", channel_key, "delivery", latency_bucket(delivery_ns))] += 1
+            shard[("latency_sum", channel_key, "delivery")] += delivery_ns
+
+    def record_error(self, channel_key: Any = None) -> None:
+        """
+        Enregistre une erreur.
+
+        Args:
+            channel_key: Identifiant du canal concerné (optionnel)
+        """
+        if channel_key is None:
+            self.counters.add("errors")
+        else:
+            self.counters.add_many(("errors", ("by_channel", channel_key, "errors")))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Agrège les statistiques.
+
+        Returns:
+            Un dictionnaire de statistiques, dont `latency` donne pour chaque
+            canal et chaque mesure le nombre d'observations, la moyenne, des
+            percentiles approchés (borne supérieure du seau) et l'histogramme
+        """
+        totals = self.counters.snapshot()
+
+        stats = {
+            "messages_sent": totals.get("messages_sent", 0),
+            "messages_received": totals.get("messages_received", 0),
+            "errors": totals.get("errors", 0),
+            "by_channel": {
+                channel_key: {"sent": 0, "received": 0, "errors": 0}
+                for channel_key in self.channels
+            },
+            "by_type": {},
+            "by_priority": {},
+            "latency": {}
+        }
+
+        buckets: Dict[Tuple[Any, str], Dict[int, int]] = defaultdict(dict)
+        for key, value in totals.items():
+            if not isinstance(key, tuple):
+                continue
+            kind = key[0]
+            if kind == "by_channel":
+                stats["by_channel"].setdefault(key[1], {"sent": 0, "received": 0, "errors": 0})[key[2]] = value
+            elif kind in ("by_type", "by_priority"):
+                stats[kind][key[1]] = value
+            elif kind == "latency":
+                buckets[(key[1], key[2])][key[3]] = value
+
+        for (channel_key, measure), histogram in buckets.items():
+            stats["latency"].setdefault(channel_key, {})[measure] = summarize_latency(
+                histogram, totals.get(("latency_sum", channel_key, measure), 0)
+            )
+
+        return stats
@@ -8,12 +8,13 @@ entre les agents à travers différents canaux spécialisés.
 import uuid
 import threading
 import logging
-import asyncio
+import time
 from typing import Dict, Any, Optional, List, Callable, Union, Set
 from datetime import datetime
 
 from .message import Message, MessageType, MessagePriority, AgentLevel
-from .channel_interface import Channel, ChannelType, ChannelException
+from .channel_interface import Channel, ChannelType, ChannelException, ChannelFullException, MessageNotifier
+from .message_statistics import MessageStatistics, LogSampler
 
 
 class MessageMiddleware:
@@ -38,19 +39,27 @@ class MessageMiddleware:
         self.global_handlers = []  # Gestionnaires globaux pour tous les messages
         self.lock = threading.RLock()  # Verrou pour les opérations concurrentes
         
+        # Notifications de dépôt de messages par destinataire (réveil des récepteurs bloqués)
+        self.notifier = MessageNotifier()
+        # Intervalle de consultation pour les canaux qui ne signalent pas leurs dépôts
+        self.poll_interval = self.config.get("poll_interval", 0.01)
+        
         # Configuration du logger
         self.logger = logging.getLogger("MessageMiddleware")
         self.logger.setLevel(logging.INFO)
         
-        # Statistiques
-        self.stats = {
-            "messages_sent": 0,
-            "messages_received": 0,
-            "errors": 0,
-            "by_channel": {},
-            "by_type": {},
-            "by_priority": {}
-        }
+        # Statistiques, tenues sans verrou sur les chemins d'envoi et de réception
+        self.statistics = MessageStatistics()
+        # Proportion des envois et réceptions journalisés au niveau INFO
+        self.log_sampler = LogSampler(self.config.get("log_sample_rate", 1.0))
+        
+        # Destinataires dont une file a dépassé ses hautes eaux, et écouteurs de contre-pression
+        self.congested_recipients: Set[str] = set()
+        self.backpressure_listeners: List[Callable[[str, bool], None]] = []
+        
+        # Serveurs exposant des canaux locaux aux autres processus, et canaux distants ouverts
+        self.channel_servers = []
+        self.remote_channels = []
         
         # Initialiser les protocoles
         self.request_response = None  # Sera initialisé plus tard
@@ -64,12 +73,15 @@ class MessageMiddleware:
             channel: Le canal à enregistrer
         """
         with self.lock:
+            previous = self.channels.get(channel.type)
+            if previous is not None and previous is not channel:
+                previous.remove_message_listener(self.notifier.notify)
+                previous.remove_pressure_listener(self._on_channel_pressure)
+            
             self.channels[channel.type] = channel
-            self.stats["by_channel"][channel.type.value] = {
-                "sent": 0,
-                "received": 0,
-                "errors": 0
-            }
+            channel.add_message_listener(self.notifier.notify)
+            channel.add_pressure_listener(self._on_channel_pressure)
+            self.statistics.register_channel(channel.type.value)
             self.logger.info(f"Channel registered: {channel.type.value}")
     
     def get_channel(self, channel_type: ChannelType) -> Optional[Channel]:
@@ -82,8 +94,62 @@ class MessageMiddleware:
         Returns:
             Le canal ou None s'il n'existe pas
         """
+        # Lecture sans verrou : le dictionnaire n'est modifié que sous verrou par register_channel
+        return self.channels.get(channel_type)
+    
+    def add_backpressure_listener(self, listener: Callable[[str, bool], None]) -> None:
+        """
+        Enregistre une fonction appelée lorsqu'un destinataire devient congestionné ou cesse de l'être.
+        
+        Les émetteurs (par exemple le coordinateur tactique) s'en servent pour
+        suspendre leurs envois vers un agent dont la file approche de sa capacité.
+        
+        Args:
+            listener: La fonction à appeler avec l'identifiant du destinataire et
+                True (congestionné) ou False (de nouveau disponible)
+        """
+        with self.lock:
+            if listener not in self.backpressure_listeners:
+                self.backpressure_listeners.append(listener)
+    
+    def remove_backpressure_listener(self, listener: Callable[[str, bool], None]) -> None:
+        """
+        Retire une fonction précédemment enregistrée par `add_backpressure_listener`.
+        
+        Args:
+            listener: La fonction à retirer
+        """
         with self.lock:
-            return self.channels.get(channel_type)
+            if listener in self.backpressure_listeners:
+                self.backpressure_listeners.remove(listener)
+    
+    def is_congested(self, recipient_id: str) -> bool:
+        """
+        Indique si la file d'un destinataire a dépassé ses hautes eaux sur l'un des canaux.
+        
+        Args:
+            recipient_id: Identifiant du destinataire
+            
+        Returns:
+            True si le destinataire est congestionné
+        """
+        return recipient_id in self.congested_recipients
+    
+    def _on_channel_pressure(self, recipient_id: str, congested: bool) -> None:
+        """Relaie aux écouteurs un changement de congestion signalé par un canal."""
+        with self.lock:
+            if congested:
+                self.congested_recipients.add(recipient_id)
+            else:
+                self.congested_recipients.discard(recipient_id)
+            listeners = list(self.backpressure_listeners)
+        
+        self.logger.info(f"Recipient {recipient_id} {'congested' if congested else 'no longer congested'}")
+        for listener in listeners:
+            try:
+                listener(recipient_id, congested)
+            except Exception as e:
+                self.logger.error(f"Error in backpressure listener: {str(e)}")
     
     def register_message_handler(self, message_type: MessageType, 
                                handler: Callable[[Message], None]) -> None:
@@ -164,6 +230,7 @@ class MessageMiddleware:
         Returns:
             True si le message a été envoyé avec succès, False sinon
         """
+        channel_type = None
         try:
             # Déterminer le canal approprié
             channel_type = self.determine_channel(message)
@@ -178,32 +245,30 @@ class MessageMiddleware:
             message.channel = channel_type.value
             
             # Envoyer le message via le canal
+            start = time.perf_counter_ns()
             success = channel.send_message(message)
             
             # Mettre à jour les statistiques
-            with self.lock:
-                self.stats["messages_sent"] += 1
-                self.stats["by_channel"][channel_type.value]["sent"] += 1
-                
-                if message.type.value not in self.stats["by_type"]:
-                    self.stats["by_type"][message.type.value] = 0
-                self.stats["by_type"][message.type.value] += 1
-                
-                if message.priority.value not in self.stats["by_priority"]:
-                    self.stats["by_priority"][message.priority.value] = 0
-                self.stats["by_priority"][message.priority.value] += 1
+            self.statistics.record_sent(
+                channel_type.value, message.type.value, message.priority.value,
+                time.perf_counter_ns() - start
+            )
             
-            # Journaliser l'envoi
-            self.logger.info(f"Message sent: {message.id} via {channel_type.value}")
+            # Journaliser l'envoi (échantillonné)
+            if self.log_sampler.should_log() and self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Message sent: {message.id} via {channel_type.value}")
             
             return success
             
+        except ChannelFullException as e:
+            # File du destinataire pleine : l'envoi est refusé à l'émetteur
+            self.statistics.record_error(channel_type.value)
+            self.logger.warning(f"Message {message.id} rejected: {str(e)}")
+            return False
+            
         except Exception as e:
             # Mettre à jour les statistiques d'erreur
-            with self.lock:
-                self.stats["errors"] += 1
-                if channel_type:
-                    self.stats["by_channel"][channel_type.value]["errors"] += 1
+            self.statistics.record_error(channel_type.value if channel_type else None)
             
             # Journaliser l'erreur
             self.logger.error(f"Error sending message: {str(e)}")
@@ -233,69 +298,31 @@ class MessageMiddleware:
                 message = channel.receive_message(recipient_id, timeout)
                 
                 if message:
-                    # Mettre à jour les statistiques
-                    with self.lock:
-                        self.stats["messages_received"] += 1
-                        self.stats["by_channel"][channel_type.value]["received"] += 1
-                    
-                    # Vérifier si c'est une réponse à une requête en attente
-                    if message.type == MessageType.RESPONSE and self.request_response:
-                        request_id = message.metadata.get("reply_to")
-                        if request_id:
-                            self.logger.info(f"Received response {message.id} for request {request_id}")
-                            result = self.request_response.handle_response(message)
-                            self.logger.info(f"Response handler result: {result}")
-                    
-                    # Appeler les gestionnaires de messages
-                    self._handle_message(message)
+                    self._process_received_message(message, channel)
                 
                 return message
             
-            # Sinon, écouter tous les canaux
-            # Créer une liste de tous les canaux
+            # Sinon, écouter tous les canaux et attendre une notification de dépôt
             channels = list(self.channels.values())
-            
-            # Attendre un message sur n'importe quel canal
-            # Implémentation simple: vérifier chaque canal séquentiellement
-            # Une implémentation plus avancée utiliserait des files d'attente et des threads
-            
-            if timeout is not None:
-                end_time = datetime.now().timestamp() + timeout
+            deadline = None if timeout is None else time.monotonic() + timeout
             
             while True:
-                for channel in channels:
-                    message = channel.receive_message(recipient_id, 0)  # Pas d'attente
-                    
-                    if message:
-                        # Mettre à jour les statistiques
-                        with self.lock:
-                            self.stats["messages_received"] += 1
-                            self.stats["by_channel"][channel.type.value]["received"] += 1
-                        
-                        # Vérifier si c'est une réponse à une requête en attente
-                        if message.type == MessageType.RESPONSE and self.request_response:
-                            request_id = message.metadata.get("reply_to")
-                            if request_id:
-                                self.logger.info(f"Received response {message.id} for request {request_id}")
-                                result = self.request_response.handle_response(message)
-                                self.logger.info(f"Response handler result: {result}")
-                        
-                        # Appeler les gestionnaires de messages
-                        self._handle_message(message)
-                        
-                        return message
+                # Lire la séquence avant de consulter les canaux pour ne perdre aucun dépôt
+                sequence = self.notifier.get_sequence(recipient_id)
                 
-                # Vérifier si le timeout est atteint
-                if timeout is not None and datetime.now().timestamp() > end_time:
+                message = self._poll_channels(recipient_id, channels)
+                if message:
+                    return message
+                
+                wait_time = self._compute_wait_time(deadline, channels)
+                if wait_time is not None and wait_time <= 0:
                     return None
                 
-                # Petite pause pour éviter de surcharger le CPU
-                threading.Event().wait(0.01)
+                self.notifier.wait(recipient_id, sequence, wait_time)
             
         except Exception as e:
             # Mettre à jour les statistiques d'erreur
-            with self.lock:
-                self.stats["errors"] += 1
+            self.statistics.record_error()
             
             # Journaliser l'erreur
             self.logger.error(f"Error receiving message: {str(e)}")
@@ -306,6 +333,9 @@ class MessageMiddleware:
         """
         Version asynchrone de receive_message.
         
+        L'attente repose sur les notifications des canaux et n'occupe aucun
+        thread de l'exécuteur par défaut.
+        
         Args:
             recipient_id: Identifiant du destinataire
             channel_type: Type de canal à écouter (optionnel)
@@ -314,13 +344,103 @@ class MessageMiddleware:
         Returns:
             Le message reçu ou None si timeout
         """
-        # Cette implémentation est simplifiée et utilise la version synchrone
-        # Une implémentation complète utiliserait des primitives asyncio
+        try:
+            if channel_type:
+                channel = self.get_channel(channel_type)
+                if not channel:
+                    self.logger.error(f"Channel not found: {channel_type.value}")
+                    return None
+                channels = [channel]
+            else:
+                channels = list(self.channels.values())
+            
+            deadline = None if timeout is None else time.monotonic() + timeout
+            
+            while True:
+                sequence = self.notifier.get_sequence(recipient_id)
+                
+                message = self._poll_channels(recipient_id, channels)
+                if message:
+                    return message
+                
+                wait_time = self._compute_wait_time(deadline, channels)
+                if wait_time is not None and wait_time <= 0:
+                    return None
+                
+                await self.notifier.wait_async(recipient_id, sequence, wait_time)
+            
+        except Exception as e:
+            self.statistics.record_error()
+            
+            self.logger.error(f"Error receiving message: {str(e)}")
+            return None
+    
+    def _poll_channels(self, recipient_id: str, channels: List[Channel]) -> Optional[Message]:
+        """
+        Consulte chaque canal sans attente et traite le premier message disponible.
+        
+        Args:
+            recipient_id: Identifiant du destinataire
+            channels: Les canaux à consulter
+            
+        Returns:
+            Le premier message disponible ou None
+        """
+        for channel in channels:
+            message = channel.receive_message(recipient_id, 0)  # Pas d'attente
+            
+            if message:
+                self._process_received_message(message, channel)
+                return message
+        
+        return None
+    
+    def _compute_wait_time(self, deadline: Optional[float], channels: List[Channel]) -> Optional[float]:
+        """
+        Calcule la durée d'attente de la prochaine notification.
+        
+        Args:
+            deadline: Échéance absolue (horloge monotone) ou None pour attente indéfinie
+            channels: Les canaux écoutés
+            
+        Returns:
+            La durée d'attente en secondes (None pour attente indéfinie, <= 0 si l'échéance est dépassée)
+        """
+        remaining = None if deadline is None else deadline - time.monotonic()
+        
+        # Les canaux qui ne signalent pas leurs dépôts doivent encore être consultés périodiquement
+        if all(channel.supports_notifications for channel in channels):
+            return remaining
+        
+        if remaining is None:
+            return self.poll_interval
+        return min(remaining, self.poll_interval) if remaining > 0 else remaining
+    
+    def _process_received_message(self, message: Message, channel: Channel) -> None:
+        """
+        Met à jour les statistiques et déclenche les gestionnaires pour un message reçu.
         
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, lambda: self.receive_message(recipient_id, channel_type, timeout)
+        Args:
+            message: Le message reçu
+            channel: Le canal d'où provient le message
+        """
+        # Mettre à jour les statistiques, avec le délai écoulé depuis la création du message
+        delivery = datetime.now() - message.timestamp if isinstance(message.timestamp, datetime) else None
+        self.statistics.record_received(
+            channel.type.value,
+            None if delivery is None else int(delivery.total_seconds() * 1e9)
         )
+        
+        # Vérifier si c'est une réponse à une requête en attente
+        if message.type == MessageType.RESPONSE and self.request_response:
+            request_id = message.metadata.get("reply_to")
+            if request_id:
+                self.logger.info(f"Received response {message.id} for request {request_id}")
+                result = self.request_response.handle_response(message)
+                self.logger.info(f"Response handler result: {result}")
+        
+        # Appeler les gestionnaires de messages
+        self._handle_message(message)
     
     def _handle_message(self, message: Message) -> None:
         """
@@ -413,11 +533,13 @@ class MessageMiddleware:
         """
         Récupère les statistiques du middleware.
         
+        Les compteurs sont agrégés à la lecture ; la clé `latency` donne, par
+        canal, les histogrammes des durées d'envoi et des délais de livraison.
+        
         Returns:
             Un dictionnaire de statistiques
         """
-        with self.lock:
-            return self.stats.copy()
+        return self.statistics.get_statistics()
     
     def get_channel_info(self, channel_type: ChannelType) -> Optional[Dict[str, Any]]:
         """
@@ -435,6 +557,52 @@ class MessageMiddleware:
         
         return channel.get_channel_info()
     
+    def serve_channel(self, channel_type: ChannelType, address: Any):
+        """
+        Expose un canal enregistré aux middlewares d'autres processus.
+        
+        Args:
+            channel_type: Le type du canal à exposer
+            address: Chemin de socket Unix ou couple (hôte, port) TCP
+            
+        Returns:
+            Le ChannelServer démarré
+            
+        Raises:
+            ValueError: Si aucun canal de ce type n'est enregistré
+        """
+        from .transport import ChannelServer
+        
+        channel = self.get_channel(channel_type)
+        if channel is None:
+            raise ValueError(f"No channel registered for type {channel_type}")
+        
+        server = ChannelServer(channel, address).start()
+        with self.lock:
+            self.channel_servers.append(server)
+        return server
+    
+    def connect_remote_channel(self, channel_type: ChannelType, address: Any,
+                               config: Optional[Dict[str, Any]] = None):
+        """
+        Enregistre un canal relayé vers le ChannelServer d'un autre processus.
+        
+        Args:
+            channel_type: Le type du canal exposé par le serveur
+            address: Adresse du ChannelServer
+            config: Configuration du canal distant (optionnel)
+            
+        Returns:
+            Le RemoteChannel enregistré
+        """
+        from .transport import RemoteChannel
+        
+        channel = RemoteChannel(f"remote-{channel_type.name.lower()}", channel_type, address, config)
+        self.register_channel(channel)
+        with self.lock:
+            self.remote_channels.append(channel)
+        return channel
+    
     def initialize_protocols(self):
         """Initialise les protocoles de communication."""
         from .request_response import RequestResponseProtocol
@@ -491,6 +659,17 @@ class MessageMiddleware:
         
         return self.publish_subscribe.publish(*args, **kwargs)
     
+    def publish_batch(self, *args, **kwargs):
+        """
+        Publie plusieurs messages sur un topic via le protocole de publication-abonnement.
+        
+        Voir PublishSubscribeProtocol.publish_batch pour les paramètres.
+        """
+        if not self.publish_subscribe:
+            self.initialize_protocols()
+        
+        return self.publish_subscribe.publish_batch(*args, **kwargs)
+    
     def subscribe(self, *args, **kwargs):
         """
         Abonne un agent à un topic via le protocole de publication-abonnement.
@@ -511,5 +690,14 @@ class MessageMiddleware:
         if self.publish_subscribe:
             self.publish_subscribe.shutdown()
         
+        # Arrêter les serveurs et fermer les canaux distants
+        for server in self.channel_servers:
+            server.stop()
+        self.channel_servers = []
+        
+        for channel in self.remote_channels:
+            channel.close()
+        self.remote_channels = []
+        
         # Journaliser l'arrêt
         self.logger.info("MessageMiddleware shutdown")
\ No newline at end of file
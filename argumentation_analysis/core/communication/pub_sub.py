@@ -4,15 +4,97 @@ Implémentation du protocole de publication-abonnement pour le système de commu
 Ce protocole permet à des agents de publier des messages sur des sujets (topics)
 auxquels d'autres agents peuvent s'abonner. Ce modèle découple les émetteurs des
 récepteurs et permet une communication one-to-many efficace.
+
+Les noms de topics sont hiérarchiques (segments séparés par des points) et
+un abonnement peut porter sur un motif avec jokers (`operational_results.*`),
+voir le module `topic_index`.
 """
 
 import uuid
 import threading
 import asyncio
-from typing import Dict, Any, Optional, Callable, List, Set
+from typing import Dict, Any, Optional, Callable, List, Set, Tuple
 from datetime import datetime, timedelta
 
 from .message import Message, MessageType, MessagePriority, AgentLevel
+from .topic_index import TopicTrie, compile_filter, is_topic_pattern
+
+
+# Livraisons en attente : identifiant d'abonnement -> (abonnement, messages retenus)
+Deliveries = Dict[str, Tuple[Dict[str, Any], List[Message]]]
+
+
+def _collect_deliveries(subscriptions: Dict[str, Dict[str, Any]], messages: List[Message],
+                        deliveries: Deliveries) -> None:
+    """
+    Ajoute aux livraisons les messages retenus par le filtre de chaque abonnement.
+    
+    Args:
+        subscriptions: Les abonnements candidats
+        messages: Les messages publiés
+        deliveries: Les livraisons à compléter
+    """
+    for subscription_id, subscriber in subscriptions.items():
+        predicate = subscriber["predicate"]
+        matched = [message for message in messages if predicate(message)]
+        if matched:
+            deliveries.setdefault(subscription_id, (subscriber, []))[1].extend(matched)
+
+
+def _deliver(deliveries: Deliveries) -> List[str]:
+    """
+    Appelle les callbacks des abonnés pour les messages qui leur sont destinés.
+    
+    Un abonnement par lot reçoit en un seul appel la liste de ses messages ;
+    les autres reçoivent un appel par message. Les callbacks sont appelés sans
+    détenir de verrou.
+    
+    Args:
+        deliveries: Les livraisons à effectuer
+        
+    Returns:
+        Liste des identifiants des abonnés qui ont reçu au moins un message
+    """
+    recipients = []
+    for subscriber, messages in deliveries.values():
+        callback = subscriber.get("callback")
+        if callback:
+            try:
+                if subscriber.get("batch"):
+                    callback(messages)
+                else:
+                    for message in messages:
+                        callback(message)
+            except Exception as e:
+                print(f"Error in subscriber callback: {e}")
+        
+        recipients.append(subscriber["subscriber_id"])
+    
+    return recipients
+
+
+def create_subscription(subscriber_id: str, callback: Optional[Callable],
+                        filter_criteria: Optional[Dict[str, Any]], batch: bool = False) -> Dict[str, Any]:
+    """
+    Crée la description d'un abonnement, avec son filtre précompilé.
+    
+    Args:
+        subscriber_id: Identifiant de l'abonné
+        callback: Fonction de rappel (optionnel)
+        filter_criteria: Critères de filtrage des messages (optionnel)
+        batch: Si True, le callback reçoit une liste de messages
+        
+    Returns:
+        La description de l'abonnement
+    """
+    return {
+        "subscriber_id": subscriber_id,
+        "callback": callback,
+        "filter_criteria": filter_criteria,
+        "predicate": compile_filter(filter_criteria),
+        "batch": batch,
+        "created_at": datetime.now()
+    }
 
 
 class Topic:
@@ -40,8 +122,8 @@ class Topic:
         self.max_history = 100  # Nombre maximum de messages à conserver
         self.lock = threading.RLock()  # Verrou pour les opérations concurrentes
     
-    def add_subscriber(self, subscriber_id: str, callback: Optional[Callable[[Message], None]] = None,
-                      filter_criteria: Optional[Dict[str, Any]] = None) -> str:
+    def add_subscriber(self, subscriber_id: str, callback: Optional[Callable] = None,
+                      filter_criteria: Optional[Dict[str, Any]] = None, batch: bool = False) -> str:
         """
         Ajoute un abonné à ce topic.
         
@@ -49,6 +131,7 @@ class Topic:
             subscriber_id: Identifiant de l'abonné
             callback: Fonction de rappel à appeler lors de la réception d'un message (optionnel)
             filter_criteria: Critères de filtrage des messages (optionnel)
+            batch: Si True, le callback reçoit la liste des messages d'une même publication
             
         Returns:
             Un identifiant d'abonnement
@@ -56,12 +139,7 @@ class Topic:
         subscription_id = f"sub-{uuid.uuid4().hex[:8]}"
         
         with self.lock:
-            self.subscribers[subscription_id] = {
-                "subscriber_id": subscriber_id,
-                "callback": callback,
-                "filter_criteria": filter_criteria,
-                "created_at": datetime.now()
-            }
+            self.subscribers[subscription_id] = create_subscription(subscriber_id, callback, filter_criteria, batch)
         
         return subscription_id
     
@@ -91,33 +169,32 @@ class Topic:
         Returns:
             Liste des identifiants des abonnés qui ont reçu le message
         """
-        recipients = []
+        deliveries: Deliveries = {}
+        self.collect_deliveries([message], deliveries)
+        return _deliver(deliveries)
+    
+    def collect_deliveries(self, messages: List[Message], deliveries: Deliveries) -> None:
+        """
+        Ajoute des messages à l'historique et détermine les abonnés à servir.
+        
+        Les callbacks ne sont pas appelés : la livraison est effectuée par
+        l'appelant, hors du verrou du topic.
+        
+        Args:
+            messages: Les messages publiés
+            deliveries: Les livraisons à compléter
+        """
+        published_at = datetime.now()
         
         with self.lock:
-            # Ajouter le message à l'historique
-            self.messages.append({
-                "message": message,
-                "published_at": datetime.now()
-            })
+            # Ajouter les messages à l'historique
+            self.messages.extend({"message": message, "published_at": published_at} for message in messages)
             
             # Limiter la taille de l'historique
             if len(self.messages) > self.max_history:
                 self.messages = self.messages[-self.max_history:]
             
-            # Distribuer le message aux abonnés
-            for subscription_id, subscriber in self.subscribers.items():
-                # Vérifier si le message correspond aux critères de filtrage
-                if self._matches_filter(message, subscriber.get("filter_criteria")):
-                    # Appeler le callback si présent
-                    if subscriber.get("callback"):
-                        try:
-                            subscriber["callback"](message)
-                        except Exception as e:
-                            print(f"Error in subscriber callback: {e}")
-                    
-                    recipients.append(subscriber["subscriber_id"])
-        
-        return recipients
+            _collect_deliveries(self.subscribers, messages, deliveries)
     
     def get_recent_messages(self, count: Optional[int] = None, 
                            filter_criteria: Optional[Dict[str, Any]] = None) -> List[Message]:
@@ -155,43 +232,7 @@ class Topic:
         Returns:
             True si le message correspond aux critères, False sinon
         """
-        if not filter_criteria:
-            return True
-        
-        # Vérifier les critères de base
-        for key, value in filter_criteria.items():
-            if key == "sender":
-                if isinstance(value, list):
-                    if message.sender not in value:
-                        return False
-                elif message.sender != value:
-                    return False
-            elif key == "priority":
-                if isinstance(value, list):
-                    if message.priority.value not in value:
-                        return False
-                elif message.priority.value != value:
-                    return False
-            elif key == "sender_level":
-                if isinstance(value, list):
-                    if message.sender_level.value not in value:
-                        return False
-                elif message.sender_level.value != value:
-                    return False
-        
-        # Vérifier les critères de contenu
-        if "content" in filter_criteria:
-            content_filter = filter_criteria["content"]
-            for content_key, content_value in content_filter.items():
-                if content_key not in message.content:
-                    return False
-                if isinstance(content_value, list):
-                    if message.content[content_key] not in content_value:
-                        return False
-                elif message.content[content_key] != content_value:
-                    return False
-        
-        return True
+        return compile_filter(filter_criteria)(message)
     
     def get_subscriber_count(self) -> int:
         """
@@ -237,7 +278,9 @@ class PublishSubscribeProtocol:
     Implémentation du protocole de publication-abonnement.
     
     Ce protocole gère la création de topics, l'abonnement des agents et la
-    publication de messages.
+    publication de messages. Les abonnements à un topic précis sont portés par
+    le topic ; les abonnements à un motif sont indexés dans un trie consulté à
+    chaque publication.
     """
     
     def __init__(self, middleware):
@@ -249,6 +292,7 @@ class PublishSubscribeProtocol:
         """
         self.middleware = middleware
         self.topics = {}  # Dictionnaire des topics
+        self.pattern_index = TopicTrie()  # Abonnements par motif de topic
         self.lock = threading.RLock()  # Verrou pour les opérations concurrentes
         
         # Démarrer le thread de nettoyage des messages expirés
@@ -320,6 +364,11 @@ class PublishSubscribeProtocol:
         """
         Publie un message sur un topic.
         
+        Le topic n'est pas créé s'il n'existe pas : le message est alors
+        seulement distribué aux abonnements par motif, sans être historisé.
+        Publier sur des topics éphémères (un par tâche par exemple) ne fait
+        donc pas croître le nombre de topics.
+        
         Args:
             topic_id: Identifiant du topic
             sender: Identifiant de l'émetteur
@@ -332,30 +381,78 @@ class PublishSubscribeProtocol:
         Returns:
             Liste des identifiants des abonnés qui ont reçu le message
         """
-        # Créer ou récupérer le topic
-        topic = self.create_topic(topic_id)
+        return self.publish_batch(topic_id, sender, sender_level, [content], priority, ttl, metadata)
+    
+    def publish_batch(
+        self,
+        topic_id: str,
+        sender: str,
+        sender_level: AgentLevel,
+        contents: List[Dict[str, Any]],
+        priority: MessagePriority = MessagePriority.NORMAL,
+        ttl: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """
+        Publie plusieurs messages sur un topic en une seule distribution.
         
-        # Créer le message
-        message = Message(
-            message_type=MessageType.PUBLICATION,
-            sender=sender,
-            sender_level=sender_level,
-            content=content,
-            recipient=None,  # Pas de destinataire spécifique
-            channel=None,  # Le canal sera déterminé par le middleware
-            priority=priority,
-            metadata={
-                "topic": topic_id,
-                "ttl": ttl or topic.ttl,
-                **(metadata or {})
-            }
-        )
+        Chaque abonnement n'est consulté qu'une fois pour l'ensemble des
+        messages ; un abonnement par lot reçoit tous ses messages en un seul
+        appel de son callback.
         
-        # Publier le message sur le topic
-        recipients = topic.publish_message(message)
+        Args:
+            topic_id: Identifiant du topic
+            sender: Identifiant de l'émetteur
+            sender_level: Niveau de l'émetteur
+            contents: Contenus des messages
+            priority: Priorité des messages
+            ttl: Durée de vie des messages en secondes (optionnel)
+            metadata: Métadonnées additionnelles (optionnel)
+            
+        Returns:
+            Liste des identifiants des abonnés qui ont reçu au moins un message
+            
+        Raises:
+            ValueError: Si l'identifiant de topic est un motif
+        """
+        if is_topic_pattern(topic_id):
+            raise ValueError(f"Cannot publish on topic pattern '{topic_id}'")
         
-        # Envoyer le message via le middleware
-        self.middleware.send_message(message)
+        topic = self.get_topic(topic_id)
+        
+        # Créer les messages
+        messages = [
+            Message(
+                message_type=MessageType.PUBLICATION,
+                sender=sender,
+                sender_level=sender_level,
+                content=content,
+                recipient=None,  # Pas de destinataire spécifique
+                channel=None,  # Le canal sera déterminé par le middleware
+                priority=priority,
+                metadata={
+                    "topic": topic_id,
+                    "ttl": ttl or (topic.ttl if topic else None),
+                    **(metadata or {})
+                }
+            )
+            for content in contents
+        ]
+        
+        # Déterminer les abonnés du topic et des motifs correspondants
+        deliveries: Deliveries = {}
+        if topic:
+            topic.collect_deliveries(messages, deliveries)
+        with self.lock:
+            pattern_subscriptions = self.pattern_index.match(topic_id)
+        _collect_deliveries(pattern_subscriptions, messages, deliveries)
+        
+        # Distribuer les messages aux abonnés
+        recipients = _deliver(deliveries)
+        
+        # Envoyer les messages via le middleware
+        for message in messages:
+            self.middleware.send_message(message)
         
         return recipients
     
@@ -363,26 +460,39 @@ class PublishSubscribeProtocol:
         self,
         topic_id: str,
         subscriber_id: str,
-        callback: Optional[Callable[[Message], None]] = None,
-        filter_criteria: Optional[Dict[str, Any]] = None
+        callback: Optional[Callable] = None,
+        filter_criteria: Optional[Dict[str, Any]] = None,
+        batch: bool = False
     ) -> str:
         """
-        Abonne un agent à un topic.
+        Abonne un agent à un topic ou à un motif de topics.
         
         Args:
-            topic_id: Identifiant du topic
+            topic_id: Identifiant du topic, ou motif avec jokers (`*` pour un
+                segment, `#` en dernier segment pour zéro segment ou plus)
             subscriber_id: Identifiant de l'abonné
             callback: Fonction de rappel à appeler lors de la réception d'un message (optionnel)
             filter_criteria: Critères de filtrage des messages (optionnel)
+            batch: Si True, le callback reçoit la liste des messages d'une même publication
             
         Returns:
             Un identifiant d'abonnement
-        """
-        # Créer ou récupérer le topic
-        topic = self.create_topic(topic_id)
-        
-        # Ajouter l'abonné au topic
-        subscription_id = topic.add_subscriber(subscriber_id, callback, filter_criteria)
+            
+        Raises:
+            ValueError: Si le motif est invalide
+        """
+        if is_topic_pattern(topic_id):
+            # Indexer l'abonnement par motif, sans créer de topic
+            subscription_id = f"sub-{uuid.uuid4().hex[:8]}"
+            with self.lock:
+                self.pattern_index.add(
+                    topic_id, subscription_id,
+                    create_subscription(subscriber_id, callback, filter_criteria, batch)
+                )
+        else:
+            # Créer ou récupérer le topic et y ajouter l'abonné
+            topic = self.create_topic(topic_id)
+            subscription_id = topic.add_subscriber(subscriber_id, callback, filter_criteria, batch)
         
         # Créer un message d'abonnement
         message = Message(
@@ -411,12 +521,16 @@ class PublishSubscribeProtocol:
         Désabonne un agent d'un topic.
         
         Args:
-            topic_id: Identifiant du topic
+            topic_id: Identifiant du topic ou motif utilisé lors de l'abonnement
             subscription_id: Identifiant d'abonnement
             
         Returns:
             True si désabonnement réussi, False sinon
         """
+        if is_topic_pattern(topic_id):
+            with self.lock:
+                return self.pattern_index.remove(subscription_id)
+        
         topic = self.get_topic(topic_id)
         if not topic:
             return False
@@ -433,6 +547,16 @@ class PublishSubscribeProtocol:
         with self.lock:
             return list(self.topics.keys())
     
+    def get_patterns(self) -> List[str]:
+        """
+        Récupère la liste des motifs de topics faisant l'objet d'un abonnement.
+        
+        Returns:
+            Liste des motifs
+        """
+        with self.lock:
+            return self.pattern_index.get_patterns()
+    
     def get_topic_info(self, topic_id: str) -> Optional[Dict[str, Any]]:
         """
         Récupère des informations sur un topic.
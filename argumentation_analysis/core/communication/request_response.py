@@ -11,10 +11,11 @@ import time
 import threading
 import asyncio
 import logging
-from typing import Dict, Any, Optional, Callable, Tuple, List
+from typing import Dict, Any, Optional, Callable, Tuple, List, Hashable
 from datetime import datetime, timedelta
 
 from .message import Message, MessageType, MessagePriority, AgentLevel
+from .deadline_scheduler import DeadlineScheduler, is_running_in_loop
 
 
 class RequestTimeoutError(Exception):
@@ -27,9 +28,14 @@ class RequestResponseProtocol:
     Implémentation du protocole de requête-réponse.
     
     Ce protocole gère l'envoi de requêtes et la réception des réponses correspondantes,
-    avec gestion des timeouts et des réessais.
+    avec gestion des timeouts et des réessais. Les échéances des requêtes
+    asynchrones et des réponses anticipées sont confiées à un échéancier
+    indexé sur l'instant d'expiration plutôt qu'à un balayage périodique.
     """
     
+    # Durée de conservation des réponses anticipées en secondes
+    EARLY_RESPONSE_TTL = 300.0
+    
     def __init__(self, middleware):
         """
         Initialise le protocole de requête-réponse.
@@ -48,11 +54,10 @@ class RequestResponseProtocol:
         self.logger = logging.getLogger("RequestResponseProtocol")
         self.logger.setLevel(logging.INFO)
         
-        # Démarrer le thread de surveillance des timeouts
+        # Démarrer l'échéancier des timeouts
         self.running = True
-        self.timeout_thread = threading.Thread(target=self._monitor_timeouts)
-        self.timeout_thread.daemon = True
-        self.timeout_thread.start()
+        self.timeouts = DeadlineScheduler(self._on_deadline, name="RequestResponseProtocol.timeouts")
+        self.timeouts.start()
     
     def send_request(
         self,
@@ -142,17 +147,20 @@ class RequestResponseProtocol:
                 # Envoyer la requête
                 self.middleware.send_message(request)
                 
-                # Attendre la réponse
+                # Attendre la réponse : l'attente de l'événement sert elle-même de minuteur
                 pending = self.pending_requests[request.id]
-                if not pending["completed"].wait(timeout=timeout):
-                    # Timeout atteint
-                    if attempt < retry_count:
-                        # Réessayer
-                        time.sleep(retry_delay)
+                completed = pending["completed"].wait(timeout=timeout)
+                if not completed and attempt < retry_count:
+                    # Patienter avant de réessayer, en acceptant une réponse tardive
+                    completed = pending["completed"].wait(timeout=retry_delay)
+                    if not completed:
                         continue
-                    else:
-                        # Échec définitif
-                        raise RequestTimeoutError(f"Request {request.id} timed out after {retry_count + 1} attempts")
+                
+                if not completed:
+                    # Échec définitif
+                    with self.lock:
+                        self.pending_requests.pop(request.id, None)
+                    raise RequestTimeoutError(f"Request {request.id} timed out after {retry_count + 1} attempts")
                 
                 # Récupérer la réponse
                 response = None
@@ -326,11 +334,16 @@ class RequestResponseProtocol:
                 self.middleware.send_message(request)
                 self.logger.info(f"Sent request {request.id} to {recipient}")
                 
-                # Attendre la réponse avec timeout
+                # Attendre la réponse, l'échéance étant déclenchée par la boucle courante
+                self.timeouts.schedule(("request", request.id), timeout, loop=asyncio.get_running_loop())
                 try:
                     self.logger.info(f"Waiting for response to request {request.id} with timeout {timeout}s")
-                    return await asyncio.wait_for(response_future, timeout=timeout)
-                except asyncio.TimeoutError:
+                    response = await response_future
+                    self.timeouts.cancel(("request", request.id))
+                    with self.lock:
+                        self.pending_requests.pop(request.id, None)
+                    return response
+                except RequestTimeoutError:
                     # Timeout atteint
                     if attempt < retry_count:
                         # Réessayer
@@ -344,6 +357,7 @@ class RequestResponseProtocol:
                 
             except asyncio.CancelledError:
                 # Gérer l'annulation de la tâche
+                self.timeouts.cancel(("request", request.id))
                 with self.lock:
                     if request.id in self.pending_requests:
                         del self.pending_requests[request.id]
@@ -423,6 +437,7 @@ class RequestResponseProtocol:
                 "retry_delay": retry_delay,
                 "attempt": 0
             }
+        self.timeouts.schedule(("request", request.id), timeout)
         
         # Envoyer la requête
         self.middleware.send_message(request)
@@ -488,18 +503,15 @@ class RequestResponseProtocol:
                         self.logger.error(f"Error in response callback: {e}")
                 
                 # Pour les requêtes synchrones simples (pas de futur, pas de callback),
-                # la suppression est maintenant gérée par send_request après récupération de la réponse.
-                # Pour les requêtes avec futur ou callback, elles restent jusqu'à ce que le futur/callback
-                # soit traité ou qu'elles expirent.
-                if "future" in pending or "callback" in pending:
-                    # Ne pas supprimer ici, send_request_async ou _handle_timeout s'en chargeront
-                    pass
-                elif request_id in self.pending_requests : # S'assurer qu'elle n'a pas déjà été supprimée par send_request
-                    # Ce cas ne devrait plus être nécessaire si send_request gère la suppression
-                    # des requêtes synchrones simples.
-                    # self.logger.info(f"Removing request {request_id} from pending requests by handle_response (should be rare).")
-                    # del self.pending_requests[request_id]
-                    pass
+                # la suppression est gérée par send_request après récupération de la réponse,
+                # et pour les requêtes avec futur par send_request_async. Une requête avec
+                # callback est terminée dès que le callback a été appelé.
+                if "future" in pending:
+                    self.timeouts.cancel(("request", request_id))
+                elif "callback" in pending:
+                    self.timeouts.cancel(("request", request_id))
+                    self.timeouts.cancel(("retry", request_id))
+                    del self.pending_requests[request_id]
 
 
                 return True
@@ -521,8 +533,10 @@ class RequestResponseProtocol:
                         "response": response,
                         "timestamp": datetime.now()
                     }
+                    self.timeouts.schedule(("early_conversation", conversation_id), self.EARLY_RESPONSE_TTL)
                     self.logger.info(f"Stored early response for conversation {conversation_id}")
                 
+                self.timeouts.schedule(("early", request_id), self.EARLY_RESPONSE_TTL)
                 self.logger.info(f"Stored early response for request {request_id}")
                 
                 # Afficher les requêtes en attente pour le débogage
@@ -532,67 +546,54 @@ class RequestResponseProtocol:
                 
                 return True
     
-    def _monitor_timeouts(self):
-        """Thread qui surveille les timeouts des requêtes en attente et nettoie les réponses anticipées."""
-        while self.running:
-            try:
-                now = datetime.now()
-                timed_out_requests = []
-                expired_early_responses = []
-                
-                # Identifier les requêtes expirées
-                with self.lock:
-                    # Vérifier les requêtes en attente
-                    for request_id, pending in list(self.pending_requests.items()):
-                        if now > pending["expires_at"] and not pending["completed"].is_set():
-                            # Vérifier s'il reste des tentatives
-                            if "retry_count" in pending and "attempt" in pending:
-                                if pending["attempt"] < pending["retry_count"]:
-                                    # Incrémenter le compteur de tentatives
-                                    pending["attempt"] += 1
-                                    
-                                    # Mettre à jour l'expiration
-                                    pending["expires_at"] = now + timedelta(seconds=pending["request"].content.get("timeout", 30.0))
-                                    
-                                    # Renvoyer la requête
-                                    self.middleware.send_message(pending["request"])
-                                    
-                                    # Attendre le délai de réessai sans bloquer le verrou
-                                    continue
-                            
-                            # Plus de tentatives ou pas de réessai configuré
-                            timed_out_requests.append(request_id)
-                    
-                    # Nettoyer les réponses anticipées expirées (plus de 5 minutes)
-                    for request_id, early_response in list(self.early_responses.items()):
-                        if (now - early_response["timestamp"]).total_seconds() > 300:  # 5 minutes
-                            expired_early_responses.append(("request", request_id))
-                    
-                    # Nettoyer les réponses anticipées par conversation expirées
-                    for conv_id, early_response in list(self.early_responses_by_conversation.items()):
-                        if (now - early_response["timestamp"]).total_seconds() > 300:  # 5 minutes
-                            expired_early_responses.append(("conversation", conv_id))
-                
-                # Traiter les requêtes expirées (en dehors du bloc verrouillé)
-                for request_id in timed_out_requests:
-                    self._handle_timeout(request_id)
-                
-                # Supprimer les réponses anticipées expirées
-                with self.lock:
-                    for type_id, id_value in expired_early_responses:
-                        if type_id == "request" and id_value in self.early_responses:
-                            del self.early_responses[id_value]
-                            self.logger.info(f"Removed expired early response for request {id_value}")
-                        elif type_id == "conversation" and id_value in self.early_responses_by_conversation:
-                            del self.early_responses_by_conversation[id_value]
-                            self.logger.info(f"Removed expired early response for conversation {id_value}")
+    def _on_deadline(self, key: Hashable) -> None:
+        """
+        Traite l'expiration d'une échéance de l'échéancier.
+        
+        Args:
+            key: Clé de l'échéance, un couple (nature, identifiant)
+        """
+        kind, identifier = key
+        
+        if kind == "request":
+            with self.lock:
+                pending = self.pending_requests.get(identifier)
+                if pending is None or pending["completed"].is_set():
+                    return
                 
-                # Attendre un peu avant la prochaine vérification
-                time.sleep(0.1)
+                # Vérifier s'il reste des tentatives
+                if "retry_count" in pending and pending["attempt"] < pending["retry_count"]:
+                    pending["attempt"] += 1
+                    self.timeouts.schedule(("retry", identifier), pending["retry_delay"])
+                    return
+            
+            # Plus de tentatives ou pas de réessai configuré
+            self._handle_timeout(identifier)
+        
+        elif kind == "retry":
+            with self.lock:
+                pending = self.pending_requests.get(identifier)
+                if pending is None or pending["completed"].is_set():
+                    return
                 
-            except Exception as e:
-                self.logger.error(f"Error in timeout monitor: {e}")
-                time.sleep(1)
+                # Mettre à jour l'expiration et renvoyer la requête
+                timeout = pending["request"].content.get("timeout", 30.0)
+                pending["expires_at"] = datetime.now() + timedelta(seconds=timeout)
+                self.timeouts.schedule(("request", identifier), timeout)
+                request = pending["request"]
+            
+            self.logger.info(f"Retrying request {identifier} (attempt {pending['attempt'] + 1})")
+            self.middleware.send_message(request)
+        
+        elif kind == "early":
+            with self.lock:
+                if self.early_responses.pop(identifier, None) is not None:
+                    self.logger.info(f"Removed expired early response for request {identifier}")
+        
+        elif kind == "early_conversation":
+            with self.lock:
+                if self.early_responses_by_conversation.pop(identifier, None) is not None:
+                    self.logger.info(f"Removed expired early response for conversation {identifier}")
     
     def _handle_timeout(self, request_id):
         """
@@ -629,7 +630,10 @@ class RequestResponseProtocol:
                     if not future.done():
                         try:
                             loop = pending.get("loop")
-                            if loop and loop.is_running():
+                            if loop and is_running_in_loop(loop):
+                                # Échéance déclenchée par la boucle du futur elle-même
+                                future.set_exception(error)
+                            elif loop and loop.is_running():
                                 loop.call_soon_threadsafe(future.set_exception, error)
                             elif not loop:
                                 self.logger.warning(f"Asyncio loop not found for future of request {request_id} in _handle_timeout, setting exception directly.")
@@ -656,11 +660,28 @@ class RequestResponseProtocol:
                 del self.pending_requests[request_id]
                 self.logger.info(f"Request {request_id} timed out and was removed")
     
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Récupère les métriques du protocole.
+        
+        Returns:
+            Un dictionnaire contenant le nombre de requêtes en attente et les
+            métriques de l'échéancier (échéances actives, expirations, retard)
+        """
+        with self.lock:
+            pending_count = len(self.pending_requests)
+            early_count = len(self.early_responses)
+        
+        return {
+            "pending_requests": pending_count,
+            "early_responses": early_count,
+            "timeouts": self.timeouts.get_metrics()
+        }
+    
     def shutdown(self):
         """Arrête proprement le protocole."""
         self.running = False
-        if self.timeout_thread.is_alive():
-            self.timeout_thread.join(timeout=2)
+        self.timeouts.stop()
         
         # Compléter toutes les requêtes en attente avec une erreur
         with self.lock:
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour les files bornées et la contre-pression des canaux.
+"""
+
+import threading
+import time
+import unittest
+
+from argumentation_analysis.core.communication.message import Message, MessageType, MessagePriority, AgentLevel
+from argumentation_analysis.core.communication.backpressure import QueuePressure, OverflowPolicy
+from argumentation_analysis.core.communication.channel_interface import ChannelFullException, ChannelType
+from argumentation_analysis.core.communication.hierarchical_channel import HierarchicalChannel
+from argumentation_analysis.core.communication.data_channel import DataChannel
+from argumentation_analysis.core.communication.collaboration_channel import CollaborationChannel
+from argumentation_analysis.core.communication.middleware import MessageMiddleware
+from argumentation_analysis.core.communication.message_queue import PriorityMessageQueue
+
+
+def create_command(priority: MessagePriority = MessagePriority.NORMAL, index: int = 0,
+                   recipient: str = "operational-agent-1") -> Message:
+    """Crée un message de commande de test."""
+    return Message(
+        message_type=MessageType.COMMAND,
+        sender="tactical-agent-1",
+        sender_level=AgentLevel.TACTICAL,
+        content={"command_type": "analyze_text", "parameters": {"index": index}},
+        recipient=recipient,
+        priority=priority
+    )
+
+
+class TestQueuePressure(unittest.TestCase):
+    """Tests pour la classe QueuePressure."""
+
+    def test_unbounded_by_default(self):
+        """Sans capacité configurée, les files ne sont pas bornées."""
+        pressure = QueuePressure()
+        self.assertFalse(pressure.bounded)
+        self.assertIsNone(pressure.update("agent", 10000))
+
+    def test_water_marks(self):
+        """La congestion commence aux hautes eaux et cesse sous les basses eaux."""
+        pressure = QueuePressure({"queue_capacity": 10})
+        self.assertEqual((pressure.high_water, pressure.low_water), (8, 5))
+
+        self.assertIsNone(pressure.update("agent", 7))
+        self.assertTrue(pressure.update("agent", 8))
+        self.assertIsNone(pressure.update("agent", 6))
+        self.assertFalse(pressure.update("agent", 5))
+        self.assertEqual(pressure.stats["max_depth"], 8)
+
+    def test_invalid_configuration(self):
+        """Une capacité nulle ou une politique inconnue est refusée."""
+        with self.assertRaises(ValueError):
+            QueuePressure({"queue_capacity": 0})
+        with self.assertRaises(ValueError):
+            QueuePressure({"queue_capacity": 1, "overflow_policy": "unknown"})
+
+
+class TestPriorityMessageQueuePopLowest(unittest.TestCase):
+    """Tests pour PriorityMessageQueue.pop_lowest."""
+
+    def test_pop_lowest(self):
+        """Le message retiré est le moins prioritaire et le plus récent à priorité égale."""
+        message_queue = PriorityMessageQueue()
+        messages = [
+            create_command(MessagePriority.LOW, 0),
+            create_command(MessagePriority.HIGH, 1),
+            create_command(MessagePriority.LOW, 2),
+            create_command(MessagePriority.NORMAL, 3)
+        ]
+        for message in messages:
+            message_queue.put(message)
+
+        self.assertIs(message_queue.pop_lowest(), messages[2])
+        # Aucun message strictement moins prioritaire que LOW (rang 3)
+        self.assertIsNone(message_queue.pop_lowest(below=3))
+        self.assertEqual([message_queue.pop() for _ in range(3)], [messages[1], messages[3], messages[0]])
+
+
+class TestHierarchicalChannelBackpressure(unittest.TestCase):
+    """Tests des politiques de débordement du canal hiérarchique."""
+
+    def create_channel(self, policy: OverflowPolicy, **config) -> HierarchicalChannel:
+        """Crée un canal dont les files contiennent au plus trois messages."""
+        return HierarchicalChannel("hierarchical", {
+            "queue_capacity": 3, "overflow_policy": policy.value, **config
+        })
+
+    def test_reject(self):
+        """Avec la politique "reject", l'envoi dans une file pleine lève une exception."""
+        channel = self.create_channel(OverflowPolicy.REJECT)
+        for index in range(3):
+            self.assertTrue(channel.send_message(create_command(index=index)))
+
+        with self.assertRaises(ChannelFullException):
+            channel.send_message(create_command(index=3))
+
+        # Les autres destinataires ne sont pas affectés
+        self.assertTrue(channel.send_message(create_command(recipient="operational-agent-2")))
+        self.assertEqual(channel.get_channel_info()["backpressure"]["rejected"], 1)
+
+    def test_drop_lowest_priority(self):
+        """Avec la politique "drop_lowest_priority", le message le moins prioritaire est abandonné."""
+        channel = self.create_channel(OverflowPolicy.DROP_LOWEST_PRIORITY)
+        for index, priority in enumerate([MessagePriority.NORMAL, MessagePriority.LOW, MessagePriority.NORMAL]):
+            channel.send_message(create_command(priority, index))
+
+        # Un message plus prioritaire évince le message LOW
+        self.assertTrue(channel.send_message(create_command(MessagePriority.HIGH, 3)))
+        # Un message LOW est lui-même abandonné
+        self.assertFalse(channel.send_message(create_command(MessagePriority.LOW, 4)))
+
+        indexes = [message.content["parameters"]["index"] for message in channel.get_pending_messages("operational-agent-1")]
+        self.assertEqual(indexes, [3, 0, 2])
+        self.assertEqual(channel.get_channel_info()["backpressure"]["dropped"], 2)
+
+    def test_block(self):
+        """Avec la politique "block", l'émetteur attend qu'une place se libère."""
+        channel = self.create_channel(OverflowPolicy.BLOCK, block_timeout=5.0)
+        for index in range(3):
+            channel.send_message(create_command(index=index))
+
+        def consume():
+            time.sleep(0.1)
+            channel.receive_message("operational-agent-1", timeout=0)
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        start = time.monotonic()
+        self.assertTrue(channel.send_message(create_command(index=3)))
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        consumer.join()
+
+    def test_block_timeout(self):
+        """L'attente de la politique "block" est bornée par `block_timeout`."""
+        channel = self.create_channel(OverflowPolicy.BLOCK, block_timeout=0.05)
+        for index in range(3):
+            channel.send_message(create_command(index=index))
+
+        with self.assertRaises(ChannelFullException):
+            channel.send_message(create_command(index=3))
+
+    def test_pressure_signals_and_gauges(self):
+        """Les transitions de congestion sont signalées et visibles dans les jauges."""
+        channel = HierarchicalChannel("hierarchical", {"queue_capacity": 4})
+        events = []
+        channel.add_pressure_listener(lambda recipient, congested: events.append((recipient, congested)))
+
+        for index in range(4):
+            channel.send_message(create_command(index=index))
+        gauges = channel.get_channel_info()["backpressure"]
+        self.assertEqual(gauges["congested"], ["operational-agent-1"])
+        self.assertEqual(gauges["queue_depths"]["operational-agent-1"]["depth"], 4)
+        self.assertEqual(gauges["queue_depths"]["operational-agent-1"]["utilization"], 1.0)
+
+        for _ in range(2):
+            channel.receive_message("operational-agent-1", timeout=0)
+        self.assertEqual(events, [("operational-agent-1", True), ("operational-agent-1", False)])
+
+
+class TestOtherChannelsBackpressure(unittest.TestCase):
+    """Tests des files bornées des canaux de données et de collaboration."""
+
+    def test_data_channel_reject(self):
+        """Le canal de données applique la capacité par destinataire."""
+        channel = DataChannel("data", {"queue_capacity": 2})
+        channel.send_message(create_command(index=0))
+        channel.send_message(create_command(index=1))
+        with self.assertRaises(ChannelFullException):
+            channel.send_message(create_command(index=2))
+
+        channel.receive_message("operational-agent-1")
+        self.assertTrue(channel.send_message(create_command(index=2)))
+        self.assertEqual(channel.get_channel_info()["backpressure"]["queue_depths"]["operational-agent-1"]["depth"], 2)
+
+    def test_data_channel_eviction_keeps_queued_payloads(self):
+        """Les données des messages en attente ne sont pas évincées par le budget d'octets du stockage."""
+        channel = DataChannel("data", {
+            "queue_capacity": 3, "max_inline_data_size": 100, "max_bytes": 400
+        })
+        for index in range(3):
+            message = create_command(index=index)
+            message.content["data"] = {"text": str(index) * 300}
+            self.assertTrue(channel.send_message(message))
+        with self.assertRaises(ChannelFullException):
+            channel.send_message(create_command(index=3))
+        
+        store_info = channel.data_store.get_store_info()
+        self.assertEqual((store_info["item_count"], store_info["pinned_items"]), (3, 3))
+        
+        for index in range(3):
+            message = channel.receive_message("operational-agent-1")
+            self.assertEqual(message.content["data"], {"text": str(index) * 300})
+        
+        # Une fois livrées, les données redeviennent évinçables
+        store_info = channel.data_store.get_store_info()
+        self.assertEqual(store_info["pinned_items"], 0)
+        self.assertLessEqual(store_info["backend_bytes"], 400)
+        self.assertEqual(store_info["stats"]["evicted_items"], 2)
+
+    def test_collaboration_channel_direct_messages(self):
+        """Les messages directs lus quittent la file et libèrent de la place."""
+        channel = CollaborationChannel("collaboration", {
+            "queue_capacity": 2, "overflow_policy": "drop_lowest_priority"
+        })
+        channel.send_message(create_command(MessagePriority.LOW, 0))
+        channel.send_message(create_command(MessagePriority.NORMAL, 1))
+        self.assertTrue(channel.send_message(create_command(MessagePriority.HIGH, 2)))
+
+        received = [channel.receive_message("operational-agent-1").content["parameters"]["index"] for _ in range(2)]
+        self.assertEqual(received, [1, 2])
+        self.assertIsNone(channel.receive_message("operational-agent-1"))
+        self.assertEqual(channel.get_channel_info()["queue_sizes"], {"operational-agent-1": 0})
+
+
+class TestMiddlewareBackpressure(unittest.TestCase):
+    """Tests de la contre-pression exposée par le middleware."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.middleware = MessageMiddleware()
+        self.middleware.register_channel(HierarchicalChannel("hierarchical", {"queue_capacity": 2}))
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.middleware.shutdown()
+
+    def test_rejection_and_congestion(self):
+        """Un envoi refusé retourne False et la congestion est relayée aux écouteurs."""
+        events = []
+        self.middleware.add_backpressure_listener(lambda recipient, congested: events.append((recipient, congested)))
+
+        self.assertTrue(self.middleware.send_message(create_command(index=0)))
+        self.assertTrue(self.middleware.send_message(create_command(index=1)))
+        self.assertTrue(self.middleware.is_congested("operational-agent-1"))
+        self.assertFalse(self.middleware.send_message(create_command(index=2)))
+
+        stats = self.middleware.get_statistics()
+        self.assertEqual(stats["by_channel"][ChannelType.HIERARCHICAL.value]["errors"], 1)
+
+        self.middleware.receive_message("operational-agent-1", timeout=0)
+        self.middleware.receive_message("operational-agent-1", timeout=0)
+        self.assertFalse(self.middleware.is_congested("operational-agent-1"))
+        self.assertEqual(events, [("operational-agent-1", True), ("operational-agent-1", False)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,13 +3,16 @@
 Tests unitaires pour l'interface de canal du système de communication multi-canal.
 """
 
+import asyncio
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
 from argumentation_analysis.core.communication.channel_interface import (
     Channel, ChannelType, ChannelException, ChannelFullException,
     ChannelTimeoutException, ChannelClosedException, InvalidMessageException,
-    UnauthorizedAccessException
+    UnauthorizedAccessException, MessageNotifier
 )
 from argumentation_analysis.core.communication.message import Message, MessageType, MessagePriority, AgentLevel
 
@@ -258,5 +261,58 @@ class TestChannelExceptions(unittest.TestCase):
             self.assertEqual(str(e), "Timeout sur le canal")
 
 
+class TestMessageNotifier(unittest.TestCase):
+    """Tests pour le mécanisme de notification par destinataire."""
+    
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.notifier = MessageNotifier()
+    
+    def test_wait_returns_immediately_if_sequence_changed(self):
+        """Un dépôt survenu après la lecture de la séquence n'est pas perdu."""
+        sequence = self.notifier.get_sequence("agent-1")
+        self.notifier.notify("agent-1")
+        
+        self.assertTrue(self.notifier.wait("agent-1", sequence, timeout=0))
+    
+    def test_wait_timeout(self):
+        """Sans dépôt, l'attente expire et retourne False."""
+        sequence = self.notifier.get_sequence("agent-1")
+        self.notifier.notify("agent-2")
+        
+        self.assertFalse(self.notifier.wait("agent-1", sequence, timeout=0.05))
+    
+    def test_wait_woken_by_notify(self):
+        """Un thread bloqué est réveillé par un dépôt pour son destinataire."""
+        sequence = self.notifier.get_sequence("agent-1")
+        timer = threading.Timer(0.05, self.notifier.notify, args=("agent-1",))
+        timer.start()
+        
+        start = time.monotonic()
+        self.assertTrue(self.notifier.wait("agent-1", sequence, timeout=5))
+        self.assertLess(time.monotonic() - start, 1)
+        timer.join()
+    
+    def test_wait_async_woken_by_notify_from_thread(self):
+        """Une coroutine en attente est réveillée par un dépôt effectué depuis un autre thread."""
+        async def scenario():
+            sequence = self.notifier.get_sequence("agent-1")
+            timer = threading.Timer(0.05, self.notifier.notify, args=("agent-1",))
+            timer.start()
+            result = await self.notifier.wait_async("agent-1", sequence, timeout=5)
+            timer.join()
+            return result
+        
+        self.assertTrue(asyncio.run(scenario()))
+    
+    def test_wait_async_timeout(self):
+        """Sans dépôt, l'attente asynchrone expire et retourne False."""
+        async def scenario():
+            sequence = self.notifier.get_sequence("agent-1")
+            return await self.notifier.wait_async("agent-1", sequence, timeout=0.05)
+        
+        self.assertFalse(asyncio.run(scenario()))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour le stockage de données du canal de données et ses backends.
+"""
+
+import gzip
+import json
+import shutil
+import tempfile
+import unittest
+
+from argumentation_analysis.core.communication.data_channel import DataStore
+from argumentation_analysis.core.communication.data_store_backend import (
+    MemoryDataStoreBackend, SegmentFileDataStoreBackend
+)
+
+
+class TestSegmentFileDataStoreBackend(unittest.TestCase):
+    """Tests pour le backend à fichier segment."""
+    
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.directory = tempfile.mkdtemp()
+        self.backend = SegmentFileDataStoreBackend(self.directory, "test", min_compaction_size=0)
+    
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.backend.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+    
+    def test_write_read_delete(self):
+        """Les charges utiles sont relues via des vues mémoire."""
+        self.backend.write("a", b"alpha")
+        self.backend.write("b", b"beta")
+        
+        view = self.backend.read("b")
+        
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(view.tobytes(), b"beta")
+        self.assertEqual(self.backend.get_size(), 9)
+        self.assertTrue(self.backend.delete("a"))
+        self.assertNotIn("a", self.backend)
+        with self.assertRaises(KeyError):
+            self.backend.read("a")
+    
+    def test_compaction_keeps_live_payloads_and_views(self):
+        """Le compactage conserve les charges vivantes et les vues déjà rendues."""
+        self.backend.write("a", b"a" * 100)
+        self.backend.write("b", b"b" * 100)
+        view = self.backend.read("a")
+        
+        self.backend.delete("a")  # 50 % d'octets morts: compactage
+        
+        self.assertEqual(self.backend.get_file_size(), 100)
+        self.assertEqual(self.backend.read("b").tobytes(), b"b" * 100)
+        self.assertEqual(view.tobytes(), b"a" * 100)
+
+
+class TestDataStore(unittest.TestCase):
+    """Tests pour la classe DataStore."""
+    
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.directory = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+    
+    def test_compressed_payload_is_stored_as_raw_bytes(self):
+        """Les données compressées sont stockées en gzip brut, sans base64."""
+        store = DataStore("store")
+        data = {"text": "argument " * 500}
+        version_id = store.store_data("item", data)
+        
+        raw, info = store.get_raw_data("item", version_id)
+        
+        self.assertTrue(info["is_compressed"])
+        self.assertEqual(len(raw), info["compressed_size"])
+        self.assertEqual(json.loads(gzip.decompress(raw)), data)
+        self.assertEqual(store.get_data("item")[0], data)
+    
+    def test_version_retention_policy(self):
+        """Seules les `max_versions` dernières versions sont conservées."""
+        store = DataStore("store", {"max_versions": 2})
+        versions = [store.store_data("item", {"value": index}) for index in range(4)]
+        
+        self.assertEqual(store.get_versions("item"), versions[2:])
+        self.assertEqual(store.get_data("item")[0], {"value": 3})
+        with self.assertRaises(KeyError):
+            store.get_data("item", versions[0])
+    
+    def test_byte_budget_evicts_least_recently_used(self):
+        """Au-delà du budget, l'élément le moins récemment utilisé est évincé."""
+        store = DataStore("store", {"max_bytes": 250})
+        for name in ("a", "b"):
+            store.store_data(name, {"value": name * 100}, compress=False)
+        store.get_data("a")  # "b" devient le moins récemment utilisé
+        
+        store.store_data("c", {"value": "c" * 100}, compress=False)
+        
+        self.assertEqual(store.get_versions("b"), [])
+        self.assertEqual(store.get_data("a")[0], {"value": "a" * 100})
+        self.assertEqual(store.get_store_info()["stats"]["evicted_items"], 1)
+    
+    def test_pinned_items_are_not_evicted(self):
+        """Un élément épinglé dépasse le budget sans être évincé, jusqu'à sa libération."""
+        store = DataStore("store", {"max_bytes": 250})
+        version_a = store.store_data("a", {"value": "a" * 100}, compress=False, pin=True)
+        store.store_data("b", {"value": "b" * 100}, compress=False)
+        store.store_data("c", {"value": "c" * 100}, compress=False)
+        
+        # "a" est le moins récemment utilisé, mais épinglé : "b" est évincé à sa place
+        self.assertEqual(store.get_versions("b"), [])
+        self.assertEqual(store.get_versions("a"), [version_a])
+        self.assertEqual(store.get_store_info()["pinned_items"], 1)
+        
+        store.release("a", version_a)
+        store.store_data("d", {"value": "d" * 100}, compress=False)
+        self.assertEqual(store.get_store_info()["pinned_items"], 0)
+        self.assertEqual(store.get_versions("a"), [])
+        self.assertFalse(store.pin("a", version_a))
+    
+    def test_byte_budget_spills_to_segment_file(self):
+        """Avec spill_to_disk, les éléments évincés sont déplacés sur disque."""
+        store = DataStore("store", {
+            "max_bytes": 250,
+            "spill_to_disk": True,
+            "spill_directory": self.directory
+        })
+        for name in ("a", "b", "c"):
+            store.store_data(name, {"value": name * 100}, compress=False)
+        
+        info = store.get_data_info("a")
+        
+        self.assertEqual(info["location"], "disk")
+        self.assertEqual(store.get_data("a")[0], {"value": "a" * 100})
+        self.assertEqual(store.get_store_info()["stats"]["spilled_items"], 1)
+        self.assertTrue(store.delete_data("a"))
+        self.assertEqual(store.get_store_info()["spilled_bytes"], 0)
+        store.close()
+    
+    def test_segment_backend_from_config(self):
+        """Le backend segment peut être choisi par configuration."""
+        store = DataStore("store", {"backend": "segment", "spill_directory": self.directory})
+        store.store_data("item", {"value": 1})
+        
+        self.assertIsInstance(store.backend, SegmentFileDataStoreBackend)
+        self.assertEqual(store.get_data("item")[0], {"value": 1})
+        store.close()
+    
+    def test_default_backend_is_memory(self):
+        """Par défaut, les données restent en mémoire."""
+        store = DataStore("store")
+        
+        self.assertIsInstance(store.backend, MemoryDataStoreBackend)
+
+
+if __name__ == "__main__":
+    unittest.main()
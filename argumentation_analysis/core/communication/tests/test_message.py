@@ -370,5 +370,71 @@ class TestEventMessage(unittest.TestCase):
         self.assertEqual(event.content["recommended_action"], "Libérer des ressources non utilisées")
 
 
+class TestCompactMessage(unittest.TestCase):
+    """Tests de la représentation compacte des messages."""
+    
+    def create_message(self, priority=MessagePriority.NORMAL, **kwargs):
+        """Crée un message de test."""
+        return Message(
+            message_type=MessageType.COMMAND,
+            sender="strategic-agent-1",
+            sender_level=AgentLevel.STRATEGIC,
+            content={"command_type": "analyze_text"},
+            recipient="tactical-agent-1",
+            priority=priority,
+            **kwargs
+        )
+    
+    def test_slots(self):
+        """Les messages et leurs sous-classes n'ont pas de dictionnaire d'attributs."""
+        self.assertFalse(hasattr(self.create_message(), "__dict__"))
+        event = EventMessage(
+            sender="system", sender_level=AgentLevel.SYSTEM, event_type="error",
+            description="Erreur", details={}
+        )
+        self.assertFalse(hasattr(event, "__dict__"))
+    
+    def test_lazy_id_and_timestamp(self):
+        """L'identifiant et l'horodatage générés sont stables une fois matérialisés."""
+        before = datetime.now()
+        message = self.create_message()
+        after = datetime.now()
+        
+        self.assertRegex(message.id, r"^command-[0-9a-f]{8}$")
+        self.assertEqual(message.id, message.id)
+        self.assertTrue(before <= message.timestamp <= after)
+        self.assertIs(message.timestamp, message.timestamp)
+    
+    def test_ordering(self):
+        """Les messages sont ordonnés par priorité décroissante puis par ancienneté."""
+        old = self.create_message(timestamp=datetime(2024, 1, 1))
+        first = self.create_message()
+        second = self.create_message()
+        urgent = self.create_message(priority=MessagePriority.CRITICAL)
+        
+        self.assertEqual(sorted([second, urgent, first, old]), [urgent, old, first, second])
+    
+    def test_to_dict_cache(self):
+        """Le dictionnaire est réutilisé tant que le message ne change pas."""
+        message = self.create_message()
+        data = message.to_dict()
+        self.assertIs(message.to_dict(), data)
+        
+        message.channel = "hierarchical"
+        self.assertEqual(message.to_dict()["channel"], "hierarchical")
+        
+        message.content = {"command_type": "other"}
+        self.assertIs(message.to_dict()["content"], message.content)
+    
+    def test_pickle(self):
+        """Un message sérialisé par pickle conserve ses champs."""
+        import pickle
+        
+        message = self.create_message(metadata={"conversation_id": "conv-1"})
+        restored = pickle.loads(pickle.dumps(message))
+        self.assertEqual(restored, message)
+        self.assertEqual(restored.to_dict(), message.to_dict())
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour la file de priorité de messages et les canaux qui l'utilisent.
+"""
+
+import threading
+import unittest
+
+from argumentation_analysis.core.communication.message import Message, MessageType, MessagePriority, AgentLevel
+from argumentation_analysis.core.communication.message_queue import PriorityMessageQueue
+from argumentation_analysis.core.communication.data_channel import DataChannel
+from argumentation_analysis.core.communication.hierarchical_channel import HierarchicalChannel
+
+
+def create_message(index, priority=MessagePriority.NORMAL, recipient="operational-agent-1"):
+    """Crée un message de commande numéroté."""
+    return Message(
+        message_type=MessageType.COMMAND,
+        sender="tactical-agent-1",
+        sender_level=AgentLevel.TACTICAL,
+        content={"command_type": "execute_task", "parameters": {"index": index}},
+        recipient=recipient,
+        priority=priority
+    )
+
+
+class TestPriorityMessageQueue(unittest.TestCase):
+    """Tests pour la classe PriorityMessageQueue."""
+    
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.queue = PriorityMessageQueue()
+    
+    def test_pop_order(self):
+        """Les messages sortent par priorité puis par ordre de dépôt."""
+        priorities = [
+            MessagePriority.LOW, MessagePriority.NORMAL, MessagePriority.CRITICAL,
+            MessagePriority.NORMAL, MessagePriority.HIGH, MessagePriority.CRITICAL
+        ]
+        for index, priority in enumerate(priorities):
+            self.queue.put(create_message(index, priority))
+        
+        order = [self.queue.pop().content["parameters"]["index"] for _ in priorities]
+        
+        self.assertEqual(order, [2, 5, 4, 1, 3, 0])
+        self.assertIsNone(self.queue.pop())
+    
+    def test_peek_does_not_drain(self):
+        """La consultation des premiers messages ne modifie pas la file."""
+        for index in range(50):
+            priority = MessagePriority.HIGH if index % 7 == 0 else MessagePriority.NORMAL
+            self.queue.put(create_message(index, priority))
+        
+        expected = self.queue.peek()
+        top = self.queue.peek(10)
+        
+        self.assertEqual(len(self.queue), 50)
+        self.assertEqual([m.id for m in top], [m.id for m in expected[:10]])
+        self.assertEqual([self.queue.pop().id for _ in range(50)], [m.id for m in expected])
+    
+    def test_peek_edge_cases(self):
+        """Consultation d'une file vide, d'un nombre nul ou supérieur à la taille."""
+        self.assertEqual(self.queue.peek(5), [])
+        
+        self.queue.put(create_message(0))
+        
+        self.assertEqual(self.queue.peek(0), [])
+        self.assertEqual(len(self.queue.peek(5)), 1)
+    
+    def test_clear(self):
+        """Le vidage retourne le nombre de messages supprimés."""
+        for index in range(3):
+            self.queue.put(create_message(index))
+        
+        self.assertEqual(self.queue.clear(), 3)
+        self.assertEqual(len(self.queue), 0)
+
+
+class TestDataChannelQueues(unittest.TestCase):
+    """Tests pour les files par destinataire du canal de données."""
+    
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.channel = DataChannel("data", {"history_size": 2})
+    
+    def test_receive_priority_order(self):
+        """Le canal de données délivre les messages par priorité."""
+        self.channel.send_message(create_message(0, MessagePriority.LOW))
+        self.channel.send_message(create_message(1, MessagePriority.HIGH))
+        
+        first = self.channel.receive_message("operational-agent-1")
+        second = self.channel.receive_message("operational-agent-1")
+        
+        self.assertEqual(first.content["parameters"]["index"], 1)
+        self.assertEqual(second.content["parameters"]["index"], 0)
+        self.assertIsNone(self.channel.receive_message("operational-agent-1"))
+    
+    def test_pending_messages_are_not_consumed(self):
+        """Les messages en attente restent disponibles pour la réception."""
+        for index in range(3):
+            self.channel.send_message(create_message(index))
+        
+        pending = self.channel.get_pending_messages("operational-agent-1", max_count=2)
+        
+        self.assertEqual([m.content["parameters"]["index"] for m in pending], [0, 1])
+        self.assertEqual(self.channel.get_channel_info()["queue_sizes"]["operational-agent-1"], 3)
+        self.assertEqual(self.channel.receive_message("operational-agent-1").id, pending[0].id)
+    
+    def test_read_messages_move_to_bounded_history(self):
+        """Les messages lus quittent la file et l'historique est borné."""
+        for index in range(3):
+            self.channel.send_message(create_message(index))
+        for _ in range(3):
+            self.channel.receive_message("operational-agent-1")
+        
+        history = self.channel.get_message_history("operational-agent-1")
+        
+        self.assertEqual([m.content["parameters"]["index"] for m in history], [1, 2])
+        self.assertEqual(self.channel.get_pending_messages("operational-agent-1"), [])
+    
+    def test_large_data_is_restored_on_receive(self):
+        """Les données volumineuses stockées à part sont restituées à la réception."""
+        message = create_message(0)
+        message.content["data"] = {"payload": "x" * 20000}
+        self.channel.send_message(message)
+        
+        pending = self.channel.get_pending_messages("operational-agent-1")
+        received = self.channel.receive_message("operational-agent-1")
+        
+        self.assertEqual(pending[0].content["data"], {"payload": "x" * 20000})
+        self.assertEqual(received.content["data"], {"payload": "x" * 20000})
+
+
+class TestHierarchicalChannelQueues(unittest.TestCase):
+    """Tests pour les files par destinataire du canal hiérarchique."""
+    
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.channel = HierarchicalChannel("hierarchical")
+    
+    def test_pending_messages_peek_without_draining(self):
+        """La consultation ne retire aucun message et respecte l'ordre de réception."""
+        self.channel.send_message(create_message(0, MessagePriority.LOW))
+        self.channel.send_message(create_message(1, MessagePriority.CRITICAL))
+        self.channel.send_message(create_message(2, MessagePriority.NORMAL))
+        
+        pending = self.channel.get_pending_messages("operational-agent-1", max_count=2)
+        info = self.channel.get_channel_info()
+        
+        self.assertEqual([m.content["parameters"]["index"] for m in pending], [1, 2])
+        self.assertEqual(info["queue_sizes"]["operational-agent-1"], 3)
+        self.assertEqual(info["pending_messages"], 3)
+        self.assertEqual(info["stats"]["peek_requests"], 1)
+        self.assertEqual(info["stats"]["peeked_messages"], 2)
+        self.assertEqual(self.channel.receive_message("operational-agent-1", 0).id, pending[0].id)
+    
+    def test_blocking_receive_woken_by_send(self):
+        """Un récepteur bloqué est réveillé par l'envoi d'un message."""
+        timer = threading.Timer(0.05, self.channel.send_message, args=(create_message(0),))
+        timer.start()
+        
+        message = self.channel.receive_message("operational-agent-1", timeout=5)
+        timer.join()
+        
+        self.assertIsNotNone(message)
+        self.assertIsNone(self.channel.receive_message("operational-agent-1", timeout=0.01))
+    
+    def test_clear_queue(self):
+        """Le vidage de la file retourne le nombre de messages supprimés."""
+        for index in range(3):
+            self.channel.send_message(create_message(index))
+        
+        self.assertEqual(self.channel.clear_queue("operational-agent-1"), 3)
+        self.assertEqual(self.channel.get_pending_messages("operational-agent-1"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour les statistiques du middleware.
+"""
+
+import threading
+import unittest
+
+from argumentation_analysis.core.communication.message import Message, MessageType, MessagePriority, AgentLevel
+from argumentation_analysis.core.communication.message_statistics import LogSampler, MessageStatistics
+from argumentation_analysis.core.utils.latency_stats import ThreadLocalCounters, latency_bucket, LATENCY_BUCKETS
+from argumentation_analysis.core.communication.middleware import MessageMiddleware
+from argumentation_analysis.core.communication.hierarchical_channel import HierarchicalChannel
+from argumentation_analysis.core.communication.channel_interface import ChannelType
+
+
+class TestThreadLocalCounters(unittest.TestCase):
+    """Tests pour la classe ThreadLocalCounters."""
+
+    def test_concurrent_increments(self):
+        """Les incréments de plusieurs threads sont tous comptés, y compris après leur fin."""
+        counters = ThreadLocalCounters()
+
+        def worker():
+            for _ in range(10000):
+                counters.add_many(("sent", ("by_type", "command")))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counters.add("sent")
+
+        snapshot = counters.snapshot()
+        self.assertEqual(snapshot["sent"], 80001)
+        self.assertEqual(snapshot[("by_type", "command")], 80000)
+
+        # Les compteurs des threads terminés ont été repliés sans être perdus
+        self.assertEqual(len(counters._shards), 1)
+        self.assertEqual(counters.snapshot()["sent"], 80001)
+
+    def test_dead_threads_pruned_without_reads(self):
+        """Les compteurs des threads terminés sont repliés à l'enregistrement d'un nouveau thread."""
+        counters = ThreadLocalCounters()
+        for _ in range(50):
+            thread = threading.Thread(target=counters.add, args=("sent",))
+            thread.start()
+            thread.join()
+
+        self.assertLessEqual(len(counters._shards), 1)
+        self.assertEqual(counters.snapshot()["sent"], 50)
+        self.assertEqual(counters._shards, [])
+
+
+class TestLatencyHistograms(unittest.TestCase):
+    """Tests des histogrammes de latence."""
+
+    def test_latency_bucket(self):
+        """Les seaux sont des puissances de deux en microsecondes."""
+        self.assertEqual(latency_bucket(0), 0)
+        self.assertEqual(latency_bucket(999), 0)
+        self.assertEqual(latency_bucket(1500), 1)
+        self.assertEqual(latency_bucket(1000000), 10)
+        self.assertEqual(latency_bucket(10 ** 18), LATENCY_BUCKETS - 1)
+
+    def test_summary(self):
+        """Le résumé donne le nombre d'observations, la moyenne et les percentiles."""
+        statistics = MessageStatistics()
+        statistics.register_channel("hierarchical")
+        statistics.register_channel("data")
+        for _ in range(99):
+            statistics.record_sent("hierarchical", "command", "normal", 3000)
+        statistics.record_sent("hierarchical", "command", "high", 3000000)
+
+        stats = statistics.get_statistics()
+        send = stats["latency"]["hierarchical"]["send"]
+        self.assertEqual(send["count"], 100)
+        self.assertAlmostEqual(send["mean_ms"], (99 * 0.003 + 3) / 100)
+        self.assertEqual(send["p50_ms"], 0.004)
+        self.assertEqual(send["p99_ms"], 0.004)
+        self.assertEqual(send["histogram_us"], {4: 99, 4096: 1})
+        self.assertEqual(stats["by_channel"]["data"], {"sent": 0, "received": 0, "errors": 0})
+        self.assertEqual(stats["by_priority"], {"normal": 99, "high": 1})
+
+
+class TestLogSampler(unittest.TestCase):
+    """Tests pour la classe LogSampler."""
+
+    def test_sampling_rate(self):
+        """Un message sur round(1 / taux) est retenu."""
+        for rate, expected in ((1.0, 100), (0.1, 10), (0, 0)):
+            sampler = LogSampler(rate)
+            self.assertEqual(sum(sampler.should_log() for _ in range(100)), expected)
+
+
+class TestMiddlewareStatistics(unittest.TestCase):
+    """Tests des statistiques exposées par le middleware."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.middleware = MessageMiddleware({"log_sample_rate": 0.01})
+        self.middleware.register_channel(HierarchicalChannel("hierarchical"))
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.middleware.shutdown()
+
+    def test_send_and_receive_statistics(self):
+        """Les envois, réceptions et latences sont comptés par canal."""
+        for index in range(3):
+            self.middleware.send_message(Message(
+                message_type=MessageType.COMMAND,
+                sender="strategic-agent-1",
+                sender_level=AgentLevel.STRATEGIC,
+                content={"command_type": "analyze_text", "parameters": {"index": index}},
+                recipient="tactical-agent-1",
+                priority=MessagePriority.HIGH
+            ))
+        self.assertIsNotNone(self.middleware.receive_message("tactical-agent-1", timeout=1.0))
+
+        stats = self.middleware.get_statistics()
+        channel_key = ChannelType.HIERARCHICAL.value
+        self.assertEqual(stats["messages_sent"], 3)
+        self.assertEqual(stats["messages_received"], 1)
+        self.assertEqual(stats["by_channel"][channel_key], {"sent": 3, "received": 1, "errors": 0})
+        self.assertEqual(stats["by_type"], {"command": 3})
+        self.assertEqual(stats["latency"][channel_key]["send"]["count"], 3)
+        self.assertEqual(stats["latency"][channel_key]["delivery"]["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,12 +5,16 @@ Tests unitaires pour le middleware de messagerie du système de communication mu
 
 import unittest
 import asyncio
+import threading
+import time
 from unittest.mock import MagicMock, patch, AsyncMock
 from datetime import datetime
 
 from argumentation_analysis.core.communication.message import Message, MessageType, MessagePriority, AgentLevel
 from argumentation_analysis.core.communication.channel_interface import Channel, ChannelType
 from argumentation_analysis.core.communication.middleware import MessageMiddleware
+from argumentation_analysis.core.communication.hierarchical_channel import HierarchicalChannel
+from argumentation_analysis.core.communication.collaboration_channel import CollaborationChannel
 
 from argumentation_analysis.paths import DATA_DIR
 
@@ -407,6 +411,64 @@ class TestMessageMiddleware(unittest.TestCase):
         mock_pub_sub_protocol.shutdown.assert_called_once()
 
 
+class TestMessageMiddlewareNotifications(unittest.TestCase):
+    """Tests pour le réveil des récepteurs bloqués par les notifications des canaux."""
+    
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.middleware = MessageMiddleware()
+        self.middleware.register_channel(HierarchicalChannel("hierarchical"))
+        self.middleware.register_channel(CollaborationChannel("collaboration"))
+    
+    def _create_message(self, recipient):
+        return Message(
+            message_type=MessageType.COMMAND,
+            sender="strategic-agent-1",
+            sender_level=AgentLevel.STRATEGIC,
+            content={"command_type": "analyze_text", "parameters": {}},
+            recipient=recipient
+        )
+    
+    def test_blocked_receiver_woken_on_send(self):
+        """Un récepteur bloqué sur tous les canaux est réveillé dès l'envoi."""
+        received = []
+        thread = threading.Thread(
+            target=lambda: received.append(self.middleware.receive_message("tactical-agent-1", timeout=5))
+        )
+        thread.start()
+        time.sleep(0.05)
+        
+        start = time.monotonic()
+        self.middleware.send_message(self._create_message("tactical-agent-1"))
+        thread.join(timeout=5)
+        
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(len(received), 1)
+        self.assertIsNotNone(received[0])
+        self.assertEqual(received[0].recipient, "tactical-agent-1")
+    
+    def test_receive_timeout_without_message(self):
+        """Sans message, la réception sur tous les canaux expire."""
+        start = time.monotonic()
+        message = self.middleware.receive_message("tactical-agent-1", timeout=0.1)
+        
+        self.assertIsNone(message)
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+    
+    def test_polling_fallback_for_channels_without_notifications(self):
+        """Les canaux qui ne signalent pas leurs dépôts sont consultés périodiquement."""
+        middleware = MessageMiddleware({"poll_interval": 0.01})
+        channel = MockChannel("system", ChannelType.SYSTEM)
+        middleware.register_channel(channel)
+        
+        timer = threading.Timer(0.05, channel.send_message, args=(self._create_message("tactical-agent-1"),))
+        timer.start()
+        message = middleware.receive_message("tactical-agent-1", timeout=5)
+        timer.join()
+        
+        self.assertIsNotNone(message)
+
+
 class TestMessageMiddlewareAsync(unittest.IsolatedAsyncioTestCase):
     """Tests pour les méthodes asynchrones du middleware de messagerie."""
     
@@ -443,6 +505,32 @@ class TestMessageMiddlewareAsync(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(received_message.sender, "strategic-agent-1")
         self.assertEqual(received_message.recipient, "tactical-agent-1")
     
+    async def test_receive_message_async_does_not_use_executor(self):
+        """La réception asynchrone attend un dépôt sans occuper de thread de l'exécuteur."""
+        self.middleware.register_channel(HierarchicalChannel("hierarchical"))
+        loop = asyncio.get_running_loop()
+        message = Message(
+            message_type=MessageType.COMMAND,
+            sender="strategic-agent-1",
+            sender_level=AgentLevel.STRATEGIC,
+            content={"command_type": "analyze_text", "parameters": {}},
+            recipient="tactical-agent-1"
+        )
+        loop.call_later(0.05, self.middleware.send_message, message)
+        
+        with patch.object(loop, "run_in_executor") as mock_executor:
+            received_message = await self.middleware.receive_message_async("tactical-agent-1", timeout=5)
+        
+        mock_executor.assert_not_called()
+        self.assertIsNotNone(received_message)
+        self.assertEqual(received_message.id, message.id)
+    
+    async def test_receive_message_async_timeout(self):
+        """Sans message, la réception asynchrone expire."""
+        received_message = await self.middleware.receive_message_async("tactical-agent-1", timeout=0.05)
+        
+        self.assertIsNone(received_message)
+    
     @patch('argumentation_analysis.core.communication.request_response.RequestResponseProtocol')
     async def test_send_request_async(self, mock_request_response):
         """Test de la méthode send_request_async."""
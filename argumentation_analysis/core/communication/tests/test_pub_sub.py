@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour l'index des topics et le protocole de publication-abonnement.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from argumentation_analysis.core.communication.message import Message, MessageType, MessagePriority, AgentLevel
+from argumentation_analysis.core.communication.topic_index import TopicTrie, compile_filter, is_topic_pattern
+from argumentation_analysis.core.communication.pub_sub import PublishSubscribeProtocol
+
+
+class TestTopicTrie(unittest.TestCase):
+    """Tests pour la classe TopicTrie."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.trie = TopicTrie()
+        for subscription_id, pattern in [
+            ("exact", "operational_results.task-1"),
+            ("single", "operational_results.*"),
+            ("multi", "operational_results.#"),
+            ("root", "#"),
+            ("other", "tactical_results.*")
+        ]:
+            self.trie.add(pattern, subscription_id, {"pattern": pattern})
+
+    def test_match(self):
+        """Les jokers `*` et `#` sélectionnent les bons abonnements."""
+        self.assertEqual(
+            set(self.trie.match("operational_results.task-1")),
+            {"exact", "single", "multi", "root"}
+        )
+        self.assertEqual(set(self.trie.match("operational_results.task-2")), {"single", "multi", "root"})
+        self.assertEqual(set(self.trie.match("operational_results")), {"multi", "root"})
+        self.assertEqual(set(self.trie.match("operational_results.task-1.step")), {"multi", "root"})
+
+    def test_remove_prunes_nodes(self):
+        """La suppression d'un abonnement élague les nœuds vides."""
+        self.assertTrue(self.trie.remove("other"))
+        self.assertFalse(self.trie.remove("other"))
+        self.assertNotIn("tactical_results", self.trie._root["children"])
+        self.assertEqual(len(self.trie), 4)
+
+    def test_invalid_pattern(self):
+        """Le joker `#` n'est accepté qu'en dernier segment."""
+        with self.assertRaises(ValueError):
+            self.trie.add("operational_results.#.status", "invalid", {})
+
+    def test_is_topic_pattern(self):
+        """Seuls les identifiants contenant un segment joker sont des motifs."""
+        self.assertTrue(is_topic_pattern("operational_results.*"))
+        self.assertFalse(is_topic_pattern("operational_results.task*"))
+
+
+class TestCompileFilter(unittest.TestCase):
+    """Tests pour la fonction compile_filter."""
+
+    def test_compiled_filter(self):
+        """Le prédicat compilé applique les critères de base et de contenu."""
+        message = Message(
+            message_type=MessageType.PUBLICATION,
+            sender="operational_manager",
+            sender_level=AgentLevel.OPERATIONAL,
+            content={"result_type": "task_completion", "tags": ["a"]},
+            priority=MessagePriority.HIGH
+        )
+
+        self.assertTrue(compile_filter(None)(message))
+        self.assertTrue(compile_filter({
+            "sender": ["operational_manager", "other"],
+            "priority": "high",
+            "content": {"result_type": "task_completion"}
+        })(message))
+        self.assertFalse(compile_filter({"sender_level": "tactical"})(message))
+        self.assertFalse(compile_filter({"content": {"missing": 1}})(message))
+        # Valeurs non hachables comparées à une liste
+        self.assertTrue(compile_filter({"content": {"tags": [["a"], ["b"]]}})(message))
+
+
+class TestPublishSubscribeProtocol(unittest.TestCase):
+    """Tests pour la classe PublishSubscribeProtocol."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.middleware = MagicMock()
+        self.protocol = PublishSubscribeProtocol(self.middleware)
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.protocol.running = False
+
+    def test_wildcard_subscription_without_per_task_topics(self):
+        """Un abonnement par motif reçoit les publications sans créer de topic par tâche."""
+        received = []
+        self.protocol.subscribe("operational_results.*", "tactical_coordinator", callback=received.append)
+
+        for index in range(3):
+            recipients = self.protocol.publish(
+                f"operational_results.task-{index}", "operational_manager",
+                AgentLevel.OPERATIONAL, {"result_type": "task_completion"}
+            )
+            self.assertEqual(recipients, ["tactical_coordinator"])
+
+        self.assertEqual([message.metadata["topic"] for message in received], [
+            "operational_results.task-0", "operational_results.task-1", "operational_results.task-2"
+        ])
+        self.assertEqual(self.protocol.get_topics(), [])
+        self.assertEqual(self.protocol.get_patterns(), ["operational_results.*"])
+
+    def test_exact_and_wildcard_subscriptions_with_filter(self):
+        """Les abonnements exacts et par motif appliquent leurs filtres."""
+        exact, wildcard = [], []
+        self.protocol.subscribe("operational_results.task-1", "exact", callback=exact.append)
+        subscription_id = self.protocol.subscribe(
+            "operational_results.#", "wildcard", callback=wildcard.append,
+            filter_criteria={"content": {"result_type": "error"}}
+        )
+
+        self.protocol.publish("operational_results.task-1", "manager", AgentLevel.OPERATIONAL, {"result_type": "ok"})
+        self.protocol.publish("operational_results.task-1", "manager", AgentLevel.OPERATIONAL, {"result_type": "error"})
+
+        self.assertEqual(len(exact), 2)
+        self.assertEqual([message.content["result_type"] for message in wildcard], ["error"])
+        self.assertEqual(self.protocol.get_topic("operational_results.task-1").get_message_count(), 2)
+
+        self.assertTrue(self.protocol.unsubscribe("operational_results.#", subscription_id))
+        self.assertEqual(self.protocol.get_patterns(), [])
+
+    def test_publish_batch(self):
+        """Un abonnement par lot reçoit les messages d'une publication en un seul appel."""
+        batches, single = [], []
+        self.protocol.subscribe("operational_results.*", "batch", callback=batches.append, batch=True)
+        self.protocol.subscribe("operational_results.*", "single", callback=single.append)
+
+        recipients = self.protocol.publish_batch(
+            "operational_results.task-1", "manager", AgentLevel.OPERATIONAL,
+            [{"index": index} for index in range(4)]
+        )
+
+        self.assertEqual(sorted(recipients), ["batch", "single"])
+        self.assertEqual(len(batches), 1)
+        self.assertEqual([message.content["index"] for message in batches[0]], [0, 1, 2, 3])
+        self.assertEqual(len(single), 4)
+        self.assertEqual(self.middleware.send_message.call_count, 4 + 2)
+
+    def test_publish_on_pattern_rejected(self):
+        """La publication sur un motif est refusée."""
+        with self.assertRaises(ValueError):
+            self.protocol.publish("operational_results.*", "manager", AgentLevel.OPERATIONAL, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour l'échéancier de timeouts et le protocole de requête-réponse.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from argumentation_analysis.core.communication.message import Message, MessageType, AgentLevel
+from argumentation_analysis.core.communication.deadline_scheduler import DeadlineHeap, DeadlineScheduler
+from argumentation_analysis.core.communication.request_response import RequestResponseProtocol, RequestTimeoutError
+
+
+def create_response(request):
+    """Crée la réponse à une requête."""
+    return Message(
+        message_type=MessageType.RESPONSE,
+        sender=request.recipient,
+        sender_level=AgentLevel.OPERATIONAL,
+        content={"status": "success"},
+        recipient=request.sender,
+        metadata={
+            "reply_to": request.id,
+            "conversation_id": request.metadata.get("conversation_id")
+        }
+    )
+
+
+class TestDeadlineHeap(unittest.TestCase):
+    """Tests pour la classe DeadlineHeap."""
+
+    def test_pop_expired_in_deadline_order(self):
+        """Seules les échéances passées sont retirées, dans l'ordre."""
+        heap = DeadlineHeap()
+        heap.push("b", 2.0)
+        heap.push("a", 1.0)
+        heap.push("c", 3.0)
+
+        self.assertEqual(heap.pop_expired(2.5), [("a", 1.0), ("b", 2.0)])
+        self.assertEqual(len(heap), 1)
+        self.assertEqual(heap.next_deadline(), 3.0)
+
+    def test_cancel_and_reschedule(self):
+        """Les entrées annulées ou replanifiées sont ignorées."""
+        heap = DeadlineHeap()
+        heap.push("a", 1.0)
+        heap.push("b", 2.0)
+        heap.push("a", 5.0)
+
+        self.assertTrue(heap.cancel("b"))
+        self.assertFalse(heap.cancel("b"))
+        self.assertEqual(heap.next_deadline(), 5.0)
+        self.assertEqual(heap.pop_expired(4.0), [])
+        self.assertEqual(heap.pop_expired(5.0), [("a", 5.0)])
+        self.assertIsNone(heap.next_deadline())
+
+
+class TestDeadlineScheduler(unittest.TestCase):
+    """Tests pour la classe DeadlineScheduler."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.expired = []
+        self.event = threading.Event()
+
+        def on_expire(key):
+            self.expired.append((key, time.monotonic()))
+            self.event.set()
+
+        self.scheduler = DeadlineScheduler(on_expire)
+        self.scheduler.start()
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.scheduler.stop()
+
+    def test_earlier_deadline_wakes_scheduler(self):
+        """Une échéance plus proche que la prochaine échéance connue est honorée."""
+        self.scheduler.schedule("late", 10.0)
+        deadline = self.scheduler.schedule("early", 0.05)
+
+        self.assertTrue(self.event.wait(2.0))
+        key, fired_at = self.expired[0]
+        self.assertEqual(key, "early")
+        self.assertGreaterEqual(fired_at, deadline)
+        self.assertLess(fired_at - deadline, 0.05)
+
+        metrics = self.scheduler.get_metrics()
+        self.assertEqual(metrics["expired"], 1)
+        self.assertEqual(metrics["pending"], 1)
+
+    def test_cancel(self):
+        """Une échéance annulée n'expire pas."""
+        self.scheduler.schedule("request", 0.05)
+        self.assertTrue(self.scheduler.cancel("request"))
+
+        self.assertFalse(self.event.wait(0.2))
+        self.assertEqual(self.scheduler.get_metrics()["cancelled"], 1)
+
+    def test_loop_deadlines(self):
+        """Les échéances d'une boucle asyncio sont déclenchées par la boucle."""
+        threads = []
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            self.scheduler.on_expire = lambda key: threads.append((key, threading.current_thread()))
+            self.scheduler.schedule("second", 0.06, loop=loop)
+            self.scheduler.schedule("first", 0.03, loop=loop)
+            self.scheduler.schedule("cancelled", 0.01, loop=loop)
+            self.scheduler.cancel("cancelled")
+            await asyncio.sleep(0.15)
+
+        asyncio.run(run())
+
+        self.assertEqual([key for key, _ in threads], ["first", "second"])
+        self.assertTrue(all(thread is threading.current_thread() for _, thread in threads))
+
+
+class TestRequestResponseTimeouts(unittest.TestCase):
+    """Tests des timeouts du protocole de requête-réponse."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.middleware = MagicMock()
+        self.protocol = RequestResponseProtocol(self.middleware)
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.protocol.shutdown()
+
+    def test_sync_timeout_removes_pending_request(self):
+        """Une requête synchrone expirée ne reste pas en attente."""
+        with self.assertRaises(RequestTimeoutError):
+            self.protocol.send_request(
+                "tactical-1", AgentLevel.TACTICAL, "operational-1", "analyze", {},
+                timeout=0.05, retry_count=1, retry_delay=0.01
+            )
+
+        self.assertEqual(self.middleware.send_message.call_count, 2)
+        self.assertEqual(self.protocol.get_metrics()["pending_requests"], 0)
+
+    def test_callback_retry_then_timeout(self):
+        """Une requête avec callback est renvoyée puis expire avec une erreur."""
+        done = threading.Event()
+        results = []
+
+        def callback(response, error):
+            results.append((response, error))
+            done.set()
+
+        self.protocol.send_request_async_callback(
+            "tactical-1", AgentLevel.TACTICAL, "operational-1", "analyze", {},
+            callback, timeout=0.05, retry_count=1, retry_delay=0.01
+        )
+
+        self.assertTrue(done.wait(2.0))
+        self.assertIsNone(results[0][0])
+        self.assertIsInstance(results[0][1], RequestTimeoutError)
+        self.assertEqual(self.middleware.send_message.call_count, 2)
+        self.assertEqual(self.protocol.pending_requests, {})
+        self.assertGreaterEqual(self.protocol.get_metrics()["timeouts"]["expired"], 2)
+
+    def test_callback_response_cancels_deadline(self):
+        """Une réponse reçue annule l'échéance de la requête."""
+        results = []
+        request_id = self.protocol.send_request_async_callback(
+            "tactical-1", AgentLevel.TACTICAL, "operational-1", "analyze", {},
+            lambda response, error: results.append((response, error)), timeout=5.0
+        )
+        request = self.middleware.send_message.call_args[0][0]
+
+        self.assertTrue(self.protocol.handle_response(create_response(request)))
+        self.assertIsNone(results[0][1])
+        self.assertNotIn(request_id, self.protocol.pending_requests)
+        self.assertEqual(self.protocol.get_metrics()["timeouts"]["pending"], 0)
+
+
+class TestRequestResponseAsyncTimeouts(unittest.IsolatedAsyncioTestCase):
+    """Tests des timeouts asynchrones du protocole de requête-réponse."""
+
+    async def asyncSetUp(self):
+        """Initialisation avant chaque test."""
+        self.middleware = MagicMock()
+        self.protocol = RequestResponseProtocol(self.middleware)
+
+    async def asyncTearDown(self):
+        """Nettoyage après chaque test."""
+        self.protocol.shutdown()
+
+    async def test_async_timeout_with_retry(self):
+        """Une requête asynchrone expire après toutes ses tentatives."""
+        start = time.monotonic()
+        with self.assertRaises(RequestTimeoutError):
+            await self.protocol.send_request_async(
+                "tactical-1", AgentLevel.TACTICAL, "operational-1", "analyze", {},
+                timeout=0.05, retry_count=1, retry_delay=0.01
+            )
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(self.middleware.send_message.call_count, 2)
+        self.assertEqual(self.protocol.pending_requests, {})
+
+    async def test_async_response_removes_pending_request(self):
+        """Une requête asynchrone satisfaite ne laisse ni requête ni échéance en attente."""
+        loop = asyncio.get_running_loop()
+
+        def reply(request):
+            loop.call_later(0.01, self.protocol.handle_response, create_response(request))
+
+        self.middleware.send_message.side_effect = reply
+
+        response = await self.protocol.send_request_async(
+            "tactical-1", AgentLevel.TACTICAL, "operational-1", "analyze", {}, timeout=5.0
+        )
+
+        self.assertEqual(response.content["status"], "success")
+        metrics = self.protocol.get_metrics()
+        self.assertEqual(metrics["pending_requests"], 0)
+        self.assertEqual(metrics["timeouts"]["pending"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
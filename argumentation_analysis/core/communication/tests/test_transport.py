@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour l'encodage binaire des messages et le transport inter-processus.
+"""
+
+import array
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from argumentation_analysis.core.communication.message import Message, MessageType, MessagePriority, AgentLevel
+from argumentation_analysis.core.communication.message_codec import (
+    CODEC_VERSION, CodecError, encode_value, decode_value, encode_message, decode_message
+)
+from argumentation_analysis.core.communication.transport import RemoteChannel
+from argumentation_analysis.core.communication.middleware import MessageMiddleware
+from argumentation_analysis.core.communication.hierarchical_channel import HierarchicalChannel
+from argumentation_analysis.core.communication.channel_interface import ChannelType
+
+
+def create_command(recipient: str = "tactical-agent-1", index: int = 0) -> Message:
+    """Crée un message de commande de test."""
+    return Message(
+        message_type=MessageType.COMMAND,
+        sender="strategic-agent-1",
+        sender_level=AgentLevel.STRATEGIC,
+        content={"command_type": "analyze_text", "parameters": {"index": index}},
+        recipient=recipient,
+        priority=MessagePriority.HIGH
+    )
+
+
+def _remote_sender(address: str, count: int) -> None:
+    """Processus enfant : envoie des commandes via un middleware relié au serveur."""
+    middleware = MessageMiddleware()
+    middleware.connect_remote_channel(ChannelType.HIERARCHICAL, address)
+    for index in range(count):
+        middleware.send_message(create_command(index=index))
+    middleware.shutdown()
+
+
+class TestMessageCodec(unittest.TestCase):
+    """Tests pour l'encodage binaire."""
+
+    def test_value_round_trip(self):
+        """Les types natifs sont restitués à l'identique."""
+        value = {
+            "none": None, "flags": [True, False], "int": -42, "big": 1 << 80,
+            "float": 1.5, "text": "déjà vu", "raw": b"\x00\xff", "nested": {"list": [1, [2, 3]]}
+        }
+        self.assertEqual(decode_value(encode_value(value)), value)
+
+    def test_conversions(self):
+        """Les énumérations, chemins, dates et tuples sont convertis."""
+        value = {
+            "level": AgentLevel.TACTICAL,
+            "path": Path("data") / "file.txt",
+            "date": datetime(2024, 1, 2, 3, 4, 5),
+            "pair": (1, 2)
+        }
+        self.assertEqual(decode_value(encode_value(value)), {
+            "level": "tactical",
+            "path": os.path.join("data", "file.txt"),
+            "date": "2024-01-02T03:04:05",
+            "pair": [1, 2]
+        })
+
+    def test_invalid_data(self):
+        """Les types non supportés et les données tronquées sont rejetés."""
+        with self.assertRaises(CodecError):
+            encode_value(object())
+        with self.assertRaises(CodecError):
+            decode_value(encode_value("abc")[:-1])
+        with self.assertRaises(CodecError):
+            decode_value(encode_value(1) + b"\x00")
+
+    def test_message_round_trip(self):
+        """Un message encodé est décodé avec les mêmes champs."""
+        message = create_command()
+        decoded = decode_message(encode_message(message))
+        self.assertEqual(decoded.to_dict(), message.to_dict())
+
+    def test_message_format_version(self):
+        """Le format positionnel est plus compact que le dictionnaire complet ; une autre version est rejetée."""
+        message = create_command()
+        full_dict = bytes((CODEC_VERSION,)) + encode_value(message.to_dict())
+        self.assertLess(len(encode_message(message)), len(full_dict))
+        for version in (1, 99):
+            with self.assertRaises(CodecError):
+                decode_message(bytes((version,)) + encode_value(message.to_dict()))
+
+    def test_typed_memoryview(self):
+        """Une memoryview de format non octet est encodée avec sa longueur en octets."""
+        view = memoryview(array.array("i", [1, 2, 3]))
+        self.assertEqual(decode_value(encode_value(view)), view.tobytes())
+
+
+class TestRemoteChannel(unittest.TestCase):
+    """Tests du canal distant relié à un serveur local."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.address = os.path.join(self.tempdir.name, "hierarchical.sock")
+
+        self.server_middleware = MessageMiddleware()
+        self.server_middleware.register_channel(HierarchicalChannel("hierarchical"))
+        self.server_middleware.serve_channel(ChannelType.HIERARCHICAL, self.address)
+
+        self.client_middleware = MessageMiddleware()
+        self.remote = self.client_middleware.connect_remote_channel(ChannelType.HIERARCHICAL, self.address)
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.client_middleware.shutdown()
+        self.server_middleware.shutdown()
+        self.tempdir.cleanup()
+
+    def test_send_and_receive(self):
+        """Les messages envoyés par le client sont reçus côté serveur, et inversement."""
+        self.assertTrue(self.client_middleware.send_message(create_command()))
+        received = self.server_middleware.receive_message("tactical-agent-1", timeout=1.0)
+        self.assertIsNotNone(received)
+        self.assertEqual(received.content["command_type"], "analyze_text")
+
+        self.server_middleware.send_message(create_command(recipient="operational-agent-1"))
+        received = self.client_middleware.receive_message("operational-agent-1", timeout=1.0)
+        self.assertIsNotNone(received)
+        self.assertEqual(received.sender, "strategic-agent-1")
+
+    def test_pending_messages_and_info(self):
+        """Les messages en attente et les informations du canal sont relayés."""
+        for index in range(3):
+            self.server_middleware.send_message(create_command(index=index))
+
+        pending = self.remote.get_pending_messages("tactical-agent-1")
+        self.assertEqual([message.content["parameters"]["index"] for message in pending], [0, 1, 2])
+
+        info = self.remote.get_channel_info()
+        self.assertTrue(info["connected"])
+        self.assertEqual(info["remote"]["id"], "hierarchical")
+
+    def test_blocking_receive_woken_by_notification(self):
+        """Une réception bloquante du client est réveillée par un dépôt côté serveur."""
+        self.assertTrue(self.remote.supports_notifications)
+        result = {}
+
+        def receiver():
+            start = time.monotonic()
+            result["message"] = self.client_middleware.receive_message("tactical-agent-1", timeout=5.0)
+            result["elapsed"] = time.monotonic() - start
+
+        thread = threading.Thread(target=receiver)
+        thread.start()
+        time.sleep(0.1)
+        self.server_middleware.send_message(create_command())
+        thread.join(5.0)
+
+        self.assertIsNotNone(result["message"])
+        self.assertLess(result["elapsed"], 2.0)
+
+    def test_subscribe(self):
+        """Les callbacks d'abonnement sont appelés dans le processus client."""
+        received = []
+        event = threading.Event()
+
+        def callback(message):
+            received.append(message)
+            event.set()
+
+        subscription_id = self.remote.subscribe("observer", callback)
+        self.server_middleware.send_message(create_command())
+
+        self.assertTrue(event.wait(2.0))
+        self.assertEqual(received[0].recipient, "tactical-agent-1")
+        self.assertTrue(self.remote.unsubscribe(subscription_id))
+
+    def test_subscribe_on_fresh_connection(self):
+        """Un abonnement ouvrant la connexion n'est enregistré qu'une fois côté serveur."""
+        server_channel = self.server_middleware.get_channel(ChannelType.HIERARCHICAL)
+        remote = RemoteChannel("fresh", ChannelType.HIERARCHICAL, self.address)
+        received = []
+        event = threading.Event()
+
+        def callback(message):
+            received.append(message)
+            event.set()
+
+        try:
+            subscription_id = remote.subscribe("observer", callback)
+            self.assertEqual(len(server_channel.subscribers), 1)
+
+            self.server_middleware.send_message(create_command())
+            self.assertTrue(event.wait(2.0))
+            time.sleep(0.2)
+            self.assertEqual(len(received), 1)
+
+            self.assertTrue(remote.unsubscribe(subscription_id))
+            self.assertEqual(server_channel.subscribers, {})
+        finally:
+            remote.close()
+
+    def test_reconnect_after_server_restart(self):
+        """Le client rétablit sa connexion après un redémarrage du serveur."""
+        self.assertTrue(self.remote.send_message(create_command()))
+
+        server = self.server_middleware.channel_servers[0]
+        server.stop()
+        server.start()
+
+        # La première opération peut constater la coupure ; les suivantes se reconnectent
+        deadline = time.monotonic() + 2.0
+        while not self.remote.send_message(create_command(index=1)):
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.05)
+
+        pending = self.server_middleware.get_pending_messages("tactical-agent-1")
+        self.assertGreaterEqual(len(pending), 2)
+
+
+class TestCrossProcessTransport(unittest.TestCase):
+    """Tests du transport entre deux processus."""
+
+    def test_messages_from_child_process(self):
+        """Un processus enfant envoie des messages reçus par le middleware parent."""
+        with tempfile.TemporaryDirectory() as tempdir:
+            address = os.path.join(tempdir, "hierarchical.sock")
+            middleware = MessageMiddleware()
+            middleware.register_channel(HierarchicalChannel("hierarchical"))
+            middleware.serve_channel(ChannelType.HIERARCHICAL, address)
+
+            try:
+                process = multiprocessing.get_context("spawn").Process(target=_remote_sender, args=(address, 5))
+                process.start()
+
+                indexes = []
+                for _ in range(5):
+                    message = middleware.receive_message("tactical-agent-1", timeout=30.0)
+                    self.assertIsNotNone(message)
+                    indexes.append(message.content["parameters"]["index"])
+
+                process.join(30.0)
+                self.assertEqual(process.exitcode, 0)
+                self.assertEqual(indexes, [0, 1, 2, 3, 4])
+            finally:
+                middleware.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
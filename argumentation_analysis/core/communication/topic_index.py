@@ -0,0 +1,240 @@
+"""
+Index des abonnements par motif de topic pour le protocole de publication-abonnement.
+
+Les noms de topics sont hiérarchiques, leurs segments étant séparés par des
+points (`operational_results.task-42`). Un motif d'abonnement peut contenir
+deux jokers :
+- `*` correspond à exactement un segment (`operational_results.*`) ;
+- `#`, uniquement en dernier segment, correspond à zéro segment ou plus
+  (`operational_results.#`).
+
+Les motifs sont rangés dans un trie indexé par segment, de sorte que la
+recherche des abonnements correspondant à un topic ne dépend que de la
+profondeur du nom et du nombre d'abonnements concernés.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from .message import Message
+
+
+SEGMENT_SEPARATOR = "."
+SINGLE_WILDCARD = "*"
+MULTI_WILDCARD = "#"
+
+
+def split_topic(topic_id: str) -> List[str]:
+    """
+    Découpe un nom ou un motif de topic en segments.
+
+    Args:
+        topic_id: Nom ou motif de topic
+
+    Returns:
+        La liste des segments
+    """
+    return topic_id.split(SEGMENT_SEPARATOR)
+
+
+def is_topic_pattern(topic_id: str) -> bool:
+    """
+    Indique si un identifiant de topic contient des jokers.
+
+    Args:
+        topic_id: Nom ou motif de topic
+
+    Returns:
+        True si l'identifiant est un motif, False s'il désigne un topic unique
+    """
+    return any(segment in (SINGLE_WILDCARD, MULTI_WILDCARD) for segment in split_topic(topic_id))
+
+
+def compile_filter(filter_criteria: Optional[Dict[str, Any]]) -> Callable[[Message], bool]:
+    """
+    Compile des critères de filtrage en un prédicat sur les messages.
+
+    Les critères sont ceux acceptés par `Topic._matches_filter` : `sender`,
+    `priority`, `sender_level` et `content`, chaque valeur pouvant être une
+    valeur unique ou une liste de valeurs admises. Les listes sont converties
+    en ensembles lorsque leurs éléments sont hachables.
+
+    Args:
+        filter_criteria: Les critères de filtrage (None pour tout accepter)
+
+    Returns:
+        Une fonction indiquant si un message satisfait les critères
+    """
+    if not filter_criteria:
+        return lambda message: True
+
+    accessors = {
+        "sender": lambda message: message.sender,
+        "priority": lambda message: message.priority.value,
+        "sender_level": lambda message: message.sender_level.value
+    }
+
+    checks = []
+    for key, value in filter_criteria.items():
+        if key in accessors:
+            checks.append((accessors[key], _compile_value(value)))
+
+    content_checks = [
+        (content_key, _compile_value(content_value))
+        for content_key, content_value in (filter_criteria.get("content") or {}).items()
+    ]
+
+    def predicate(message: Message) -> bool:
+        for accessor, accepts in checks:
+            if not accepts(accessor(message)):
+                return False
+
+        content = message.content
+        for content_key, accepts in content_checks:
+            if content_key not in content or not accepts(content[content_key]):
+                return False
+
+        return True
+
+    return predicate
+
+
+def _compile_value(expected: Any) -> Callable[[Any], bool]:
+    """Construit le test d'une valeur attendue ou d'une liste de valeurs admises."""
+    if isinstance(expected, list):
+        try:
+            allowed = frozenset(expected)
+        except TypeError:
+            return lambda value: value in expected
+        return lambda value: _is_member(value, allowed, expected)
+    return lambda value: value == expected
+
+
+def _is_member(value: Any, allowed: frozenset, expected: List[Any]) -> bool:
+    """Teste l'appartenance, en repliant sur la liste pour les valeurs non hachables."""
+    try:
+        return value in allowed
+    except TypeError:
+        return value in expected
+
+
+class TopicTrie:
+    """
+    Trie des abonnements indexés par motif de topic.
+
+    Chaque nœud correspond à un segment ; les abonnements sont attachés au
+    nœud de leur dernier segment. La classe n'est pas thread-safe, le
+    protocole propriétaire doit protéger ses accès par son propre verrou.
+    """
+
+    def __init__(self):
+        """Initialise un trie vide."""
+        self._root = self._new_node()
+        self._patterns: Dict[str, str] = {}  # identifiant d'abonnement -> motif
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    @staticmethod
+    def _new_node() -> Dict[str, Any]:
+        """Crée un nœud vide."""
+        return {"children": {}, "subscriptions": {}}
+
+    def add(self, pattern: str, subscription_id: str, subscription: Dict[str, Any]) -> None:
+        """
+        Ajoute un abonnement pour un motif.
+
+        Args:
+            pattern: Motif de topic
+            subscription_id: Identifiant d'abonnement
+            subscription: Description de l'abonnement
+
+        Raises:
+            ValueError: Si `#` n'est pas le dernier segment du motif
+        """
+        segments = split_topic(pattern)
+        if MULTI_WILDCARD in segments[:-1]:
+            raise ValueError(f"Wildcard '{MULTI_WILDCARD}' must be the last segment of pattern '{pattern}'")
+
+        node = self._root
+        for segment in segments:
+            node = node["children"].setdefault(segment, self._new_node())
+
+        node["subscriptions"][subscription_id] = subscription
+        self._patterns[subscription_id] = pattern
+
+    def remove(self, subscription_id: str) -> bool:
+        """
+        Supprime un abonnement et élague les nœuds devenus vides.
+
+        Args:
+            subscription_id: Identifiant d'abonnement
+
+        Returns:
+            True si l'abonnement existait, False sinon
+        """
+        pattern = self._patterns.pop(subscription_id, None)
+        if pattern is None:
+            return False
+
+        path = [self._root]
+        segments = split_topic(pattern)
+        for segment in segments:
+            path.append(path[-1]["children"][segment])
+
+        del path[-1]["subscriptions"][subscription_id]
+
+        # Élaguer depuis la feuille tant que les nœuds sont vides
+        for depth in range(len(segments), 0, -1):
+            node = path[depth]
+            if node["children"] or node["subscriptions"]:
+                break
+            del path[depth - 1]["children"][segments[depth - 1]]
+
+        return True
+
+    def match(self, topic_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Recherche les abonnements dont le motif correspond à un topic.
+
+        Args:
+            topic_id: Nom de topic (sans jokers)
+
+        Returns:
+            Un dictionnaire identifiant d'abonnement -> description de l'abonnement
+        """
+        matches: Dict[str, Dict[str, Any]] = {}
+        if not self._patterns:
+            return matches
+
+        frontier = [self._root]
+        for segment in split_topic(topic_id):
+            next_frontier = []
+            for node in frontier:
+                children = node["children"]
+                if MULTI_WILDCARD in children:
+                    matches.update(children[MULTI_WILDCARD]["subscriptions"])
+                if segment in children:
+                    next_frontier.append(children[segment])
+                if SINGLE_WILDCARD in children:
+                    next_frontier.append(children[SINGLE_WILDCARD])
+            frontier = next_frontier
+            if not frontier:
+                return matches
+
+        for node in frontier:
+            matches.update(node["subscriptions"])
+            # `#` correspond aussi à zéro segment
+            multi = node["children"].get(MULTI_WILDCARD)
+            if multi is not None:
+                matches.update(multi["subscriptions"])
+
+        return matches
+
+    def get_patterns(self) -> List[str]:
+        """
+        Retourne les motifs ayant au moins un abonnement.
+
+        Returns:
+            Liste des motifs, sans doublons
+        """
+        return sorted(set(self._patterns.values()))
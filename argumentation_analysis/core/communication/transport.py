@@ -0,0 +1,647 @@
+"""
+Transport inter-processus pour les canaux du système de communication multi-canal.
+
+Un `ChannelServer` expose un canal local (par exemple le canal hiérarchique
+du processus stratégique) sur une socket de domaine Unix ou TCP. Dans les
+autres processus, un `RemoteChannel` implémente l'interface `Channel` en
+relayant chaque opération vers ce serveur : il s'enregistre dans un
+`MessageMiddleware` comme n'importe quel autre canal.
+
+Chaque client maintient une connexion persistante, rétablie automatiquement
+après une coupure. Les trames sont préfixées par leur longueur et leur
+contenu est encodé par `message_codec` ; les requêtes portent un numéro qui
+permet à plusieurs threads de partager la connexion. Le serveur pousse aux
+clients les notifications de dépôt de messages, ce qui permet au middleware
+distant d'attendre sans consultation périodique.
+"""
+
+import itertools
+import logging
+import os
+import socket
+import struct
+import threading
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .channel_interface import Channel, ChannelType, ChannelException, ChannelTimeoutException
+from .message import Message
+from .message_codec import CodecError, decode_value, encode_value
+
+
+# Adresse de transport : chemin de socket Unix ou couple (hôte, port) TCP
+TransportAddress = Union[str, Tuple[str, int]]
+
+_FRAME_HEADER = struct.Struct(">I")
+
+# Taille maximale d'une trame, pour rejeter un flux corrompu
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+
+class TransportError(ChannelException):
+    """Exception levée en cas d'échec de communication avec un canal distant."""
+    pass
+
+
+def _create_socket(address: TransportAddress) -> socket.socket:
+    """Crée une socket adaptée au type d'adresse."""
+    if isinstance(address, str):
+        if not hasattr(socket, "AF_UNIX"):
+            raise TransportError("Unix domain sockets are not available on this platform, use a (host, port) address")
+        return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def send_frame(sock: socket.socket, payload: Dict[str, Any]) -> None:
+    """
+    Envoie une trame sur une socket.
+
+    L'appelant doit sérialiser les écritures concurrentes sur une même socket.
+
+    Args:
+        sock: La socket connectée
+        payload: Le contenu de la trame
+    """
+    data = encode_value(payload)
+    sock.sendall(_FRAME_HEADER.pack(len(data)) + data)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> Optional[bytes]:
+    """Lit exactement `size` octets ; retourne None si la connexion est fermée."""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            return None
+        received += count
+    return bytes(buffer)
+
+
+def recv_frame(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """
+    Lit une trame sur une socket.
+
+    Args:
+        sock: La socket connectée
+
+    Returns:
+        Le contenu de la trame, ou None si la connexion a été fermée
+
+    Raises:
+        TransportError: Si la trame est invalide
+    """
+    header = _recv_exactly(sock, _FRAME_HEADER.size)
+    if header is None:
+        return None
+
+    size = _FRAME_HEADER.unpack(header)[0]
+    if size > MAX_FRAME_SIZE:
+        raise TransportError(f"Frame of {size} bytes exceeds the maximum frame size")
+
+    data = _recv_exactly(sock, size)
+    if data is None:
+        return None
+
+    try:
+        return decode_value(data)
+    except CodecError as e:
+        raise TransportError(f"Invalid frame: {e}") from e
+
+
+class _ServerConnection:
+    """Connexion d'un client à un `ChannelServer`."""
+
+    def __init__(self, server: "ChannelServer", sock: socket.socket):
+        self.server = server
+        self.sock = sock
+        self.write_lock = threading.Lock()
+        self.watching = False
+        self.subscriptions: List[str] = []
+        self.closed = False
+
+    def send(self, payload: Dict[str, Any]) -> None:
+        """Envoie une trame au client ; les erreurs ferment la connexion."""
+        if self.closed:
+            return
+        try:
+            with self.write_lock:
+                send_frame(self.sock, payload)
+        except (OSError, CodecError) as e:
+            self.server.logger.warning(f"Error sending frame to client: {e}")
+            self.close()
+
+    def on_message_signal(self, recipient_id: str) -> None:
+        """Relaie au client une notification de dépôt du canal."""
+        if self.watching:
+            self.send({"event": "signal", "recipient": recipient_id})
+
+    def on_pressure_signal(self, recipient_id: str, congested: bool) -> None:
+        """Relaie au client un changement de congestion du canal."""
+        if self.watching:
+            self.send({"event": "pressure", "recipient": recipient_id, "congested": congested})
+
+    def close(self) -> None:
+        """Ferme la connexion et libère ses abonnements."""
+        if self.closed:
+            return
+        self.closed = True
+
+        channel = self.server.channel
+        channel.remove_message_listener(self.on_message_signal)
+        channel.remove_pressure_listener(self.on_pressure_signal)
+        for subscription_id in self.subscriptions:
+            channel.unsubscribe(subscription_id)
+
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class ChannelServer:
+    """
+    Serveur exposant un canal local aux processus distants.
+
+    Les opérations non bloquantes d'une connexion sont traitées dans l'ordre
+    de réception par le thread de lecture de cette connexion, ce qui préserve
+    l'ordre des envois d'un même client. Les réceptions avec attente sont
+    confiées à un thread dédié pour ne pas bloquer la connexion.
+    """
+
+    def __init__(self, channel: Channel, address: TransportAddress):
+        """
+        Initialise le serveur.
+
+        Args:
+            channel: Le canal à exposer
+            address: Chemin de socket Unix ou couple (hôte, port) TCP
+        """
+        self.channel = channel
+        self.address = address
+        self.logger = logging.getLogger(f"ChannelServer.{channel.id}")
+
+        self.connections: List[_ServerConnection] = []
+        self.lock = threading.Lock()
+        self.running = False
+        self._listener: Optional[socket.socket] = None
+        self._accept_thread: Optional[threading.Thread] = None
+
+    def start(self) -> "ChannelServer":
+        """
+        Démarre l'écoute des connexions.
+
+        Returns:
+            Le serveur lui-même
+        """
+        listener = _create_socket(self.address)
+        if isinstance(self.address, str):
+            # Supprimer une socket laissée par un processus précédent
+            if os.path.exists(self.address):
+                os.remove(self.address)
+        else:
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+        listener.bind(self.address)
+        listener.listen()
+        if not isinstance(self.address, str):
+            # Récupérer le port effectif lorsque le port 0 a été demandé
+            self.address = listener.getsockname()[:2]
+
+        self._listener = listener
+        self.running = True
+        self._accept_thread = threading.Thread(
+            target=self._accept_loop, name=f"ChannelServer-{self.channel.id}", daemon=True
+        )
+        self._accept_thread.start()
+
+        self.logger.info(f"Serving channel {self.channel.id} on {self.address}")
+        return self
+
+    def stop(self) -> None:
+        """Arrête le serveur et ferme toutes les connexions."""
+        self.running = False
+        if self._listener is not None:
+            try:
+                self._listener.close()
+            except OSError:
+                pass
+            self._listener = None
+
+        with self.lock:
+            connections = list(self.connections)
+            self.connections.clear()
+        for connection in connections:
+            connection.close()
+
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            try:
+                os.remove(self.address)
+            except OSError:
+                pass
+
+        self.logger.info(f"Channel server {self.channel.id} stopped")
+
+    def _accept_loop(self) -> None:
+        """Accepte les connexions entrantes."""
+        while self.running:
+            try:
+                sock, _ = self._listener.accept()
+            except OSError:
+                # Socket d'écoute fermée par stop()
+                break
+
+            connection = _ServerConnection(self, sock)
+            with self.lock:
+                self.connections.append(connection)
+            threading.Thread(target=self._serve_connection, args=(connection,), daemon=True).start()
+
+    def _serve_connection(self, connection: _ServerConnection) -> None:
+        """Traite les requêtes d'une connexion jusqu'à sa fermeture."""
+        try:
+            while self.running and not connection.closed:
+                request = recv_frame(connection.sock)
+                if request is None:
+                    break
+
+                if request.get("op") == "receive" and request.get("timeout") != 0:
+                    threading.Thread(target=self._handle_request, args=(connection, request), daemon=True).start()
+                else:
+                    self._handle_request(connection, request)
+        except (OSError, TransportError) as e:
+            if self.running:
+                self.logger.warning(f"Connection error: {e}")
+        finally:
+            connection.close()
+            with self.lock:
+                if connection in self.connections:
+                    self.connections.remove(connection)
+
+    def _handle_request(self, connection: _ServerConnection, request: Dict[str, Any]) -> None:
+        """Exécute une requête et renvoie sa réponse au client."""
+        request_id = request.get("id")
+        try:
+            result = self._execute(connection, request)
+            connection.send({"id": request_id, "ok": True, "result": result})
+        except Exception as e:
+            self.logger.error(f"Error handling {request.get('op')} request: {e}")
+            connection.send({"id": request_id, "ok": False, "error": str(e)})
+
+    def _execute(self, connection: _ServerConnection, request: Dict[str, Any]) -> Any:
+        """Applique une opération au canal exposé."""
+        op = request.get("op")
+        channel = self.channel
+
+        if op == "send":
+            return channel.send_message(Message.from_dict(request["message"]))
+
+        if op == "receive":
+            message = channel.receive_message(request["recipient"], request.get("timeout"))
+            return message.to_dict() if message else None
+
+        if op == "pending":
+            messages = channel.get_pending_messages(request["recipient"], request.get("max_count"))
+            return [message.to_dict() for message in messages]
+
+        if op == "info":
+            return channel.get_channel_info()
+
+        if op == "watch":
+            if not connection.watching:
+                connection.watching = True
+                channel.add_message_listener(connection.on_message_signal)
+                channel.add_pressure_listener(connection.on_pressure_signal)
+            return True
+
+        if op == "subscribe":
+            remote_id = request["subscription_id"]
+
+            def forward(message: Message) -> None:
+                connection.send({"event": "message", "subscription_id": remote_id, "message": message.to_dict()})
+
+            subscription_id = channel.subscribe(request["subscriber_id"], forward, request.get("filter_criteria"))
+            connection.subscriptions.append(subscription_id)
+            return subscription_id
+
+        if op == "unsubscribe":
+            subscription_id = request["subscription_id"]
+            if subscription_id in connection.subscriptions:
+                connection.subscriptions.remove(subscription_id)
+            return channel.unsubscribe(subscription_id)
+
+        raise TransportError(f"Unknown operation: {op}")
+
+
+class RemoteChannel(Channel):
+    """
+    Canal relayant ses opérations vers un `ChannelServer` d'un autre processus.
+
+    Les callbacks d'abonnement restent locaux : le serveur transmet les
+    messages correspondants et le canal distant appelle les callbacks à leur
+    réception, depuis son thread de lecture : un callback ne doit donc pas
+    attendre le résultat d'une autre opération sur ce même canal.
+    """
+
+    supports_notifications = True
+
+    def __init__(self, channel_id: str, channel_type: ChannelType, address: TransportAddress,
+                 config: Optional[Dict[str, Any]] = None):
+        """
+        Initialise un canal distant.
+
+        Args:
+            channel_id: Identifiant local du canal
+            channel_type: Type du canal exposé par le serveur
+            address: Adresse du `ChannelServer`
+            config: Configuration (optionnel) :
+                - request_timeout : délai de réponse du serveur en secondes (défaut 30)
+                - connect_timeout : délai d'établissement de la connexion (défaut 5)
+        """
+        super().__init__(channel_id, channel_type, config)
+        self.address = address
+        self.request_timeout = self.config.get("request_timeout", 30.0)
+        self.connect_timeout = self.config.get("connect_timeout", 5.0)
+
+        self.logger = logging.getLogger(f"RemoteChannel.{channel_id}")
+
+        self.lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._sock: Optional[socket.socket] = None
+        self._request_ids = itertools.count(1)
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        # Abonnements locaux : identifiant local -> (abonné, callback, critères, identifiant distant)
+        self._subscriptions: Dict[str, Dict[str, Any]] = {}
+        self._closed = False
+
+    def _connect(self) -> socket.socket:
+        """Établit la connexion si nécessaire et restaure les notifications et abonnements."""
+        with self.lock:
+            if self._sock is not None:
+                return self._sock
+            if self._closed:
+                raise TransportError(f"Remote channel {self.id} is closed")
+
+            sock = _create_socket(self.address)
+            sock.settimeout(self.connect_timeout)
+            try:
+                sock.connect(self.address)
+            except OSError as e:
+                sock.close()
+                raise TransportError(f"Cannot connect to {self.address}: {e}") from e
+            sock.settimeout(None)
+
+            self._sock = sock
+            threading.Thread(target=self._read_loop, args=(sock,), name=f"RemoteChannel-{self.id}", daemon=True).start()
+            self.logger.info(f"Connected to channel server at {self.address}")
+
+            # Seuls les abonnements déjà enregistrés sur une connexion précédente sont rétablis :
+            # un abonnement en cours de création est enregistré par `subscribe` lui-même
+            subscriptions = [
+                (local_id, subscription) for local_id, subscription in self._subscriptions.items()
+                if subscription["remote_id"] is not None
+            ]
+
+        # Demander les notifications de dépôt et rétablir les abonnements
+        self._call("watch")
+        for local_id, subscription in subscriptions:
+            subscription["remote_id"] = self._call(
+                "subscribe",
+                subscriber_id=subscription["subscriber_id"],
+                subscription_id=local_id,
+                filter_criteria=subscription["filter_criteria"]
+            )
+        return sock
+
+    def _read_loop(self, sock: socket.socket) -> None:
+        """Lit les réponses et les événements poussés par le serveur."""
+        try:
+            while True:
+                frame = recv_frame(sock)
+                if frame is None:
+                    break
+
+                if "event" in frame:
+                    self._handle_event(frame)
+                    continue
+
+                with self.lock:
+                    pending = self._pending.pop(frame.get("id"), None)
+                if pending is not None:
+                    pending["response"] = frame
+                    pending["done"].set()
+        except (OSError, TransportError) as e:
+            if not self._closed:
+                self.logger.warning(f"Connection to {self.address} lost: {e}")
+        finally:
+            self._disconnect(sock)
+
+    def _handle_event(self, frame: Dict[str, Any]) -> None:
+        """Traite une notification, un changement de congestion ou un message d'abonnement poussé par le serveur."""
+        if frame["event"] == "signal":
+            self._signal_message(frame["recipient"])
+        elif frame["event"] == "pressure":
+            self._signal_pressure(frame["recipient"], frame["congested"])
+        elif frame["event"] == "message":
+            subscription = self._subscriptions.get(frame["subscription_id"])
+            if subscription and subscription["callback"]:
+                try:
+                    subscription["callback"](Message.from_dict(frame["message"]))
+                except Exception as e:
+                    self.logger.error(f"Error in subscriber callback: {e}")
+
+    def _disconnect(self, sock: socket.socket) -> None:
+        """Ferme une connexion et fait échouer les requêtes en attente."""
+        with self.lock:
+            if self._sock is sock:
+                self._sock = None
+            pending = list(self._pending.values())
+            self._pending.clear()
+
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+        for entry in pending:
+            entry["response"] = {"ok": False, "error": "connection lost"}
+            entry["done"].set()
+
+    def _call(self, op: str, timeout: Optional[float] = None, **params) -> Any:
+        """
+        Envoie une requête au serveur et attend sa réponse.
+
+        Args:
+            op: Nom de l'opération
+            timeout: Durée d'attente propre à l'opération, ajoutée au délai de réponse
+            **params: Paramètres de l'opération
+
+        Returns:
+            Le résultat de l'opération
+
+        Raises:
+            TransportError: Si la connexion échoue ou si le serveur signale une erreur
+            ChannelTimeoutException: Si le serveur ne répond pas à temps
+        """
+        sock = self._connect()
+
+        request_id = next(self._request_ids)
+        entry = {"done": threading.Event(), "response": None}
+        with self.lock:
+            self._pending[request_id] = entry
+
+        try:
+            with self._write_lock:
+                send_frame(sock, {"op": op, "id": request_id, **params})
+        except OSError as e:
+            self._disconnect(sock)
+            raise TransportError(f"Error sending {op} request: {e}") from e
+
+        wait_time = None if timeout is None and op == "receive" else self.request_timeout + (timeout or 0)
+        if not entry["done"].wait(wait_time):
+            with self.lock:
+                self._pending.pop(request_id, None)
+            raise ChannelTimeoutException(f"No response to {op} request from {self.address}")
+
+        response = entry["response"]
+        if not response.get("ok"):
+            raise TransportError(f"Remote {op} failed: {response.get('error')}")
+        return response.get("result")
+
+    def send_message(self, message: Message) -> bool:
+        """
+        Envoie un message via le canal distant.
+
+        Args:
+            message: Le message à envoyer
+
+        Returns:
+            True si le message a été envoyé avec succès, False sinon
+        """
+        try:
+            return bool(self._call("send", message=message.to_dict()))
+        except (ChannelException, CodecError) as e:
+            self.logger.error(f"Error sending message {message.id}: {e}")
+            return False
+
+    def receive_message(self, recipient_id: str, timeout: Optional[float] = None) -> Optional[Message]:
+        """
+        Reçoit un message du canal distant pour un destinataire spécifique.
+
+        Args:
+            recipient_id: Identifiant du destinataire
+            timeout: Délai d'attente maximum en secondes (None pour attente indéfinie)
+
+        Returns:
+            Le message reçu ou None si timeout
+        """
+        try:
+            data = self._call("receive", timeout=timeout, recipient=recipient_id)
+        except ChannelException as e:
+            self.logger.error(f"Error receiving message for {recipient_id}: {e}")
+            return None
+        return Message.from_dict(data) if data else None
+
+    def subscribe(self, subscriber_id: str, callback: Optional[Callable[[Message], None]] = None,
+                  filter_criteria: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Abonne un agent au canal distant.
+
+        Args:
+            subscriber_id: Identifiant de l'abonné
+            callback: Fonction de rappel appelée dans ce processus (optionnel)
+            filter_criteria: Critères de filtrage appliqués par le serveur (optionnel)
+
+        Returns:
+            Un identifiant d'abonnement local
+        """
+        subscription_id = f"sub-{uuid.uuid4().hex[:8]}"
+        subscription = {
+            "subscriber_id": subscriber_id,
+            "callback": callback,
+            "filter_criteria": filter_criteria,
+            "remote_id": None
+        }
+        with self.lock:
+            self._subscriptions[subscription_id] = subscription
+
+        try:
+            subscription["remote_id"] = self._call(
+                "subscribe", subscriber_id=subscriber_id,
+                subscription_id=subscription_id, filter_criteria=filter_criteria
+            )
+        except ChannelException:
+            with self.lock:
+                self._subscriptions.pop(subscription_id, None)
+            raise
+        return subscription_id
+
+    def unsubscribe(self, subscription_id: str) -> bool:
+        """
+        Désabonne un agent du canal distant.
+
+        Args:
+            subscription_id: Identifiant d'abonnement local
+
+        Returns:
+            True si désabonnement réussi, False sinon
+        """
+        with self.lock:
+            subscription = self._subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            return False
+
+        try:
+            return bool(self._call("unsubscribe", subscription_id=subscription["remote_id"]))
+        except ChannelException as e:
+            self.logger.warning(f"Error unsubscribing {subscription_id}: {e}")
+            return False
+
+    def get_pending_messages(self, recipient_id: str, max_count: Optional[int] = None) -> List[Message]:
+        """
+        Récupère les messages en attente pour un destinataire spécifique.
+
+        Args:
+            recipient_id: Identifiant du destinataire
+            max_count: Nombre maximum de messages à récupérer (None pour tous)
+
+        Returns:
+            Liste des messages en attente
+        """
+        try:
+            data = self._call("pending", recipient=recipient_id, max_count=max_count)
+        except ChannelException as e:
+            self.logger.error(f"Error getting pending messages for {recipient_id}: {e}")
+            return []
+        return [Message.from_dict(item) for item in data]
+
+    def get_channel_info(self) -> Dict[str, Any]:
+        """
+        Récupère des informations sur ce canal.
+
+        Returns:
+            Les informations du canal distant, complétées par l'adresse du serveur
+        """
+        info = {"id": self.id, "type": self.type.value, "remote_address": self.address}
+        try:
+            info["remote"] = self._call("info")
+            info["connected"] = True
+        except ChannelException as e:
+            info["connected"] = False
+            info["error"] = str(e)
+        return info
+
+    def close(self) -> None:
+        """Ferme la connexion au serveur."""
+        with self.lock:
+            self._closed = True
+            sock = self._sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._disconnect(sock)
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Compteurs par thread et histogrammes de latence.
+
+Outils de mesure sans dépendance vers les autres couches, partagés par les
+statistiques du middleware de communication et par la mesure des requêtes
+logiques :
+
+- `ThreadLocalCounters` : compteurs incrémentés sans verrou par chaque thread
+  et agrégés à la lecture ;
+- `latency_bucket` / `summarize_latency` : histogrammes à seaux
+  logarithmiques (puissances de deux en microsecondes) et leur résumé
+  (moyenne, percentiles).
+"""
+
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Hashable, List, Tuple
+
+
+# Nombre de seaux des histogrammes de latence : le dernier seau regroupe
+# les latences supérieures à 2^(LATENCY_BUCKETS - 2) µs (environ 18 min)
+LATENCY_BUCKETS = 32
+
+
+def latency_bucket(latency_ns: int) -> int:
+    """
+    Calcule le seau d'histogramme d'une latence.
+
+    Le seau `i` contient les latences de l'intervalle [2^(i-1), 2^i[ µs,
+    le seau 0 les latences inférieures à une microseconde.
+
+    Args:
+        latency_ns: La latence en nanosecondes
+
+    Returns:
+        L'indice du seau
+    """
+    return min(max(latency_ns, 0) // 1000, 1 << (LATENCY_BUCKETS - 2)).bit_length()
+
+
+class ThreadLocalCounters:
+    """
+    Compteurs sans verrou tenus par thread et agrégés à la lecture.
+
+    Chaque thread écrit dans son propre dictionnaire ; seul l'enregistrement
+    du dictionnaire d'un nouveau thread prend un verrou. Les dictionnaires des
+    threads terminés sont repliés dans un total commun lors des lectures et de
+    l'enregistrement d'un nouveau thread : leur nombre reste borné par celui
+    des threads vivants, même si les compteurs ne sont jamais lus.
+    """
+
+    def __init__(self):
+        """Initialise des compteurs vides."""
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[Tuple[threading.Thread, Dict[Hashable, int]]] = []
+        self._retired: Dict[Hashable, int] = defaultdict(int)
+
+    def shard(self) -> Dict[Hashable, int]:
+        """
+        Retourne le dictionnaire de compteurs du thread courant.
+
+        Seul le thread courant doit écrire dans ce dictionnaire.
+
+        Returns:
+            Un dictionnaire clé -> valeur dont les clés absentes valent 0
+        """
+        try:
+            return self._local.counters
+        except AttributeError:
+            shard = defaultdict(int)
+            self._local.counters = shard
+            with self._lock:
+                self._fold_dead_shards()
+                self._shards.append((threading.current_thread(), shard))
+            return shard
+
+    def _fold_dead_shards(self) -> None:
+        """Replie dans le total commun les compteurs des threads terminés (verrou tenu)."""
+        alive = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+            else:
+                # Plus aucune écriture possible : replier dans le total commun
+                for key, value in shard.items():
+                    self._retired[key] += value
+        self._shards = alive
+
+    def add(self, key: Hashable, value: int = 1) -> None:
+        """
+        Incrémente un compteur.
+
+        Args:
+            key: Clé du compteur
+            value: Valeur à ajouter
+        """
+        self.shard()[key] += value
+
+    def add_many(self, keys: Tuple[Hashable, ...], value: int = 1) -> None:
+        """
+        Incrémente plusieurs compteurs avec une seule recherche du dictionnaire du thread.
+
+        Args:
+            keys: Clés des compteurs
+            value: Valeur à ajouter à chacun
+        """
+        shard = self.shard()
+        for key in keys:
+            shard[key] += value
+
+    def snapshot(self) -> Dict[Hashable, int]:
+        """
+        Agrège les compteurs de tous les threads.
+
+        Returns:
+            Un dictionnaire clé -> valeur totale
+        """
+        with self._lock:
+            self._fold_dead_shards()
+
+            totals = dict(self._retired)
+            for _, shard in self._shards:
+                # La copie d'un dictionnaire est atomique vis-à-vis des autres threads
+                for key, value in shard.copy().items():
+                    totals[key] = totals.get(key, 0) + value
+
+        return totals
+
+
+def summarize_latency(histogram: Dict[int, int], total_ns: int) -> Dict[str, Any]:
+    """
+    Résume un histogramme de latence construit avec `latency_bucket`.
+
+    Args:
+        histogram: Le nombre de mesures par seau
+        total_ns: La somme des latences mesurées, en nanosecondes
+
+    Returns:
+        Le nombre de mesures, la moyenne et les percentiles 50/90/99 en
+        millisecondes, et l'histogramme indexé par borne supérieure en µs
+    """
+    count = sum(histogram.values())
+    summary = {
+        "count": count,
+        "mean_ms": total_ns / count / 1e6 if count else 0.0,
+        "histogram_us": {1 << bucket: histogram[bucket] for bucket in sorted(histogram)}
+    }
+
+    for name, ratio in (("p50_ms", 0.5), ("p90_ms", 0.9), ("p99_ms", 0.99)):
+        threshold = ratio * count
+        cumulative = 0
+        for bucket in sorted(histogram):
+            cumulative += histogram[bucket]
+            if cumulative >= threshold:
+                summary[name] = (1 << bucket) / 1000
+                break
+
+    return summary
@@ -4,6 +4,8 @@ Module définissant le Coordinateur de Tâches de l'architecture hiérarchique.
 
 from typing import Dict, List, Any, Optional
 import logging
+import threading
+from collections import defaultdict, deque
 from datetime import datetime
 import uuid
 
@@ -48,6 +50,15 @@ class TaskCoordinator:
             "data_extractor": ["entity_extraction", "relation_detection", "metadata_analysis"]
         }
         
+        # Tâches retenues pour les agents dont la file de messages est congestionnée
+        self.congested_agents = set()
+        self.deferred_tasks: Dict[str, deque] = defaultdict(deque)
+        self._deferred_lock = threading.Lock()
+        # Avec un middleware sans signaux de contre-pression, les tâches ne sont jamais différées
+        add_backpressure_listener = getattr(self.middleware, "add_backpressure_listener", None)
+        if add_backpressure_listener is not None:
+            add_backpressure_listener(self._on_backpressure)
+        
         # S'abonner aux directives stratégiques
         self._subscribe_to_strategic_directives()
     
@@ -195,11 +206,32 @@ class TaskCoordinator:
             task: La tâche à assigner
         """
         required_capabilities = task.get("required_capabilities", [])
-        priority = task.get("priority", "medium")
         
         # Déterminer l'agent approprié
         recipient_id = self._determine_appropriate_agent(required_capabilities)
         
+        # Retenir la tâche si la file de l'agent est congestionnée : elle sera
+        # assignée lorsque l'agent repassera sous ses basses eaux
+        if recipient_id:
+            with self._deferred_lock:
+                if recipient_id in self.congested_agents:
+                    self.deferred_tasks[recipient_id].append(task)
+                    self.logger.info(f"Tâche {task.get('id')} différée : file de {recipient_id} congestionnée")
+                    return
+        
+        self._dispatch_task(task, recipient_id)
+    
+    def _dispatch_task(self, task: Dict[str, Any], recipient_id: Optional[str]) -> None:
+        """
+        Envoie une tâche à un agent opérationnel ou la publie s'il n'y a pas d'agent désigné.
+        
+        Args:
+            task: La tâche à envoyer
+            recipient_id: L'agent destinataire, ou None pour publier la tâche
+        """
+        required_capabilities = task.get("required_capabilities", [])
+        priority = task.get("priority", "medium")
+        
         # Mapper la priorité textuelle à l'énumération
         priority_map = {
             "high": MessagePriority.HIGH,
@@ -242,6 +274,63 @@ class TaskCoordinator:
             
             self.logger.info(f"Tâche {task.get('id')} publiée pour les agents avec capacités: {required_capabilities}")
     
+    def _on_backpressure(self, recipient_id: str, congested: bool) -> None:
+        """
+        Suspend ou reprend l'assignation de tâches à un agent selon la congestion de sa file.
+        
+        Args:
+            recipient_id: L'agent concerné
+            congested: True si sa file a dépassé ses hautes eaux, False si elle est redescendue
+        """
+        with self._deferred_lock:
+            if congested:
+                self.congested_agents.add(recipient_id)
+            else:
+                self.congested_agents.discard(recipient_id)
+        
+        if congested:
+            self.logger.info(f"Assignation suspendue pour {recipient_id} (file congestionnée)")
+        else:
+            self._release_deferred_tasks(recipient_id)
+    
+    def _release_deferred_tasks(self, recipient_id: str) -> int:
+        """
+        Assigne dans leur ordre d'arrivée les tâches retenues pour un agent, tant qu'il n'est pas congestionné.
+        
+        Args:
+            recipient_id: L'agent concerné
+            
+        Returns:
+            Le nombre de tâches assignées
+        """
+        released = 0
+        while True:
+            with self._deferred_lock:
+                pending = self.deferred_tasks.get(recipient_id)
+                if not pending or recipient_id in self.congested_agents:
+                    break
+                task = pending.popleft()
+                if not pending:
+                    del self.deferred_tasks[recipient_id]
+            
+            self._dispatch_task(task, recipient_id)
+            released += 1
+        
+        if released:
+            self._log_action("Reprise des assignations",
+                            f"{released} tâches différées assignées à {recipient_id}")
+        return released
+    
+    def get_deferred_task_count(self) -> int:
+        """
+        Compte les tâches retenues en attendant que les files des agents se désengorgent.
+        
+        Returns:
+            Le nombre de tâches différées
+        """
+        with self._deferred_lock:
+            return sum(len(tasks) for tasks in self.deferred_tasks.values())
+    
     def _determine_appropriate_agent(self, required_capabilities: List[str]) -> Optional[str]:
         """
         Détermine l'agent opérationnel approprié en fonction des capacités requises.
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmarks du système de communication multi-canal.
+
+Ce script mesure les performances des briques de `core.communication` sans
+dépendre des agents ni de services externes. Chaque benchmark est exposé
+sous forme de sous-commande :
+
+    python -m argumentation_analysis.scripts.benchmark_communication hop-latency
+    python -m argumentation_analysis.scripts.benchmark_communication idle-cpu [--asyncio]
+    python -m argumentation_analysis.scripts.benchmark_communication data-channel [--messages 100000]
+    python -m argumentation_analysis.scripts.benchmark_communication send-throughput [--threads 8]
+    python -m argumentation_analysis.scripts.benchmark_communication message [--count 100000]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from argumentation_analysis.core.communication.message import Message, MessageType, MessagePriority, AgentLevel
+from argumentation_analysis.core.communication.message_codec import encode_message, decode_message
+from argumentation_analysis.core.communication.middleware import MessageMiddleware
+from argumentation_analysis.core.communication.hierarchical_channel import HierarchicalChannel
+from argumentation_analysis.core.communication.collaboration_channel import CollaborationChannel
+from argumentation_analysis.core.communication.data_channel import DataChannel
+
+
+logger = logging.getLogger("BenchmarkCommunication")
+
+
+def _create_middleware() -> MessageMiddleware:
+    """Crée un middleware équipé des trois canaux standards."""
+    middleware = MessageMiddleware()
+    middleware.register_channel(HierarchicalChannel("hierarchical"))
+    middleware.register_channel(CollaborationChannel("collaboration"))
+    middleware.register_channel(DataChannel("data"))
+    return middleware
+
+
+def _create_message(recipient: str, index: int) -> Message:
+    """Crée un message de commande minimal pour les mesures."""
+    return Message(
+        message_type=MessageType.COMMAND,
+        sender="tactical-bench",
+        sender_level=AgentLevel.TACTICAL,
+        content={"command_type": "noop", "parameters": {"index": index}},
+        recipient=recipient
+    )
+
+
+def _percentile(values: List[float], ratio: float) -> float:
+    """Calcule un percentile simple sur une liste triée."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(ratio * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def benchmark_hop_latency(hops: int = 200) -> Dict[str, float]:
+    """
+    Mesure la latence d'un saut : délai entre l'envoi d'un message et le réveil
+    d'un récepteur bloqué dans `receive_message` sans type de canal.
+
+    Args:
+        hops: Nombre de messages échangés
+
+    Returns:
+        Un dictionnaire de statistiques de latence en millisecondes
+    """
+    middleware = _create_middleware()
+    latencies: List[float] = []
+    ready = threading.Event()
+    done = threading.Event()
+    sent_at: Dict[int, float] = {}
+
+    def receiver():
+        ready.set()
+        for _ in range(hops):
+            message = middleware.receive_message("operational-bench", timeout=5.0)
+            if message is None:
+                break
+            latencies.append((time.perf_counter() - sent_at[message.content["parameters"]["index"]]) * 1000)
+        done.set()
+
+    thread = threading.Thread(target=receiver, daemon=True)
+    thread.start()
+    ready.wait()
+
+    for index in range(hops):
+        # Laisser le récepteur se rebloquer avant chaque envoi
+        time.sleep(0.002)
+        sent_at[index] = time.perf_counter()
+        middleware.send_message(_create_message("operational-bench", index))
+
+    done.wait(timeout=30)
+    middleware.shutdown()
+
+    return {
+        "hops": len(latencies),
+        "mean_ms": statistics.mean(latencies) if latencies else float("nan"),
+        "p50_ms": _percentile(latencies, 0.5) if latencies else float("nan"),
+        "p99_ms": _percentile(latencies, 0.99) if latencies else float("nan"),
+        "max_ms": max(latencies) if latencies else float("nan")
+    }
+
+
+def benchmark_idle_cpu(waiters: int = 200, duration: float = 2.0, use_asyncio: bool = False) -> Dict[str, float]:
+    """
+    Mesure le temps CPU consommé par des récepteurs bloqués sans message à recevoir.
+
+    Args:
+        waiters: Nombre de récepteurs (threads, ou coroutines si `use_asyncio`)
+        duration: Durée de la mesure en secondes
+        use_asyncio: Utiliser `receive_message_async` dans une boucle d'événements
+
+    Returns:
+        Un dictionnaire contenant le temps CPU consommé et son ratio au temps écoulé
+    """
+    middleware = _create_middleware()
+
+    async def wait_all():
+        await asyncio.gather(*[
+            middleware.receive_message_async(f"operational-idle-{index}", timeout=duration)
+            for index in range(waiters)
+        ])
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    if use_asyncio:
+        asyncio.run(wait_all())
+    else:
+        threads = [
+            threading.Thread(
+                target=middleware.receive_message,
+                args=(f"operational-idle-{index}",),
+                kwargs={"timeout": duration},
+                daemon=True
+            )
+            for index in range(waiters)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    cpu_used = time.process_time() - cpu_start
+    wall_elapsed = time.perf_counter() - wall_start
+    middleware.shutdown()
+
+    return {
+        "waiters": waiters,
+        "asyncio": use_asyncio,
+        "wall_s": wall_elapsed,
+        "cpu_s": cpu_used,
+        "cpu_ratio": cpu_used / wall_elapsed if wall_elapsed else float("nan")
+    }
+
+
+def benchmark_data_channel(messages: int = 100000, pending_count: int = 10) -> Dict[str, float]:
+    """
+    Fait transiter `messages` messages par un unique destinataire du canal de données.
+
+    Mesure l'envoi, la consultation des premiers messages en attente et la
+    réception complète de la file.
+
+    Args:
+        messages: Nombre de messages envoyés au destinataire
+        pending_count: Nombre de messages demandés à `get_pending_messages`
+
+    Returns:
+        Un dictionnaire de débits (messages/s) et de durées (ms)
+    """
+    channel = DataChannel("data-bench")
+    batch = [_create_message("operational-data", index) for index in range(messages)]
+
+    start = time.perf_counter()
+    for message in batch:
+        channel.send_message(message)
+    send_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(100):
+        channel.get_pending_messages("operational-data", pending_count)
+    pending_elapsed = (time.perf_counter() - start) / 100
+
+    start = time.perf_counter()
+    received = 0
+    while channel.receive_message("operational-data", 0) is not None:
+        received += 1
+    receive_elapsed = time.perf_counter() - start
+
+    return {
+        "messages": messages,
+        "received": received,
+        "send_msg_per_s": messages / send_elapsed,
+        "pending_ms": pending_elapsed * 1000,
+        "receive_msg_per_s": received / receive_elapsed if receive_elapsed else float("nan")
+    }
+
+
+def benchmark_send_throughput(threads: int = 8, messages: int = 20000) -> Dict[str, float]:
+    """
+    Mesure le débit de `send_message` lorsque plusieurs threads envoient en parallèle.
+
+    Chaque thread envoie `messages` messages à son propre destinataire sur le
+    canal hiérarchique ; la journalisation par message est échantillonnée.
+
+    Args:
+        threads: Nombre de threads émetteurs
+        messages: Nombre de messages envoyés par thread
+
+    Returns:
+        Un dictionnaire contenant le débit global et la latence d'envoi mesurée
+    """
+    middleware = MessageMiddleware({"log_sample_rate": 0.001})
+    middleware.register_channel(HierarchicalChannel("hierarchical"))
+    start_barrier = threading.Barrier(threads + 1)
+
+    def sender(thread_index: int):
+        batch = [_create_message(f"operational-send-{thread_index}", index) for index in range(messages)]
+        start_barrier.wait()
+        for message in batch:
+            middleware.send_message(message)
+
+    workers = [threading.Thread(target=sender, args=(index,), daemon=True) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    start_barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    stats = middleware.get_statistics()
+    send_latency = next(iter(stats["latency"].values()))["send"]
+    middleware.shutdown()
+
+    return {
+        "threads": threads,
+        "messages": stats["messages_sent"],
+        "send_msg_per_s": stats["messages_sent"] / elapsed,
+        "send_mean_ms": send_latency["mean_ms"],
+        "send_p99_ms": send_latency["p99_ms"]
+    }
+
+
+class _ReferenceMessage:
+    """
+    Reproduction de l'ancienne classe `Message` (attributs dans `__dict__`,
+    identifiant uuid4 et horodatage calculés à la construction, `to_dict`
+    recalculé à chaque appel), servant de référence au benchmark `message`.
+    """
+
+    def __init__(self, message_type, sender, sender_level, content, recipient=None, channel=None,
+                 priority=MessagePriority.NORMAL, metadata=None, message_id=None, timestamp=None):
+        self.id = message_id or f"{message_type.value}-{uuid.uuid4().hex[:8]}"
+        self.type = message_type
+        self.sender = sender
+        self.sender_level = sender_level
+        self.recipient = recipient
+        self.channel = channel
+        self.priority = priority
+        self.content = content
+        self.metadata = metadata or {}
+        self.timestamp = timestamp or datetime.now()
+        self._priority_map = {
+            MessagePriority.LOW: 0,
+            MessagePriority.NORMAL: 1,
+            MessagePriority.HIGH: 2,
+            MessagePriority.CRITICAL: 3
+        }
+
+    def __lt__(self, other):
+        if self._priority_map[self.priority] != self._priority_map[other.priority]:
+            return self._priority_map[self.priority] > self._priority_map[other.priority]
+        return self.timestamp < other.timestamp
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.type.value,
+            "sender": self.sender,
+            "sender_level": self.sender_level.value,
+            "recipient": self.recipient,
+            "channel": self.channel,
+            "priority": self.priority.value,
+            "content": self.content,
+            "metadata": self.metadata,
+            "timestamp": self.timestamp.isoformat()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "_ReferenceMessage":
+        return cls(
+            message_type=MessageType(data["type"]),
+            sender=data["sender"],
+            sender_level=AgentLevel(data["sender_level"]),
+            content=data["content"],
+            recipient=data.get("recipient"),
+            channel=data.get("channel"),
+            priority=MessagePriority(data.get("priority", "normal")),
+            metadata=data.get("metadata", {}),
+            message_id=data["id"],
+            timestamp=datetime.fromisoformat(data["timestamp"])
+        )
+
+
+def _time_per_item(count: int, operation: Callable[[int], Any]) -> float:
+    """Mesure la durée moyenne d'une opération en microsecondes."""
+    start = time.perf_counter()
+    for index in range(count):
+        operation(index)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def benchmark_message(count: int = 100000) -> Dict[str, float]:
+    """
+    Compare la classe `Message` à l'ancienne implémentation pour la construction,
+    la comparaison utilisée par les files de priorité, `to_dict` et un aller-retour
+    sérialisé (JSON pour la référence, codec binaire pour `Message`).
+
+    Args:
+        count: Nombre d'opérations mesurées par cas
+
+    Returns:
+        Un dictionnaire de durées moyennes en microsecondes
+    """
+    results: Dict[str, float] = {}
+    priorities = list(MessagePriority)
+
+    for name, cls in (("reference", _ReferenceMessage), ("message", Message)):
+        def create(index, cls=cls):
+            return cls(
+                message_type=MessageType.COMMAND,
+                sender="tactical-bench",
+                sender_level=AgentLevel.TACTICAL,
+                content={"command_type": "noop", "parameters": {"index": index}},
+                recipient="operational-bench",
+                priority=priorities[index % len(priorities)]
+            )
+
+        results[f"{name}_create_us"] = _time_per_item(count, create)
+
+        messages = [create(index) for index in range(count)]
+        results[f"{name}_lt_us"] = _time_per_item(count - 1, lambda index: messages[index] < messages[index + 1])
+        results[f"{name}_sort_ms"] = _time_per_item(1, lambda _: sorted(messages)) / 1000
+        results[f"{name}_to_dict_us"] = _time_per_item(count, lambda index: messages[index].to_dict())
+
+        if cls is Message:
+            results[f"{name}_round_trip_us"] = _time_per_item(
+                count, lambda index: decode_message(encode_message(messages[index]))
+            )
+        else:
+            results[f"{name}_round_trip_us"] = _time_per_item(
+                count, lambda index: cls.from_dict(json.loads(json.dumps(messages[index].to_dict())))
+            )
+
+    return results
+
+
+def _print_results(name: str, results: Dict[str, float]) -> None:
+    """Affiche les résultats d'un benchmark."""
+    print(f"== {name} ==")
+    for key, value in results.items():
+        if isinstance(value, float):
+            print(f"  {key:<16} {value:12.4f}")
+        else:
+            print(f"  {key:<16} {str(value):>12}")
+
+
+def main() -> None:
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(description="Micro-benchmarks du système de communication")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    hop_parser = subparsers.add_parser("hop-latency", help="Latence d'un saut émetteur -> récepteur bloqué")
+    hop_parser.add_argument("--hops", type=int, default=200)
+
+    idle_parser = subparsers.add_parser("idle-cpu", help="CPU consommé par des récepteurs inactifs")
+    idle_parser.add_argument("--waiters", type=int, default=200)
+    idle_parser.add_argument("--duration", type=float, default=2.0)
+    idle_parser.add_argument("--asyncio", action="store_true", help="Récepteurs asynchrones au lieu de threads")
+
+    data_parser = subparsers.add_parser("data-channel", help="Débit du canal de données pour un destinataire")
+    data_parser.add_argument("--messages", type=int, default=100000)
+    data_parser.add_argument("--pending-count", type=int, default=10)
+
+    send_parser = subparsers.add_parser("send-throughput", help="Débit de send_message avec plusieurs émetteurs")
+    send_parser.add_argument("--threads", type=int, default=8)
+    send_parser.add_argument("--messages", type=int, default=20000)
+
+    message_parser = subparsers.add_parser("message", help="Coût de construction, comparaison et sérialisation des messages")
+    message_parser.add_argument("--count", type=int, default=100000)
+
+    args = parser.parse_args()
+    # Les canaux journalisent chaque message : couper les logs pour ne mesurer que la messagerie
+    logging.disable(logging.WARNING)
+
+    if args.benchmark == "hop-latency":
+        _print_results("hop-latency", benchmark_hop_latency(args.hops))
+    elif args.benchmark == "idle-cpu":
+        _print_results("idle-cpu", benchmark_idle_cpu(args.waiters, args.duration, args.asyncio))
+    elif args.benchmark == "data-channel":
+        _print_results("data-channel", benchmark_data_channel(args.messages, args.pending_count))
+    elif args.benchmark == "send-throughput":
+        _print_results("send-throughput", benchmark_send_throughput(args.threads, args.messages))
+    elif args.benchmark == "message":
+        _print_results("message", benchmark_message(args.count))
+
+
+if __name__ == "__main__":
+    main()
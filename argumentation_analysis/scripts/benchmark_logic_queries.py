@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de l'exécution groupée des requêtes logiques via TweetyBridge.
+
+Compare, pour 1, 10 et 100 requêtes sur un même ensemble de croyances
+propositionnel, la boucle historique (`execute_pl_query` par requête) à
+`TweetyBridge.execute_queries_batch`. Nécessite une JVM et les bibliothèques
+TweetyProject :
+
+    python -m argumentation_analysis.scripts.benchmark_logic_queries [--atoms 50] [--repeat 5]
+
+Chaque mesure est faite cache de parsing vidé (« cold ») puis cache rempli
+(« warm »), afin de distinguer le gain dû au parsing de celui dû aux appels.
+"""
+
+import argparse
+import logging
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from argumentation_analysis.agents.core.logic.belief_set import PropositionalBeliefSet
+from argumentation_analysis.agents.core.logic.parse_cache import ParseCache
+from argumentation_analysis.agents.core.logic.tweety_bridge import TweetyBridge
+
+
+logger = logging.getLogger("BenchmarkLogicQueries")
+
+QUERY_COUNTS = (1, 10, 100)
+
+
+def _create_belief_set(atoms: int) -> PropositionalBeliefSet:
+    """Crée une chaîne d'implications p0 => p1 => ... => pN."""
+    formulas = ["p0"] + [f"p{index} => p{index + 1}" for index in range(atoms - 1)]
+    return PropositionalBeliefSet("; ".join(formulas))
+
+
+def _create_queries(count: int, atoms: int) -> List[str]:
+    """Crée des requêtes alternant formules acceptées et rejetées."""
+    return [f"p{index % atoms}" if index % 2 == 0 else f"!p{index % atoms}" for index in range(count)]
+
+
+def _median_ms(parse_cache: ParseCache, operation: Callable[[], object], repeat: int, cold: bool) -> float:
+    """Exécute une opération plusieurs fois et retourne la durée médiane en millisecondes."""
+    durations = []
+    for _ in range(repeat):
+        if cold:
+            parse_cache.invalidate()
+        start = time.perf_counter()
+        operation()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def benchmark_batch_queries(atoms: int = 50, repeat: int = 5) -> Dict[str, float]:
+    """
+    Mesure la boucle par requête et l'exécution groupée pour chaque nombre de requêtes.
+
+    Args:
+        atoms: Nombre de variables propositionnelles de l'ensemble de croyances
+        repeat: Nombre de répétitions par mesure (la médiane est retenue)
+
+    Returns:
+        Un dictionnaire de durées en millisecondes et de facteurs d'accélération
+    """
+    parse_cache = ParseCache()
+    bridge = TweetyBridge(parse_cache)
+    belief_set = _create_belief_set(atoms)
+    results: Dict[str, float] = {}
+
+    for count in QUERY_COUNTS:
+        queries = _create_queries(count, atoms)
+
+        def loop():
+            return [bridge.execute_pl_query(belief_set.content, query) for query in queries]
+
+        def batch():
+            return bridge.execute_queries_batch(belief_set, queries)
+
+        # Les deux chemins doivent donner les mêmes résultats
+        loop_results = ["ACCEPTED" in message for message in loop()]
+        batch_results = [result["result"] for result in batch()]
+        if loop_results != batch_results:
+            raise RuntimeError(f"Batch results differ from loop results for {count} queries")
+
+        for cache_state, cold in (("cold", True), ("warm", False)):
+            loop_ms = _median_ms(parse_cache, loop, repeat, cold)
+            batch_ms = _median_ms(parse_cache, batch, repeat, cold)
+            results[f"loop_{count}_{cache_state}_ms"] = loop_ms
+            results[f"batch_{count}_{cache_state}_ms"] = batch_ms
+            results[f"speedup_{count}_{cache_state}"] = loop_ms / batch_ms if batch_ms else float("inf")
+
+    results["parse_cache_hit_rate"] = parse_cache.get_stats()["hit_rate"]
+    return results
+
+
+def _print_results(name: str, results: Dict[str, float]) -> None:
+    """Affiche les résultats d'un benchmark."""
+    print(f"== {name} ==")
+    for key, value in results.items():
+        print(f"  {key:<24} {value:12.4f}")
+
+
+def main() -> None:
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(description="Benchmark de l'exécution groupée des requêtes logiques")
+    parser.add_argument("--atoms", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    # TweetyBridge et les handlers journalisent chaque requête : couper les logs pour ne mesurer que le raisonnement
+    logging.disable(logging.WARNING)
+
+    _print_results("batch-queries", benchmark_batch_queries(args.atoms, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
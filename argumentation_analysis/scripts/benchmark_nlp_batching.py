@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de l'inférence par lots des pipelines de l'analyseur contextuel amélioré.
+
+Compare, sur CPU, l'analyse phrase par phrase (un appel aux pipelines de
+sentiment et d'entités nommées par phrase, comportement historique de
+`EnhancedContextualFallacyAnalyzer`) à `run_pipeline_in_batches`, pour
+plusieurs tailles de lot. Le corpus est formé des textes français du
+répertoire `examples/`, répétés jusqu'au nombre de phrases demandé.
+Nécessite transformers et torch (les modèles sont téléchargés au premier
+lancement) :
+
+    python -m argumentation_analysis.scripts.benchmark_nlp_batching [--sentences 200] [--batch-sizes 8 16 32]
+
+Les débits sont exprimés en phrases par seconde (deux pipelines par phrase).
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from argumentation_analysis.agents.tools.analysis.enhanced.contextual_fallacy_analyzer import run_pipeline_in_batches
+
+
+logger = logging.getLogger("BenchmarkNlpBatching")
+
+EXAMPLES_DIR = Path(__file__).resolve().parents[2] / "examples"
+DEFAULT_BATCH_SIZES = (8, 16, 32)
+
+
+def load_french_corpus(sentence_count: int, examples_dir: Path = EXAMPLES_DIR) -> List[str]:
+    """
+    Construit un corpus de phrases à partir des textes d'exemple.
+
+    Args:
+        sentence_count: Nombre de phrases voulu
+        examples_dir: Répertoire des textes (.txt)
+
+    Returns:
+        Les phrases, découpées comme dans l'analyseur et répétées au besoin
+    """
+    sentences = []
+    for path in sorted(examples_dir.glob("*.txt")):
+        text = " ".join(path.read_text(encoding="utf-8").split())
+        sentences.extend(sentence for sentence in text.split(". ") if sentence.strip())
+    if not sentences:
+        raise RuntimeError(f"No example text found in {examples_dir}")
+    return [sentences[index % len(sentences)] for index in range(sentence_count)]
+
+
+def _label(result: Any) -> Optional[str]:
+    """Extrait l'étiquette d'un résultat du pipeline de sentiment."""
+    if isinstance(result, list):
+        result = result[0]
+    return result["label"]
+
+
+def benchmark_nlp_batching(sentence_count: int = 200, batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+                           sentiment_model: Optional[str] = None, ner_model: Optional[str] = None) -> Dict[str, float]:
+    """
+    Mesure le débit phrase par phrase puis par lots.
+
+    Args:
+        sentence_count: Nombre de phrases du corpus
+        batch_sizes: Tailles de lot à mesurer
+        sentiment_model: Modèle du pipeline de sentiment (None : modèle par défaut de transformers)
+        ner_model: Modèle du pipeline d'entités nommées (None : modèle par défaut de transformers)
+
+    Returns:
+        Un dictionnaire de débits (phrases/s) et de facteurs d'accélération
+    """
+    from transformers import pipeline
+
+    sentences = load_french_corpus(sentence_count)
+    sentiment = pipeline("sentiment-analysis", model=sentiment_model, device=-1)
+    ner = pipeline("ner", model=ner_model, device=-1)
+
+    # Échauffement : chargement paresseux des poids et allocation des tampons
+    run_pipeline_in_batches(sentiment, sentences[:8], 8)
+    run_pipeline_in_batches(ner, sentences[:8], 8)
+
+    start = time.perf_counter()
+    reference = [sentiment(sentence) for sentence in sentences]
+    for sentence in sentences:
+        ner(sentence)
+    sequential_s = time.perf_counter() - start
+    results = {"sequential_sentences_per_s": sentence_count / sequential_s}
+
+    for batch_size in batch_sizes:
+        start = time.perf_counter()
+        batched = run_pipeline_in_batches(sentiment, sentences, batch_size)
+        run_pipeline_in_batches(ner, sentences, batch_size)
+        batched_s = time.perf_counter() - start
+
+        # Le remplissage peut modifier les scores à la marge, pas les étiquettes
+        differing = sum(_label(a) != _label(b) for a, b in zip(reference, batched))
+        if differing:
+            logger.warning(f"Batch size {batch_size}: {differing} sentiment labels differ from sequential inference")
+        results[f"batch_{batch_size}_sentences_per_s"] = sentence_count / batched_s
+        results[f"speedup_batch_{batch_size}"] = sequential_s / batched_s
+
+    return results
+
+
+def _print_results(name: str, results: Dict[str, float]) -> None:
+    """Affiche les résultats d'un benchmark."""
+    print(f"== {name} ==")
+    for key, value in results.items():
+        print(f"  {key:<32} {value:12.2f}")
+
+
+def main() -> None:
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(description="Benchmark de l'inférence par lots des pipelines transformers")
+    parser.add_argument("--sentences", type=int, default=200)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=list(DEFAULT_BATCH_SIZES))
+    parser.add_argument("--sentiment-model", default=None)
+    parser.add_argument("--ner-model", default=None)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    _print_results("nlp-batching", benchmark_nlp_batching(
+        args.sentences, args.batch_sizes, args.sentiment_model, args.ner_model
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark des fonctions natives de taxonomie de `InformalAnalysisPlugin`.
+
+Mesure la latence des appels d'outils du LLM `explore_fallacy_hierarchy`,
+`get_fallacy_details` et `find_fallacy_definition` sur la taxonomie réelle,
+avec l'index en mémoire (`TaxonomyIndex`), et la compare aux parcours du
+DataFrame effectués auparavant à chaque appel (copie du DataFrame, filtres
+`path.str.startswith`, trois `str.contains` par recherche de nom), reproduits
+ici comme référence. Nécessite pandas et semantic_kernel :
+
+    python -m argumentation_analysis.scripts.benchmark_taxonomy_lookups [--calls 300]
+
+Les latences sont exprimées en microsecondes par appel.
+"""
+
+import argparse
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from argumentation_analysis.agents.core.informal.informal_definitions import InformalAnalysisPlugin
+
+
+logger = logging.getLogger("BenchmarkTaxonomyLookups")
+
+
+def _dataframe_explore(df: pd.DataFrame, pk: int) -> Dict[str, Any]:
+    """Enfants directs par filtre sur `path`, comme avant l'index."""
+    df = df.copy()
+    row = df.loc[pk]
+    prefix = f"{row['path']}."
+    candidates = df[df['path'].astype(str).str.startswith(prefix, na=False)]
+    children = candidates[~candidates['path'].astype(str).str.slice(start=len(prefix)).str.contains('.', regex=False)]
+    return {"pk": pk, "children": [int(child_pk) for child_pk, _ in children.head(15).iterrows()]}
+
+
+def _dataframe_details(df: pd.DataFrame, pk: int) -> Dict[str, Any]:
+    """Détails, parent et enfants par filtres sur `path`, comme avant l'index."""
+    df = df.copy()
+    row = df.loc[pk]
+    result = {col: value for col, value in row.items() if pd.notna(value)}
+    path = str(row['path'])
+    if '.' in path:
+        parent = df[df['path'] == path.rsplit('.', 1)[0]]
+        result["parent"] = int(parent.index[0]) if len(parent) else None
+    result["children"] = _dataframe_explore(df, pk)["children"]
+    return result
+
+
+def _dataframe_find(df: pd.DataFrame, name: str) -> Optional[int]:
+    """Recherche par trois `str.contains`, comme avant l'index."""
+    df = df.copy()
+    condition = pd.Series(False, index=df.index)
+    for column in ('nom_vulgarisé', 'text_fr', 'Latin'):
+        condition |= df[column].fillna('').astype(str).str.contains(name, case=False, na=False, regex=False)
+    found = df[condition]
+    return int(found.index[0]) if not found.empty else None
+
+
+def _time_calls(function: Callable[[Any], Any], arguments: List[Any]) -> float:
+    """Retourne la latence moyenne (µs) d'une fonction sur une liste d'arguments."""
+    start = time.perf_counter()
+    for argument in arguments:
+        function(argument)
+    return (time.perf_counter() - start) / len(arguments) * 1e6
+
+
+def benchmark_taxonomy_lookups(calls: int = 300, taxonomy_path: Optional[str] = None) -> Dict[str, float]:
+    """
+    Mesure la latence des fonctions natives avec l'index et avec les parcours du DataFrame.
+
+    Args:
+        calls: Nombre d'appels par fonction
+        taxonomy_path: Fichier CSV de la taxonomie (None : taxonomie par défaut)
+
+    Returns:
+        Un dictionnaire de latences (µs par appel) et de facteurs d'accélération
+    """
+    plugin = InformalAnalysisPlugin(taxonomy_file_path=taxonomy_path)
+    start = time.perf_counter()
+    df = plugin._get_taxonomy_dataframe()
+    load_s = time.perf_counter() - start
+    start = time.perf_counter()
+    plugin._get_taxonomy_index()
+    results = {"dataframe_load_ms": load_s * 1e3, "index_build_ms": (time.perf_counter() - start) * 1e3}
+
+    pks = [int(pk) for pk in df.index]
+    pk_args = [pks[(index * 37) % len(pks)] for index in range(calls)]
+    names = [str(name) for name in df['text_fr'].dropna()]
+    # Noms exacts, fragments de noms (recherche par sous-chaîne) et noms absents
+    name_args = []
+    for index in range(calls):
+        name = names[(index * 53) % len(names)]
+        name_args.append([name, name[1:-1].upper(), f"sophisme inexistant {index}"][index % 3])
+
+    cases = {
+        "explore_fallacy_hierarchy": (lambda pk: plugin.explore_fallacy_hierarchy(str(pk)),
+                                      lambda pk: json.dumps(_dataframe_explore(df, pk), default=str), pk_args),
+        "get_fallacy_details": (lambda pk: plugin.get_fallacy_details(str(pk)),
+                                lambda pk: json.dumps(_dataframe_details(df, pk), default=str), pk_args),
+        "find_fallacy_definition": (plugin.find_fallacy_definition,
+                                    lambda name: _dataframe_find(df, name), name_args),
+    }
+    for name, (indexed, scanned, arguments) in cases.items():
+        indexed_us = _time_calls(indexed, arguments)
+        scanned_us = _time_calls(scanned, arguments)
+        results[f"{name}_index_us"] = indexed_us
+        results[f"{name}_dataframe_us"] = scanned_us
+        results[f"{name}_speedup"] = scanned_us / indexed_us
+
+    return results
+
+
+def _print_results(name: str, results: Dict[str, float]) -> None:
+    """Affiche les résultats d'un benchmark."""
+    print(f"== {name} ==")
+    for key, value in results.items():
+        print(f"  {key:<40} {value:12.2f}")
+
+
+def main() -> None:
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(description="Benchmark des fonctions natives de taxonomie des sophismes")
+    parser.add_argument("--calls", type=int, default=300)
+    parser.add_argument("--taxonomy", default=None)
+    args = parser.parse_args()
+    # Les fonctions natives journalisent chaque appel
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("InformalAnalysisPlugin").setLevel(logging.WARNING)
+
+    _print_results("taxonomy-lookups", benchmark_taxonomy_lookups(args.calls, args.taxonomy))
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,12 @@ except ImportError as e:
     FallacySeverityEvaluator = None
     EnhancedContextualAnalyzer = None
 
+try:
+    from argumentation_analysis.agents.tools.analysis.pattern_matcher import PatternMatcher
+except ImportError as e:
+    logging.warning(f"Impossible d'importer le moteur de patterns de sophismes: {e}")
+    PatternMatcher = None
+
 # Imports des modèles (style relatif)
 from ..models.request_models import FallacyRequest, FallacyOptions
 from ..models.response_models import FallacyResponse, FallacyDetection
@@ -243,6 +249,10 @@ class FallacyService:
                 'severity': 0.6
             }
         }
+        # Sans moteur de patterns (import impossible), la détection par patterns est désactivée
+        self.pattern_matcher = PatternMatcher({
+            fallacy_type: fallacy_info['patterns'] for fallacy_type, fallacy_info in self.fallacy_patterns.items()
+        }) if PatternMatcher else None
     
     def is_healthy(self) -> bool:
         """Vérifie si le service de détection de sophismes est opérationnel.
@@ -399,53 +409,33 @@ class FallacyService:
         :rtype: List[FallacyDetection]
         """
         fallacies = []
-        text_lower = text.lower()
+        if self.pattern_matcher is None:
+            return fallacies
         
         try:
-            for fallacy_type, fallacy_info in self.fallacy_patterns.items():
-                for pattern in fallacy_info['patterns']:
-                    if self._pattern_matches(pattern, text_lower):
-                        position = text_lower.find(pattern.split('.*')[0] if '.*' in pattern else pattern)
-                        
-                        fallacy = FallacyDetection(
-                            type=fallacy_type,
-                            name=fallacy_info['name'],
-                            description=fallacy_info['description'],
-                            severity=fallacy_info['severity'],
-                            confidence=0.6,
-                            location={'start': position, 'end': position + len(pattern)} if position >= 0 else None,
-                            context=self._extract_context(text, position) if position >= 0 else None,
-                            explanation=f"Pattern détecté: {pattern}"
-                        )
-                        fallacies.append(fallacy)
-                        break 
+            # Tous les patterns sont recherchés en un seul parcours du texte
+            matches_by_type = self.pattern_matcher.matches_by_label(text)
+            for fallacy_type, matches in matches_by_type.items():
+                fallacy_info = self.fallacy_patterns[fallacy_type]
+                match = matches[0]
+                
+                fallacy = FallacyDetection(
+                    type=fallacy_type,
+                    name=fallacy_info['name'],
+                    description=fallacy_info['description'],
+                    severity=fallacy_info['severity'],
+                    confidence=0.6,
+                    location={'start': match.start, 'end': match.end},
+                    context=self._extract_context(text, match.start),
+                    explanation=f"Pattern détecté: {match.pattern}"
+                )
+                fallacies.append(fallacy)
         
         except Exception as e:
             self.logger.error(f"Erreur détection patterns: {e}")
         
         return fallacies
     
-    def _pattern_matches(self, pattern: str, text: str) -> bool:
-        """Vérifie si un pattern (simplifié) correspond à un texte (insensible à la casse).
-
-        Tente une recherche regex après avoir remplacé '.*' par '.*?'.
-        En cas d'échec de la regex, effectue une simple recherche de sous-chaîne.
-
-        :param pattern: Le pattern à rechercher (peut contenir '.*').
-        :type pattern: str
-        :param text: Le texte dans lequel rechercher.
-        :type text: str
-        :return: True si le pattern est trouvé, False sinon.
-        :rtype: bool
-        """
-        import re
-        
-        try:
-            regex_pattern = pattern.replace('.*', r'.*?')
-            return bool(re.search(regex_pattern, text, re.IGNORECASE))
-        except Exception:
-            return pattern.replace('.*', '') in text
-    
     def _extract_context(self, text: str, position: int, context_size: int = 50) -> Optional[str]:
         """Extrait une portion de texte (contexte) autour d'une position donnée.
 
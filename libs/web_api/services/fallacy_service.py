@@ -29,6 +29,12 @@ except ImportError as e:
     FallacySeverityEvaluator = None
     EnhancedContextualAnalyzer = None
 
+try:
+    from argumentation_analysis.agents.tools.analysis.pattern_matcher import PatternMatcher
+except ImportError as e:
+    logging.warning(f"Impossible d'importer le moteur de patterns de sophismes: {e}")
+    PatternMatcher = None
+
 from libs.web_api.models.request_models import FallacyRequest
 from libs.web_api.models.response_models import FallacyResponse, FallacyDetection
 
@@ -162,6 +168,10 @@ class FallacyService:
                 'severity': 0.6
             }
         }
+        # Sans moteur de patterns (import impossible), la détection par patterns est désactivée
+        self.pattern_matcher = PatternMatcher({
+            fallacy_type: fallacy_info['patterns'] for fallacy_type, fallacy_info in self.fallacy_patterns.items()
+        }) if PatternMatcher else None
     
     def is_healthy(self) -> bool:
         """Vérifie l'état de santé du service."""
@@ -284,46 +294,34 @@ class FallacyService:
     def _detect_with_patterns(self, text: str, options) -> List[FallacyDetection]:
         """Détection avec les patterns de sophismes intégrés."""
         fallacies = []
-        text_lower = text.lower()
+        if self.pattern_matcher is None:
+            return fallacies
         
         try:
-            for fallacy_type, fallacy_info in self.fallacy_patterns.items():
-                # Vérification des patterns
-                for pattern in fallacy_info['patterns']:
-                    if self._pattern_matches(pattern, text_lower):
-                        # Calcul de la position approximative
-                        position = text_lower.find(pattern.split('.*')[0] if '.*' in pattern else pattern)
-                        
-                        fallacy = FallacyDetection(
-                            type=fallacy_type,
-                            name=fallacy_info['name'],
-                            description=fallacy_info['description'],
-                            severity=fallacy_info['severity'],
-                            confidence=0.6,  # Confiance modérée pour les patterns
-                            location={'start': position, 'end': position + len(pattern)} if position >= 0 else None,
-                            context=self._extract_context(text, position) if position >= 0 else None,
-                            explanation=f"Pattern détecté: {pattern}"
-                        )
-                        fallacies.append(fallacy)
-                        break  # Un seul match par type de sophisme
+            # Tous les patterns sont recherchés en un seul parcours du texte
+            matches_by_type = self.pattern_matcher.matches_by_label(text)
+            # Un seul match par type de sophisme : le premier pattern de la table présent dans le texte
+            for fallacy_type, matches in matches_by_type.items():
+                fallacy_info = self.fallacy_patterns[fallacy_type]
+                match = matches[0]
+                
+                fallacy = FallacyDetection(
+                    type=fallacy_type,
+                    name=fallacy_info['name'],
+                    description=fallacy_info['description'],
+                    severity=fallacy_info['severity'],
+                    confidence=0.6,  # Confiance modérée pour les patterns
+                    location={'start': match.start, 'end': match.end},
+                    context=self._extract_context(text, match.start),
+                    explanation=f"Pattern détecté: {match.pattern}"
+                )
+                fallacies.append(fallacy)
         
         except Exception as e:
             self.logger.error(f"Erreur détection patterns: {e}")
         
         return fallacies
     
-    def _pattern_matches(self, pattern: str, text: str) -> bool:
-        """Vérifie si un pattern correspond au texte."""
-        import re
-        
-        try:
-            # Conversion du pattern simple en regex
-            regex_pattern = pattern.replace('.*', r'.*?')
-            return bool(re.search(regex_pattern, text, re.IGNORECASE))
-        except Exception:
-            # Fallback: recherche simple
-            return pattern.replace('.*', '') in text
-    
     def _extract_context(self, text: str, position: int, context_size: int = 50) -> str:
         """Extrait le contexte autour d'une position."""
         if position < 0:
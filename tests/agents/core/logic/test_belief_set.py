@@ -4,12 +4,14 @@
 Tests unitaires pour les classes BeliefSet.
 """
 
+import pickle
 import unittest
 from unittest.mock import patch
 
 from argumentation_analysis.agents.core.logic.belief_set import (
-    BeliefSet, PropositionalBeliefSet, FirstOrderBeliefSet, ModalBeliefSet
+    BeliefSet, PropositionalBeliefSet, FirstOrderBeliefSet, ModalBeliefSet, as_belief_set
 )
+from argumentation_analysis.agents.core.logic.parse_cache import ParseCache
 
 
 class MockBeliefSet(BeliefSet):
@@ -99,6 +101,55 @@ class TestBeliefSet(unittest.TestCase):
         self.assertEqual(belief_set.content, "")
 
 
+class TestStructuredBeliefSet(unittest.TestCase):
+    """Tests de la représentation structurée des ensembles de croyances."""
+
+    def test_formulas_and_hash(self):
+        """Les formules sont découpées une fois ; le condensat ignore la mise en forme."""
+        belief_set = PropositionalBeliefSet("a;  a => b\nb => c % commentaire\n")
+        self.assertEqual(belief_set.formulas, ("a", "a => b", "b => c"))
+        self.assertIs(belief_set.formulas, belief_set.formulas)
+        self.assertEqual(belief_set.canonical_content, "a; a => b; b => c")
+
+        same = PropositionalBeliefSet.from_formulas(["a", "a => b", "b => c"])
+        self.assertEqual(same.content, "a; a => b; b => c")
+        self.assertEqual(same.content_hash, belief_set.content_hash)
+        self.assertEqual(belief_set.content_hash, ParseCache.content_hash("a; a => b; b => c"))
+        self.assertNotEqual(PropositionalBeliefSet("a; b").content_hash, belief_set.content_hash)
+
+    def test_serialization(self):
+        """to_dict/from_dict conservent la signature ; le pickle n'emporte pas l'objet Java."""
+        belief_set = FirstOrderBeliefSet("P(a)", signature="predicate P(thing)")
+        belief_set.set_java_object(object(), ("fol", None))
+
+        data = belief_set.to_dict()
+        self.assertEqual(data["signature"], "predicate P(thing)")
+        self.assertEqual(data["content_hash"], belief_set.content_hash)
+        restored = BeliefSet.from_dict(data)
+        self.assertEqual((restored.content, restored.signature), ("P(a)", "predicate P(thing)"))
+        self.assertEqual(BeliefSet.from_dict({"logic_type": "modal", "formulas": ["[]p", "p"]}).content, "[]p; p")
+
+        unpickled = pickle.loads(pickle.dumps(belief_set))
+        self.assertEqual(unpickled.formulas, ("P(a)",))
+        self.assertIsNone(unpickled.get_java_object(("fol", None)))
+
+    def test_java_object_context(self):
+        """L'objet Java n'est retourné que pour le contexte de parsing dans lequel il a été construit."""
+        belief_set = ModalBeliefSet("[]p")
+        handle = object()
+        belief_set.set_java_object(handle, ("modal", "S4", None))
+        self.assertIs(belief_set.get_java_object(("modal", "S4", None)), handle)
+        self.assertIsNone(belief_set.get_java_object(("modal", "K", None)))
+
+    def test_as_belief_set(self):
+        """Un texte est converti dans la classe demandée ; un objet est retourné tel quel."""
+        belief_set = ModalBeliefSet("[]p")
+        self.assertIs(as_belief_set(belief_set, PropositionalBeliefSet), belief_set)
+        converted = as_belief_set("a; b", PropositionalBeliefSet)
+        self.assertIsInstance(converted, PropositionalBeliefSet)
+        self.assertEqual(converted.formulas, ("a", "b"))
+
+
 class TestPropositionalBeliefSet(unittest.TestCase):
     """Tests pour la classe PropositionalBeliefSet."""
     
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# tests/agents/core/logic/test_entailment_memo.py
+"""
+Tests unitaires pour la mémoïsation persistante des résultats d'inférence.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from argumentation_analysis.agents.core.logic.belief_set import PropositionalBeliefSet
+from argumentation_analysis.agents.core.logic.entailment_memo import (
+    EntailmentMemo, OPERATION_CONSISTENCY, OPERATION_QUERY
+)
+from argumentation_analysis.agents.core.logic.parse_cache import ParseCache
+from argumentation_analysis.agents.core.logic.pl_handler import PLHandler
+
+
+class TestEntailmentMemo(unittest.TestCase):
+    """Tests pour la classe EntailmentMemo."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "memo", "entailments.sqlite3")
+        self.memo = EntailmentMemo(self.path)
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.memo.close()
+        self.tempdir.cleanup()
+
+    def test_normalization(self):
+        """L'ordre, les doublons, les espaces et les '%' finaux ne changent pas le condensat."""
+        self.assertEqual(
+            EntailmentMemo.belief_set_hash("a => b; a;"),
+            EntailmentMemo.belief_set_hash(" a ;a=>b%; a")
+        )
+        self.assertNotEqual(EntailmentMemo.belief_set_hash("a"), EntailmentMemo.belief_set_hash("b"))
+        self.assertEqual(EntailmentMemo.normalize_formula(" a  || !b %"), "a||!b")
+
+    def test_normalization_follows_parsing(self):
+        """Le condensat suit le découpage du parseur : retours à la ligne et commentaires '%'."""
+        self.assertNotEqual(EntailmentMemo.belief_set_hash("a\nb"), EntailmentMemo.belief_set_hash("ab"))
+        self.assertEqual(EntailmentMemo.belief_set_hash("a\nb"), EntailmentMemo.belief_set_hash("b; a"))
+        self.assertEqual(EntailmentMemo.belief_set_hash("a % comment; b"), EntailmentMemo.belief_set_hash("a"))
+        self.assertNotEqual(EntailmentMemo.belief_set_hash("a % comment; b"), EntailmentMemo.belief_set_hash("a; b"))
+        self.assertNotEqual(EntailmentMemo.belief_set_hash("a b"), EntailmentMemo.belief_set_hash("ab"))
+        self.assertEqual(
+            EntailmentMemo.belief_set_hash(PropositionalBeliefSet("a =>  b\na")),
+            EntailmentMemo.belief_set_hash("a; a=>b")
+        )
+
+    def test_lookup_and_persistence(self):
+        """Un résultat mémorisé est retrouvé, y compris après réouverture du fichier."""
+        self.assertIsNone(self.memo.lookup("pl", "a; a => b", OPERATION_QUERY, "b"))
+        self.memo.store("pl", "a; a => b", OPERATION_QUERY, "b", True)
+        self.memo.store("pl", "a; a => b", OPERATION_CONSISTENCY, "", True)
+        self.memo.close()
+
+        self.memo = EntailmentMemo(self.path)
+        self.assertTrue(self.memo.lookup("pl", "a=>b; a", OPERATION_QUERY, "b "))
+        self.assertTrue(self.memo.lookup("pl", "a; a => b", OPERATION_CONSISTENCY))
+        self.assertIsNone(self.memo.lookup("fol", "a; a => b", OPERATION_QUERY, "b"))
+        self.assertEqual(self.memo.get_stats()["hits"], 2)
+
+    def test_invalidation_by_belief_set(self):
+        """L'invalidation par ensemble de croyances ne touche pas les autres ensembles."""
+        self.memo.store("pl", "a", OPERATION_QUERY, "a", True)
+        self.memo.store("pl", "a", OPERATION_QUERY, "b", False)
+        self.memo.store("pl", "b", OPERATION_QUERY, "b", True)
+
+        self.assertEqual(self.memo.invalidate(knowledge_base="a;"), 2)
+        self.assertIsNone(self.memo.lookup("pl", "a", OPERATION_QUERY, "a"))
+        self.assertTrue(self.memo.lookup("pl", "b", OPERATION_QUERY, "b"))
+        self.assertEqual(self.memo.invalidate(), 1)
+
+
+class TestPLHandlerEntailmentMemo(unittest.TestCase):
+    """Tests de l'utilisation de la mémoïsation par PLHandler."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.jpype_patcher = patch('argumentation_analysis.agents.core.logic.pl_handler.jpype')
+        self.jstring_patcher = patch('argumentation_analysis.agents.core.logic.pl_handler.JString', side_effect=str)
+        self.mock_jpype = self.jpype_patcher.start()
+        self.jstring_patcher.start()
+        self.mock_jpype.JClass.return_value = MagicMock(side_effect=lambda: MagicMock(name="PlBeliefSet"))
+
+        self.reasoner = MagicMock()
+        self.reasoner.query.return_value = True
+        self.reasoner.isConsistent.return_value = False
+        initializer = MagicMock()
+        initializer.get_pl_reasoner.return_value = self.reasoner
+
+        self.memo = EntailmentMemo()
+        self.handler = PLHandler(initializer, ParseCache(), self.memo)
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.memo.close()
+        self.jstring_patcher.stop()
+        self.jpype_patcher.stop()
+
+    def test_repeated_query_skips_reasoner(self):
+        """Une question déjà posée, même formulée autrement, n'appelle plus le raisonneur."""
+        self.assertTrue(self.handler.pl_query("a; a => b", "b"))
+        self.assertTrue(self.handler.pl_query("a => b; a", "b"))
+        self.assertEqual(self.reasoner.query.call_count, 1)
+
+        self.assertFalse(self.handler.pl_check_consistency("a; !a"))
+        self.assertFalse(self.handler.pl_check_consistency("!a; a"))
+        self.assertEqual(self.reasoner.isConsistent.call_count, 1)
+
+    def test_opt_out(self):
+        """Avec use_memo=False, la mémoïsation n'est ni consultée ni alimentée."""
+        self.handler.pl_query("a; a => b", "b", use_memo=False)
+        self.handler.pl_query("a; a => b", "b", use_memo=False)
+        self.assertEqual(self.reasoner.query.call_count, 2)
+        self.assertEqual(self.memo.get_stats()["entries"], 0)
+
+    def test_batch_uses_memo(self):
+        """Les requêtes groupées déjà mémorisées n'appellent pas le raisonneur."""
+        self.handler.pl_query("a; a => b", "b")
+        results = self.handler.pl_query_batch("a; a => b", ["b", "a"])
+        self.assertEqual([r["entailed"] for r in results], [True, True])
+        self.assertEqual(self.reasoner.query.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
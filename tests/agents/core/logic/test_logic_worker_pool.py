@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# tests/agents/core/logic/test_logic_worker_pool.py
+"""
+Tests unitaires pour le pool de processus de raisonnement.
+
+Les processus utilisent un service simulé à la place de TweetyBridge : ces
+tests vérifient l'isolation, les délais et la relance des processus, sans JVM.
+"""
+
+import os
+import time
+import unittest
+
+from argumentation_analysis.agents.core.logic.logic_worker_pool import (
+    LogicWorkerError, LogicWorkerPool, LogicWorkerTimeout
+)
+
+
+class FakeBridge:
+    """Service simulé : la requête détermine le comportement du processus."""
+
+    def execute_fol_query(self, belief_set_content, query_string):
+        if query_string == "hang":
+            time.sleep(60)
+        if query_string == "crash":
+            os._exit(1)
+        if query_string == "boom":
+            raise ValueError("invalid formula")
+        if query_string == "slow":
+            time.sleep(0.3)
+        return os.getpid()
+
+
+def create_fake_bridge():
+    return FakeBridge()
+
+
+def create_failing_bridge():
+    raise RuntimeError("no JVM")
+
+
+class TestLogicWorkerPool(unittest.TestCase):
+    """Tests pour la classe LogicWorkerPool."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.pool = LogicWorkerPool(size=2, query_timeout=5, startup_timeout=60, factory=create_fake_bridge)
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.pool.shutdown()
+
+    def test_queries_run_in_worker_processes(self):
+        """Les requêtes sont exécutées hors du processus courant, en parallèle."""
+        self.pool.start()
+        start = time.perf_counter()
+        futures = [self.pool.submit("execute_fol_query", "kb", "slow") for _ in range(2)]
+        pids = {future.result() for future in futures}
+        elapsed = time.perf_counter() - start
+
+        self.assertNotIn(os.getpid(), pids)
+        self.assertEqual(len(pids), 2)
+        self.assertLess(elapsed, 0.55)
+        self.assertEqual(self.pool.get_stats()["alive"], 2)
+
+    def test_timeout_kills_and_respawns_worker(self):
+        """Une requête bloquée expire ; son processus est tué puis relancé à la requête suivante."""
+        pool = LogicWorkerPool(size=1, query_timeout=5, startup_timeout=60, factory=create_fake_bridge)
+        try:
+            first_pid = pool.execute("execute_fol_query", "kb", "a")
+            with self.assertRaises(LogicWorkerTimeout):
+                pool.execute("execute_fol_query", "kb", "hang", timeout=0.3)
+            second_pid = pool.execute("execute_fol_query", "kb", "a")
+            self.assertNotEqual(first_pid, second_pid)
+
+            stats = pool.get_stats()
+            self.assertEqual((stats["timeouts"], stats["starts"]), (1, 2))
+        finally:
+            pool.shutdown()
+
+    def test_crash_and_errors(self):
+        """Un processus arrêté est signalé puis relancé ; une exception du service est propagée."""
+        with self.assertRaises(LogicWorkerError):
+            self.pool.execute("execute_fol_query", "kb", "crash")
+        with self.assertRaisesRegex(LogicWorkerError, "ValueError: invalid formula"):
+            self.pool.execute("execute_fol_query", "kb", "boom")
+        self.assertIsInstance(self.pool.execute("execute_fol_query", "kb", "a"), int)
+        self.assertEqual(self.pool.get_stats()["crashes"], 1)
+
+    def test_unknown_method(self):
+        """Seules les méthodes de raisonnement de TweetyBridge peuvent être appelées."""
+        with self.assertRaises(ValueError):
+            self.pool.execute("shutdown_executor")
+
+    def test_startup_failure(self):
+        """Un échec de démarrage du service est signalé sans bloquer le pool."""
+        pool = LogicWorkerPool(size=1, startup_timeout=60, factory=create_failing_bridge)
+        try:
+            with self.assertRaisesRegex(LogicWorkerError, "no JVM"):
+                pool.execute("execute_fol_query", "kb", "a")
+            self.assertEqual(pool.get_stats()["pool"]["created"], 0)
+        finally:
+            pool.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
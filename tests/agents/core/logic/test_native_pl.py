@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+# tests/agents/core/logic/test_native_pl.py
+"""
+Tests unitaires pour le raisonneur propositionnel en Python pur.
+
+Les résultats du solveur sont comparés à une évaluation exhaustive par
+tables de vérité sur des formules aléatoires (graine fixe). La comparaison
+avec TweetyProject se trouve dans
+tests/integration/jpype_tweety/test_native_pl_differential.py.
+"""
+
+import itertools
+import random
+import unittest
+from unittest.mock import MagicMock, patch
+
+from argumentation_analysis.agents.core.logic.native_pl import (
+    CDCLSolver, NativePLHandler, TseitinEncoder, evaluate, parse_formula
+)
+from argumentation_analysis.agents.core.logic.parse_cache import ParseCache
+from argumentation_analysis.agents.core.logic.tweety_bridge import TweetyBridge
+
+ATOMS = ["a", "b", "c", "d", "e"]
+OPERATORS = ["&&", "||", "=>", "<=>", "^^"]
+
+
+def random_formula(rng: random.Random, depth: int) -> str:
+    """Génère une formule aléatoire en syntaxe Tweety."""
+    if depth == 0 or rng.random() < 0.25:
+        atom = rng.choice(ATOMS)
+        return f"!{atom}" if rng.random() < 0.3 else atom
+    if rng.random() < 0.15:
+        return f"!({random_formula(rng, depth - 1)})"
+    operator = rng.choice(OPERATORS)
+    return f"({random_formula(rng, depth - 1)} {operator} {random_formula(rng, depth - 1)})"
+
+
+def truth_table_entails(formulas, query) -> bool:
+    """Vérifie l'inférence par énumération de toutes les interprétations."""
+    for values in itertools.product([False, True], repeat=len(ATOMS)):
+        assignment = dict(zip(ATOMS, values))
+        if all(evaluate(f, assignment) for f in formulas) and not evaluate(query, assignment):
+            return False
+    return True
+
+
+class TestParser(unittest.TestCase):
+    """Tests du parseur de la syntaxe Tweety."""
+
+    def test_precedence(self):
+        """&& lie plus fort que ||, qui lie plus fort que => puis <=>."""
+        self.assertEqual(
+            parse_formula("a && b || c => d <=> e"),
+            parse_formula("(((a && b) || c) => d) <=> e")
+        )
+        self.assertEqual(parse_formula("a => b => c"), parse_formula("a => (b => c)"))
+        self.assertEqual(parse_formula("!a && b"), parse_formula("(!a) && b"))
+
+    def test_constants_and_comments(self):
+        """'+' et '-' désignent le vrai et le faux ; le '%' final est ignoré."""
+        self.assertTrue(evaluate(parse_formula("+ || -"), {}))
+        self.assertFalse(evaluate(parse_formula("a && - %"), {"a": True}))
+
+    def test_invalid_formulas(self):
+        """Les formules mal formées lèvent une ValueError."""
+        for formula_str in ["", "a &&", "(a || b", "a b", "a & b", "=> a"]:
+            with self.assertRaises(ValueError, msg=formula_str):
+                parse_formula(formula_str)
+
+
+class TestCDCLSolver(unittest.TestCase):
+    """Tests du solveur CDCL."""
+
+    def test_pigeonhole_unsatisfiable(self):
+        """4 pigeons dans 3 trous : insatisfiable, avec apprentissage de clauses."""
+        pigeons, holes = 4, 3
+        var = lambda p, h: p * holes + h + 1
+        clauses = [[var(p, h) for h in range(holes)] for p in range(pigeons)]
+        clauses += [[-var(p, h), -var(q, h)] for h in range(holes)
+                    for p in range(pigeons) for q in range(p + 1, pigeons)]
+        solver = CDCLSolver(pigeons * holes, clauses)
+        self.assertIsNone(solver.solve())
+        self.assertGreater(solver.stats["conflicts"], 0)
+
+    def test_random_3sat_models(self):
+        """Les modèles retournés satisfont toutes les clauses ; l'insatisfiabilité est confirmée par énumération."""
+        rng = random.Random(7)
+        for _ in range(100):
+            clauses = [[rng.choice([-1, 1]) * rng.randint(1, 8) for _ in range(3)] for _ in range(rng.randint(10, 45))]
+            model = CDCLSolver(8, clauses).solve()
+            if model is not None:
+                self.assertTrue(all(any(model[abs(l)] == (l > 0) for l in clause) for clause in clauses))
+            else:
+                for values in itertools.product([False, True], repeat=8):
+                    self.assertFalse(all(any(values[abs(l) - 1] == (l > 0) for l in clause) for clause in clauses))
+
+
+class TestTseitinEncoder(unittest.TestCase):
+    """Tests de la transformation de Tseitin."""
+
+    def test_equisatisfiable(self):
+        """Une formule et ses clauses de Tseitin ont les mêmes modèles sur les atomes."""
+        rng = random.Random(11)
+        for _ in range(150):
+            formula = parse_formula(random_formula(rng, 4))
+            encoder = TseitinEncoder()
+            encoder.assert_formula(formula)
+            model = CDCLSolver(encoder.num_vars, encoder.all_clauses()).solve()
+            satisfiable = any(evaluate(formula, dict(zip(ATOMS, values)))
+                              for values in itertools.product([False, True], repeat=len(ATOMS)))
+            self.assertEqual(model is not None, satisfiable)
+            if model is not None:
+                assignment = {atom: model[v] for atom, v in encoder.atoms.items()}
+                self.assertTrue(evaluate(formula, assignment))
+
+
+class TestNativePLHandler(unittest.TestCase):
+    """Tests pour la classe NativePLHandler."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.parse_cache = ParseCache()
+        self.handler = NativePLHandler(self.parse_cache)
+
+    def test_query_and_consistency(self):
+        """Requêtes et cohérence sur des ensembles simples."""
+        self.assertTrue(self.handler.pl_query("a; a => b", "b"))
+        self.assertFalse(self.handler.pl_query("a; a => b", "c"))
+        self.assertTrue(self.handler.pl_query("", "a || !a"))
+        self.assertTrue(self.handler.pl_check_consistency("a; a => b"))
+        self.assertTrue(self.handler.pl_check_consistency(""))
+        self.assertFalse(self.handler.pl_check_consistency("a; !a"))
+        # Un ensemble incohérent infère tout
+        self.assertTrue(self.handler.pl_query("a; !a", "z"))
+
+    def test_random_entailment_matches_truth_tables(self):
+        """Les inférences correspondent à l'énumération des tables de vérité."""
+        rng = random.Random(3)
+        for _ in range(120):
+            kb_strs = [random_formula(rng, 2) for _ in range(rng.randint(1, 4))]
+            query_str = random_formula(rng, 2)
+            expected = truth_table_entails([parse_formula(f) for f in kb_strs], parse_formula(query_str))
+            self.assertEqual(self.handler.pl_query("; ".join(kb_strs), query_str), expected,
+                             f"KB: {kb_strs}, query: {query_str}")
+
+    def test_batch_and_cache(self):
+        """Les requêtes groupées réutilisent l'ensemble compilé ; une requête invalide n'affecte qu'elle-même."""
+        results = self.handler.pl_query_batch("a; a => b", ["b", "c", "b &&"])
+        self.assertEqual([r["entailed"] for r in results], [True, False, None])
+        self.assertIn("Error parsing PL formula", results[2]["error"])
+        self.handler.pl_query("a; a => b", "b")
+        self.assertGreater(self.parse_cache.get_stats()["hits"], 0)
+
+        with self.assertRaises(ValueError):
+            self.handler.pl_query_batch("a; a =>", ["a"])
+
+    def test_model(self):
+        """Un modèle est retourné pour un ensemble cohérent, None sinon."""
+        model = self.handler.pl_get_model("a; a => b; !c")
+        self.assertEqual(model, {"a": True, "b": True, "c": False})
+        self.assertIsNone(self.handler.pl_get_model("a; !a"))
+
+
+class TestTweetyBridgePLBackend(unittest.TestCase):
+    """Tests de la sélection du backend propositionnel par TweetyBridge."""
+
+    def create_bridge(self, pl_backend):
+        """Crée un TweetyBridge sans JVM, avec un PLHandler simulé."""
+        with patch.object(TweetyBridge, "__init__", return_value=None):
+            bridge = TweetyBridge()
+        bridge._logger = MagicMock()
+        bridge._pl_backend = pl_backend
+        bridge._handlers = {}
+        bridge._native_pl_handler = NativePLHandler(ParseCache())
+        bridge._pl_handler = MagicMock()
+        bridge._pl_handler.pl_query.return_value = False
+        bridge._pl_handler.pl_query_batch.side_effect = lambda kb, queries, use_memo: [
+            {"query": query, "entailed": False, "error": None} for query in queries
+        ]
+        return bridge
+
+    def test_native_backend(self):
+        """En mode "native", le PLHandler n'est jamais appelé, y compris pour les erreurs."""
+        bridge = self.create_bridge("native")
+        self.assertTrue(bridge._run_pl_query("a; a => b", "b"))
+        with self.assertRaises(ValueError):
+            bridge._run_pl_query("a; a => b", "b &&")
+        bridge._pl_handler.pl_query.assert_not_called()
+
+    def test_auto_backend_falls_back_to_tweety(self):
+        """En mode "auto", les formules non reconnues et les grands ensembles passent par TweetyProject."""
+        bridge = self.create_bridge("auto")
+        self.assertTrue(bridge._run_pl_query("a; a => b", "b"))
+        bridge._pl_handler.pl_query.assert_not_called()
+
+        self.assertFalse(bridge._run_pl_query("a; forall X: b", "b"))
+        large_kb = "; ".join(f"p{i}" for i in range(200))
+        self.assertFalse(bridge._run_pl_query(large_kb, "p0"))
+        self.assertEqual(bridge._pl_handler.pl_query.call_count, 2)
+
+        results = bridge._run_pl_query_batch("a", ["a", "a &&"], True)
+        self.assertEqual([r["entailed"] for r in results], [True, False])
+        bridge._pl_handler.pl_query_batch.assert_called_once_with("a", ["a &&"], True)
+
+
+if __name__ == "__main__":
+    unittest.main()
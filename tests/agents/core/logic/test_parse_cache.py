@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# tests/agents/core/logic/test_parse_cache.py
+"""
+Tests unitaires pour le cache des formules et ensembles de croyances parsés.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+from tests.mocks.jpype_mock import JException as MockedJException
+
+from argumentation_analysis.agents.core.logic.belief_set import PropositionalBeliefSet
+from argumentation_analysis.agents.core.logic.parse_cache import ParseCache, ENTRY_OVERHEAD
+from argumentation_analysis.agents.core.logic.pl_handler import PLHandler
+
+
+class TestParseCache(unittest.TestCase):
+    """Tests pour la classe ParseCache."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.cache = ParseCache(max_entries=3)
+        self.parse = MagicMock(side_effect=lambda text: f"parsed:{text}")
+
+    def test_hit_and_miss(self):
+        """Un texte déjà parsé est servi par le cache."""
+        self.assertEqual(self.cache.get_or_parse("pl", "formula", "a => b", self.parse), "parsed:a => b")
+        self.assertEqual(self.cache.get_or_parse("pl", "formula", "a => b", self.parse), "parsed:a => b")
+        self.parse.assert_called_once_with("a => b")
+
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_keys_separate_logic_kind_and_signature(self):
+        """Le même texte est parsé séparément par logique, nature et signature."""
+        self.cache.get_or_parse("pl", "formula", "p", self.parse)
+        self.cache.get_or_parse("pl", "belief_set", "p", self.parse)
+        self.cache.get_or_parse("modal", "formula", "p", self.parse, signature=("S4", None))
+        self.cache.get_or_parse("modal", "formula", "p", self.parse, signature=("K", None))
+        self.assertEqual(self.parse.call_count, 4)
+
+    def test_entry_budget_evicts_least_recently_used(self):
+        """Au-delà du nombre d'entrées, l'entrée la moins récemment utilisée est évincée."""
+        for text in ("a", "b", "c"):
+            self.cache.get_or_parse("pl", "formula", text, self.parse)
+        self.cache.get_or_parse("pl", "formula", "a", self.parse)
+        self.cache.get_or_parse("pl", "formula", "d", self.parse)
+
+        self.cache.get_or_parse("pl", "formula", "a", self.parse)
+        self.cache.get_or_parse("pl", "formula", "b", self.parse)
+        self.assertEqual([call.args[0] for call in self.parse.call_args_list], ["a", "b", "c", "d", "b"])
+        self.assertEqual(self.cache.get_stats()["evictions"], 2)
+
+    def test_byte_budget(self):
+        """Le budget en octets borne le cache et les objets trop gros ne sont pas conservés."""
+        cache = ParseCache(max_bytes=2 * (ENTRY_OVERHEAD + 10))
+        cache.get_or_parse("pl", "belief_set", "x" * 10, self.parse)
+        cache.get_or_parse("pl", "belief_set", "y" * 10, self.parse)
+        cache.get_or_parse("pl", "belief_set", "z" * 10, self.parse)
+        self.assertEqual(cache.get_stats()["entries"], 2)
+        self.assertLessEqual(cache.get_stats()["bytes"], cache.max_bytes)
+
+        cache.get_or_parse("pl", "belief_set", "w" * 1000, self.parse)
+        self.assertEqual(cache.get_stats()["entries"], 2)
+
+    def test_errors_are_not_cached(self):
+        """Une erreur de parsing est propagée et le texte sera re-parsé."""
+        parse = MagicMock(side_effect=[ValueError("syntax error"), "parsed"])
+        with self.assertRaises(ValueError):
+            self.cache.get_or_parse("pl", "formula", "a =>", parse)
+        self.assertEqual(self.cache.get_or_parse("pl", "formula", "a =>", parse), "parsed")
+
+    def test_invalidate(self):
+        """L'invalidation peut cibler un type de logique."""
+        self.cache.get_or_parse("pl", "formula", "a", self.parse)
+        self.cache.get_or_parse("fol", "formula", "P(x)", self.parse)
+        self.assertEqual(self.cache.invalidate("pl"), 1)
+        self.assertEqual(self.cache.invalidate(), 1)
+        self.assertEqual(self.cache.get_stats()["bytes"], 0)
+
+
+class TestPLHandlerParseCache(unittest.TestCase):
+    """Tests de l'utilisation du cache par PLHandler."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.jpype_patcher = patch('argumentation_analysis.agents.core.logic.pl_handler.jpype')
+        self.jstring_patcher = patch('argumentation_analysis.agents.core.logic.pl_handler.JString', side_effect=str)
+        self.mock_jpype = self.jpype_patcher.start()
+        self.mock_jpype.JException = MockedJException
+        self.jstring_patcher.start()
+        self.mock_jpype.JClass.return_value = MagicMock(side_effect=lambda: MagicMock(name="PlBeliefSet"))
+
+        self.parser = MagicMock()
+        self.parser.parseFormula.side_effect = lambda text: f"formula:{text}"
+        self.reasoner = MagicMock()
+        self.reasoner.query.return_value = True
+        initializer = MagicMock()
+        initializer.get_pl_parser.return_value = self.parser
+        initializer.get_pl_reasoner.return_value = self.reasoner
+
+        self.cache = ParseCache()
+        self.handler = PLHandler(initializer, self.cache)
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.jstring_patcher.stop()
+        self.jpype_patcher.stop()
+
+    def test_repeated_queries_parse_belief_set_once(self):
+        """Des requêtes répétées sur le même ensemble de croyances ne le re-parsent pas."""
+        knowledge_base = "a; a => b; b => c"
+        for query in ("b", "c", "b"):
+            self.assertTrue(self.handler.pl_query(knowledge_base, query))
+
+        parsed = [call.args[0] for call in self.parser.parseFormula.call_args_list]
+        self.assertEqual(parsed, ["a", "a => b", "b => c", "b", "c"])
+        self.assertEqual(self.mock_jpype.JClass.return_value.call_count, 1)
+
+        first_kb = self.reasoner.query.call_args_list[0].args[0]
+        self.assertTrue(all(call.args[0] is first_kb for call in self.reasoner.query.call_args_list))
+        self.assertEqual(self.cache.get_stats()["hits"], 3)
+
+    def test_batch_query(self):
+        """Une requête groupée parse l'ensemble de croyances une fois et isole les erreurs."""
+        self.reasoner.query.side_effect = lambda kb, formula: formula == "formula:b"
+        self.parser.parseFormula.side_effect = lambda text: f"formula:{text}" if text != "=>" else self.fail_parse()
+
+        results = self.handler.pl_query_batch("a; a => b", ["b", "c", "=>"])
+
+        self.assertEqual([(r["query"], r["entailed"]) for r in results], [("b", True), ("c", False), ("=>", None)])
+        self.assertIn("syntax error", results[2]["error"])
+        self.assertEqual(self.mock_jpype.JClass.return_value.call_count, 1)
+        self.assertEqual(self.reasoner.query.call_count, 2)
+
+    def test_structured_belief_set(self):
+        """Un BeliefSet garde l'objet Java ; un texte de même contenu normalisé réutilise l'entrée du cache."""
+        belief_set = PropositionalBeliefSet.from_formulas(["a", "a => b"])
+        kb = self.handler.parse_pl_belief_set(belief_set)
+        self.assertIs(belief_set.get_java_object("pl"), kb)
+
+        lookups = self.cache.get_stats()["hits"] + self.cache.get_stats()["misses"]
+        self.assertIs(self.handler.parse_pl_belief_set(belief_set), kb)
+        self.assertEqual(self.cache.get_stats()["hits"] + self.cache.get_stats()["misses"], lookups)
+
+        self.assertIs(self.handler.parse_pl_belief_set("a;a => b\n"), kb)
+        self.assertTrue(self.handler.pl_query(belief_set, "b"))
+        self.assertEqual(self.mock_jpype.JClass.return_value.call_count, 1)
+
+    def fail_parse(self):
+        """Simule une erreur du parser Java."""
+        raise self.mock_jpype.JException("syntax error")
+
+
+if __name__ == "__main__":
+    unittest.main()
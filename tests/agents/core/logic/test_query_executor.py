@@ -143,6 +143,18 @@ class TestQueryExecutor(unittest.TestCase):
         # Vérifier le résultat
         self.assertTrue(result)
         self.assertEqual(message, "Tweety Result: Modal Query '[]p' is ACCEPTED (True).")
+
+    def test_execute_query_first_order_timeout(self):
+        """Test d'une requête du premier ordre interrompue à l'expiration de son délai."""
+        self.mock_tweety_bridge.validate_fol_formula.return_value = (True, "OK")
+        self.mock_tweety_bridge.execute_fol_query.return_value = "TIMEOUT: La requête FOL 'P(a)' a dépassé son délai de 2.0 s."
+
+        belief_set = FirstOrderBeliefSet("forall X: (P(X) => Q(X))")
+        result, message = self.query_executor.execute_query(belief_set, "P(a)", timeout=2.0)
+
+        self.mock_tweety_bridge.execute_fol_query.assert_called_once_with("forall X: (P(X) => Q(X))", "P(a)", timeout=2.0)
+        self.assertIsNone(result)
+        self.assertTrue(message.startswith("TIMEOUT:"))
     
     def test_execute_query_unsupported_type(self):
         """Test de l'exécution d'une requête avec un type non supporté."""
@@ -203,6 +215,24 @@ class TestQueryExecutor(unittest.TestCase):
         self.assertIsNone(result3)
         self.assertEqual(message3, "FUNC_ERROR: Requête invalide: Syntax Error in c")
 
+    def test_execute_queries_batch(self):
+        """Test de l'exécution groupée de plusieurs requêtes."""
+        self.mock_tweety_bridge.execute_queries_batch.return_value = [
+            {"query": "a", "result": True, "message": "Tweety Result: Query 'a' is ACCEPTED (True)."},
+            {"query": "c", "result": None, "message": "FUNC_ERROR: Syntax Error in c"}
+        ]
+
+        belief_set = PropositionalBeliefSet("a => b")
+        results = self.query_executor.execute_queries_batch(belief_set, ["a", "c"])
+
+        # Un seul appel groupé, sans validation ni exécution requête par requête
+        self.mock_tweety_bridge.execute_queries_batch.assert_called_once_with(belief_set, ["a", "c"])
+        self.mock_tweety_bridge.execute_pl_query.assert_not_called()
+        self.assertEqual(results, [
+            ("a", True, "Tweety Result: Query 'a' is ACCEPTED (True)."),
+            ("c", None, "FUNC_ERROR: Syntax Error in c")
+        ])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
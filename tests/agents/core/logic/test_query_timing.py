@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# tests/agents/core/logic/test_query_timing.py
+"""
+Tests unitaires pour les délais des requêtes logiques et les histogrammes de latence.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from argumentation_analysis.agents.core.logic.belief_set import FirstOrderBeliefSet, ModalBeliefSet
+from argumentation_analysis.agents.core.logic.query_timing import (
+    QueryLatencyStats, ReasoningTimeout, run_with_deadline
+)
+from argumentation_analysis.agents.core.logic.tweety_bridge import TIMEOUT_PREFIX, TweetyBridge
+
+
+class TestRunWithDeadline(unittest.TestCase):
+    """Tests pour la fonction run_with_deadline."""
+
+    def setUp(self):
+        """Initialisation avant chaque test : JVM simulée comme démarrée."""
+        self.jpype_patcher = patch('argumentation_analysis.agents.core.logic.query_timing.jpype')
+        self.mock_jpype = self.jpype_patcher.start()
+        self.mock_jpype.isJVMStarted.return_value = True
+        self.java_thread = self.mock_jpype.JClass.return_value.currentThread.return_value
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.jpype_patcher.stop()
+
+    def test_result_and_exception(self):
+        """Le résultat et les exceptions de l'appel sont transmis à l'appelant."""
+        self.assertEqual(run_with_deadline(lambda: 42, 1.0), 42)
+        with self.assertRaises(ValueError):
+            run_with_deadline(lambda: int("x"), 1.0)
+        self.java_thread.interrupt.assert_not_called()
+
+    def test_timeout_interrupts_java_thread(self):
+        """À l'expiration du délai, ReasoningTimeout est levée et le thread Java est interrompu."""
+        release = threading.Event()
+        with self.assertRaises(ReasoningTimeout) as context:
+            run_with_deadline(lambda: release.wait(5), 0.05)
+        release.set()
+        self.assertEqual(context.exception.timeout, 0.05)
+        self.assertIsInstance(context.exception, TimeoutError)
+        self.java_thread.interrupt.assert_called_once()
+
+    def test_no_deadline_runs_inline(self):
+        """Sans délai, l'appel est exécuté dans le thread courant."""
+        self.assertIs(run_with_deadline(threading.current_thread, None), threading.current_thread())
+
+
+class TestQueryLatencyStats(unittest.TestCase):
+    """Tests pour la classe QueryLatencyStats."""
+
+    def test_outcomes_and_histogram(self):
+        """Chaque logique a son histogramme et ses compteurs par issue."""
+        stats = QueryLatencyStats()
+        stats.measure("fol", lambda: True)
+        with self.assertRaises(ValueError):
+            stats.measure("fol", lambda: int("x"))
+        with self.assertRaises(ReasoningTimeout):
+            stats.measure("fol", lambda: run_with_deadline(lambda: time.sleep(0.2), 0.01))
+        stats.record("modal", "ok", 3_000_000)
+
+        result = stats.get_stats()
+        self.assertEqual(result["fol"]["count"], 3)
+        self.assertEqual(result["fol"]["outcomes"], {"ok": 1, "error": 1, "timeout": 1})
+        self.assertEqual(result["modal"]["histogram_us"], {4096: 1})
+        self.assertAlmostEqual(result["modal"]["mean_ms"], 3.0)
+
+
+class TestTweetyBridgeDeadlines(unittest.TestCase):
+    """Tests des délais des requêtes FOL et modales dans TweetyBridge."""
+
+    def setUp(self):
+        """Initialisation avant chaque test : handlers FOL et modal lents."""
+        self.initializer_patcher = patch('argumentation_analysis.agents.core.logic.tweety_bridge.TweetyInitializer')
+        mock_initializer = self.initializer_patcher.start().return_value
+        mock_initializer.is_jvm_started.return_value = True
+        self.release = threading.Event()
+
+        def slow_batch(*args):
+            self.release.wait(5)
+            return [{"query": query, "entailed": True, "error": None} for query in args[1]]
+
+        self.handler_patchers = []
+        for name in ("FOLHandler", "ModalHandler"):
+            handler = MagicMock()
+            handler.fol_query_batch.side_effect = slow_batch
+            handler.modal_query_batch.side_effect = slow_batch
+            patcher = patch(f'argumentation_analysis.agents.core.logic.tweety_bridge.{name}', return_value=handler)
+            patcher.start()
+            self.handler_patchers.append(patcher)
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.release.set()
+        for patcher in self.handler_patchers:
+            patcher.stop()
+        self.initializer_patcher.stop()
+
+    def test_batch_timeout(self):
+        """Un lot FOL qui dépasse son délai retourne un résultat TIMEOUT pour chaque requête."""
+        bridge = TweetyBridge(pl_backend="native", pool_size=1)
+        start = time.perf_counter()
+        results = bridge.execute_queries_batch(FirstOrderBeliefSet("P(a)"), ["P(a)", "Q(a)"], timeout=0.1)
+        self.assertLess(time.perf_counter() - start, 2)
+
+        self.assertEqual([r["result"] for r in results], [None, None])
+        self.assertTrue(all(r["message"].startswith(TIMEOUT_PREFIX) for r in results))
+        self.assertEqual(bridge.get_latency_stats()["fol"]["outcomes"]["timeout"], 1)
+        # Le handler reste emprunté par l'appel abandonné jusqu'à sa fin
+        self.assertEqual(bridge.get_pool_stats()["fol"]["in_use"], 1)
+        self.release.set()
+
+    def test_default_timeout_and_completion(self):
+        """Le délai par défaut de TweetyBridge s'applique ; un appel terminé à temps est enregistré comme réussi."""
+        bridge = TweetyBridge(pl_backend="native", query_timeout=0.1)
+        results = bridge.execute_queries_batch(ModalBeliefSet("[]p"), ["[]p"])
+        self.assertTrue(results[0]["message"].startswith(TIMEOUT_PREFIX))
+
+        self.release.set()
+        results = bridge.execute_queries_batch(ModalBeliefSet("[]p"), ["[]p"], timeout=2)
+        self.assertTrue(results[0]["result"])
+        self.assertEqual(bridge.get_latency_stats()["modal"]["outcomes"], {"ok": 1, "error": 0, "timeout": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
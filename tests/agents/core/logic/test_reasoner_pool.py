@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# tests/agents/core/logic/test_reasoner_pool.py
+"""
+Tests unitaires pour le pool de handlers et l'exécution parallèle de TweetyBridge.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from argumentation_analysis.agents.core.logic.belief_set import FirstOrderBeliefSet
+from argumentation_analysis.agents.core.logic.reasoner_pool import ReasonerPool
+from argumentation_analysis.agents.core.logic.tweety_bridge import TweetyBridge
+
+
+class TestReasonerPool(unittest.TestCase):
+    """Tests pour la classe ReasonerPool."""
+
+    def test_checkout_reuses_instances(self):
+        """Les éléments sont créés à la demande puis réutilisés après restitution."""
+        pool = ReasonerPool(lambda index: f"item{index}", max_size=2)
+        with pool.checkout() as first:
+            with pool.checkout() as second:
+                self.assertEqual((first, second), ("item0", "item1"))
+        with pool.checkout() as item:
+            self.assertIn(item, ("item0", "item1"))
+
+        stats = pool.get_stats()
+        self.assertEqual((stats["created"], stats["idle"], stats["in_use"], stats["checkouts"]), (2, 2, 0, 3))
+
+    def test_concurrency_is_bounded(self):
+        """Jamais plus de max_size éléments ne sont empruntés en même temps."""
+        pool = ReasonerPool(lambda index: index, max_size=3)
+        lock = threading.Lock()
+        active = {"now": 0, "max": 0}
+
+        def worker():
+            with pool.checkout():
+                with lock:
+                    active["now"] += 1
+                    active["max"] = max(active["max"], active["now"])
+                time.sleep(0.01)
+                with lock:
+                    active["now"] -= 1
+
+        threads = [threading.Thread(target=worker) for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLessEqual(active["max"], 3)
+        self.assertLessEqual(pool.get_stats()["created"], 3)
+        self.assertGreater(pool.get_stats()["waits"], 0)
+
+    def test_timeout(self):
+        """Un emprunt sur un pool épuisé expire avec une TimeoutError."""
+        pool = ReasonerPool(lambda index: index, max_size=1)
+        with pool.checkout():
+            with self.assertRaises(TimeoutError):
+                with pool.checkout(timeout=0.05):
+                    pass
+        self.assertEqual(pool.get_stats()["timeouts"], 1)
+
+    def test_factory_failure_frees_slot(self):
+        """Un échec de création ne consomme pas de place dans le pool."""
+        calls = []
+
+        def factory(index):
+            calls.append(index)
+            if len(calls) == 1:
+                raise RuntimeError("creation failed")
+            return index
+
+        pool = ReasonerPool(factory, max_size=1)
+        with self.assertRaises(RuntimeError):
+            with pool.checkout():
+                pass
+        with pool.checkout(timeout=0.5) as item:
+            self.assertEqual(item, 0)
+
+    def test_invalid_size(self):
+        """Une taille inférieure à 1 lève une ValueError."""
+        with self.assertRaises(ValueError):
+            ReasonerPool(lambda index: index, max_size=0)
+
+
+class TestTweetyBridgeParallel(unittest.TestCase):
+    """Tests de l'emprunt des handlers et de l'exécution parallèle dans TweetyBridge."""
+
+    def setUp(self):
+        """Initialisation avant chaque test : chaque handler FOL enregistre le thread qui l'utilise."""
+        self.initializer_patcher = patch('argumentation_analysis.agents.core.logic.tweety_bridge.TweetyInitializer')
+        self.mock_initializer = self.initializer_patcher.start().return_value
+        self.mock_initializer.is_jvm_started.return_value = True
+        self.mock_initializer.create_components.side_effect = lambda logic: {"fol_parser": MagicMock()}
+
+        self.handler_patcher = patch('argumentation_analysis.agents.core.logic.tweety_bridge.FOLHandler',
+                                     side_effect=self.create_handler)
+        self.handler_patcher.start()
+        self.lock = threading.Lock()
+        self.active = set()
+        self.overlaps = 0
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.handler_patcher.stop()
+        self.initializer_patcher.stop()
+
+    def create_handler(self, *args, **kwargs):
+        handler = MagicMock()
+
+        def fol_query_batch(belief_set_content, queries, signature_declarations_str):
+            with self.lock:
+                if handler in self.active:
+                    self.overlaps += 1
+                self.active.add(handler)
+            time.sleep(0.01)
+            with self.lock:
+                self.active.discard(handler)
+            return [{"query": query, "entailed": query.startswith("p"), "error": None} for query in queries]
+
+        handler.fol_query_batch.side_effect = fol_query_batch
+        return handler
+
+    def test_parallel_queries_keep_order(self):
+        """Les résultats sont retournés dans l'ordre des requêtes ; aucun handler n'est partagé entre threads."""
+        bridge = TweetyBridge(pl_backend="native", pool_size=3)
+        queries = [f"{'p' if i % 2 == 0 else 'q'}{i}(a)" for i in range(10)]
+        results = bridge.execute_queries_parallel(FirstOrderBeliefSet("p0(a)"), queries)
+        bridge.shutdown_executor()
+
+        self.assertEqual([r["query"] for r in results], queries)
+        self.assertEqual([r["result"] for r in results], [i % 2 == 0 for i in range(10)])
+        self.assertEqual(self.overlaps, 0)
+        stats = bridge.get_pool_stats()["fol"]
+        self.assertLessEqual(stats["created"], 3)
+        self.assertEqual(stats["in_use"], 0)
+
+    def test_concurrent_submissions_use_distinct_handlers(self):
+        """Des appels concurrents empruntent des handlers distincts, créés avec leurs propres composants."""
+        bridge = TweetyBridge(pl_backend="native", pool_size=2)
+        belief_set = FirstOrderBeliefSet("p0(a)")
+        futures = [bridge.submit("execute_queries_batch", belief_set, [f"p{i}(a)"]) for i in range(8)]
+        self.assertTrue(all(f.result()[0]["result"] for f in futures))
+        bridge.shutdown_executor()
+
+        self.assertEqual(self.overlaps, 0)
+        self.assertLessEqual(bridge.get_pool_stats()["fol"]["created"], 2)
+        for call in self.mock_initializer.create_components.call_args_list:
+            self.assertEqual(call.args, ("fol",))
+
+    def test_native_queries_do_not_borrow(self):
+        """Une requête PL native n'emprunte aucun handler."""
+        bridge = TweetyBridge(pl_backend="native", pool_size=2)
+        self.assertEqual(bridge.validate_formula("a => b"), (True, "Formule valide"))
+        self.assertEqual(bridge.get_pool_stats(), {})
+
+    @patch('argumentation_analysis.agents.core.logic.tweety_bridge.PLHandler')
+    def test_pl_session_has_its_own_handler(self, mock_pl_handler):
+        """Une session PL reçoit un handler créé avec ses propres composants, distinct du handler principal."""
+        components = {"pl_parser": MagicMock(), "pl_reasoner": MagicMock()}
+        self.mock_initializer.create_components.side_effect = lambda logic: components
+        bridge = TweetyBridge(pl_backend="native")
+        bridge._pl_handler = MagicMock(name="main_pl_handler")
+
+        session = bridge.create_pl_session("a; b")
+
+        self.assertIs(session, mock_pl_handler.return_value.create_session.return_value)
+        mock_pl_handler.return_value.create_session.assert_called_once_with("a; b")
+        self.assertEqual(mock_pl_handler.call_args.kwargs, components)
+        bridge._handlers["pl"].create_session.assert_not_called()
+
+    def test_private_methods_cannot_be_submitted(self):
+        """Seules les méthodes publiques peuvent être soumises à l'exécuteur."""
+        bridge = TweetyBridge(pl_backend="native")
+        with self.assertRaises(AttributeError):
+            bridge.submit("_get_handler", "fol")
+
+
+if __name__ == "__main__":
+    unittest.main()
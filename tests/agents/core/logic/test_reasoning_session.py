@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# tests/agents/core/logic/test_reasoning_session.py
+"""
+Tests unitaires pour les sessions de raisonnement propositionnel incrémental.
+
+Les classes Java sont simulées par un petit solveur sur des littéraux
+("a", "!a"), suffisant pour vérifier la réutilisation des modèles et des
+résultats par la session.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from argumentation_analysis.agents.core.logic.reasoning_session import PLReasoningSession, split_formulas
+
+
+class FakeLiteral:
+    """Littéral propositionnel simulant une PlFormula."""
+
+    def __init__(self, atom: str, positive: bool = True):
+        self.atom = atom
+        self.positive = positive
+
+
+class FakeModel:
+    """Interprétation simulant un PossibleWorld."""
+
+    def __init__(self, true_atoms):
+        self.true_atoms = set(true_atoms)
+
+    def satisfies(self, literal):
+        return (literal.atom in self.true_atoms) == literal.positive
+
+
+class FakeFormulaList(list):
+    """Collection Java simulée (PlBeliefSet, ArrayList)."""
+
+    def __init__(self, items=()):
+        super().__init__(items)
+
+    def add(self, item):
+        self.append(item)
+
+
+class FakeSolver:
+    """Solveur SAT sur des conjonctions de littéraux."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def getWitness(self, formulas):
+        self.calls += 1
+        literals = {(f.atom, f.positive) for f in formulas}
+        if any((atom, not positive) in literals for atom, positive in literals):
+            return None
+        return FakeModel(atom for atom, positive in literals if positive)
+
+
+def parse_literal(text: str) -> FakeLiteral:
+    """Parse un littéral "a" ou "!a"."""
+    if not text or text.strip("!") == "":
+        raise ValueError(f"Invalid formula '{text}'")
+    return FakeLiteral(text.lstrip("!"), not text.startswith("!"))
+
+
+class TestPLReasoningSession(unittest.TestCase):
+    """Tests pour la classe PLReasoningSession."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.solver = FakeSolver()
+        classes = {
+            "org.tweetyproject.logics.pl.syntax.PlBeliefSet": FakeFormulaList,
+            "java.util.ArrayList": FakeFormulaList,
+            "org.tweetyproject.logics.pl.syntax.Negation": lambda f: FakeLiteral(f.atom, not f.positive),
+            "org.tweetyproject.logics.pl.sat.SatSolver": MagicMock(getDefaultSolver=lambda: self.solver)
+        }
+        self.jpype_patcher = patch('argumentation_analysis.agents.core.logic.reasoning_session.jpype')
+        mock_jpype = self.jpype_patcher.start()
+        mock_jpype.JClass.side_effect = classes.__getitem__
+
+        self.handler = MagicMock()
+        self.handler.parse_pl_formula.side_effect = parse_literal
+        self.session = PLReasoningSession(self.handler, ["a", "b"])
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.jpype_patcher.stop()
+
+    def test_split_formulas(self):
+        """Les formules sont séparées par ';' ou des retours à la ligne, sans commentaires ni doublons."""
+        self.assertEqual(split_formulas("a; b\nc % commentaire\n\na;"), ["a", "b", "c"])
+
+    def test_add_and_retract(self):
+        """Les formules sont ajoutées une fois et retirées de l'ensemble Java."""
+        self.assertFalse(self.session.add_formula("a %"))
+        self.assertTrue(self.session.add_formula("c"))
+        self.assertTrue(self.session.retract_formula("b"))
+        self.assertFalse(self.session.retract_formula("b"))
+        self.assertEqual(self.session.formulas, ["a", "c"])
+        self.assertEqual(self.session.content, "a; c")
+        self.assertEqual(len(self.session._kb), 2)
+
+    def test_comments_are_ignored(self):
+        """Le commentaire qui suit un '%' est retiré des formules, requêtes et hypothèses."""
+        self.assertFalse(self.session.add_formula("a % déjà présente"))
+        self.assertTrue(self.session.add_formula("c % indice"))
+        self.assertEqual(self.session.formulas, ["a", "b", "c"])
+        self.assertTrue(self.session.entails("d % requête", assumptions=["d % hypothèse"]))
+        self.assertTrue(self.session.retract_formula("c %"))
+
+    def test_known_model_refutes_query(self):
+        """Un modèle connu falsifiant la requête évite l'appel au solveur."""
+        self.assertFalse(self.session.entails("c"))
+        self.assertEqual(self.solver.calls, 1)
+
+        # Le modèle {a, b} trouvé ci-dessus falsifie "d"
+        self.assertFalse(self.session.entails("d"))
+        self.assertEqual(self.solver.calls, 1)
+        self.assertEqual(self.session.get_stats()["model_hits"], 1)
+
+    def test_entailment_survives_additions(self):
+        """Une requête inférée le reste après un ajout, sans nouvel appel au solveur."""
+        self.assertTrue(self.session.entails("a"))
+        self.session.add_formula("c")
+        self.assertTrue(self.session.entails("a"))
+        self.assertEqual(self.solver.calls, 1)
+
+        # Après un retrait, l'inférence est recalculée
+        self.session.retract_formula("a")
+        self.assertFalse(self.session.entails("a"))
+        self.assertEqual(self.solver.calls, 2)
+
+    def test_consistency(self):
+        """La cohérence est recalculée seulement lorsqu'aucun modèle connu ne la garantit."""
+        self.session.entails("c")
+        self.session.add_formula("c")
+        # Le modèle {a, b, !c} ne satisfait pas "c" : la cohérence doit être recalculée
+        self.assertTrue(self.session.is_consistent())
+        self.assertEqual(self.solver.calls, 2)
+
+        self.session.add_formula("!a")
+        self.assertFalse(self.session.is_consistent())
+        self.assertTrue(self.session.entails("z"))
+
+        self.session.retract_formula("!a")
+        self.assertTrue(self.session.is_consistent())
+
+    def test_assumptions(self):
+        """Les hypothèses s'appliquent à une requête sans modifier la session."""
+        self.assertTrue(self.session.entails("c", assumptions=["c"]))
+        self.assertFalse(self.session.entails("c"))
+        self.assertEqual(self.session.formulas, ["a", "b"])
+
+    def test_sync(self):
+        """La synchronisation applique seulement la différence avec le nouveau contenu."""
+        self.assertTrue(self.session.entails("a"))
+        changes = self.session.sync("a\nc\nd")
+        self.assertEqual(changes, {"added": 2, "retracted": 1})
+        self.assertEqual(self.session.formulas, ["a", "c", "d"])
+        self.assertEqual(self.handler.parse_pl_formula.call_count, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# tests/agents/core/logic/test_tweety_initializer.py
+"""
+Tests unitaires pour l'initialisation paresseuse des composants Tweety.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from argumentation_analysis.agents.core.logic.belief_set import PropositionalBeliefSet
+from argumentation_analysis.agents.core.logic.tweety_bridge import TweetyBridge
+from argumentation_analysis.agents.core.logic.tweety_initializer import COMPONENT_CLASSES, TweetyInitializer
+
+
+class TestTweetyInitializer(unittest.TestCase):
+    """Tests pour l'initialisation par logique, le registre de classes et le préchauffage."""
+
+    def setUp(self):
+        """Initialisation avant chaque test : JVM simulée comme démarrée, aucun composant chargé."""
+        self.jpype_patcher = patch('argumentation_analysis.agents.core.logic.tweety_initializer.jpype')
+        self.mock_jpype = self.jpype_patcher.start()
+        self.mock_jpype.JClass.side_effect = lambda name: MagicMock(name=name)
+        self.saved_state = {name: getattr(TweetyInitializer, name) for name in (
+            "_jvm_started", "_pl_parser", "_pl_reasoner", "_fol_parser", "_modal_parser", "_warmup_thread"
+        )}
+        TweetyInitializer._jvm_started = True
+        TweetyInitializer._pl_parser = TweetyInitializer._pl_reasoner = None
+        TweetyInitializer._fol_parser = TweetyInitializer._modal_parser = None
+        TweetyInitializer._warmup_thread = None
+        TweetyInitializer._jclass_registry.clear()
+        TweetyInitializer._startup_timings.clear()
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        for name, value in self.saved_state.items():
+            setattr(TweetyInitializer, name, value)
+        TweetyInitializer._jclass_registry.clear()
+        self.jpype_patcher.stop()
+
+    def loaded_classes(self):
+        return [call.args[0] for call in self.mock_jpype.JClass.call_args_list]
+
+    def test_pl_only_loads_pl_classes_once(self):
+        """Initialiser PL ne charge que les classes PL, et une seule fois."""
+        initializer = TweetyInitializer(None)
+        parser, reasoner = initializer.initialize_pl_components()
+        self.assertEqual(initializer.initialize_pl_components(), (parser, reasoner))
+
+        self.assertEqual(sorted(self.loaded_classes()), sorted(COMPONENT_CLASSES["pl"]))
+        self.assertIsNone(TweetyInitializer.get_fol_parser())
+        self.assertIn("pl", TweetyInitializer.get_startup_timings())
+        self.assertIn("classes.pl", TweetyInitializer.get_startup_timings())
+
+    def test_jclass_registry(self):
+        """Le registre ne charge chaque classe qu'une fois."""
+        first = TweetyInitializer.get_jclass("java.util.ArrayList")
+        self.assertIs(TweetyInitializer.get_jclass("java.util.ArrayList"), first)
+        self.assertEqual(self.mock_jpype.JClass.call_count, 1)
+
+    def test_unknown_logic(self):
+        """Une logique inconnue lève une ValueError."""
+        with self.assertRaises(ValueError):
+            TweetyInitializer(None).initialize_components("dl")
+
+    def test_warmup(self):
+        """Le préchauffage initialise les logiques demandées dans un thread, une seule fois."""
+        thread = TweetyInitializer.start_warmup(["fol", "modal"])
+        self.assertTrue(TweetyInitializer.wait_for_warmup(timeout=5))
+        self.assertIs(TweetyInitializer.start_warmup(["pl"]), thread)
+
+        self.assertIsNotNone(TweetyInitializer.get_fol_parser())
+        self.assertIsNotNone(TweetyInitializer.get_modal_parser())
+        self.assertIsNone(TweetyInitializer.get_pl_parser())
+        self.assertIn("warmup", TweetyInitializer.get_startup_timings())
+
+
+class TestTweetyBridgeLazyHandlers(unittest.TestCase):
+    """Tests de l'initialisation des handlers de TweetyBridge à la première utilisation."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.initializer_patcher = patch('argumentation_analysis.agents.core.logic.tweety_bridge.TweetyInitializer')
+        self.mock_initializer_class = self.initializer_patcher.start()
+        self.mock_initializer = self.mock_initializer_class.return_value
+        self.mock_initializer.is_jvm_started.return_value = True
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        self.initializer_patcher.stop()
+
+    def test_handlers_are_initialized_on_first_use(self):
+        """La construction n'initialise aucune logique ; chaque handler est créé à son premier accès."""
+        bridge = TweetyBridge(pl_backend="tweety")
+        self.assertTrue(bridge.is_jvm_ready())
+        self.mock_initializer.initialize_components.assert_not_called()
+
+        fol_handler = bridge._fol_handler
+        self.assertIs(bridge._fol_handler, fol_handler)
+        self.mock_initializer.initialize_components.assert_called_once_with("fol")
+
+    def test_native_backend_skips_tweety_pl(self):
+        """Avec le backend "native", une requête PL n'initialise pas les composants PL de Tweety."""
+        bridge = TweetyBridge(pl_backend="native")
+        self.assertEqual(bridge.validate_formula("a => b"), (True, "Formule valide"))
+        results = bridge.execute_queries_batch(PropositionalBeliefSet("a; a => b"), ["b"])
+        self.assertTrue(results[0]["result"])
+        self.mock_initializer.initialize_components.assert_not_called()
+
+    def test_failed_initialization_is_reported(self):
+        """Un échec d'initialisation d'une logique est signalé sans empêcher les autres."""
+        def initialize_components(logic):
+            if logic == "modal":
+                raise RuntimeError("Java class import failed")
+
+        self.mock_initializer.initialize_components.side_effect = initialize_components
+        bridge = TweetyBridge(pl_backend="tweety")
+        self.assertEqual(bridge.preload_logics(["fol", "modal"]), {"fol": True, "modal": False})
+        self.assertEqual(bridge.validate_modal_formula("[]a"), (False, "TweetyBridge ou ModalHandler non prêt."))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -80,6 +80,7 @@ except ImportError:
 
 # Import du module à tester
 from argumentation_analysis.agents.tools.analysis.enhanced.contextual_fallacy_analyzer import EnhancedContextualFallacyAnalyzer
+from argumentation_analysis.agents.tools.analysis.analysis_cache import AnalysisCache
 
 @pytest.fixture(scope="module", autouse=True)
 def setup_module_patches():
@@ -128,7 +129,8 @@ def setup_module_patches():
 def analyzer_instance():
     """Fixture pour initialiser EnhancedContextualFallacyAnalyzer pour chaque test."""
     logger.debug("Initialisation de EnhancedContextualFallacyAnalyzer pour un test.")
-    analyzer = EnhancedContextualFallacyAnalyzer(model_name="distilbert-base-uncased")
+    # Un cache propre à chaque test, pour ne pas dépendre des analyses des tests précédents
+    analyzer = EnhancedContextualFallacyAnalyzer(model_name="distilbert-base-uncased", analysis_cache=AnalysisCache())
     # La réinitialisation d'état qui était dans setUp est gérée par la recréation de l'instance
     return analyzer
 
@@ -143,6 +145,23 @@ def test_initialization(analyzer_instance):
     assert analyzer_instance.nlp_models is not None
     assert analyzer_instance.learning_data is not None
 
+def test_models_shared_and_loaded_on_first_use():
+    """Test le chargement paresseux et partagé des modèles entre instances."""
+    from argumentation_analysis.agents.tools.analysis.model_registry import ModelRegistry
+    module = 'argumentation_analysis.agents.tools.analysis.enhanced.contextual_fallacy_analyzer'
+    mock_pipeline = MagicMock(side_effect=lambda task, **kwargs: MagicMock(name=task))
+    with patch(f'{module}._lazy_imports'), \
+         patch(f'{module}.HAS_TRANSFORMERS', True), \
+         patch(f'{module}.get_model_registry', return_value=ModelRegistry()), \
+         patch(f'{module}.pipeline', mock_pipeline, create=True):
+        first = EnhancedContextualFallacyAnalyzer()
+        second = EnhancedContextualFallacyAnalyzer()
+        mock_pipeline.assert_not_called()
+
+        assert first.nlp_models["sentiment"] is second.nlp_models["sentiment"]
+        assert [call.args[0] for call in mock_pipeline.call_args_list] == ["sentiment-analysis"]
+        assert not first.nlp_models.is_loaded("text_generation")
+
 def test_analyze_context(analyzer_instance):
     """Test l'analyse contextuelle."""
     text = "Les experts affirment que ce produit est sûr et efficace."
@@ -203,6 +222,105 @@ def test_identify_potential_fallacies_with_nlp(analyzer_instance):
         popularity_fallacy = next((f for f in result if f["fallacy_type"] == "Appel à la popularité"), None)
         assert popularity_fallacy is not None
 
+def test_identify_potential_fallacies_with_nlp_batches_sentences(analyzer_instance):
+    """Test le passage des phrases aux pipelines par lots, résultats remis dans l'ordre des phrases."""
+    sentences = [f"Phrase {'longue ' * (i % 4)}numéro {i}" for i in range(9)]
+    sentences[4] = "Le scientifique Einstein est une autorité"
+    calls = []
+
+    def sentiment(batch, batch_size):
+        calls.append(("sentiment", list(batch), batch_size))
+        return [{"label": "POSITIVE", "score": 0.95 if "numéro 2" in s else 0.5} for s in batch]
+
+    def ner(batch, batch_size):
+        calls.append(("ner", list(batch), batch_size))
+        return [[{"entity": "B-PER", "word": "Einstein"}] if "Einstein" in s else [] for s in batch]
+
+    analyzer_instance.nlp_models = {"sentiment": sentiment, "ner": ner}
+    analyzer_instance.nlp_batch_size = 4
+    with patch('argumentation_analysis.agents.tools.analysis.enhanced.contextual_fallacy_analyzer.HAS_TRANSFORMERS', True), \
+         patch.object(analyzer_instance, '_identify_potential_fallacies', return_value=[]):
+        result = analyzer_instance._identify_potential_fallacies_with_nlp(". ".join(sentences))
+
+    # 9 phrases, lots de 4 : 3 appels par pipeline au lieu de 9
+    assert [(name, size) for name, _, size in calls] == [("sentiment", 4), ("sentiment", 4), ("sentiment", 1),
+                                                          ("ner", 4), ("ner", 4), ("ner", 1)]
+    # Chaque lot réunit des phrases de longueurs voisines
+    for _, batch, _ in calls:
+        assert [len(s) for s in batch] == sorted(len(s) for s in batch)
+    assert [(f["fallacy_type"], f["context_text"]) for f in result] == [
+        ("Appel à l'émotion", sentences[2]),
+        ("Appel à l'autorité", sentences[4]),
+    ]
+
+def test_identify_potential_fallacies_with_nlp_reuses_cached_sentences(analyzer_instance):
+    """Test que seules les phrases absentes du cache sont soumises aux pipelines."""
+    calls = []
+
+    def pipeline(batch, batch_size):
+        calls.append(list(batch))
+        return [{"label": "NEUTRAL", "score": 0.5} if len(calls) % 2 else [] for _ in batch]
+
+    analyzer_instance.nlp_models = {"sentiment": pipeline, "ner": pipeline}
+    with patch('argumentation_analysis.agents.tools.analysis.enhanced.contextual_fallacy_analyzer.HAS_TRANSFORMERS', True), \
+         patch.object(analyzer_instance, '_identify_potential_fallacies', return_value=[]):
+        analyzer_instance._identify_potential_fallacies_with_nlp("Première phrase. Deuxième phrase")
+        analyzer_instance._identify_potential_fallacies_with_nlp("Deuxième phrase. Première phrase")
+        assert len(calls) == 2
+        analyzer_instance._identify_potential_fallacies_with_nlp("Première phrase. Troisième phrase")
+
+    assert calls[2:] == [["Troisième phrase"], ["Troisième phrase"]]
+    assert analyzer_instance.context_embeddings_cache.get_stats()["hits"] == 6
+
+def test_analyze_context_deeply_cache(analyzer_instance):
+    """Test le cache des analyses de contexte : clé normalisée, sans collision de préfixe, partagé."""
+    prefix = "Discours politique " * 10
+    with patch.object(analyzer_instance, '_determine_context_type', side_effect=["politique", "commercial"]) as mock_determine:
+        first = analyzer_instance._analyze_context_deeply(prefix + "devant le parlement")
+        cached = analyzer_instance._analyze_context_deeply("  " + (prefix + "DEVANT le parlement").upper())
+        assert cached == first and cached is not first
+        # Le résultat retourné est une copie : le modifier ne modifie pas le cache
+        cached["context_subtypes"].append("modifié")
+        second = analyzer_instance._analyze_context_deeply(prefix + "pour une publicité")
+    assert mock_determine.call_count == 2
+    assert (first["context_type"], second["context_type"]) == ("politique", "commercial")
+
+    other = EnhancedContextualFallacyAnalyzer(analysis_cache=analyzer_instance.context_embeddings_cache)
+    assert other._analyze_context_deeply(prefix + "pour une publicité") == second
+    assert other._analyze_context_deeply(prefix + "devant le parlement")["context_subtypes"] == first["context_subtypes"]
+
+def test_run_pipeline_cached_returns_copies(analyzer_instance):
+    """Test que les entités nommées en cache ne sont pas partagées avec l'appelant."""
+    ner = MagicMock(side_effect=lambda batch, batch_size: [[{"entity": "B-PER", "word": "Dupont"}] for _ in batch])
+    analyzer_instance.nlp_models = {"ner": ner}
+    first = analyzer_instance._run_pipeline_cached("ner", ["Le professeur Dupont"])
+    first[0].append({"entity": "B-LOC", "word": "Paris"})
+    first[0][0]["word"] = "modifié"
+    second = analyzer_instance._run_pipeline_cached("ner", ["Le professeur Dupont"])
+
+    assert second == [[{"entity": "B-PER", "word": "Dupont"}]]
+    assert ner.call_count == 1
+
+def test_nlp_load_failure_falls_back_quietly():
+    """Test qu'après un échec de chargement, l'analyse revient aux méthodes de base sans retenter."""
+    from argumentation_analysis.agents.tools.analysis.model_registry import ModelRegistry
+    module = 'argumentation_analysis.agents.tools.analysis.enhanced.contextual_fallacy_analyzer'
+    mock_pipeline = MagicMock(side_effect=OSError("download failed"))
+    with patch(f'{module}._lazy_imports'), \
+         patch(f'{module}.HAS_TRANSFORMERS', True), \
+         patch(f'{module}.get_model_registry', return_value=ModelRegistry()), \
+         patch(f'{module}.pipeline', mock_pipeline, create=True):
+        analyzer = EnhancedContextualFallacyAnalyzer(analysis_cache=AnalysisCache())
+        with patch.object(analyzer.logger, 'error') as mock_error:
+            first = analyzer._analyze_context_deeply("Discours politique")
+            second = analyzer._analyze_context_deeply("Discours commercial")
+            analyzer._identify_potential_fallacies_with_nlp("Une phrase. Une autre phrase")
+
+    assert not analyzer.nlp_models
+    assert mock_pipeline.call_count == 1
+    assert mock_error.call_count == 1
+    assert first["confidence"] == second["confidence"] == 0.7
+
 def test_filter_by_context_semantic(analyzer_instance):
     """Test le filtrage sémantique par contexte."""
     potential_fallacies = [
@@ -0,0 +1,21 @@
+import pytest
+
+from argumentation_analysis.agents.core.logic.belief_set import PropositionalBeliefSet
+from argumentation_analysis.agents.core.logic.logic_worker_pool import LogicWorkerPool
+
+
+@pytest.mark.real_jpype
+def test_worker_processes_run_tweety_queries():
+    """
+    Scénario: exécuter des requêtes PL dans deux processus disposant chacun de leur JVM.
+    Assertion: les résultats sont ceux de TweetyBridge dans le processus courant.
+    """
+    with LogicWorkerPool(size=2, query_timeout=120, startup_timeout=300, pl_backend="tweety") as pool:
+        pool.start()
+        assert pool.execute("validate_formula", "a => b") == (True, "Formule valide")
+        assert "ACCEPTED" in pool.execute("execute_pl_query", "a; a => b", "b")
+
+        futures = [pool.submit("execute_queries_batch", PropositionalBeliefSet("a; a => b"), ["b", "c"]) for _ in range(4)]
+        for future in futures:
+            assert [r["result"] for r in future.result()] == [True, False]
+        assert pool.get_stats()["alive"] == 2
@@ -0,0 +1,72 @@
+import itertools
+import random
+
+import jpype
+import pytest
+
+from argumentation_analysis.agents.core.logic.native_pl import NativePLHandler
+from argumentation_analysis.agents.core.logic.parse_cache import ParseCache
+
+# Ensembles de croyances et requêtes couvrant tous les opérateurs de la syntaxe Tweety
+FIXED_CASES = [
+    ("a; a => b", ["b", "!b", "a && b", "c"]),
+    ("a || b; !a", ["b", "a", "a ^^ b"]),
+    ("a <=> b; b => c; a", ["c", "a && b && c", "!c"]),
+    ("a ^^ b; a", ["!b", "b"]),
+    ("a; !a", ["z", "!z"]),
+    ("", ["a || !a", "a", "+", "-"]),
+    ("(a && b) => c; a; !c", ["!b", "b", "a => b => c"]),
+    ("a && b || c => d; c", ["d", "a"]),
+]
+
+ATOMS = ["a", "b", "c", "d"]
+OPERATORS = ["&&", "||", "=>", "<=>", "^^"]
+
+
+def _random_formula(rng, depth):
+    """Génère une formule aléatoire entièrement parenthésée."""
+    if depth == 0 or rng.random() < 0.3:
+        atom = rng.choice(ATOMS)
+        return f"!{atom}" if rng.random() < 0.3 else atom
+    return f"({_random_formula(rng, depth - 1)} {rng.choice(OPERATORS)} {_random_formula(rng, depth - 1)})"
+
+
+def _random_cases(count):
+    rng = random.Random(2024)
+    for _ in range(count):
+        kb = "; ".join(_random_formula(rng, 2) for _ in range(rng.randint(1, 4)))
+        yield kb, [_random_formula(rng, 2) for _ in range(3)]
+
+
+@pytest.fixture(scope="module")
+def tweety_pl(logic_classes):
+    """Parseur et raisonneur SAT de TweetyProject."""
+    parser = logic_classes["PlParser"]()
+    reasoner = jpype.JClass("org.tweetyproject.logics.pl.reasoner.SatReasoner")()
+    PlBeliefSet = logic_classes["PlBeliefSet"]
+
+    def parse_belief_set(kb):
+        belief_set = PlBeliefSet()
+        for formula in kb.split(";"):
+            if formula.strip():
+                belief_set.add(parser.parseFormula(formula.strip()))
+        return belief_set
+
+    return parser, reasoner, parse_belief_set
+
+
+@pytest.mark.real_jpype
+@pytest.mark.parametrize("kb, queries", list(itertools.chain(FIXED_CASES, _random_cases(40))))
+def test_native_matches_tweety(tweety_pl, kb, queries):
+    """
+    Scénario: comparer le moteur propositionnel Python pur au SatReasoner de TweetyProject.
+    Assertion: la cohérence et le résultat de chaque requête sont identiques.
+    """
+    parser, reasoner, parse_belief_set = tweety_pl
+    native = NativePLHandler(ParseCache())
+    belief_set = parse_belief_set(kb)
+
+    assert native.pl_check_consistency(kb) == bool(reasoner.isConsistent(belief_set)), f"Cohérence différente pour '{kb}'"
+    for query in queries:
+        expected = bool(reasoner.query(belief_set, parser.parseFormula(query)))
+        assert native.pl_query(kb, query) == expected, f"Résultat différent pour '{kb}' |= '{query}'"
@@ -572,4 +572,28 @@ def test_handle_task_result_missing_tactical_task_id(task_coordinator):
     assert response["status"] == "error"
     assert "Identifiant de tâche tactique manquant" in response["message"]
     task_coordinator.state.update_task_status.assert_not_called()
-    task_coordinator.state.add_intermediate_result.assert_not_called()
\ No newline at end of file
+    task_coordinator.state.add_intermediate_result.assert_not_called()
+
+
+def test_backpressure_defers_and_releases_tasks(task_coordinator):
+    """Teste la mise en attente des tâches d'un agent congestionné puis leur assignation."""
+    mock_middleware = task_coordinator.middleware
+    mock_middleware.add_backpressure_listener.assert_called_once_with(task_coordinator._on_backpressure)
+
+    task_coordinator._on_backpressure("informal_analyzer", True)
+    tasks = [
+        {"id": f"t{index}", "objective_id": "obj1", "required_capabilities": ["fallacy_detection"]}
+        for index in range(3)
+    ]
+    for task in tasks:
+        task_coordinator._assign_task_to_operational_agent(task)
+
+    task_coordinator.adapter.assign_task.assert_not_called()
+    assert task_coordinator.get_deferred_task_count() == 3
+
+    with patch.object(task_coordinator, '_log_action'):
+        task_coordinator._on_backpressure("informal_analyzer", False)
+
+    assert task_coordinator.get_deferred_task_count() == 0
+    assigned = [call[1]["parameters"]["id"] for call in task_coordinator.adapter.assign_task.call_args_list]
+    assert assigned == ["t0", "t1", "t2"]
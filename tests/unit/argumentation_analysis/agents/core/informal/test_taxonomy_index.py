@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour le module taxonomy_index.
+
+L'index est construit à partir de la taxonomie réelle (lue avec le module csv,
+cellules vides converties en None comme les NaN de pandas) et comparé à des
+parcours complets des lignes, équivalents aux filtres du DataFrame.
+"""
+
+import csv
+import unittest
+
+from argumentation_analysis.agents.core.informal.taxonomy_index import TaxonomyIndex, normalize_name
+from argumentation_analysis.paths import DATA_DIR
+
+TAXONOMY_PATH = DATA_DIR / "argumentum_fallacies_taxonomy.csv"
+
+
+def load_taxonomy_rows():
+    """Lit la taxonomie réelle : liste de couples (PK, ligne)."""
+    with open(TAXONOMY_PATH, encoding="utf-8", newline="") as taxonomy_file:
+        reader = csv.DictReader(taxonomy_file)
+        columns = [column for column in reader.fieldnames if column != "PK"]
+        rows = [(int(row.pop("PK")), {column: (value if value != "" else None) for column, value in row.items()})
+                for row in reader]
+    for _, row in rows:
+        row["depth"] = int(row["depth"])
+    return rows, columns
+
+
+class TestTaxonomyIndexRealTaxonomy(unittest.TestCase):
+    """Tests de l'index sur la taxonomie réelle (hiérarchie par 'path')."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rows, cls.columns = load_taxonomy_rows()
+        cls.index = TaxonomyIndex(cls.rows, cls.columns)
+
+    def test_children_match_path_scan(self):
+        """Les enfants sont ceux du filtre startswith(path + '.') sans point restant, dans l'ordre des lignes."""
+        for pk, row in self.rows[::7]:
+            prefix = row["path"] + "."
+            expected = [child_pk for child_pk, child in self.rows
+                        if child["path"].startswith(prefix) and "." not in child["path"][len(prefix):]]
+            self.assertEqual(self.index.children_of(pk), expected)
+        self.assertEqual(self.index.children_of(5), [6, 7, 8])
+        self.assertEqual(self.index.children_of(99999), [])
+
+    def test_parent_of(self):
+        """Le parent est le nœud dont le chemin précède le dernier segment."""
+        self.assertEqual(self.index.parent_of(5), 4)
+        self.assertIsNone(self.index.parent_of(1))
+        self.assertIsNone(self.index.parent_of(99999))
+
+    def test_find_by_name_matches_substring_scan(self):
+        """Hors nom exact, le résultat est la première ligne dont un nom contient la requête."""
+        search_columns = ("nom_vulgarisé", "text_fr", "Latin")
+
+        def scan(query):
+            query = normalize_name(query)
+            exact = [pk for column in (("nom_vulgarisé", "text_fr"), ("Latin",)) for pk, row in self.rows
+                     if any(row[c] and normalize_name(row[c]) == query for c in column)]
+            if exact:
+                return exact[0]
+            return next((pk for pk, row in self.rows
+                         if any(query in normalize_name(row[c] or "") for c in search_columns)), None)
+
+        queries = [row["text_fr"] for _, row in self.rows[::23]]
+        queries += [name[2:-2].upper() for name in queries] + ["  appel  À L'IGNORANCE ", "ad", "", "zzz introuvable"]
+        queries += [row["Latin"] for _, row in self.rows if row["Latin"]][:5]
+        for query in queries:
+            self.assertEqual(self.index.find_by_name(query), scan(query), query)
+
+    def test_exact_name_preferred(self):
+        """Un nom exact l'emporte sur une ligne antérieure qui le contient."""
+        # "Preuve par intimidation" précède "Intimidation" dans la taxonomie
+        pk = self.index.find_by_name("intimidation")
+        self.assertEqual(self.index.get(pk)["text_fr"], "Intimidation")
+        self.assertEqual(self.index.get(self.index.find_by_name("intimid"))["text_fr"], "Preuve par intimidation")
+
+    def test_categories(self):
+        """Les catégories suivent l'ordre d'apparition et listent leurs sophismes."""
+        expected = list(dict.fromkeys(row["Famille"] for _, row in self.rows if row["Famille"]))
+        self.assertEqual(self.index.categories(), expected)
+        self.assertEqual(self.index.in_category("Insuffisance"),
+                         [pk for pk, row in self.rows if row["Famille"] == "Insuffisance"])
+        self.assertEqual(self.index.in_category("inexistante"), [])
+
+
+class TestTaxonomyIndexParentColumn(unittest.TestCase):
+    """Tests de l'index avec une colonne de parenté ou sans chemin."""
+
+    def test_parent_column_has_priority(self):
+        """FK_Parent définit la hiérarchie, y compris pour des valeurs flottantes ou textuelles."""
+        rows = [
+            (0, {"FK_Parent": None, "path": "0", "nom_vulgarisé": "Racine"}),
+            (1, {"FK_Parent": 0.0, "path": "9", "nom_vulgarisé": "A"}),
+            (2, {"FK_Parent": "0", "path": "0.1", "nom_vulgarisé": "B"}),
+            (3, {"FK_Parent": float("nan"), "path": "1.2", "nom_vulgarisé": "C"}),
+            (4, {"FK_Parent": 1, "path": "1", "nom_vulgarisé": "D"}),
+        ]
+        index = TaxonomyIndex(rows, ["FK_Parent", "path", "nom_vulgarisé"])
+        self.assertEqual(index.children_of(0), [1, 2])
+        self.assertEqual(index.children_of(1), [4])
+        self.assertEqual((index.parent_of(2), index.parent_of(0)), (0, None))
+        # Sans parent renseigné, le chemin est utilisé
+        self.assertEqual(index.parent_of(3), 4)
+
+    def test_depth_fallback(self):
+        """Un nœud sans chemin a pour enfants les nœuds de profondeur suivante."""
+        rows = [(0, {"path": "", "depth": 0}), (1, {"path": "1", "depth": "1"}), (2, {"path": "1.1", "depth": 2})]
+        index = TaxonomyIndex(rows, ["path", "depth"])
+        self.assertEqual(index.children_of(0), [1])
+        self.assertEqual(index.children_of(1), [2])
+        self.assertEqual(index.depth_of(1), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour le module analysis_cache.
+
+Ce module contient les tests unitaires du cache borné des résultats d'analyse :
+éviction LRU, expiration, niveau disque et statistiques.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from argumentation_analysis.agents.tools.analysis import analysis_cache
+from argumentation_analysis.agents.tools.analysis.analysis_cache import AnalysisCache, normalize_text
+
+
+class FakeClock:
+    """Horloge manuelle pour les tests d'expiration."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAnalysisCache(unittest.TestCase):
+    """Tests pour la classe AnalysisCache."""
+
+    def test_normalize_text(self):
+        """La normalisation ignore la casse et les espaces superflus."""
+        self.assertEqual(normalize_text("  Discours\tPOLITIQUE \n officiel "), "discours politique officiel")
+
+    def test_namespaces_and_full_text_keys(self):
+        """Les clés dépendent de l'espace de noms et du texte entier, pas d'un préfixe."""
+        cache = AnalysisCache()
+        prefix = "x" * 200
+        cache.put("context", prefix + "a", 1)
+        self.assertIsNone(cache.get("context", prefix + "b"))
+        self.assertIsNone(cache.get("nlp:ner", prefix + "a"))
+        self.assertEqual(cache.get("context", prefix + "a"), 1)
+        self.assertEqual(cache.get_or_compute("context", prefix + "b", lambda: 2), 2)
+        self.assertEqual(cache.get_or_compute("context", prefix + "b", lambda: 3), 2)
+
+    def test_lru_eviction(self):
+        """Au-delà de la limite, l'entrée la moins récemment utilisée est évincée."""
+        cache = AnalysisCache(max_entries=2)
+        cache.put("ns", "a", 1)
+        cache.put("ns", "b", 2)
+        cache.get("ns", "a")
+        cache.put("ns", "c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("ns", "b"))
+        self.assertEqual((cache.get("ns", "a"), cache.get("ns", "c")), (1, 3))
+
+        stats = cache.get_stats()
+        self.assertEqual((stats["entries"], stats["evictions"], stats["hits"], stats["misses"]), (2, 1, 3, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 0.75)
+
+    def test_ttl_expiration(self):
+        """Une entrée plus vieille que la durée de vie n'est plus servie."""
+        clock = FakeClock()
+        cache = AnalysisCache(ttl=60, clock=clock)
+        cache.put("ns", "a", 1)
+        clock.now += 30
+        self.assertEqual(cache.get("ns", "a"), 1)
+        clock.now += 31
+        self.assertIsNone(cache.get("ns", "a"))
+        self.assertEqual((len(cache), cache.get_stats()["expirations"]), (0, 1))
+
+    def test_invalid_limits(self):
+        """Les limites doivent être strictement positives."""
+        for kwargs in ({"max_entries": 0}, {"ttl": 0}, {"max_disk_entries": 0}):
+            with self.assertRaises(ValueError):
+                AnalysisCache(**kwargs)
+
+    def test_disk_tier(self):
+        """Le niveau disque survit au cache mémoire ; il est borné et ignore les valeurs non JSON."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "cache", "analysis.sqlite")
+            clock = FakeClock()
+            cache = AnalysisCache(disk_path=path, max_disk_entries=2, clock=clock)
+            cache.put("ns", "a", {"context_type": "politique", "subtypes": ["électoral"]})
+            cache.put("ns", "not-json", object())
+            cache.close()
+
+            reopened = AnalysisCache(disk_path=path, max_disk_entries=2, clock=clock)
+            self.assertEqual(reopened.get("ns", "a"), {"context_type": "politique", "subtypes": ["électoral"]})
+            self.assertIsNone(reopened.get("ns", "not-json"))
+            self.assertEqual(reopened.get_stats()["disk_hits"], 1)
+
+            clock.now += 1
+            reopened.put("ns", "b", 2)
+            clock.now += 1
+            reopened.put("ns", "c", 3)
+            reopened.clear()
+            self.assertIsNone(reopened.get("ns", "a"))
+            self.assertEqual(reopened.get("ns", "c"), 3)
+
+            reopened.clear(disk=True)
+            self.assertIsNone(reopened.get("ns", "c"))
+            reopened.close()
+
+    def test_disk_tier_batches_and_trims_in_slices(self):
+        """Les écritures groupées partagent une transaction ; la table est réduite par tranches."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "analysis.sqlite")
+            clock = FakeClock()
+            cache = AnalysisCache(disk_path=path, max_disk_entries=20, clock=clock)
+            for index in range(20):
+                clock.now += 1
+                cache.put("ns", f"t{index}", index)
+            cache.put("ns", "t19", 19)  # Remplacement : pas de nouvelle ligne
+            self.assertEqual(cache._disk_count, 20)
+
+            clock.now += 1
+            cache.put_many("ns", [("u0", 0), ("u1", 1), ("bad", object())])
+            # 22 lignes > 20 : les 4 plus anciennes sont supprimées (retour à 18)
+            count = cache._disk.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            self.assertEqual((count, cache._disk_count), (18, 18))
+            self.assertEqual(cache.get_stats()["disk_writes"], 23)
+            cache.close()
+
+            reopened = AnalysisCache(disk_path=path, max_disk_entries=20, clock=clock)
+            self.assertEqual(reopened._disk_count, 18)
+            self.assertIsNone(reopened.get("ns", "t3"))
+            self.assertEqual((reopened.get("ns", "t4"), reopened.get("ns", "u1")), (4, 1))
+            reopened.close()
+
+    def test_shared_cache_configuration(self):
+        """Le cache partagé est unique et configuré par l'environnement."""
+        with patch.object(analysis_cache, '_cache', None), \
+             patch.dict(os.environ, {"ANALYSIS_CACHE_MAX_ENTRIES": "10", "ANALYSIS_CACHE_TTL": "bad"}):
+            cache = analysis_cache.get_analysis_cache()
+            self.assertIs(analysis_cache.get_analysis_cache(), cache)
+            self.assertEqual((cache.max_entries, cache.ttl, cache.get_stats()["disk_enabled"]), (10, None, False))
+
+        with patch.object(analysis_cache, '_cache', None), \
+             patch.dict(os.environ, {"ANALYSIS_CACHE_MAX_ENTRIES": "-5", "ANALYSIS_CACHE_TTL": "-1"}):
+            cache = analysis_cache.get_analysis_cache()
+            self.assertEqual((cache.max_entries, cache.ttl), (analysis_cache.DEFAULT_MAX_ENTRIES, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
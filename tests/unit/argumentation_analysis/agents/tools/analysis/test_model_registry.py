@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour le module model_registry.
+
+Ce module contient les tests unitaires du registre partagé des modèles de langage :
+chargement paresseux et unique, quantification, libération après inactivité.
+"""
+
+import os
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from argumentation_analysis.agents.tools.analysis import model_registry
+from argumentation_analysis.agents.tools.analysis.model_registry import LazyModels, ModelRegistry
+
+
+class FakeClock:
+    """Horloge manuelle pour les tests de libération."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestModelRegistry(unittest.TestCase):
+    """Tests pour la classe ModelRegistry."""
+
+    def test_loaded_once_on_first_use(self):
+        """Un modèle est chargé à sa première utilisation, une seule fois, même en concurrence."""
+        registry = ModelRegistry()
+        loader = MagicMock(return_value="model")
+        registry.register("m", loader)
+        registry.register("m", MagicMock(side_effect=AssertionError("second loader used")))
+        self.assertFalse(registry.is_loaded("m"))
+        loader.assert_not_called()
+
+        threads = [threading.Thread(target=registry.get, args=("m",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(registry.get("m"), "model")
+        loader.assert_called_once_with()
+        self.assertEqual((registry.get_stats()["m"]["loads"], registry.get_stats()["m"]["hits"]), (1, 8))
+
+    def test_unknown_model(self):
+        """Un modèle non déclaré lève une KeyError."""
+        with self.assertRaises(KeyError):
+            ModelRegistry().get("missing")
+
+    def test_failed_load_not_retried_until_evicted(self):
+        """Un échec de chargement est mémorisé ; evict permet de retenter."""
+        registry = ModelRegistry()
+        loader = MagicMock(side_effect=[OSError("download failed"), "model"])
+        registry.register("m", loader)
+        with self.assertRaises(OSError):
+            registry.get("m")
+        with self.assertRaises(RuntimeError):
+            registry.get("m")
+        self.assertEqual(loader.call_count, 1)
+        self.assertTrue(registry.get_stats()["m"]["failed"])
+
+        registry.evict("m")
+        self.assertEqual(registry.get("m"), "model")
+
+    def test_idle_eviction(self):
+        """Un modèle inutilisé au-delà du délai est libéré, puis rechargé à la demande."""
+        clock = FakeClock()
+        registry = ModelRegistry(idle_timeout=10, clock=clock)
+        loaders = {name: MagicMock(return_value=name) for name in ("a", "b")}
+        for name, loader in loaders.items():
+            registry.register(name, loader)
+
+        registry.get("a")
+        clock.now = 5
+        registry.get("b")
+        clock.now = 12
+        self.assertEqual(registry.evict_idle(), ["a"])
+        self.assertTrue(registry.is_loaded("b"))
+
+        # L'accès à un modèle libère les autres modèles inactifs
+        clock.now = 30
+        registry.get("a")
+        self.assertFalse(registry.is_loaded("b"))
+        self.assertEqual(loaders["a"].call_count, 2)
+        self.assertEqual(registry.get_stats()["b"]["evictions"], 1)
+
+    def test_quantization(self):
+        """Seuls les modèles déclarés quantifiables sont quantifiés, si le registre le demande."""
+        with patch.object(model_registry, 'quantize_for_cpu', side_effect=lambda model: f"int8:{model}") as quantize:
+            registry = ModelRegistry(quantize=True)
+            registry.register("pipeline", lambda: "pipeline", quantizable=True)
+            registry.register("tokenizer", lambda: "tokenizer")
+            self.assertEqual(registry.get("pipeline"), "int8:pipeline")
+            self.assertEqual(registry.get("tokenizer"), "tokenizer")
+            quantize.assert_called_once_with("pipeline")
+
+            self.assertEqual(ModelRegistry().get_stats(), {})
+
+    def test_lazy_models_view(self):
+        """La vue est vraie sans rien charger ; l'accès à une clé charge le modèle."""
+        registry = ModelRegistry()
+        loader = MagicMock(return_value="pipeline")
+        registry.register("pipeline:ner", loader)
+        models = LazyModels(registry, {"ner": "pipeline:ner"})
+
+        self.assertTrue(models)
+        self.assertEqual(list(models), ["ner"])
+        self.assertFalse(models.is_loaded("ner"))
+        loader.assert_not_called()
+        self.assertEqual(models["ner"], "pipeline")
+        self.assertTrue(models.is_loaded("ner"))
+
+    def test_lazy_models_unavailable_after_failure(self):
+        """Après un échec de chargement, la vue devient fausse sans nouvelle tentative."""
+        registry = ModelRegistry()
+        loader = MagicMock(side_effect=OSError("download failed"))
+        registry.register("pipeline:ner", loader)
+        models = LazyModels(registry, {"ner": "pipeline:ner"})
+
+        self.assertTrue(models.available)
+        with self.assertRaises(OSError):
+            models["ner"]
+        self.assertTrue(registry.has_failed("pipeline:ner"))
+        self.assertFalse(models.available)
+        self.assertFalse(models)
+        self.assertEqual(loader.call_count, 1)
+        self.assertFalse(LazyModels(registry, {}))
+
+        registry.evict("pipeline:ner")
+        self.assertTrue(models)
+
+    def test_shared_registry_configuration(self):
+        """Le registre partagé est unique et configuré par l'environnement."""
+        with patch.object(model_registry, '_registry', None), \
+             patch.dict(os.environ, {"NLP_MODEL_QUANTIZE": "1", "NLP_MODEL_IDLE_TIMEOUT": "600"}):
+            registry = model_registry.get_model_registry()
+            self.assertIs(model_registry.get_model_registry(), registry)
+            self.assertEqual((registry.quantize, registry.idle_timeout), (True, 600.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour le module pattern_matcher.
+
+Ce module contient les tests unitaires de l'automate de mots-clés et de la table
+de patterns compilée partagée par les analyseurs de sophismes.
+"""
+
+import re
+import unittest
+
+from argumentation_analysis.agents.tools.analysis.contextual_fallacy_analyzer import FALLACY_KEYWORDS
+from argumentation_analysis.agents.tools.analysis.pattern_matcher import (
+    KeywordAutomaton, PatternMatch, PatternMatcher
+)
+
+
+class TestKeywordAutomaton(unittest.TestCase):
+    """Tests pour la classe KeywordAutomaton."""
+
+    def test_overlapping_matches(self):
+        """Toutes les occurrences, y compris chevauchantes ou incluses, sont trouvées."""
+        automaton = KeywordAutomaton(["he", "she", "his", "hers", "he"])
+        matches = [(start, end, automaton.keywords[kid]) for start, end, kid in automaton.iter_matches("ushers")]
+        self.assertEqual(sorted(matches), [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")])
+        self.assertEqual(automaton.keywords, ["he", "she", "his", "hers"])
+
+    def test_first_occurrences(self):
+        """Seule la première occurrence de chaque mot-clé est retenue."""
+        automaton = KeywordAutomaton(["ab", "b", "zz"])
+        first = {automaton.keywords[kid]: start for kid, start in automaton.first_occurrences("xabab").items()}
+        self.assertEqual(first, {"ab": 1, "b": 2})
+
+
+class TestPatternMatcher(unittest.TestCase):
+    """Tests pour la classe PatternMatcher."""
+
+    def test_first_matches_follow_table_order(self):
+        """Les occurrences sont retournées dans l'ordre de la table, avec leur position."""
+        matcher = PatternMatcher({"b": ["Zèbre", "chat"], "a": ["chat"]})
+        text = "Un chat et un ZÈBRE, puis un chat."
+        self.assertEqual(matcher.first_matches(text), [
+            PatternMatch("b", "zèbre", 14, 19),
+            PatternMatch("b", "chat", 3, 7),
+            PatternMatch("a", "chat", 3, 7),
+        ])
+        self.assertEqual([m.start for m in matcher.find_all(text)], [3, 3, 14, 29, 29])
+
+    def test_wildcard_patterns(self):
+        """Les patterns à joker sont des expressions non gourmandes, évaluées seulement si leurs segments sont présents."""
+        matcher = PatternMatcher({"cond": ["si.*alors.*donc"], "circ": ["car.*donc", "parce que.*c'est"]})
+        text = "Si tu viens, alors je pars, donc tout va bien car il le faut, donc oui."
+        grouped = matcher.matches_by_label(text)
+        self.assertEqual(grouped["cond"], [PatternMatch("cond", "si.*alors.*donc", 0, 32)])
+        self.assertEqual([m.pattern for m in grouped["circ"]], ["car.*donc"])
+        self.assertEqual(matcher.matches_by_label("alors donc"), {})
+
+    def test_invalid_regex_falls_back_to_literal(self):
+        """Un pattern invalide est recherché comme littéral, sans ses jokers."""
+        matcher = PatternMatcher({"x": ["(a.*b"]})
+        self.assertEqual(matcher.first_matches("zz (ab"), [PatternMatch("x", "(a.*b", 3, 6)])
+
+    def test_equivalent_to_substring_search(self):
+        """Avec ou sans automate, le résultat est celui d'une recherche par sous-chaîne."""
+        text = ("Tout le monde le sait : les experts sont unanimes, et cette tradition "
+                "ancestrale mènera à une communauté plus moderne, soit dit en passant.")
+        text_lower = text.lower()
+        expected = [
+            (fallacy_type, keyword, text_lower.find(keyword))
+            for fallacy_type, keywords in FALLACY_KEYWORDS.items()
+            for keyword in keywords if keyword in text_lower
+        ]
+        for automaton_min_keywords in (1, 10000):
+            matcher = PatternMatcher(FALLACY_KEYWORDS, automaton_min_keywords=automaton_min_keywords)
+            self.assertEqual([(m.label, m.pattern, m.start) for m in matcher.first_matches(text)], expected)
+
+        all_hits = {(m.pattern, m.start) for m in matcher.find_all(text)}
+        for keyword in {k for keywords in FALLACY_KEYWORDS.values() for k in keywords}:
+            for found in re.finditer(re.escape(keyword), text_lower):
+                self.assertIn((keyword, found.start()), all_hits)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,7 +9,10 @@ import json
 import os
 from pathlib import Path
 from tests.async_test_case import AsyncTestCase
-from argumentation_analysis.agents.tools.analysis.enhanced.contextual_fallacy_analyzer import EnhancedContextualFallacyAnalyzer
+from argumentation_analysis.agents.tools.analysis.analysis_cache import AnalysisCache
+from argumentation_analysis.agents.tools.analysis.enhanced.contextual_fallacy_analyzer import (
+    CONTEXT_ANALYSIS_NAMESPACE, EnhancedContextualFallacyAnalyzer
+)
 
 
 class TestEnhancedContextualFallacyAnalyzer(unittest.TestCase):
@@ -22,7 +25,7 @@ class TestEnhancedContextualFallacyAnalyzer(unittest.TestCase):
         self.mock_transformers = self.patcher_transformers.start()
         
         # Créer une instance de l'analyseur
-        self.analyzer = EnhancedContextualFallacyAnalyzer()
+        self.analyzer = EnhancedContextualFallacyAnalyzer(analysis_cache=AnalysisCache())
         
         # Données de test
         self.test_text = "Les experts sont unanimes : ce produit est sûr et efficace. Des millions de personnes l'utilisent déjà."
@@ -112,9 +115,8 @@ class TestEnhancedContextualFallacyAnalyzer(unittest.TestCase):
         self.assertIsInstance(result["confidence"], float)
         
         # Vérifier que le résultat est mis en cache
-        context_key = "discours commercial pour un produit de santé".lower()[:100]
-        self.assertIn(context_key, self.analyzer.context_embeddings_cache)
-        self.assertEqual(self.analyzer.context_embeddings_cache[context_key], result)
+        cached = self.analyzer.context_embeddings_cache.get(CONTEXT_ANALYSIS_NAMESPACE, "discours commercial pour un produit de santé")
+        self.assertEqual(cached, result)
         
         # Tester l'utilisation du cache
         cached_result = self.analyzer._analyze_context_deeply("discours commercial pour un produit de santé")